@@ -358,37 +358,24 @@ class ActionExecutor:
                 message="No position_id or trade_id in metadata and could not resolve from reasoning",
             )
 
-        # Convert DB trade_id (e.g. ALAB_150.0_20260313_C_1936967951) to
-        # canonical position key (ALAB_150.0_20260313_C) that matches IBKR.
-        # The DB trade_id may have a hash suffix that the IBKR-derived key
-        # never includes, causing update_position() to fail with "not found".
-        from src.utils.position_key import position_key_from_trade
-        from src.data.models import Trade
-
-        try:
-            trade = self.db.query(Trade).filter(Trade.trade_id == position_id).first()
-            if trade:
-                # Already closed? Return early instead of failing at IBKR level.
-                if trade.exit_date is not None:
-                    logger.info(
-                        f"CLOSE_POSITION skipped: {trade.symbol} ({position_id}) "
-                        f"already closed at {trade.exit_date}"
-                    )
-                    return ExecutionResult(
-                        success=True,
-                        action="CLOSE_POSITION",
-                        message=f"Position {trade.symbol} already closed at {trade.exit_date} — no action needed",
-                        data={"position_id": position_id, "already_closed": True},
-                    )
-
-                canonical_id = position_key_from_trade(trade)
-                if canonical_id != position_id:
-                    logger.info(
-                        f"Converted trade_id to position key: {position_id} -> {canonical_id}"
-                    )
-                    position_id = canonical_id
-        except Exception as e:
-            logger.debug(f"Could not convert trade_id to position key: {e}")
+        trade, canonical_id = self._position_key(position_id)
+        # Already closed? Return early instead of failing at IBKR level.
+        if trade is not None and trade.exit_date is not None:
+            logger.info(
+                f"CLOSE_POSITION skipped: {trade.symbol} ({position_id}) "
+                f"already closed at {trade.exit_date}"
+            )
+            return ExecutionResult(
+                success=True,
+                action="CLOSE_POSITION",
+                message=f"Position {trade.symbol} already closed at {trade.exit_date} — no action needed",
+                data={"position_id": position_id, "already_closed": True},
+            )
+        if canonical_id != position_id:
+            logger.info(
+                f"Converted trade_id to position key: {position_id} -> {canonical_id}"
+            )
+            position_id = canonical_id
 
         if not self.exit_manager:
             return ExecutionResult(
@@ -434,19 +421,82 @@ class ActionExecutor:
                 error=str(e),
             )
 
-    async def _handle_close_all(self, decision: DecisionOutput) -> ExecutionResult:
-        """CLOSE_ALL_POSITIONS: Emergency close all open positions via ExitManager."""
-        from src.data.models import Trade
+    def _position_key(self, position_id: str):
+        """Trade row and canonical IBKR position key for a DB trade_id.
+
+        Converts a DB trade_id (e.g. ALAB_150.0_20260313_C_1936967951) to the
+        canonical position key (ALAB_150.0_20260313_C) that matches IBKR.
+        The DB trade_id may have a hash suffix that the IBKR-derived key
+        never includes, causing update_position() to fail with "not found".
+
+        Returns:
+            (Trade or None, position key) — the key is unchanged if no
+            trade matches
+        """
         from src.utils.position_key import position_key_from_trade
+        from src.data.models import Trade
 
         try:
-            open_trades = (
-                self.db.query(Trade)
-                .filter(Trade.exit_date.is_(None))
-                .all()
+            trade = self.db.query(Trade).filter(Trade.trade_id == position_id).first()
+            if trade:
+                return trade, position_key_from_trade(trade)
+        except Exception as e:
+            logger.debug(f"Could not convert trade_id to position key: {e}")
+        return None, position_id
+
+    async def preflight_close(self, trade_id: str) -> Optional[str]:
+        """Pre-flight checks for a CLOSE_POSITION that is still being reasoned.
+
+        Qualifies the contract through ExitManager without placing an
+        order; the close, if confirmed, reuses it. The trade lookup runs
+        off the event loop.
+
+        Args:
+            trade_id: DB trade_id of the position
+
+        Returns:
+            Position key of the prepared exit, None if nothing was prepared
+        """
+        if not self.exit_manager:
+            return None
+        trade, position_id = await asyncio.to_thread(self._position_key, trade_id)
+        if trade is not None and trade.exit_date is not None:
+            return None
+        if not await self.exit_manager.prepare_exit(position_id):
+            return None
+        return position_id
+
+    def discard_preflights(self, position_ids: list[str]) -> None:
+        """Drop pre-flight state left by closes that were never executed.
+
+        Args:
+            position_ids: Keys returned by this caller's preflight_close()
+        """
+        if self.exit_manager and position_ids:
+            self.exit_manager.discard_prepared_exits(position_ids)
+
+    async def _handle_close_all(self, decision: DecisionOutput) -> ExecutionResult:
+        """CLOSE_ALL_POSITIONS: Emergency close all open positions.
+
+        Goes through ExitManager.emergency_flatten(): one cancel sweep, then
+        every closing order submitted at once and escalated against a
+        deadline, instead of one blocking execute_exit() per position.
+        """
+        if not self.exit_manager:
+            return ExecutionResult(
+                success=False,
+                action="CLOSE_ALL_POSITIONS",
+                message="No exit_manager available",
+                error="exit_manager is None",
             )
 
-            if not open_trades:
+        try:
+            # Same thread as the ib_async event loop, as for execute_exit()
+            report = self.exit_manager.emergency_flatten(
+                reason=decision.metadata.get("reason", "emergency_close_all")
+            )
+
+            if not report.legs:
                 return ExecutionResult(
                     success=True,
                     action="CLOSE_ALL_POSITIONS",
@@ -454,67 +504,41 @@ class ActionExecutor:
                     data={"closed_count": 0, "failed_count": 0},
                 )
 
-            if not self.exit_manager:
-                return ExecutionResult(
-                    success=False,
-                    action="CLOSE_ALL_POSITIONS",
-                    message="No exit_manager available",
-                    error="exit_manager is None",
-                )
-
-            from src.execution.exit_manager import ExitDecision
-
-            closed = 0
-            failed = 0
             details: list[dict] = []
-
-            for trade in open_trades:
-                try:
-                    position_key = position_key_from_trade(trade)
-                    exit_decision = ExitDecision(
-                        should_exit=True,
-                        reason=decision.metadata.get("reason", "emergency_close_all"),
-                        exit_type="market",
-                        urgency="critical",
-                    )
-                    result = self.exit_manager.execute_exit(position_key, exit_decision)
-                    if result.success:
-                        closed += 1
-                        details.append({
-                            "trade_id": trade.trade_id,
-                            "symbol": trade.symbol,
-                            "status": "closed",
-                            "exit_price": result.exit_price,
-                        })
-                    else:
-                        failed += 1
-                        details.append({
-                            "trade_id": trade.trade_id,
-                            "symbol": trade.symbol,
-                            "status": "failed",
-                            "error": result.error_message,
-                        })
-                except Exception as e:
-                    failed += 1
-                    details.append({
-                        "trade_id": trade.trade_id,
-                        "symbol": trade.symbol,
-                        "status": "error",
-                        "error": str(e),
-                    })
+            for leg in report.legs:
+                detail = {
+                    "trade_id": leg.target.position_id,
+                    "symbol": leg.target.symbol,
+                    "status": leg.status,
+                }
+                if leg.status == "filled":
+                    detail["exit_price"] = leg.fill_price
+                elif leg.status == "working":
+                    detail["order_id"] = leg.order_id
+                elif leg.error:
+                    detail["error"] = leg.error
+                details.append(detail)
+
+            # Working orders count as placed, as for a single close
+            closed = sum(
+                1 for leg in report.legs
+                if leg.status in ("filled", "working", "dry_run")
+            )
+            failed = len(report.legs) - closed
 
             return ExecutionResult(
                 success=failed == 0,
                 action="CLOSE_ALL_POSITIONS",
                 message=(
                     f"Emergency close: {closed} closed, {failed} failed "
-                    f"(out of {len(open_trades)} positions)"
+                    f"(out of {len(report.legs)} positions) — {report.summary()}"
                 ),
                 data={
                     "closed_count": closed,
                     "failed_count": failed,
-                    "total": len(open_trades),
+                    "total": len(report.legs),
                     "details": details,
+                    "time_to_flat_seconds": report.time_to_flat_seconds,
                 },
             )
         except Exception as e:
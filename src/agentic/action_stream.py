@@ -0,0 +1,169 @@
+"""Incremental action parsing for streamed Claude responses.
+
+The reasoning engine used to wait for the whole completion before parsing
+the decision JSON, although the ``action`` field is written near the start
+and the reasoning text makes up most of the output. With streaming, the
+parser here scans the text as it arrives and reports each action as soon
+as its value string is complete, paired with the trade it applies to:
+
+- the ``trade_id`` of the same action object, or of its ``metadata``
+  object (batched exit checks put metadata first);
+- otherwise the trade the request was about (single exit checks), as soon
+  as the action is known;
+- otherwise None, once the action object closes.
+
+The scan is a single pass over each chunk that only tracks strings, nesting
+and the keys it cares about, so text inside string values (braces, quotes
+in reasoning) cannot produce a false action. Early actions are advisory:
+the full response is still parsed and validated before anything executes.
+
+Usage:
+    parser = IncrementalActionParser(default_trade_id="AAPL_150_P")
+    for chunk in stream:
+        for early in parser.feed(chunk):
+            print(early.action, early.trade_id, early.elapsed_ms)
+    parser.first_action_ms  # time to first action, None if none was seen
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Optional
+
+_CAPTURED_KEYS = ("action", "trade_id")
+
+
+@dataclass
+class EarlyAction:
+    """An action surfaced before the response finished streaming."""
+
+    action: str
+    trade_id: Optional[str]
+    elapsed_ms: float
+
+
+class IncrementalActionParser:
+    """Surfaces action/trade_id pairs from a JSON response as it streams."""
+
+    def __init__(
+        self,
+        default_trade_id: Optional[str] = None,
+        started: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """Initialize parser.
+
+        Args:
+            default_trade_id: Trade the request was about, if only one
+            started: perf_counter() reading at request start (defaults to now)
+            clock: Time source matching ``started``
+        """
+        self.default_trade_id = default_trade_id
+        self._clock = clock
+        self.reset(started)
+
+    def reset(self, started: Optional[float] = None) -> None:
+        """Start over for a new response (e.g. a retried request).
+
+        Args:
+            started: perf_counter() reading at request start (defaults to now)
+        """
+        self._started = started if started is not None else self._clock()
+        self.actions: list[EarlyAction] = []
+
+        # Scanner state (persists across chunks)
+        self._containers: list[str] = []  # "{" or "["
+        self._frames: list[dict] = []  # captured fields per open object
+        self._in_string = False
+        self._escape = False
+        self._buf: list[str] = []
+        self._expect_key = False
+        self._key: Optional[str] = None
+
+    @property
+    def first_action_ms(self) -> Optional[float]:
+        return self.actions[0].elapsed_ms if self.actions else None
+
+    def feed(self, text: str) -> list[EarlyAction]:
+        """Scan a chunk of streamed text.
+
+        Returns:
+            Actions completed by this chunk (usually none)
+        """
+        found: list[EarlyAction] = []
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    self._buf.append(ch)
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._end_string("".join(self._buf), found)
+                    self._buf = []
+                elif self._expect_key or self._key in _CAPTURED_KEYS:
+                    self._buf.append(ch)
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._containers.append("{")
+                self._frames.append({"emitted": False})
+                self._expect_key = True
+                self._key = None
+            elif ch == "[":
+                self._containers.append("[")
+                self._expect_key = False
+                self._key = None
+            elif ch == "}":
+                self._close_object(found)
+            elif ch == "]":
+                if self._containers and self._containers[-1] == "[":
+                    self._containers.pop()
+                self._key = None
+            elif ch == ":":
+                self._expect_key = False
+            elif ch == ",":
+                self._expect_key = bool(self._containers) and self._containers[-1] == "{"
+                self._key = None
+        return found
+
+    def _end_string(self, value: str, found: list[EarlyAction]) -> None:
+        if not self._frames or self._containers[-1] != "{":
+            return
+        if self._expect_key:
+            self._key = value
+            return
+        if self._key in _CAPTURED_KEYS:
+            frame = self._frames[-1]
+            frame.setdefault(self._key, value)
+            self._maybe_emit(frame, found, closing=False)
+        self._key = None
+
+    def _close_object(self, found: list[EarlyAction]) -> None:
+        if not self._containers or self._containers[-1] != "{":
+            return
+        self._containers.pop()
+        frame = self._frames.pop()
+        self._key = None
+        if self._frames and frame.get("trade_id"):
+            # metadata.trade_id belongs to the enclosing action object
+            parent = self._frames[-1]
+            parent.setdefault("trade_id", frame["trade_id"])
+            self._maybe_emit(parent, found, closing=False)
+        self._maybe_emit(frame, found, closing=True)
+
+    def _maybe_emit(self, frame: dict, found: list[EarlyAction], closing: bool) -> None:
+        if frame["emitted"] or not frame.get("action"):
+            return
+        trade_id = frame.get("trade_id") or self.default_trade_id
+        if trade_id is None and not closing:
+            return
+        frame["emitted"] = True
+        early = EarlyAction(
+            action=frame["action"],
+            trade_id=trade_id,
+            elapsed_ms=(self._clock() - self._started) * 1000.0,
+        )
+        self.actions.append(early)
+        found.append(early)
@@ -0,0 +1,175 @@
+"""Execution layer for blocking work inside the daemon's asyncio loop.
+
+The daemon is a single asyncio loop: while a synchronous Claude call or a
+long SQLAlchemy query runs on it, the heartbeat, time emitter, event
+detector and event stream all stall. Two pieces keep it responsive:
+
+- BlockingExecutor: a bounded thread pool for blocking LLM and DB calls.
+  It is installed as the loop's default executor, so every
+  ``asyncio.to_thread`` call shares the same bound. DB work gets its own
+  session per task (SQLAlchemy sessions must not cross threads). IBKR
+  calls are *not* offloaded: ib_async is not thread-safe, so IBKR work uses
+  its native awaitables on the loop instead.
+- LoopLagMonitor: measures how late the loop wakes up and, from a watchdog
+  thread, logs a stack sample of whatever callback is blocking it past a
+  threshold.
+
+Usage:
+    blocking = BlockingExecutor(max_workers=4, session_factory=get_session)
+    blocking.install()
+    decisions = await blocking.run(engine.reason, context=ctx, event_type=t)
+    report = await blocking.run_db(loop_obj.run_weekly_learning)
+
+    monitor = LoopLagMonitor(threshold_ms=250)
+    monitor.start()
+"""
+
+import asyncio
+import functools
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from loguru import logger
+
+from src.utils.latency import summarize_latencies
+
+
+class BlockingExecutor:
+    """Bounded thread pool for blocking LLM and DB calls."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        session_factory: Optional[Callable[[], Any]] = None,
+        shared_session: Optional[Any] = None,
+    ):
+        """Initialize executor.
+
+        Args:
+            max_workers: Threads available for blocking calls
+            session_factory: Creates a fresh SQLAlchemy session per DB task.
+                If None, DB tasks run inline on the loop with shared_session
+                (a session bound to the loop thread cannot be handed to a
+                worker thread).
+            shared_session: Session used when there is no session_factory
+        """
+        self.max_workers = max_workers
+        self.session_factory = session_factory
+        self.shared_session = shared_session
+        self.pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="taad-blocking"
+        )
+
+    def install(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Make this pool the loop's default executor (asyncio.to_thread)."""
+        (loop or asyncio.get_running_loop()).set_default_executor(self.pool)
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def run_db(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn(session, *args, **kwargs)`` with a session of its own.
+
+        The session is committed on success, rolled back on error and closed
+        either way.
+        """
+        if self.session_factory is None:
+            return fn(self.shared_session, *args, **kwargs)
+
+        def task():
+            session = self.session_factory()
+            try:
+                result = fn(session, *args, **kwargs)
+                session.commit()
+                return result
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        return await self.run(task)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self.pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class LoopLagMonitor:
+    """Detect callbacks that block the event loop.
+
+    A loop task wakes every ``interval`` seconds and records how late it
+    woke (loop lag). A watchdog thread checks that the task keeps beating;
+    when the loop has been blocked for longer than ``threshold_ms`` it logs
+    the loop thread's current stack once per stall.
+    """
+
+    def __init__(self, threshold_ms: float = 250.0, interval: float = 0.1):
+        """Initialize monitor.
+
+        Args:
+            threshold_ms: Blocking time that triggers a warning and stack sample
+            interval: Seconds between loop heartbeats
+        """
+        self.threshold_ms = threshold_ms
+        self.interval = interval
+        self._lags: deque[float] = deque(maxlen=1000)
+        self.stalls = 0
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start the loop heartbeat task and the watchdog thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._beat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="taad-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    def lag_summary(self) -> dict:
+        """p50/p95/p99/max of loop wake-up lag (ms)."""
+        return summarize_latencies(list(self._lags))
+
+    async def _beat(self) -> None:
+        while not self._stopped.is_set():
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._lags.append(max(0.0, (now - expected) * 1000.0))
+            self._last_beat = now
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stopped.wait(self.interval):
+            beat = self._last_beat
+            blocked_ms = (time.monotonic() - beat) * 1000.0
+            if blocked_ms < self.threshold_ms or beat == reported_beat:
+                continue
+            reported_beat = beat
+            self.stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)[-12:]) if frame else "<unavailable>"
+            logger.warning(
+                f"Event loop blocked for {blocked_ms:.0f}ms "
+                f"(threshold {self.threshold_ms:.0f}ms); loop thread stack:\n{stack}"
+            )
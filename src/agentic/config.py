@@ -31,10 +31,17 @@ class ClaudeConfig(BaseModel):
     reasoning_model: str = "claude-sonnet-4-5-20250929"
     reflection_model: str = "claude-sonnet-4-5-20250929"
     embedding_model: str = "text-embedding-3-small"
+    embedding_index_dir: str = "data/decision_index"  # Local similarity index ("" = pgvector only)
+    embedding_dim: int = Field(default=256, ge=32)  # Local index vector size (hashed text embeddings)
     max_tokens: int = Field(default=1500, ge=256)
     temperature: float = Field(default=0.2, ge=0.0, le=1.0)
     daily_cost_cap_usd: float = Field(default=10.0, ge=0.0)
     max_retries: int = Field(default=3, ge=1)
+    prompt_caching: bool = True  # Cache the stable prompt prefix (system prompt, patterns)
+    streaming: bool = True  # Stream reasoning responses; act on actions as they complete
+    max_concurrent_requests: int = Field(default=4, ge=1)  # Claude calls in flight at once
+    requests_per_minute: int = Field(default=50, ge=1)
+    input_tokens_per_minute: int = Field(default=80000, ge=1000)
     reasoning_system_prompt: str = ""
     position_exit_system_prompt: str = ""
     reflection_system_prompt: str = ""
@@ -46,8 +53,17 @@ class DaemonConfig(BaseModel):
 
     client_id: int = Field(default=10, ge=1)  # Avoids conflicts with CLI (1), watch (2/4), sell (5)
     heartbeat_interval_seconds: int = Field(default=60, ge=10)
-    event_poll_interval_seconds: int = Field(default=5, ge=1)
+    event_poll_interval_seconds: int = Field(default=30, ge=1)  # Safety net; emits wake the bus
     max_events_per_cycle: int = Field(default=10, ge=1)
+    event_workers: int = Field(default=4, ge=1)  # Events processed concurrently
+    # Per-event-type concurrency caps (types not listed share event_workers)
+    event_type_concurrency: dict[str, int] = Field(
+        default_factory=lambda: {"POSITION_EXIT_CHECK": 3}
+    )
+    blocking_workers: int = Field(default=4, ge=1)  # Threads for blocking Claude/DB calls
+    loop_lag_threshold_ms: float = Field(default=250.0, ge=10)  # Log callbacks blocking the loop longer
+    exit_memo_ttl_seconds: int = Field(default=900, ge=0)  # Reuse unchanged exit-check decisions (0 = off)
+    exit_check_batch_size: int = Field(default=5, ge=1)  # Exit checks per Claude call in one cycle (1 = no batching)
     pid_file: str = "run/taad.pid"
     graceful_shutdown_timeout_seconds: int = Field(default=30, ge=5)
     reconnect_interval_seconds: int = Field(default=30, ge=10, le=300)
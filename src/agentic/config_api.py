@@ -300,10 +300,17 @@ const SECTIONS = {
       reasoning_model: {desc: 'Primary model for trade decisions', type: 'model'},
       reflection_model: {desc: 'Model for self-reflection pass', type: 'model'},
       embedding_model: {desc: 'Embedding model (not typically changed)', type: 'text'},
+      embedding_index_dir: {desc: 'Directory of the local similarity index for past decisions (empty = pgvector only)', type: 'text'},
+      embedding_dim: {desc: 'Local index vector size (changing it needs a fresh index directory)', type: 'number'},
       max_tokens: {desc: 'Max response tokens per call', type: 'number'},
       temperature: {desc: 'Sampling temperature (0=deterministic)', type: 'number', step: 0.1},
       daily_cost_cap_usd: {desc: 'Hard daily spend limit ($)', type: 'number', step: 0.5},
       max_retries: {desc: 'API retry attempts on failure', type: 'number'},
+      prompt_caching: {desc: 'Cache the stable prompt prefix (system prompt, pattern summaries) across calls', type: 'bool'},
+      streaming: {desc: 'Stream reasoning responses so a CLOSE_POSITION starts its pre-flight checks before the reasoning finishes', type: 'bool'},
+      max_concurrent_requests: {desc: 'Claude requests in flight at once (reasoning, reflection, CRO)', type: 'number'},
+      requests_per_minute: {desc: 'Claude request rate budget (per minute)', type: 'number'},
+      input_tokens_per_minute: {desc: 'Claude input-token rate budget (per minute)', type: 'number'},
     }
   },
   autonomy: {
@@ -345,8 +352,13 @@ const SECTIONS = {
     fields: {
       client_id: {desc: 'IBKR client ID (avoid conflicts)', type: 'number'},
       heartbeat_interval_seconds: {desc: 'Heartbeat interval', type: 'number'},
-      event_poll_interval_seconds: {desc: 'Event bus poll interval', type: 'number'},
+      event_poll_interval_seconds: {desc: 'Event bus safety-net poll interval (new events wake the bus immediately)', type: 'number'},
       max_events_per_cycle: {desc: 'Max events processed per cycle', type: 'number'},
+      event_workers: {desc: 'Events processed concurrently (same trade always in order)', type: 'number'},
+      blocking_workers: {desc: 'Threads for blocking Claude and database calls', type: 'number'},
+      loop_lag_threshold_ms: {desc: 'Log a stack sample when the event loop is blocked longer than this (ms)', type: 'number'},
+      exit_memo_ttl_seconds: {desc: 'Reuse an exit-check decision for an unchanged position for this long (seconds, 0 = off)', type: 'number'},
+      exit_check_batch_size: {desc: 'Grey-zone exit checks from one monitoring cycle judged in a single Claude call (1 = one call per position)', type: 'number'},
       pid_file: {desc: 'PID file path', type: 'text'},
       graceful_shutdown_timeout_seconds: {desc: 'Shutdown timeout', type: 'number'},
     }
@@ -0,0 +1,194 @@
+"""Versioned per-section cache for ReasoningContext assembly.
+
+Every event used to rebuild the whole reasoning context: open trades,
+stock positions and covered calls, patterns and closed trades from the DB,
+then live market data, option quotes for every position and staged
+candidates. A POSITION_EXIT_CHECK for one trade paid for all of it.
+
+The context is split into sections. Each section has a version number that
+is bumped by the events and actions that change it (a fill or close bumps
+positions/P&L/staged, a material VIX tick bumps market). A built section is
+reused while its version is unchanged and it is younger than its TTL; the
+TTL is a safety net for writers outside the daemon (CLI, dashboard).
+Event types only assemble the sections they reason over, and each build is
+timed per section.
+
+Usage:
+    cache = ContextSectionCache()
+    trades = cache.build(SECTION_POSITIONS, load_positions)   # builds
+    trades = cache.build(SECTION_POSITIONS, load_positions)   # cached copy
+    cache.invalidate_for_event("POSITION_CLOSED")             # next build reloads
+"""
+
+import copy
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional
+
+from src.utils.latency import summarize_latencies
+
+# DB-backed sections (built by WorkingMemory.assemble_context)
+SECTION_POSITIONS = "positions"  # open option trades, held stock, covered calls
+SECTION_PATTERNS = "patterns"
+SECTION_RECENT_TRADES = "recent_trades"
+# Live sections (built by the daemon's context enrichment)
+SECTION_MARKET = "market"  # VIX, VVIX, term structure, SPY
+SECTION_PNL = "pnl"  # live option quotes for open positions
+SECTION_STAGED = "staged"  # staged ScanOpportunity candidates
+
+ALL_SECTIONS = frozenset(
+    {
+        SECTION_POSITIONS,
+        SECTION_PATTERNS,
+        SECTION_RECENT_TRADES,
+        SECTION_MARKET,
+        SECTION_PNL,
+        SECTION_STAGED,
+    }
+)
+_POSITION_SECTIONS = frozenset({SECTION_POSITIONS, SECTION_MARKET, SECTION_PNL})
+
+# Sections each event type reasons over (other types get ALL_SECTIONS)
+EVENT_SECTIONS: dict[str, frozenset] = {
+    "POSITION_EXIT_CHECK": _POSITION_SECTIONS,
+    "RISK_LIMIT_BREACH": _POSITION_SECTIONS,
+}
+
+# Events whose arrival means these sections changed
+_TRADE_CHANGE = frozenset(
+    {SECTION_POSITIONS, SECTION_PNL, SECTION_RECENT_TRADES, SECTION_STAGED}
+)
+INVALIDATED_BY_EVENT: dict[str, frozenset] = {
+    "ORDER_FILLED": _TRADE_CHANGE,
+    "POSITION_CLOSED": _TRADE_CHANGE,
+    "MARKET_OPEN": ALL_SECTIONS,
+    "MARKET_CLOSE": ALL_SECTIONS,
+    "TWS_RECONNECTED": ALL_SECTIONS,
+    "WEEKLY_LEARNING": frozenset({SECTION_PATTERNS}),
+}
+
+# Executed actions that change these sections
+INVALIDATED_BY_ACTION: dict[str, frozenset] = {
+    "STAGE_CANDIDATES": frozenset({SECTION_STAGED}),
+    "EXECUTE_TRADES": _TRADE_CHANGE,
+    "CLOSE_POSITION": _TRADE_CHANGE,
+    "CLOSE_ALL_POSITIONS": _TRADE_CHANGE,
+}
+
+# Maximum age of a built section (seconds), whatever its version
+SECTION_TTL_SECONDS: dict[str, float] = {
+    SECTION_POSITIONS: 120.0,
+    SECTION_PATTERNS: 900.0,
+    SECTION_RECENT_TRADES: 300.0,
+    SECTION_MARKET: 60.0,
+    SECTION_PNL: 15.0,
+    SECTION_STAGED: 60.0,
+}
+
+# VIX move (points) that invalidates the market section
+MARKET_SECTION_VIX_STEP = 0.1
+
+
+def sections_for_event(event_type: Optional[str]) -> frozenset:
+    """Sections the given event type needs (all sections if unknown)."""
+    return EVENT_SECTIONS.get(event_type or "", ALL_SECTIONS)
+
+
+class ContextSectionCache:
+    """Context sections cached by version, with per-section build timings."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Per-section overrides of SECTION_TTL_SECONDS
+            clock: Time source (seconds)
+        """
+        self.ttl_seconds = {**SECTION_TTL_SECONDS, **(ttl_seconds or {})}
+        self._clock = clock
+        self.versions: dict[str, int] = {section: 0 for section in ALL_SECTIONS}
+        # section -> (version, built_at, value)
+        self._entries: dict[str, tuple[int, float, Any]] = {}
+        self._build_ms: dict[str, deque[float]] = {
+            section: deque(maxlen=500) for section in ALL_SECTIONS
+        }
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, *sections: str) -> None:
+        """Bump the version of each section so the next build reloads it."""
+        for section in sections:
+            self.versions[section] = self.versions.get(section, 0) + 1
+
+    def invalidate_for_event(self, event_type: Optional[str]) -> None:
+        self.invalidate(*INVALIDATED_BY_EVENT.get(event_type or "", ()))
+
+    def invalidate_for_action(self, action: Optional[str]) -> None:
+        self.invalidate(*INVALIDATED_BY_ACTION.get(action or "", ()))
+
+    def is_fresh(self, section: str) -> bool:
+        """Whether the section has a current, unexpired value."""
+        entry = self._entries.get(section)
+        if entry is None:
+            return False
+        version, built_at, _ = entry
+        return (
+            version == self.versions.get(section, 0)
+            and self._clock() - built_at < self.ttl_seconds.get(section, 0.0)
+        )
+
+    def get(self, section: str) -> Any:
+        """Copy of the section's current value, or None."""
+        if not self.is_fresh(section):
+            return None
+        return copy.deepcopy(self._entries[section][2])
+
+    def build(self, section: str, builder: Callable[[], Any]) -> Any:
+        """Return the cached section, or build, time and cache it.
+
+        The builder returns None to signal a partial/failed build, which is
+        returned but not cached.
+        """
+        if self.is_fresh(section):
+            self.hits += 1
+            return copy.deepcopy(self._entries[section][2])
+        self.misses += 1
+        version = self.versions.get(section, 0)
+        start = time.perf_counter()
+        value = builder()
+        self._store(section, version, start, value)
+        return value
+
+    async def build_async(
+        self, section: str, builder: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """build() for a coroutine builder."""
+        if self.is_fresh(section):
+            self.hits += 1
+            return copy.deepcopy(self._entries[section][2])
+        self.misses += 1
+        version = self.versions.get(section, 0)
+        start = time.perf_counter()
+        value = await builder()
+        self._store(section, version, start, value)
+        return value
+
+    def _store(self, section: str, version: int, start: float, value: Any) -> None:
+        self._build_ms[section].append((time.perf_counter() - start) * 1000.0)
+        if value is not None:
+            # Versioned as of build start: an invalidation during the build
+            # leaves the entry stale
+            self._entries[section] = (version, self._clock(), copy.deepcopy(value))
+
+    def build_time_summary(self, sections: Optional[Iterable[str]] = None) -> dict:
+        """Per-section build time percentiles (ms), for sections built so far."""
+        return {
+            section: summarize_latencies(list(self._build_ms[section]))
+            for section in sorted(sections or ALL_SECTIONS)
+            if self._build_ms.get(section)
+        }
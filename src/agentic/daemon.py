@@ -3,6 +3,10 @@
 TAADDaemon.run() is the async main loop. Each event goes through an 8-step
 pipeline: assemble context -> check mandatory triggers -> reason with Claude
 -> log decision -> check autonomy gate -> execute -> update memory -> heartbeat.
+Events are claimed in batches and run on an EventWorkerPool, so a slow
+Claude call for one position does not hold up the others. Blocking Claude
+and DB work runs on a BlockingExecutor thread pool, IBKR work uses native
+awaitables, and a LoopLagMonitor logs anything that still stalls the loop.
 
 Graceful degradation:
 - TWS disconnect: pause + reconnect loop
@@ -21,6 +25,7 @@ import signal
 import subprocess
 import threading
 import time
+from collections.abc import Callable
 from datetime import datetime, date, timedelta
 from typing import Optional
 from uuid import uuid4
@@ -32,10 +37,27 @@ from sqlalchemy import func as sa_func
 from sqlalchemy.orm import Session
 
 from src.agentic.action_executor import ActionExecutor
+from src.agentic.action_stream import EarlyAction
 from src.agents.cro_agent import CROAgent, CROAssessment
+from src.agents.llm_limiter import configure_limiter, get_limiter
 from src.agentic.autonomy_governor import AutonomyGovernor
+from src.agentic.blocking import BlockingExecutor, LoopLagMonitor
 from src.agentic.config import Phase5Config, load_phase5_config
+from src.agentic.context_sections import (
+    SECTION_MARKET,
+    SECTION_PNL,
+    SECTION_STAGED,
+    sections_for_event,
+)
 from src.agentic.event_bus import EventBus, EventType
+from src.agentic.event_workers import EventWorkerPool
+from src.agentic.exit_memo import (
+    DECISION_SOURCE as EXIT_MEMO_SOURCE,
+    ExitDecisionMemo,
+    MemoEntry,
+    exit_check_fingerprint,
+    vix_regime,
+)
 from src.agentic.guardrails.context_validator import ContextValidator
 from src.agentic.guardrails.execution_gate import ExecutionGate
 from src.agentic.guardrails.monitoring import ConfidenceCalibrator, ReasoningEntropyMonitor
@@ -44,10 +66,15 @@ from src.agentic.guardrails.output_validator import OutputValidator
 from src.agentic.guardrails.registry import GuardrailRegistry
 from src.agentic.health_monitor import HealthMonitor
 from src.agentic.learning_loop import LearningLoop
-from src.agentic.reasoning_engine import ClaudeReasoningEngine, DecisionOutput
+from src.agentic.reasoning_engine import (
+    ClaudeReasoningEngine,
+    DecisionOutput,
+    exit_check_positions,
+)
+from src.agentic.vector_index import LocalVectorIndex
 from src.agentic.working_memory import ReasoningContext, WorkingMemory
 from src.config.base import IBKRConfig, get_config
-from src.data.database import get_db_session, init_database
+from src.data.database import get_db_session, get_session, init_database
 from src.data.models import (
     DaemonEvent,
     DaemonNotification,
@@ -64,6 +91,12 @@ from src.config.exchange_profile import get_active_profile as _get_active_profil
 
 ET = _get_active_profile().timezone
 
+# Oldest shared market-conditions snapshot accepted for context enrichment
+MARKET_DATA_MAX_AGE_SECONDS = 60
+
+# Position fields set by live P&L enrichment (cached as the "pnl" section)
+_PNL_FIELDS = ("current_mid", "pnl", "pnl_pct", "pnl_source")
+
 
 class TAADDaemon:
     """The Autonomous Agentic Trading Daemon (TAAD).
@@ -72,6 +105,9 @@ class TAADDaemon:
     and executes actions through existing trading infrastructure.
     """
 
+    exit_memo: Optional[ExitDecisionMemo] = None
+    exit_check_batch_size: int = 1
+
     def __init__(
         self,
         config: Optional[Phase5Config] = None,
@@ -86,6 +122,8 @@ class TAADDaemon:
         self.config = config or load_phase5_config()
         self._db_session = db_session
         self._running = False
+        self.blocking: Optional[BlockingExecutor] = None
+        self.loop_monitor: Optional[LoopLagMonitor] = None
 
     def _init_components(self, db: Session) -> None:
         """Initialize all daemon components with a database session.
@@ -115,10 +153,40 @@ class TAADDaemon:
             )
 
         self.event_bus = EventBus(db)
-        self.memory = WorkingMemory(db)
+        self.memory = WorkingMemory(db, vector_index=self._open_vector_index())
+        if self.memory.vector_index is not None:
+            try:
+                added = self.memory.sync_vector_index()
+                logger.info(
+                    f"Decision vector index: {self.memory.vector_index.count} vectors "
+                    f"({added} backfilled)"
+                )
+            except Exception as e:
+                logger.warning(f"Decision vector index sync failed, using pgvector only: {e}")
+                self.memory.vector_index = None
+        self.exit_memo = ExitDecisionMemo(
+            ttl_seconds=self.config.daemon.exit_memo_ttl_seconds
+        )
+        self.exit_check_batch_size = self.config.daemon.exit_check_batch_size
         self.governor = AutonomyGovernor(db, self.config.autonomy)
+        # Standalone runs give worker threads their own sessions; an injected
+        # session (tests) is shared and DB tasks stay on the loop
+        session_factory = None if self._db_session else get_session
+        self.blocking = BlockingExecutor(
+            max_workers=self.config.daemon.blocking_workers,
+            session_factory=session_factory,
+            shared_session=db,
+        )
+        configure_limiter(
+            max_concurrency=self.config.claude.max_concurrent_requests,
+            requests_per_minute=self.config.claude.requests_per_minute,
+            tokens_per_minute=self.config.claude.input_tokens_per_minute,
+        )
         self.reasoning = ClaudeReasoningEngine(
-            db, self.config.claude, entry_days=self.config.strategy.entry_days
+            db,
+            self.config.claude,
+            entry_days=self.config.strategy.entry_days,
+            session_factory=session_factory,
         )
         self.health = HealthMonitor(
             db,
@@ -189,6 +257,7 @@ class TAADDaemon:
             position_monitor=self.position_monitor,
             ibkr_client=self.ibkr_client,
             market_calendar=self.calendar,
+            context_cache=self.memory.context_cache,
         )
 
         # Initialize CRO (Chief Risk Officer) adversarial agent
@@ -227,6 +296,17 @@ class TAADDaemon:
             )
             self.memory.set_autonomy_level(effective)
 
+    def _open_vector_index(self) -> Optional[LocalVectorIndex]:
+        """Local similarity index for past decisions, None if disabled or unusable."""
+        index_dir = self.config.claude.embedding_index_dir
+        if not index_dir:
+            return None
+        try:
+            return LocalVectorIndex(dim=self.config.claude.embedding_dim, path=index_dir)
+        except Exception as e:
+            logger.warning(f"Decision vector index unavailable, using pgvector only: {e}")
+            return None
+
     @staticmethod
     def _market_timestamp() -> str:
         """Current time formatted in the active exchange timezone."""
@@ -298,11 +378,26 @@ class TAADDaemon:
                     sig,
                 )
 
+            # Bound every to_thread() call by the blocking pool, and watch
+            # for callbacks that still block the loop
+            self.blocking.install(loop)
+            self.loop_monitor = LoopLagMonitor(
+                threshold_ms=self.config.daemon.loop_lag_threshold_ms
+            )
+            self.loop_monitor.start()
+
             # Start background tasks
             heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             time_emitter_task = asyncio.create_task(self._time_based_emitter())
             event_detector_task = asyncio.create_task(self.event_detector.run())
 
+            # Open the shared market-conditions streams so the first
+            # enrichment and gate checks read a warm snapshot
+            if self.ibkr_client is not None and self.ibkr_client.is_connected():
+                from src.services.market_conditions import get_market_conditions_service
+
+                get_market_conditions_service(self.ibkr_client).start()
+
             logger.info(
                 f"Daemon running (pid={__import__('os').getpid()}, "
                 f"autonomy=L{self.governor.level})"
@@ -337,21 +432,30 @@ class TAADDaemon:
                     )
                     self.event_bus.emit(EventType.MARKET_CLOSE)
 
-            # Main event processing loop
+            # Main event processing loop: events are claimed in batches and
+            # processed concurrently (one at a time per trade/position)
+            workers = EventWorkerPool(
+                lambda event: self._process_claimed_event(event, db),
+                max_workers=self.config.daemon.event_workers,
+                type_limits=self.config.daemon.event_type_concurrency,
+            )
             async for event in self.event_bus.stream(
                 poll_interval=self.config.daemon.event_poll_interval_seconds,
                 max_events=self.config.daemon.max_events_per_cycle,
+                claim=True,
             ):
                 if self.health.shutdown_requested:
                     logger.info("Shutdown requested, stopping event loop")
+                    self.event_bus.release(event)
                     break
 
                 # Check if paused
                 if self.health.is_paused():
+                    self.event_bus.release(event)
                     await asyncio.sleep(5)
                     continue
 
-                await self._process_event(event, db)
+                await workers.submit(event)
 
         except asyncio.CancelledError:
             logger.info("Daemon cancelled")
@@ -362,6 +466,14 @@ class TAADDaemon:
             self._running = False
             self.event_bus.stop()
 
+            # Let in-flight events finish (cancelled ones are reset to
+            # 'pending' on the next startup)
+            workers = locals().get("workers")
+            if workers is not None:
+                await workers.drain(
+                    timeout=self.config.daemon.graceful_shutdown_timeout_seconds
+                )
+
             # Cancel background tasks
             for task_name in ("heartbeat_task", "time_emitter_task", "event_detector_task"):
                 task = locals().get(task_name)
@@ -372,6 +484,19 @@ class TAADDaemon:
                     except asyncio.CancelledError:
                         pass
 
+            # Fold the memory journal into its snapshot for a fast restart
+            memory = getattr(self, "memory", None)
+            if memory is not None:
+                try:
+                    memory.save()
+                except Exception as e:
+                    logger.warning(f"Working memory compaction failed: {e}")
+
+            if self.loop_monitor is not None:
+                self.loop_monitor.stop()
+            if self.blocking is not None:
+                self.blocking.shutdown()
+
             self.health.stop()
 
             # Disconnect IBKR client if connected
@@ -410,7 +535,48 @@ class TAADDaemon:
         t = threading.Thread(target=_force_exit, daemon=True)
         t.start()
 
-    async def _process_event(self, event: DaemonEvent, db: Session) -> None:
+    async def _process_claimed_event(self, event: DaemonEvent, db: Session) -> None:
+        """Event worker entry point: process a claimed event on its own session.
+
+        Concurrent workers must not share one Session, or their commits and
+        rollbacks interleave at await points. Standalone runs give each event
+        a fresh session; an injected session (tests) is shared.
+        """
+        if self._db_session is not None:
+            await self._process_event(event, db, claimed=True)
+            return
+        session = get_session()
+        try:
+            own_event = session.get(DaemonEvent, event.id)
+            if own_event is None:
+                logger.warning(f"Claimed event {event.id} no longer exists")
+                return
+            await self._process_event(own_event, session, claimed=True)
+        finally:
+            session.close()
+
+    async def _offload_db(self, fn: Callable[[Session], object], db: Session) -> object:
+        """Run a DB-only hook on the blocking pool with a session of its own.
+
+        Hooks that touch IBKR, the event bus or in-memory state must stay on
+        the loop. Without per-task sessions (an injected session), the hook
+        runs inline on ``db``.
+
+        Args:
+            fn: Callable taking a session
+            db: The event's session, used when nothing can be offloaded
+
+        Returns:
+            Whatever fn returns
+        """
+        blocking = getattr(self, "blocking", None)
+        if blocking is None or blocking.session_factory is None:
+            return fn(db)
+        return await blocking.run_db(fn)
+
+    async def _process_event(
+        self, event: DaemonEvent, db: Session, claimed: bool = False
+    ) -> None:
         """Process a single event through the 8-step pipeline.
 
         Steps:
@@ -426,19 +592,26 @@ class TAADDaemon:
         Args:
             event: The event to process
             db: Database session
+            claimed: Event was already claimed (claim_pending_events)
         """
         # Early exit if shutdown was requested while this event was queued
         if self.health.shutdown_requested:
+            if claimed:
+                self.event_bus.release(event)
             return
 
         event_type = event.event_type
-        if not self.event_bus.mark_processing(event):
+        if not claimed and not self.event_bus.mark_processing(event):
             logger.debug(f"Event {event.id} no longer claimable — skipping")
             return
         self.health.record_event(event_type)
 
         logger.info(f"Processing event: {event_type} (id={event.id})")
 
+        # Fills, closes and alerts make memoized exit decisions stale
+        if self.exit_memo is not None:
+            self.exit_memo.invalidate_for_event(event_type)
+
         # Skip stale MARKET_OPEN/SCHEDULED_CHECK/POSITION_EXIT_CHECK events
         # replayed after hours. These pile up when the daemon is killed during
         # market hours and restarted after close — replaying them wastes
@@ -465,7 +638,7 @@ class TAADDaemon:
             # closed by any path (bracket fills, market order retries, etc.)
             # since the last check. Runs BEFORE _monitor_positions so the
             # dashboard and Claude context are clean.
-            self._auto_dismiss_closed_position_decisions(db)
+            await self._offload_db(self._auto_dismiss_closed_position_decisions, db)
             await self._monitor_positions(db)
 
         if event_type == "MARKET_OPEN":
@@ -490,10 +663,11 @@ class TAADDaemon:
         if event_type == "MARKET_CLOSE":
             await self._run_eod_sync(db)
             await self._close_expired_positions(db)
-            self._auto_reject_stale_guardrail_blocks(db)
+            await self._offload_db(self._auto_reject_stale_guardrail_blocks, db)
             self._calibrate_closed_trades(db)
             self._persist_guardrail_metrics(db)
             self._record_clean_day(db)
+            await self._offload_db(self._run_retention, db)
 
         # Route learning events directly to the learning loop —
         # these bypass the normal Claude reasoning pipeline.
@@ -505,12 +679,40 @@ class TAADDaemon:
             await self._handle_weekly_learning(event, db)
             return
 
+        preflights: list[asyncio.Task] = []
         try:
+            # Step 0.5: Reuse a recent exit decision for each position where
+            # nothing material changed (fingerprint from the payload and cached
+            # state, before enrichment); only the rest go to Claude
+            event_payload = event.payload
+            memo_fps: dict[str, str] = {}
+            if event_type == "POSITION_EXIT_CHECK" and self.exit_memo is not None:
+                misses = []
+                for position in exit_check_positions(event.payload):
+                    trade_id = str(position.get("trade_id"))
+                    memo_fp = exit_check_fingerprint(
+                        position,
+                        vix=(self.memory.market_context or {}).get("vix"),
+                        autonomy_level=self.governor.level,
+                    )
+                    memo_entry = self.exit_memo.lookup(trade_id, memo_fp)
+                    if memo_entry is not None:
+                        self._apply_exit_memo(event, db, memo_entry, trade_id)
+                        continue
+                    if memo_fp is not None:
+                        memo_fps[trade_id] = memo_fp
+                    misses.append(position)
+                if not misses:
+                    self.event_bus.mark_completed(event)
+                    return
+                if "positions" in (event.payload or {}):
+                    event_payload = misses[0] if len(misses) == 1 else {"positions": misses}
+
             # Step 1: Assemble context
             context = self.memory.assemble_context(event_type)
 
             # Step 1.5: Enrich context with live IBKR data
-            await self._enrich_context(context, db)
+            await self._enrich_context(context, db, event_type)
 
             # Step 1.6: Pre-Claude context validation (Phase 6)
             all_guardrail_results = []
@@ -583,8 +785,7 @@ class TAADDaemon:
                     )]
                     skip_claude = True
                 else:
-                    self.memory.last_scheduled_fingerprint = fp
-                    self.memory.save()
+                    self.memory.set_scheduled_fingerprint(fp)
 
             if not skip_claude:
                 # Step 2: Reason with Claude
@@ -592,12 +793,17 @@ class TAADDaemon:
                 # Run in a thread so the event loop stays responsive to
                 # SIGINT/SIGTERM — without this, Ctrl+C hangs until
                 # the Claude API call completes.
+                # A CLOSE_POSITION that streams in early starts its pre-flight
+                # (contract qualify) while the reasoning is still arriving.
                 decisions = await asyncio.to_thread(
                     self.reasoning.reason,
                     context=context,
                     event_type=event_type,
-                    event_payload=event.payload,
+                    event_payload=event_payload,
+                    on_early_action=self._close_preflight_starter(preflights),
                 )
+                if preflights:
+                    await asyncio.gather(*preflights, return_exceptions=True)
 
                 # Check shutdown between Claude response and execution —
                 # if the user pressed Ctrl+C while Claude was thinking,
@@ -664,7 +870,12 @@ class TAADDaemon:
                 # Deduplicate: if the same trade-affecting action was already
                 # decided within the last 90 seconds, suppress the duplicate.
                 if decision.action in ("EXECUTE_TRADES", "CLOSE_POSITION", "CLOSE_ALL_POSITIONS") and not skip_claude:
-                    dominated = self._is_duplicate_decision(decision.action)
+                    dominated = self._is_duplicate_decision(
+                        decision.action,
+                        trade_id=(decision.metadata or {}).get("trade_id")
+                        if event_type == "POSITION_EXIT_CHECK"
+                        else None,
+                    )
                     if dominated:
                         logger.info(
                             f"Suppressing duplicate {decision.action} — "
@@ -869,6 +1080,12 @@ class TAADDaemon:
                 else:
                     result = await self.executor.execute(decision, context=exec_context)
 
+                # Fills, closes and staging change the context sections
+                if result.success:
+                    self.memory.context_cache.invalidate_for_action(decision.action)
+                    if self.exit_memo is not None:
+                        self.exit_memo.invalidate_for_action(decision.action)
+
                 # Update audit with execution result
                 audit.autonomy_approved = result.success and result.action != "REQUEST_HUMAN_REVIEW"
                 audit.executed = result.success and result.action not in ("MONITOR_ONLY", "REQUEST_HUMAN_REVIEW")
@@ -885,6 +1102,19 @@ class TAADDaemon:
                 db.add(audit)
                 db.commit()
 
+                # Memoize Claude's exit decision (fallbacks carry no call cost
+                # and are never reused)
+                call_cost = (decision.metadata or {}).get("call_cost_usd")
+                memo_trade_id = str((decision.metadata or {}).get("trade_id"))
+                if memo_trade_id in memo_fps and call_cost is not None:
+                    self.exit_memo.store(
+                        memo_trade_id,
+                        memo_fps[memo_trade_id],
+                        decision,
+                        cost_usd=call_cost,
+                        audit_id=audit.id,
+                    )
+
                 # Emergency notification for CLOSE_ALL_POSITIONS
                 if decision.action == "CLOSE_ALL_POSITIONS" and result.success:
                     self._upsert_notification(
@@ -938,6 +1168,8 @@ class TAADDaemon:
                         "executed": audit.executed,
                         "result": result.message[:200] if result.message else "",
                     }
+                    if (decision.metadata or {}).get("trade_id"):
+                        decision_entry["trade_id"] = str(decision.metadata["trade_id"])
                     # Enrich EXECUTE_TRADES with fill counts for Claude feedback
                     if decision.action == "EXECUTE_TRADES" and result.data:
                         decision_entry["filled_count"] = result.data.get("filled_count")
@@ -952,7 +1184,8 @@ class TAADDaemon:
 
             # After plan loop: safety net for material positions Claude missed
             if event_type == "SCHEDULED_CHECK":
-                self._emit_material_position_checks(db, set())
+                prices = await self._fetch_position_prices(db)
+                self._emit_material_position_checks(db, set(), prices)
 
             # Mark event complete (after ALL actions processed)
             self.event_bus.mark_completed(event)
@@ -961,6 +1194,14 @@ class TAADDaemon:
             logger.error(f"Event processing failed: {e}", exc_info=True)
             self.event_bus.mark_failed(event, str(e))
             self.health.record_error()
+        finally:
+            # Closes that ended as MONITOR_ONLY or were blocked never
+            # consume their pre-flight contract; drop only this event's
+            if preflights:
+                prepared = await asyncio.gather(*preflights, return_exceptions=True)
+                self.executor.discard_preflights(
+                    [key for key in prepared if isinstance(key, str)]
+                )
 
     def _escalate_guardrail_block(
         self,
@@ -1482,15 +1723,24 @@ class TAADDaemon:
         try:
             from src.data.repositories import TradeRepository
             from src.services.order_reconciliation import OrderReconciliation
+            from src.services.reconciliation_watermark import (
+                ReconciliationWatermarkStore,
+            )
 
             trade_repo = TradeRepository(db)
-            reconciler = OrderReconciliation(self.ibkr_client, trade_repo)
+            reconciler = OrderReconciliation(
+                self.ibkr_client,
+                trade_repo,
+                watermarks=ReconciliationWatermarkStore(db),
+            )
 
-            # Step 1: Sync orders
+            # Step 1: Sync orders (incremental from the shared watermark)
             logger.info("[1/2] Syncing orders with IBKR...")
             sync_report = await reconciler.sync_all_orders(include_filled=True)
             logger.info(
-                f"  Sync complete: {sync_report.total_reconciled} reconciled, "
+                f"  Sync complete ({sync_report.mode}): "
+                f"{sync_report.total_reconciled} reconciled, "
+                f"{sync_report.unchanged} unchanged, "
                 f"{sync_report.total_discrepancies} discrepancies, "
                 f"{len(sync_report.orphans)} orphans"
             )
@@ -2004,7 +2254,10 @@ class TAADDaemon:
         self._auto_dismiss_closed_position_decisions(db)
 
     def _emit_material_position_checks(
-        self, db: Session, exited_pids: set[str]
+        self,
+        db: Session,
+        exited_pids: set[str],
+        prices: Optional[dict[str, float]] = None,
     ) -> int:
         """Emit POSITION_EXIT_CHECK events for positions in the grey zone.
 
@@ -2015,16 +2268,19 @@ class TAADDaemon:
 
         Grey zone: +50% ≤ P&L < +75% (profit) or -100% ≥ P&L > -300% (loss).
 
-        Each event includes an escalation_reason explaining WHY the rule
-        engine couldn't decide, plus available risk data (delta, IV, etc.)
-        from position snapshots.
+        Each position's payload includes an escalation_reason explaining WHY
+        the rule engine couldn't decide, plus available risk data (delta, IV,
+        etc.) from position snapshots. Positions escalated in the same cycle
+        are coalesced into batched events of up to exit_check_batch_size
+        positions, so they share one Claude call.
 
         Args:
             db: Database session
             exited_pids: Position IDs already exited deterministically (skip these)
+            prices: Live mid prices keyed by trade_id (_fetch_position_prices)
 
         Returns:
-            Number of events emitted
+            Number of positions sent for an exit check
         """
         open_trades = (
             db.query(Trade)
@@ -2065,7 +2321,7 @@ class TAADDaemon:
         except Exception as e:
             logger.debug(f"Margin query failed: {e}")
 
-        emitted = 0
+        exit_payloads = []
         for trade in open_trades:
             if trade.trade_id in exited_pids:
                 continue
@@ -2075,7 +2331,7 @@ class TAADDaemon:
             if str(trade.trade_id) in suppressed_tids:
                 continue
 
-            pnl_pct = self._get_position_pnl_pct(trade, db)
+            pnl_pct = self._get_position_pnl_pct(trade, db, prices)
             if pnl_pct is None:
                 continue
 
@@ -2093,7 +2349,7 @@ class TAADDaemon:
             snapshot_data = self._get_latest_snapshot_data(trade, db)
 
             # Find same-sector positions
-            sector_context = self._get_sector_context(trade, open_trades, db)
+            sector_context = self._get_sector_context(trade, open_trades, db, prices)
 
             # Earnings proximity (24h-cached per symbol)
             earnings_in_dte = None
@@ -2114,9 +2370,8 @@ class TAADDaemon:
             except Exception as e:
                 logger.debug(f"Earnings query failed for {trade.symbol}: {e}")
 
-            self.event_bus.emit(
-                EventType.POSITION_EXIT_CHECK,
-                payload={
+            exit_payloads.append(
+                {
                     "trade_id": trade.trade_id,
                     "symbol": trade.symbol,
                     "strike": trade.strike,
@@ -2132,9 +2387,8 @@ class TAADDaemon:
                     "earnings_in_dte": earnings_in_dte,
                     "days_to_earnings": days_to_earnings,
                     "earnings_date": earnings_date_str,
-                },
+                }
             )
-            emitted += 1
             opt_code = (trade.option_type or "PUT")[0]
             logger.info(
                 f"POSITION_EXIT_CHECK emitted: {trade.symbol} "
@@ -2142,10 +2396,24 @@ class TAADDaemon:
                 f"reason: {escalation}"
             )
 
-        if emitted:
-            logger.info(f"Emitted {emitted} per-position exit check(s)")
+        # One event per batch of positions (a batch of one is a plain check)
+        size = max(1, self.exit_check_batch_size)
+        batches = [
+            exit_payloads[i:i + size] for i in range(0, len(exit_payloads), size)
+        ]
+        for batch in batches:
+            self.event_bus.emit(
+                EventType.POSITION_EXIT_CHECK,
+                payload=batch[0] if len(batch) == 1 else {"positions": batch},
+            )
+
+        if exit_payloads:
+            logger.info(
+                f"Emitted {len(exit_payloads)} per-position exit check(s) "
+                f"in {len(batches)} event(s)"
+            )
 
-        return emitted
+        return len(exit_payloads)
 
     def _build_escalation_context(
         self, trade: Trade, pnl_pct: float, dte: int, db: Session
@@ -2300,7 +2568,11 @@ class TAADDaemon:
         return result
 
     def _get_sector_context(
-        self, trade: Trade, all_trades: list[Trade], db: Session
+        self,
+        trade: Trade,
+        all_trades: list[Trade],
+        db: Session,
+        prices: Optional[dict[str, float]] = None,
     ) -> str:
         """Find other open positions in the same sector.
 
@@ -2320,7 +2592,7 @@ class TAADDaemon:
                 if t.trade_id == trade.trade_id:
                     continue
                 if get_sector(t.symbol) == target_sector:
-                    pnl = self._get_position_pnl_pct(t, db)
+                    pnl = self._get_position_pnl_pct(t, db, prices)
                     peer_pnls.append(pnl)
                     pnl_str = f"{pnl:+.0f}%" if pnl is not None else "?"
                     from src.utils.timezone import trading_date
@@ -2346,11 +2618,88 @@ class TAADDaemon:
             logger.debug(f"Sector context failed: {e}")
             return "Unknown"
 
-    def _get_position_pnl_pct(self, trade: Trade, db: Session) -> Optional[float]:
+    def _cached_position_price(self, trade: Trade) -> Optional[float]:
+        """Price from the position monitor's cache, None if it has none."""
+        if self.position_monitor:
+            try:
+                cached = self.position_monitor.get_position_price(trade.trade_id)
+                if cached and cached > 0:
+                    return cached
+            except (AttributeError, Exception):
+                pass
+        return None
+
+    async def _fetch_position_prices(self, db: Session) -> dict[str, float]:
+        """Live mid prices for open positions the monitor has no price for.
+
+        Contracts are qualified and quoted concurrently with ib_async's
+        native awaitables (1s timeout per quote), so the exit-check sweep
+        never waits on IBKR round-trips one position at a time.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Mid price keyed by trade_id
+        """
+        if self.ibkr_client is None or not self.ibkr_client.is_connected():
+            return {}
+
+        trade_ids, contracts = [], []
+        for trade in db.query(Trade).filter(Trade.exit_date.is_(None)).all():
+            if not trade.entry_premium or self._cached_position_price(trade) is not None:
+                continue
+            exp_str = str(trade.expiration).replace("-", "")
+            if len(exp_str) != 8:
+                continue
+            try:
+                contracts.append(
+                    self.ibkr_client.get_option_contract(
+                        symbol=trade.symbol,
+                        expiration=exp_str,
+                        strike=trade.strike,
+                        right=(trade.option_type or "PUT")[0],  # "P" or "C"
+                    )
+                )
+                trade_ids.append(trade.trade_id)
+            except Exception as e:
+                logger.debug(f"P&L quote failed for {trade.symbol}: {e}")
+
+        # One qualify call per contract keeps results aligned with trades
+        qualified_results = await asyncio.gather(
+            *(self.ibkr_client.qualify_contracts_async(c) for c in contracts),
+            return_exceptions=True,
+        )
+        to_quote = [
+            (trade_id, result[0])
+            for trade_id, result in zip(trade_ids, qualified_results)
+            if isinstance(result, list) and result
+        ]
+        quotes = await asyncio.gather(
+            *(self.ibkr_client.get_quote(q, timeout=1.0) for _, q in to_quote),
+            return_exceptions=True,
+        )
+
+        prices = {}
+        for (trade_id, _), quote in zip(to_quote, quotes):
+            if isinstance(quote, Exception):
+                logger.debug(f"P&L quote failed for {trade_id}: {quote}")
+                continue
+            if quote.is_valid and quote.bid > 0 and quote.ask > 0:
+                prices[trade_id] = (quote.bid + quote.ask) / 2
+        return prices
+
+    def _get_position_pnl_pct(
+        self,
+        trade: Trade,
+        db: Session,
+        prices: Optional[dict[str, float]] = None,
+    ) -> Optional[float]:
         """Compute P&L percentage for an open position.
 
-        Uses the position_monitor's cached price if available, otherwise
-        attempts a live IBKR quote. Returns None if price unavailable.
+        Uses the position_monitor's cached price if available, otherwise a
+        live price fetched beforehand by _fetch_position_prices(). Returns
+        None if price unavailable.
 
         P&L% = (entry_premium - current_price) / entry_premium * 100
         Positive = profit (option value decreased), Negative = loss.
@@ -2358,6 +2707,7 @@ class TAADDaemon:
         Args:
             trade: Open Trade record
             db: Database session
+            prices: Live mid prices keyed by trade_id
 
         Returns:
             P&L percentage or None if price unavailable
@@ -2365,44 +2715,9 @@ class TAADDaemon:
         if not trade.entry_premium or trade.entry_premium <= 0:
             return None
 
-        current_price = None
-
-        # Try position monitor cache first
-        if self.position_monitor:
-            try:
-                cached = self.position_monitor.get_position_price(trade.trade_id)
-                if cached and cached > 0:
-                    current_price = cached
-            except (AttributeError, Exception):
-                pass
-
-        # Fall back to live quote
-        if current_price is None and self.ibkr_client and self.ibkr_client.is_connected():
-            try:
-                exp_str = str(trade.expiration).replace("-", "")
-                if len(exp_str) == 10:  # "YYYY-MM-DD" format
-                    exp_str = exp_str.replace("-", "")
-                if len(exp_str) != 8:
-                    return None
-
-                right = (trade.option_type or "PUT")[0]  # "P" or "C"
-                contract = self.ibkr_client.get_option_contract(
-                    symbol=trade.symbol,
-                    expiration=exp_str,
-                    strike=trade.strike,
-                    right=right,
-                )
-                qualified = self.ibkr_client.qualify_contract(contract)
-                if qualified:
-                    import asyncio
-                    quote = asyncio.get_event_loop().run_until_complete(
-                        self.ibkr_client.get_quote(qualified, timeout=1.0)
-                    )
-                    if quote.is_valid and quote.bid > 0 and quote.ask > 0:
-                        current_price = (quote.bid + quote.ask) / 2
-            except Exception as e:
-                logger.debug(f"P&L quote failed for {trade.symbol}: {e}")
-                return None
+        current_price = self._cached_position_price(trade)
+        if current_price is None and prices:
+            current_price = prices.get(trade.trade_id)
 
         if current_price is None:
             return None
@@ -2522,9 +2837,10 @@ class TAADDaemon:
                 .all()
             )
             for event in pending_events:
-                tid = (event.payload or {}).get("trade_id")
-                if tid:
-                    suppressed_trade_ids.add(str(tid))
+                for position in exit_check_positions(event.payload):
+                    tid = position.get("trade_id")
+                    if tid:
+                        suppressed_trade_ids.add(str(tid))
 
         except Exception as e:
             logger.warning(f"Could not query suppressed close decisions: {e}")
@@ -2590,6 +2906,9 @@ class TAADDaemon:
                 "exit_price": exit_price,
             },
         )
+        self.memory.context_cache.invalidate_for_event(EventType.POSITION_CLOSED.value)
+        if self.exit_memo is not None:
+            self.exit_memo.invalidate_for_event(EventType.POSITION_CLOSED.value)
         # Immediate feedback to governor + learning
         self._record_trade_outcome(position_id, db)
 
@@ -2741,7 +3060,12 @@ class TAADDaemon:
             )
 
             # Step 1: Run the core learning cycle (pure Python, no API cost)
-            report = self.learning.run_weekly_learning()
+            # on a worker thread with a session of its own
+            report = await self.blocking.run_db(
+                lambda session: self.learning.run_weekly_learning(db_session=session)
+            )
+
+            self.memory.context_cache.invalidate_for_event(event.event_type)
 
             if report.get("error"):
                 logger.error(f"Weekly learning failed: {report['error']}")
@@ -2869,6 +3193,22 @@ class TAADDaemon:
         except Exception as e:
             logger.error(f"Clean day recording failed: {e}", exc_info=True)
 
+    def _run_retention(self, db: Session) -> None:
+        """Archive daemon_events/decision_audit/cost/metric rows past retention.
+
+        Called at MARKET_CLOSE, after the EOD tasks that read today's rows.
+
+        Args:
+            db: Database session
+        """
+        from src.services.retention import RetentionService
+
+        try:
+            RetentionService(db).run()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Retention run failed: {e}")
+
     def _calibrate_closed_trades(self, db: Session) -> int:
         """Feed today's closed trades into the confidence calibrator.
 
@@ -3306,16 +3646,22 @@ class TAADDaemon:
         )
         return decision
 
-    def _is_duplicate_decision(self, action: str, window_seconds: int = 90) -> int | None:
+    def _is_duplicate_decision(
+        self, action: str, window_seconds: int = 90, trade_id: Optional[str] = None
+    ) -> int | None:
         """Check if the same action was already decided recently.
 
         Scans recent_decisions for the same action within *window_seconds*.
+        With a trade_id, decisions recorded for a different trade don't
+        count (several positions closed from one batched exit check).
         Returns the age in seconds if a duplicate is found, else None.
         """
         now = datetime.now(ET)
         for d in reversed(list(self.memory.recent_decisions)):
             if d.get("action") != action:
                 continue
+            if trade_id and d.get("trade_id") and d["trade_id"] != str(trade_id):
+                continue
             ts_str = d.get("timestamp", "")
             try:
                 # _market_timestamp() produces "2026-03-03 15:31:22 EST"
@@ -3356,22 +3702,6 @@ class TAADDaemon:
             except (ValueError, TypeError):
                 pnl_buckets.append(0)
 
-        # VIX regime bucket — matches the VIX Regime Table thresholds
-        try:
-            vix = float(context.market_context.get("vix") or 0)
-        except (ValueError, TypeError):
-            vix = 0.0
-        if vix < 15:
-            vix_regime = "low"
-        elif vix < 20:
-            vix_regime = "normal"
-        elif vix < 30:
-            vix_regime = "elevated"
-        elif vix < 40:
-            vix_regime = "high"
-        else:
-            vix_regime = "extreme"
-
         essential = {
             "autonomy": context.autonomy_level,
             "pos_symbols": sorted(p["symbol"] for p in context.open_positions),
@@ -3380,7 +3710,7 @@ class TAADDaemon:
                 f"{c['symbol']}:{c['state']}" for c in context.staged_candidates
             ),
             "favorable": context.market_context.get("conditions_favorable"),
-            "vix_regime": vix_regime,
+            "vix_regime": vix_regime(context.market_context.get("vix")),
             "anomaly_count": len(context.anomalies),
         }
 
@@ -3388,6 +3718,89 @@ class TAADDaemon:
             json.dumps(essential, sort_keys=True).encode()
         ).hexdigest()
 
+    def _close_preflight_starter(
+        self, tasks: list[asyncio.Task]
+    ) -> Callable[[EarlyAction], None]:
+        """Early-action callback that starts close pre-flight on the event loop.
+
+        The callback runs on the reasoning thread; pre-flight touches IBKR,
+        so it is scheduled onto the loop and collected in ``tasks`` for the
+        caller to await before executing.
+        """
+        loop = asyncio.get_running_loop()
+
+        def start(trade_id: str) -> None:
+            tasks.append(loop.create_task(self.executor.preflight_close(trade_id)))
+
+        def on_early_action(early: EarlyAction) -> None:
+            if early.action == "CLOSE_POSITION" and early.trade_id:
+                loop.call_soon_threadsafe(start, str(early.trade_id))
+
+        return on_early_action
+
+    def _apply_exit_memo(
+        self, event: DaemonEvent, db: Session, entry: MemoEntry, trade_id: str
+    ) -> None:
+        """Record a reused exit decision without enrichment or reasoning.
+
+        The original MONITOR_ONLY needs no execution, so the hit is only
+        audited (with the cost it saved) and added to working memory. The
+        caller completes the event once every position in it is handled.
+
+        Args:
+            event: The POSITION_EXIT_CHECK event
+            db: Database session
+            entry: Memoized decision for the trade
+            trade_id: Trade the decision is reused for
+        """
+        age = int(self.exit_memo.age_seconds(entry))
+        reasoning = (
+            f"Unchanged since exit check {age}s ago (audit #{entry.audit_id}): "
+            f"{entry.decision.reasoning or ''}"
+        )
+        audit = DecisionAudit(
+            event_id=event.id,
+            timestamp=utc_now(),
+            autonomy_level=self.governor.level,
+            event_type=event.event_type,
+            action=entry.decision.action,
+            confidence=entry.decision.confidence,
+            reasoning=reasoning,
+            key_factors=["exit_memo_hit"],
+            risks_considered=entry.decision.risks_considered,
+            autonomy_approved=True,
+            executed=False,
+            decision_metadata={
+                "decision_source": EXIT_MEMO_SOURCE,
+                "trade_id": trade_id,
+                "memo_audit_id": entry.audit_id,
+                "memo_age_seconds": age,
+                "saved_cost_usd": entry.cost_usd,
+            },
+            input_tokens=0,
+            output_tokens=0,
+            cost_usd=0.0,
+            execution_result={"message": "Memoized exit decision reused"},
+        )
+        db.add(audit)
+        db.commit()
+
+        self.memory.add_decision({
+            "timestamp": self._market_timestamp(),
+            "event_type": event.event_type,
+            "action": entry.decision.action,
+            "confidence": entry.decision.confidence,
+            "reasoning": reasoning[:200],
+            "executed": False,
+            "result": "Memoized exit decision reused",
+        })
+        self.health.record_decision()
+        logger.info(
+            f"POSITION_EXIT_CHECK for {trade_id} reused memoized "
+            f"{entry.decision.action} ({age}s old, saved ${entry.cost_usd:.4f}; "
+            f"hit rate {self.exit_memo.hit_rate:.0%})"
+        )
+
     def _is_first_trade_of_day(self) -> bool:
         """Check if no trades have been executed today."""
         today_decisions = [
@@ -3398,29 +3811,76 @@ class TAADDaemon:
         ]
         return len(today_decisions) == 0
 
-    async def _enrich_context(self, ctx: ReasoningContext, db: Session) -> None:
+    async def _enrich_context(
+        self,
+        ctx: ReasoningContext,
+        db: Session,
+        event_type: Optional[str] = None,
+    ) -> None:
         """Enrich reasoning context with live IBKR data.
 
-        Three enrichments:
+        Three enrichments, each a context section cached until an event
+        invalidates it or its TTL passes:
         a) Market data (VIX, SPY) via MarketConditionMonitor
         b) Position P&L via live option quotes
         c) Staged candidates from ScanOpportunity table
 
+        Only the sections the event type needs are enriched (a
+        POSITION_EXIT_CHECK skips staged candidates).
+
         Falls back gracefully if IBKR is unavailable — context retains
         DB-only data and data_stale flag is set.
 
         Args:
             ctx: ReasoningContext to enrich in-place
             db: Database session for staged candidate queries
+            event_type: Event being processed (None = all sections)
         """
+        cache = self.memory.context_cache
+        sections = sections_for_event(event_type)
+
         # (a) Market data enrichment
-        await self._enrich_market_data(ctx)
+        if SECTION_MARKET in sections:
+
+            async def build_market():
+                await self._enrich_market_data(ctx)
+                return None if ctx.market_context.get("data_stale") else ctx.market_context
+
+            market = await cache.build_async(SECTION_MARKET, build_market)
+            if market is not None:
+                ctx.market_context = market
 
         # (b) Position P&L enrichment
-        await self._enrich_position_pnl(ctx)
+        if SECTION_PNL in sections:
+
+            async def build_pnl():
+                await self._enrich_position_pnl(ctx)
+                pnl = {
+                    pos["trade_id"]: {k: pos[k] for k in _PNL_FIELDS}
+                    for pos in ctx.open_positions
+                    if "pnl" in pos and pos.get("trade_id")
+                }
+                return pnl or None
+
+            pnl = await cache.build_async(SECTION_PNL, build_pnl) or {}
+            for pos in ctx.open_positions:
+                pos.update(pnl.get(pos.get("trade_id"), {}))
 
         # (c) Staged candidates from DB
-        self._enrich_staged_candidates(ctx, db)
+        if SECTION_STAGED in sections:
+
+            def build_staged():
+                self._enrich_staged_candidates(ctx, db)
+                return ctx.staged_candidates
+
+            ctx.staged_candidates = cache.build(SECTION_STAGED, build_staged) or []
+
+        timings = cache.build_time_summary(sections)
+        if timings:
+            logger.debug(
+                f"Context sections for {event_type or 'event'}: "
+                + ", ".join(f"{name} p50 {t['p50']}ms" for name, t in timings.items())
+            )
 
     async def _enrich_market_data(self, ctx: ReasoningContext) -> None:
         """Fetch VIX and SPY from IBKR and update market_context.
@@ -3448,10 +3908,11 @@ class TAADDaemon:
 
         try:
             from datetime import datetime, timezone
-            from src.services.market_conditions import MarketConditionMonitor
+            from src.services.market_conditions import get_market_conditions_service
 
-            monitor = MarketConditionMonitor(self.ibkr_client)
-            conditions = await monitor.check_conditions()
+            conditions = await get_market_conditions_service(self.ibkr_client).current(
+                max_age_seconds=MARKET_DATA_MAX_AGE_SECONDS
+            )
 
             # Session-open VIX baseline: set once on first enrichment of the
             # day, then used for all subsequent change calculations.  Stored in
@@ -3582,7 +4043,9 @@ class TAADDaemon:
         Updates each position dict in ctx.open_positions with:
         current_mid, pnl, pnl_pct fields.
 
-        Limited to first 10 positions with 1s timeout per quote.
+        Limited to first 10 positions with 1s timeout per quote. Contracts
+        are qualified and quoted concurrently with ib_async's native
+        awaitables, so the loop never blocks on IBKR round-trips.
         """
         if not ctx.open_positions:
             return
@@ -3591,38 +4054,54 @@ class TAADDaemon:
             return
 
         try:
+            positions, contracts = [], []
             for pos in ctx.open_positions[:10]:
+                exp_str = str(pos.get("expiration", "")).replace("-", "")
+                if len(exp_str) != 8:
+                    continue
+                right = pos.get("option_type", "PUT")[0]  # "P" or "C"
                 try:
-                    exp_str = str(pos.get("expiration", "")).replace("-", "")
-                    if len(exp_str) != 8:
-                        continue
-
-                    right = pos.get("option_type", "PUT")[0]  # "P" or "C"
-                    contract = self.ibkr_client.get_option_contract(
-                        symbol=pos["symbol"],
-                        expiration=exp_str,
-                        strike=pos["strike"],
-                        right=right,
+                    contracts.append(
+                        self.ibkr_client.get_option_contract(
+                            symbol=pos["symbol"],
+                            expiration=exp_str,
+                            strike=pos["strike"],
+                            right=right,
+                        )
                     )
-                    qualified = self.ibkr_client.qualify_contract(contract)
-                    if not qualified:
-                        continue
-
-                    quote = await self.ibkr_client.get_quote(qualified, timeout=1.0)
-                    if quote.is_valid and quote.bid > 0 and quote.ask > 0:
-                        current_mid = round((quote.bid + quote.ask) / 2, 4)
-                        entry_premium = pos.get("entry_premium", 0)
-                        if entry_premium and entry_premium > 0:
-                            pnl = round(entry_premium - current_mid, 4)
-                            pnl_pct = round(pnl / entry_premium * 100, 1)
-                            pos["current_mid"] = current_mid
-                            pos["pnl"] = pnl
-                            pos["pnl_pct"] = f"{pnl_pct:+.1f}%"
-                            pos["pnl_source"] = quote.reason if quote.reason else ""
-
+                    positions.append(pos)
                 except Exception as e:
                     logger.debug(f"P&L enrichment failed for {pos.get('symbol')}: {e}")
+
+            # One qualify call per contract keeps results aligned with positions
+            qualified_results = await asyncio.gather(
+                *(self.ibkr_client.qualify_contracts_async(c) for c in contracts),
+                return_exceptions=True,
+            )
+            to_quote = [
+                (pos, result[0])
+                for pos, result in zip(positions, qualified_results)
+                if isinstance(result, list) and result
+            ]
+            quotes = await asyncio.gather(
+                *(self.ibkr_client.get_quote(q, timeout=1.0) for _, q in to_quote),
+                return_exceptions=True,
+            )
+
+            for (pos, _), quote in zip(to_quote, quotes):
+                if isinstance(quote, Exception):
+                    logger.debug(f"P&L enrichment failed for {pos.get('symbol')}: {quote}")
                     continue
+                if quote.is_valid and quote.bid > 0 and quote.ask > 0:
+                    current_mid = round((quote.bid + quote.ask) / 2, 4)
+                    entry_premium = pos.get("entry_premium", 0)
+                    if entry_premium and entry_premium > 0:
+                        pnl = round(entry_premium - current_mid, 4)
+                        pnl_pct = round(pnl / entry_premium * 100, 1)
+                        pos["current_mid"] = current_mid
+                        pos["pnl"] = pnl
+                        pos["pnl_pct"] = f"{pnl_pct:+.1f}%"
+                        pos["pnl_source"] = quote.reason if quote.reason else ""
 
             # Second pass: fill gaps from IBKR portfolio (works after hours)
             positions_missing_pnl = [p for p in ctx.open_positions[:10] if "pnl" not in p]
@@ -4012,7 +4491,26 @@ class TAADDaemon:
         while self._running:
             try:
                 ibkr_ok = self.ibkr_client is not None and self.ibkr_client.is_connected()
-                self.health.heartbeat(ibkr_connected=ibkr_ok)
+                dispatch = self.event_bus.dispatch_latency_summary()
+                parts = []
+                if dispatch["count"]:
+                    parts.append(
+                        f"event dispatch p50 {dispatch['p50']}ms, p95 {dispatch['p95']}ms"
+                    )
+                if self.loop_monitor is not None:
+                    lag = self.loop_monitor.lag_summary()
+                    if lag["count"]:
+                        parts.append(
+                            f"loop lag p95 {lag['p95']}ms, {self.loop_monitor.stalls} stalls"
+                        )
+                llm = get_limiter().stats()
+                if llm["queue_wait_ms"]["count"]:
+                    parts.append(
+                        f"LLM in flight {llm['in_flight']}/{llm['max_concurrency']}, "
+                        f"{llm['waiting']} queued, wait p95 {llm['queue_wait_ms']['p95']}ms"
+                    )
+                message = f"Heartbeat OK ({'; '.join(parts)})" if parts else None
+                self.health.heartbeat(message=message, ibkr_connected=ibkr_ok)
             except Exception as e:
                 logger.error(f"Heartbeat failed: {e}")
             await asyncio.sleep(interval)
@@ -902,13 +902,17 @@ def create_dashboard_app(auth_token: str = "") -> "FastAPI":
         return {"status": "restarting"}
 
     @app.post("/api/sync-orders")
-    def sync_orders_endpoint(token: None = Depends(verify_token)):
-        """Sync order status with IBKR (order fills, commissions, status)."""
+    def sync_orders_endpoint(full: bool = False, token: None = Depends(verify_token)):
+        """Sync order status with IBKR (order fills, commissions, status).
+
+        Incremental from the shared execution watermark unless ``full`` is set.
+        """
         import asyncio
 
         from src.config.base import IBKRConfig
         from src.data.repositories import TradeRepository
         from src.services.order_reconciliation import OrderReconciliation
+        from src.services.reconciliation_watermark import ReconciliationWatermarkStore
         from src.tools.ibkr_client import IBKRClient
 
         config = IBKRConfig()
@@ -922,14 +926,19 @@ def create_dashboard_app(auth_token: str = "") -> "FastAPI":
 
             with get_db_session() as db:
                 trade_repo = TradeRepository(db)
-                reconciler = OrderReconciliation(client, trade_repo)
+                reconciler = OrderReconciliation(
+                    client, trade_repo, watermarks=ReconciliationWatermarkStore(db)
+                )
 
                 report = asyncio.get_event_loop().run_until_complete(
-                    reconciler.sync_all_orders(include_filled=True)
+                    reconciler.sync_all_orders(include_filled=True, full=full)
                 )
 
-                lines.append(f"Order Sync — {report.date}")
+                lines.append(f"Order Sync — {report.date} ({report.mode})")
+                lines.append(f"New executions: {report.new_executions}")
                 lines.append(f"Reconciled: {report.total_reconciled}")
+                if report.unchanged:
+                    lines.append(f"Unchanged: {report.unchanged}")
                 lines.append(f"Discrepancies: {report.total_discrepancies}")
                 lines.append(f"Resolved: {report.total_resolved}")
 
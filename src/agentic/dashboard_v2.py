@@ -903,13 +903,17 @@ def create_dashboard_app_v2(auth_token: str = "") -> "FastAPI":
         return {"status": "restarting"}
 
     @app.post("/api/sync-orders")
-    def sync_orders_endpoint(token: None = Depends(verify_token)):
-        """Sync order status with IBKR (order fills, commissions, status)."""
+    def sync_orders_endpoint(full: bool = False, token: None = Depends(verify_token)):
+        """Sync order status with IBKR (order fills, commissions, status).
+
+        Incremental from the shared execution watermark unless ``full`` is set.
+        """
         import asyncio
 
         from src.config.base import IBKRConfig
         from src.data.repositories import TradeRepository
         from src.services.order_reconciliation import OrderReconciliation
+        from src.services.reconciliation_watermark import ReconciliationWatermarkStore
         from src.tools.ibkr_client import IBKRClient
 
         config = IBKRConfig()
@@ -923,14 +927,19 @@ def create_dashboard_app_v2(auth_token: str = "") -> "FastAPI":
 
             with get_db_session() as db:
                 trade_repo = TradeRepository(db)
-                reconciler = OrderReconciliation(client, trade_repo)
+                reconciler = OrderReconciliation(
+                    client, trade_repo, watermarks=ReconciliationWatermarkStore(db)
+                )
 
                 report = asyncio.get_event_loop().run_until_complete(
-                    reconciler.sync_all_orders(include_filled=True)
+                    reconciler.sync_all_orders(include_filled=True, full=full)
                 )
 
-                lines.append(f"Order Sync — {report.date}")
+                lines.append(f"Order Sync — {report.date} ({report.mode})")
+                lines.append(f"New executions: {report.new_executions}")
                 lines.append(f"Reconciled: {report.total_reconciled}")
+                if report.unchanged:
+                    lines.append(f"Unchanged: {report.unchanged}")
                 lines.append(f"Discrepancies: {report.total_discrepancies}")
                 lines.append(f"Resolved: {report.total_resolved}")
 
@@ -1097,6 +1106,12 @@ def create_dashboard_app_v2(auth_token: str = "") -> "FastAPI":
         """Get Claude API cost summary."""
         from sqlalchemy import func as sa_func
 
+        from src.agentic.exit_memo import load_exit_memo_summary
+        from src.agentic.reasoning_engine import (
+            load_prompt_cache_summary,
+            load_streaming_summary,
+        )
+
         with get_db_session() as db:
             today = date.today()
             daily_total = (
@@ -1130,9 +1145,43 @@ def create_dashboard_app_v2(auth_token: str = "") -> "FastAPI":
                 "monthly_total_usd": round(monthly_total, 4),
                 "all_time_total_usd": round(all_time_total, 4),
                 "calls_today": total_calls,
+                "exit_memo": load_exit_memo_summary(db, days=1),
+                "prompt_cache": load_prompt_cache_summary(db, days=1),
+                "streaming": load_streaming_summary(db, days=1),
                 "date": str(today),
             }
 
+    @app.get("/api/execution-latency")
+    def get_execution_latency(
+        days: int = 30,
+        token: None = Depends(verify_token),
+    ):
+        """Get order lifecycle latency percentiles per execution stage.
+
+        Aggregates order_latency rows (written by RapidFireExecutor) into
+        p50/p95/p99 and histogram buckets for each stage segment.
+        """
+        from src.services.execution_latency import load_latency_summary
+
+        with get_db_session() as db:
+            return load_latency_summary(db, days=days)
+
+    @app.get("/api/detection-latency")
+    def get_detection_latency(
+        days: int = 7,
+        token: None = Depends(verify_token),
+    ):
+        """Get tick-to-event latency percentiles for risk breach detection.
+
+        Aggregates detection_latency_ms from RISK_LIMIT_BREACH payloads
+        (written by EventDetector on tick-driven detections), overall and
+        per breach type.
+        """
+        from src.agentic.event_detector import load_detection_latency_summary
+
+        with get_db_session() as db:
+            return load_detection_latency_summary(db, days=days)
+
     @app.get("/api/guardrails")
     def get_guardrails(token: None = Depends(verify_token)):
         """Get guardrail activity summary for the last 24 hours.
@@ -2084,6 +2133,12 @@ _DASHBOARD_HTML_V2 = """<!DOCTYPE html>
       <div class="card-body" id="costs-body"></div>
     </div>
 
+    <!-- Execution Latency (full width) -->
+    <div class="card full">
+      <div class="card-header"><h2>Execution Latency</h2></div>
+      <div class="card-body" id="latency-body"></div>
+    </div>
+
     <!-- Daemon Log (full width) -->
     <div class="card full">
       <div class="card-header">
@@ -3008,7 +3063,54 @@ async function fetchData() {
         '<div class="stat"><div class="value">$' + costs.monthly_total_usd.toFixed(4) + '</div><div class="label">This Month</div></div>' +
         '<div class="stat"><div class="value">$' + costs.all_time_total_usd.toFixed(2) + '</div><div class="label">All Time</div></div>' +
         '<div class="stat"><div class="value">' + costs.calls_today + '</div><div class="label">Calls Today</div></div>' +
-      '</div>';
+      '</div>' +
+      (costs.exit_memo && costs.exit_memo.exit_checks ?
+        '<div style="margin-top:6px;font-size:var(--text-xs);color:var(--text-secondary);">Exit-check memo: ' +
+          costs.exit_memo.memo_hits + '/' + costs.exit_memo.exit_checks + ' reused (' +
+          (costs.exit_memo.hit_rate * 100).toFixed(0) + '%), $' + costs.exit_memo.saved_usd.toFixed(4) + ' saved today</div>' : '') +
+      (costs.prompt_cache && costs.prompt_cache.calls ?
+        '<div style="margin-top:6px;font-size:var(--text-xs);color:var(--text-secondary);">Prompt cache: ' +
+          (costs.prompt_cache.cache_hit_ratio * 100).toFixed(0) + '% of prompt tokens cached, $' +
+          costs.prompt_cache.saved_usd.toFixed(4) + ' saved (' + costs.prompt_cache.cost_reduction_pct.toFixed(0) + '% cost)' +
+          (costs.prompt_cache.latency_reduction_pct == null ? '' :
+            ', p50 latency ' + costs.prompt_cache.latency_reduction_pct.toFixed(0) + '% lower when cached') +
+        '</div>' : '') +
+      (costs.streaming && costs.streaming.streamed_calls ?
+        '<div style="margin-top:6px;font-size:var(--text-xs);color:var(--text-secondary);">Time to first action: p50 ' +
+          costs.streaming.first_action_p50_ms.toFixed(0) + 'ms, p95 ' + costs.streaming.first_action_p95_ms.toFixed(0) + 'ms' +
+          (costs.streaming.head_start_pct == null ? '' :
+            ' (' + costs.streaming.head_start_pct.toFixed(0) + '% before the full response)') +
+        '</div>' : '');
+
+    // Execution latency
+    try {
+      const lat = await (await fetch('/api/execution-latency')).json();
+      const fmtMs = v => v == null ? '--' : (v >= 1000 ? (v/1000).toFixed(2) + 's' : v.toFixed(0) + 'ms');
+      const segRows = Object.entries(lat.segments || {}).concat([['modify_round_trip', lat.modify || {}]]);
+      document.getElementById('latency-body').innerHTML = lat.orders ?
+        '<table>' +
+          '<tr><th>Stage</th><th>N</th><th>p50</th><th>p95</th><th>p99</th><th>Max</th><th>Distribution</th></tr>' +
+          segRows.map(([name, s]) => {
+            const hist = s.histogram || [];
+            const peak = Math.max(1, ...hist.map(b => b.count));
+            return '<tr>' +
+              '<td>' + esc(name.replace(/_/g, ' ')) + '</td>' +
+              '<td>' + (s.count || 0) + '</td>' +
+              '<td>' + fmtMs(s.p50) + '</td>' +
+              '<td>' + fmtMs(s.p95) + '</td>' +
+              '<td>' + fmtMs(s.p99) + '</td>' +
+              '<td>' + fmtMs(s.max) + '</td>' +
+              '<td style="white-space:nowrap;">' + hist.map(b =>
+                '<span title="' + (b.le == null ? '> last bucket' : '<= ' + b.le + 'ms') + ': ' + b.count + '" ' +
+                'style="display:inline-block;width:6px;margin-right:1px;vertical-align:bottom;background:var(--accent);height:' +
+                Math.max(1, Math.round(18 * b.count / peak)) + 'px;"></span>').join('') + '</td>' +
+            '</tr>';
+          }).join('') +
+        '</table>' +
+        '<div style="margin-top:6px;font-size:var(--text-xs);color:var(--text-secondary);">' +
+          lat.orders + ' orders across ' + lat.batches + ' executions, last ' + lat.days + ' days</div>'
+        : '<div class="empty">No execution latency recorded</div>';
+    } catch(e) { document.getElementById('latency-body').innerHTML = '<div class="empty">Latency not available</div>'; }
 
     // Guardrails
     try {
@@ -3,21 +3,50 @@
 Events are persisted to the daemon_events table and replayed on startup.
 Supports 13 event types with priority ordering. Time-based emitters
 use MarketCalendar. IBKR callbacks register for fill/disconnect/reconnect.
+
+stream() wakes as soon as an event is emitted instead of waiting for the
+next poll:
+- In-process: emit() signals every stream running in the same process
+  (the daemon's own emitters, and SQLite/tests).
+- Cross-process: on PostgreSQL, emit() sends NOTIFY on the daemon_events
+  channel and stream() LISTENs on a dedicated connection, so events from
+  the dashboard or CLI wake the daemon too.
+The DB poll remains as a slow safety net (missed notifications, lost
+LISTEN connection).
 """
 
 import asyncio
+from collections import deque
 from collections.abc import AsyncGenerator
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from loguru import logger
+from sqlalchemy import select, text
 from sqlalchemy import update as sa_update
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 
 from src.data.models import DaemonEvent
+from src.utils.latency import summarize_latencies
 from src.utils.timezone import utc_now
 
+# PostgreSQL NOTIFY channel announcing new daemon events
+NOTIFY_CHANNEL = "daemon_events"
+
+# Streams waiting in this process: (their event loop, their wake-up event)
+_local_listeners: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+
+def _wake_local_listeners() -> None:
+    """Wake every stream in this process (safe from any thread)."""
+    for loop, wake in list(_local_listeners):
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # Loop already closed
+            _local_listeners.discard((loop, wake))
+
 
 class EventType(str, Enum):
     """Daemon event types ordered by typical priority."""
@@ -81,6 +110,10 @@ class EventBus:
         """
         self.db = db_session
         self._stop_event = asyncio.Event()
+        self._wake: Optional[asyncio.Event] = None
+
+        # Emit -> dispatch latency samples (ms) of streamed events
+        self._dispatch_latencies: deque[float] = deque(maxlen=500)
 
     def emit(
         self,
@@ -111,11 +144,32 @@ class EventBus:
             created_at=utc_now(),
         )
         self.db.add(event)
+        self._notify_postgres(event)
         self.db.commit()
+        _wake_local_listeners()
 
         logger.info(f"Event emitted: {event_type.value} (id={event.id}, priority={priority})")
         return event
 
+    def _is_postgres(self) -> bool:
+        try:
+            return self.db.get_bind().dialect.name == "postgresql"
+        except Exception:
+            return False
+
+    def _notify_postgres(self, event: DaemonEvent) -> None:
+        """Queue a NOTIFY in the emitting transaction (delivered on commit)."""
+        if not self._is_postgres():
+            return
+        try:
+            self.db.flush()
+            self.db.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": NOTIFY_CHANNEL, "payload": str(event.id)},
+            )
+        except Exception as e:
+            logger.debug(f"Event NOTIFY failed (stream will poll): {e}")
+
     def get_pending_events(self, limit: int = 10) -> list[DaemonEvent]:
         """Get claimable (status='pending') events ordered by priority then creation time.
 
@@ -188,6 +242,68 @@ class EventBus:
         self.db.refresh(event)
         return True
 
+    def claim_pending_events(self, limit: int = 10) -> list[DaemonEvent]:
+        """Atomically claim up to ``limit`` pending events in one statement.
+
+        A single UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+        RETURNING id. On PostgreSQL, concurrent claimers skip each other's
+        rows instead of blocking. SQLite ignores the lock clause and runs the
+        statement under its single-writer lock. Either way no event is
+        claimed twice.
+
+        Args:
+            limit: Maximum events to claim
+
+        Returns:
+            Claimed events (status='processing') ordered by priority then
+            creation time
+        """
+        if limit <= 0:
+            return []
+        candidates = (
+            select(DaemonEvent.id)
+            .where(DaemonEvent.status == "pending")
+            .order_by(DaemonEvent.priority, DaemonEvent.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.db.execute(
+            sa_update(DaemonEvent)
+            .where(DaemonEvent.id.in_(candidates))
+            .values(status="processing", processed_at=utc_now())
+            .returning(DaemonEvent.id)
+            .execution_options(synchronize_session=False)
+        )
+        ids = [row[0] for row in result]
+        self.db.commit()
+        if not ids:
+            return []
+        return (
+            self.db.query(DaemonEvent)
+            .filter(DaemonEvent.id.in_(ids))
+            .order_by(DaemonEvent.priority, DaemonEvent.created_at)
+            .populate_existing()
+            .all()
+        )
+
+    def _commit(self, event: DaemonEvent) -> None:
+        """Commit a status change on the session that holds the event.
+
+        Event workers load their event into a session of their own, so the
+        bus session would not see (or commit) the change.
+        """
+        (object_session(event) or self.db).commit()
+
+    def release(self, event: DaemonEvent) -> None:
+        """Return a claimed but unprocessed event to 'pending'.
+
+        Args:
+            event: The event to release
+        """
+        event.status = "pending"
+        event.processed_at = None
+        self._commit(event)
+
     def mark_completed(self, event: DaemonEvent) -> None:
         """Mark event as completed.
 
@@ -196,7 +312,7 @@ class EventBus:
         """
         event.status = "completed"
         event.completed_at = utc_now()
-        self.db.commit()
+        self._commit(event)
 
     def mark_failed(self, event: DaemonEvent, error: str) -> None:
         """Mark event as failed with error message.
@@ -208,56 +324,141 @@ class EventBus:
         event.status = "failed"
         event.error_message = error
         event.completed_at = utc_now()
-        self.db.commit()
+        self._commit(event)
 
     async def stream(
-        self, poll_interval: float = 5.0, max_events: int = 10
+        self, poll_interval: float = 30.0, max_events: int = 10, claim: bool = False
     ) -> AsyncGenerator[DaemonEvent, None]:
         """Async generator that yields events ordered by priority.
 
-        First replays any pending/processing events from DB, then polls
-        for new events at the configured interval.
+        First replays any pending/processing events from DB, then waits
+        for new events: woken immediately by emit() in this process or by
+        PostgreSQL NOTIFY, and by a DB poll every poll_interval seconds
+        as a safety net.
 
         Args:
-            poll_interval: Seconds between DB polls
+            poll_interval: Seconds between safety-net DB polls
             max_events: Max events per poll
+            claim: Claim each batch atomically (claim_pending_events) and
+                yield events already marked 'processing'. Claimed events not
+                yielded before stop() are released back to 'pending'.
 
         Yields:
             DaemonEvent records in priority order
         """
-        # Startup crash recovery: reset any events stuck in 'processing' from a
-        # previous run back to 'pending' so mark_processing() can claim them cleanly.
-        self.reset_stale_processing_events()
-
-        # Replay events that were pending at startup
-        pending = self.get_pending_events(limit=max_events)
-        if pending:
-            logger.info(f"Replaying {len(pending)} pending events from DB")
-            for event in pending:
-                if self._stop_event.is_set():
-                    return
-                yield event
-
-        # Steady-state polling: only 'pending' events are fetched.
-        # Completed/failed events are excluded; in-flight events are excluded
-        # (they were claimed by mark_processing and are now 'processing').
-        while not self._stop_event.is_set():
-            events = self.get_pending_events(limit=max_events)
-            for event in events:
-                if self._stop_event.is_set():
-                    return
-                yield event
+        fetch = self.claim_pending_events if claim else self.get_pending_events
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        listener = (loop, self._wake)
+        _local_listeners.add(listener)
+        pg_conn = self._listen_postgres(loop, self._wake)
+        batch: list[DaemonEvent] = []
+
+        try:
+            # Startup crash recovery: reset any events stuck in 'processing' from a
+            # previous run back to 'pending' so they can be claimed cleanly.
+            self.reset_stale_processing_events()
+
+            # Replay events that were pending at startup
+            batch = fetch(limit=max_events)
+            if batch:
+                logger.info(f"Replaying {len(batch)} pending events from DB")
+                while batch:
+                    if self._stop_event.is_set():
+                        return
+                    yield batch.pop(0)
+
+            # Steady state: only 'pending' events are fetched.
+            # Completed/failed events are excluded; in-flight events are excluded
+            # (they were claimed and are now 'processing').
+            while not self._stop_event.is_set():
+                # Clear before querying so an emit during dispatch is not lost
+                self._wake.clear()
+                batch = fetch(limit=max_events)
+                full = len(batch) == max_events
+                while batch:
+                    if self._stop_event.is_set():
+                        return
+                    event = batch.pop(0)
+                    self._record_dispatch(event)
+                    yield event
+
+                if full:
+                    # More may be queued behind a full batch. Yield to the
+                    # loop first: without claim, events the consumer has not
+                    # marked are fetched again and would otherwise spin.
+                    await asyncio.sleep(0)
+                    continue
+
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=poll_interval)
+                except asyncio.TimeoutError:
+                    pass  # Safety-net poll
+        finally:
+            if claim:
+                for event in batch:
+                    self.release(event)
+            _local_listeners.discard(listener)
+            if pg_conn is not None:
+                self._unlisten_postgres(loop, pg_conn)
+
+    def _listen_postgres(self, loop: asyncio.AbstractEventLoop, wake: asyncio.Event):
+        """LISTEN for new-event notifications on a dedicated connection.
 
+        Returns:
+            The DBAPI connection, or None when not on PostgreSQL or LISTEN
+            could not be set up (stream() then relies on polling).
+        """
+        if not self._is_postgres():
+            return None
+        try:
+            raw = self.db.get_bind().raw_connection()
+            # Keep the long-lived LISTEN connection out of the pool
+            raw.detach()
+            conn = raw.driver_connection
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        except Exception as e:
+            logger.warning(f"Event LISTEN unavailable, polling only: {e}")
+            return None
+
+        def on_readable() -> None:
             try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(), timeout=poll_interval
-                )
-            except asyncio.TimeoutError:
-                pass  # Normal polling timeout
+                conn.poll()
+                if conn.notifies:
+                    conn.notifies.clear()
+                    wake.set()
+            except Exception as e:
+                logger.warning(f"Event LISTEN connection lost, polling only: {e}")
+                loop.remove_reader(conn.fileno())
+
+        loop.add_reader(conn.fileno(), on_readable)
+        logger.info(f"EventBus listening on PostgreSQL channel '{NOTIFY_CHANNEL}'")
+        return conn
+
+    @staticmethod
+    def _unlisten_postgres(loop: asyncio.AbstractEventLoop, conn) -> None:
+        try:
+            loop.remove_reader(conn.fileno())
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Failed to close event LISTEN connection: {e}")
+
+    def _record_dispatch(self, event: DaemonEvent) -> None:
+        if event.created_at is not None:
+            latency_ms = (utc_now() - event.created_at).total_seconds() * 1000.0
+            self._dispatch_latencies.append(max(0.0, latency_ms))
+
+    def dispatch_latency_summary(self) -> dict:
+        """p50/p95/p99 of emit -> dispatch latency (ms) for streamed events."""
+        return summarize_latencies(list(self._dispatch_latencies))
 
     def stop(self) -> None:
         """Signal the event stream to stop."""
         self._stop_event.set()
+        if self._wake is not None:
+            self._wake.set()
 
     def get_event_counts(self) -> dict[str, int]:
         """Get counts of events by status.
@@ -1,10 +1,21 @@
 """Active event detector for VIX spikes and position alerts.
 
-Runs as an independent async background task (5-minute poll cycle).
-Emits events to the EventBus when thresholds are breached:
-- VIX spike: >15% *increase* from session open (drops are not risk events)
+Runs as an independent async background task. Emits events to the
+EventBus when thresholds are breached:
+- VIX spike: >15% *increase* from session open, or from the rolling
+  VIX baseline (drops are not risk events)
+- Strike breach: an open position's underlying trades through its strike
 - Critical position alerts: approaching stop loss
 
+VIX and the underlyings of open positions are evaluated on every tick
+(Ticker.updateEvent), so a crossing is emitted as soon as the quote
+arrives rather than at the next poll. The 5-minute poll remains as a
+fallback for when streaming is unavailable and for P&L-based alerts.
+Detection latency (tick time -> emit) is recorded in each breach payload
+and summarised by load_detection_latency_summary(). A VIX move of at
+least MARKET_SECTION_VIX_STEP also invalidates the cached market section
+of the reasoning context.
+
 Separate from the 15-minute SCHEDULED_CHECK — catches intraday
 volatility events between Claude reasoning cycles.
 
@@ -13,24 +24,66 @@ stale/default data when IBKR returns no quote outside trading hours.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import math
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from loguru import logger
 
+from src.agentic.context_sections import (
+    MARKET_SECTION_VIX_STEP,
+    SECTION_MARKET,
+    ContextSectionCache,
+)
 from src.agentic.event_bus import EventBus, EventType
 from src.data.models import DaemonEvent
+from src.utils.latency import summarize_latencies
+from src.utils.market_data import last_tick
 
 
-# Default VIX returned by MarketConditionMonitor when quote fails.
+# Default VIX returned by MarketConditionMonitor when quote fails
+# (the streamed snapshot never uses it: no VIX tick means no snapshot).
 # We must reject this value in spike calculations — it's synthetic.
 _VIX_DEFAULT_FALLBACK = 20.0
 
+# Seconds between refreshes of the streamed symbol set (open positions)
+_STREAM_REFRESH_SECONDS = 60
+
+
+class RollingBaseline:
+    """Time-decayed moving average with O(1) updates.
+
+    Each update weights the previous mean by exp(-dt / tau), so irregular
+    tick spacing is handled without keeping a window of samples.
+    """
+
+    def __init__(self, half_life_seconds: float = 1800.0):
+        """Initialize baseline.
+
+        Args:
+            half_life_seconds: Age at which a sample's weight halves
+        """
+        self.tau = half_life_seconds / math.log(2)
+        self.value: Optional[float] = None
+        self._last_t: Optional[float] = None
+
+    def update(self, value: float, t: float) -> float:
+        """Fold a sample observed at time t (seconds) into the mean."""
+        if self.value is None or self._last_t is None:
+            self.value = value
+        else:
+            dt = max(0.0, t - self._last_t)
+            alpha = 1.0 - math.exp(-dt / self.tau)
+            self.value += alpha * (value - self.value)
+        self._last_t = t
+        return self.value
 
 class EventDetector:
-    """Detect VIX spikes and critical position alerts.
+    """Detect VIX spikes, strike breaches and critical position alerts.
 
-    Polls IBKR every 5 minutes for VIX changes and position P&L alerts.
+    Evaluates VIX and open-position underlyings on each streamed tick, and
+    polls IBKR every 5 minutes for VIX changes and position P&L alerts.
     Emits RISK_LIMIT_BREACH events when thresholds are crossed.
     """
 
@@ -41,6 +94,7 @@ class EventDetector:
         ibkr_client: Optional[object] = None,
         vix_spike_threshold_pct: float = 15.0,
         market_calendar: Optional[object] = None,
+        context_cache: Optional[ContextSectionCache] = None,
     ):
         """Initialize event detector.
 
@@ -50,12 +104,16 @@ class EventDetector:
             ibkr_client: IBKR client for VIX data (optional)
             vix_spike_threshold_pct: VIX change threshold (default 15%)
             market_calendar: MarketCalendar for market-hours gating (optional)
+            context_cache: Reasoning-context cache whose market section VIX
+                ticks invalidate (optional)
         """
         self.event_bus = event_bus
         self.position_monitor = position_monitor
         self.ibkr_client = ibkr_client
         self.vix_spike_threshold_pct = vix_spike_threshold_pct
         self.calendar = market_calendar
+        # Oldest shared market-conditions snapshot accepted for spike checks
+        self.vix_max_age_seconds = 60.0
 
         # Session-relative VIX baseline (reset at MARKET_OPEN)
         self._session_open_vix: Optional[float] = None
@@ -66,32 +124,211 @@ class EventDetector:
         self._breach_emitted: dict[str, datetime] = {}
         self._breach_cooldown = timedelta(hours=2)
 
+        # Tick-driven detection: rolling baselines and live subscriptions
+        self._vix_baseline = RollingBaseline()
+        self._vix_ticker: Optional[object] = None
+        # symbol -> [(position_id, strike, option_type)] for open positions
+        self._watched: dict[str, list[tuple[str, float, str]]] = {}
+        self._underlying_tickers: dict[str, object] = {}
+        self._underlying_baselines: dict[str, RollingBaseline] = {}
+
+        # Tick -> emit latency samples (ms) since startup
+        self._detection_latencies: deque[float] = deque(maxlen=500)
+
+        self.context_cache = context_cache
+        # VIX at the last market-section invalidation
+        self._context_vix: Optional[float] = None
+
     async def run(self, poll_interval: int = 300) -> None:
-        """Background loop — check VIX + positions every poll_interval seconds.
+        """Background loop — keep tick streams current and poll as fallback.
+
+        Stream subscriptions are refreshed every minute (or every
+        poll_interval, if shorter); VIX and positions are polled every
+        poll_interval seconds.
 
         Args:
             poll_interval: Seconds between checks (default 300 = 5 min)
         """
         logger.info(f"EventDetector started (poll every {poll_interval}s)")
-        while True:
-            try:
-                if self.ibkr_client and self.ibkr_client.is_connected():
-                    await self._check_vix()
-                    await self._check_critical_alerts()
-            except asyncio.CancelledError:
-                logger.info("EventDetector cancelled")
-                return
-            except Exception as e:
-                logger.error(f"EventDetector error: {e}")
-            await asyncio.sleep(poll_interval)
+        refresh_interval = min(_STREAM_REFRESH_SECONDS, poll_interval)
+        since_poll = poll_interval
+        try:
+            while True:
+                try:
+                    if self.ibkr_client and self.ibkr_client.is_connected():
+                        self._refresh_streams()
+                        if since_poll >= poll_interval:
+                            since_poll = 0
+                            await self._check_vix()
+                            await self._check_critical_alerts()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"EventDetector error: {e}")
+                await asyncio.sleep(refresh_interval)
+                since_poll += refresh_interval
+        except asyncio.CancelledError:
+            logger.info("EventDetector cancelled")
+        finally:
+            self.stop_streams()
 
     def reset_session(self) -> None:
         """Reset session VIX baseline at MARKET_OPEN."""
         self._session_open_vix = None
         self._last_vix = None
         self._vix_spike_emitted = False
+        self._vix_baseline = RollingBaseline()
         logger.info("EventDetector: session reset (VIX baseline cleared)")
 
+    def detection_latency_summary(self) -> dict:
+        """p50/p95/p99 of tick -> emit latency (ms) since startup."""
+        return summarize_latencies(list(self._detection_latencies))
+
+    # ------------------------------------------------------------------
+    # Tick streams
+    # ------------------------------------------------------------------
+
+    def _refresh_streams(self) -> None:
+        """Attach to the shared VIX stream and sync underlying subscriptions."""
+        from src.services.market_conditions import get_market_conditions_service
+
+        service = get_market_conditions_service(self.ibkr_client)
+        service.start()
+        vix_ticker = service.ticker("VIX")
+        # The service replaces its tickers when it resubscribes
+        if vix_ticker is not self._vix_ticker:
+            if self._vix_ticker is not None:
+                self._vix_ticker.updateEvent.disconnect(self._on_vix_tick)
+            if vix_ticker is not None:
+                vix_ticker.updateEvent.connect(self._on_vix_tick)
+            self._vix_ticker = vix_ticker
+
+        self._watched = self._load_watched_positions()
+        for symbol in set(self._underlying_tickers) - set(self._watched):
+            self._unsubscribe_underlying(symbol)
+        for symbol in set(self._watched) - set(self._underlying_tickers):
+            try:
+                ticker = self.ibkr_client.ticker(symbol)
+            except Exception as e:
+                logger.debug(f"EventDetector: failed to stream {symbol}: {e}")
+                continue
+            ticker.updateEvent.connect(self._on_underlying_tick)
+            self._underlying_tickers[symbol] = ticker
+
+    def stop_streams(self) -> None:
+        """Detach from VIX and cancel underlying subscriptions."""
+        if self._vix_ticker is not None:
+            self._vix_ticker.updateEvent.disconnect(self._on_vix_tick)
+            self._vix_ticker = None
+        for symbol in list(self._underlying_tickers):
+            self._unsubscribe_underlying(symbol)
+
+    def _unsubscribe_underlying(self, symbol: str) -> None:
+        ticker = self._underlying_tickers.pop(symbol)
+        self._underlying_baselines.pop(symbol, None)
+        ticker.updateEvent.disconnect(self._on_underlying_tick)
+        try:
+            self.ibkr_client.cancel_market_data(ticker.contract)
+        except Exception as e:
+            logger.debug(f"EventDetector: failed to cancel {symbol} stream: {e}")
+
+    def _load_watched_positions(self) -> dict[str, list[tuple[str, float, str]]]:
+        """Open short options grouped by underlying (covered calls excluded)."""
+        from sqlalchemy import or_
+
+        from src.data.models import Trade
+        from src.services.covered_call_detector import CoveredCallDetector
+        from src.utils.position_key import position_key_from_trade
+
+        db = self.event_bus.db
+        trades = (
+            db.query(Trade)
+            .filter(
+                Trade.exit_date.is_(None),
+                or_(Trade.tws_status.is_(None), Trade.tws_status != "Submitted"),
+            )
+            .all()
+        )
+        covered = CoveredCallDetector(db).get_covered_symbols()
+        watched: dict[str, list[tuple[str, float, str]]] = {}
+        for trade in trades:
+            option_type = (trade.option_type or "PUT").upper()
+            # A covered call going ITM means assignment of owned shares, not a loss
+            if option_type.startswith("C") and trade.symbol in covered:
+                continue
+            watched.setdefault(trade.symbol, []).append(
+                (position_key_from_trade(trade), trade.strike, option_type)
+            )
+        return watched
+
+    def _market_open(self) -> bool:
+        if self.calendar is None:
+            return True
+        from zoneinfo import ZoneInfo
+
+        return self.calendar.is_market_open(datetime.now(ZoneInfo("America/New_York")))
+
+    def _on_vix_tick(self, ticker) -> None:
+        """Evaluate a VIX tick against the session-open and rolling baselines."""
+        try:
+            if not self._market_open():
+                return
+            current_vix, observed_at = last_tick(ticker)
+            if not current_vix or current_vix <= 0:
+                return
+            rolling = self._vix_baseline.value
+            self._vix_baseline.update(current_vix, observed_at.timestamp())
+            self._evaluate_vix(current_vix, rolling=rolling, observed_at=observed_at)
+            self._invalidate_market_context(current_vix)
+        except Exception as e:
+            logger.debug(f"VIX tick evaluation failed: {e}")
+
+    def _invalidate_market_context(self, vix: float) -> None:
+        """Invalidate the cached market section when VIX has moved."""
+        if self.context_cache is None:
+            return
+        if self._context_vix is None or abs(vix - self._context_vix) >= MARKET_SECTION_VIX_STEP:
+            self._context_vix = vix
+            self.context_cache.invalidate(SECTION_MARKET)
+
+    def _on_underlying_tick(self, ticker) -> None:
+        """Emit a strike breach for each watched position the tick puts ITM."""
+        from src.utils.option_math import is_itm
+
+        try:
+            if not self._market_open():
+                return
+            symbol = ticker.contract.symbol
+            price, observed_at = last_tick(ticker)
+            if not price or price <= 0:
+                return
+            baseline = self._underlying_baselines.setdefault(symbol, RollingBaseline())
+            rolling = baseline.value
+            baseline.update(price, observed_at.timestamp())
+            for position_id, strike, option_type in self._watched.get(symbol, []):
+                if not is_itm(price, strike, option_type):
+                    continue
+                self._emit_breach(
+                    position_id,
+                    {
+                        "breach_type": "strike_breach",
+                        "position_id": position_id,
+                        "message": (
+                            f"{symbol} {price:.2f} through {option_type} strike {strike}"
+                        ),
+                        "current_value": price,
+                        "threshold": strike,
+                        "rolling_baseline": round(rolling, 4) if rolling else None,
+                    },
+                    observed_at=observed_at,
+                )
+        except Exception as e:
+            logger.debug(f"Underlying tick evaluation failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Polling checks
+    # ------------------------------------------------------------------
+
     async def _check_vix(self) -> None:
         """Check VIX for intraday spikes relative to session open.
 
@@ -103,18 +340,14 @@ class EventDetector:
         """
         try:
             # Gate: only check VIX during market hours
-            if self.calendar is not None:
-                from datetime import datetime
-                from zoneinfo import ZoneInfo
-
-                now_et = datetime.now(ZoneInfo("America/New_York"))
-                if not self.calendar.is_market_open(now_et):
-                    return
+            if not self._market_open():
+                return
 
-            from src.services.market_conditions import MarketConditionMonitor
+            from src.services.market_conditions import get_market_conditions_service
 
-            monitor = MarketConditionMonitor(self.ibkr_client)
-            conditions = await monitor.check_conditions()
+            conditions = await get_market_conditions_service(self.ibkr_client).current(
+                max_age_seconds=self.vix_max_age_seconds
+            )
             current_vix = conditions.vix
 
             if current_vix <= 0:
@@ -130,40 +363,109 @@ class EventDetector:
                 )
                 return
 
-            # Set session baseline on first valid check
-            if self._session_open_vix is None:
-                self._session_open_vix = current_vix
-                logger.info(f"EventDetector: VIX session baseline set to {current_vix:.1f}")
-
-            self._last_vix = current_vix
-
-            # Check for spike: only VIX INCREASES are risk events.
-            # A VIX drop (current < baseline) means volatility is easing —
-            # that's good news, not a risk breach.
-            if self._session_open_vix > 0 and not self._vix_spike_emitted:
-                if current_vix <= self._session_open_vix:
-                    return  # VIX flat or falling — no risk event
-
-                change_pct = (current_vix - self._session_open_vix) / self._session_open_vix * 100
-                if change_pct >= self.vix_spike_threshold_pct:
-                    logger.warning(
-                        f"VIX SPIKE DETECTED: {self._session_open_vix:.1f} -> "
-                        f"{current_vix:.1f} (+{change_pct:.1f}%)"
-                    )
-                    self.event_bus.emit(
-                        EventType.RISK_LIMIT_BREACH,
-                        payload={
-                            "breach_type": "vix_spike",
-                            "vix_session_open": self._session_open_vix,
-                            "vix_current": current_vix,
-                            "change_pct": round(change_pct, 2),
-                        },
-                    )
-                    self._vix_spike_emitted = True
+            self._evaluate_vix(current_vix)
 
         except Exception as e:
             logger.debug(f"VIX check failed: {e}")
 
+    def _evaluate_vix(
+        self,
+        current_vix: float,
+        rolling: Optional[float] = None,
+        observed_at: Optional[datetime] = None,
+    ) -> None:
+        """Emit a VIX spike (once per session) if the threshold is crossed.
+
+        Only VIX INCREASES are risk events. A VIX drop means volatility is
+        easing — that's good news, not a risk breach.
+
+        Args:
+            current_vix: Latest VIX value
+            rolling: Rolling VIX baseline before this value, if tracked
+            observed_at: Tick time (UTC) for detection latency, if streamed
+        """
+        # Set session baseline on first valid check
+        if self._session_open_vix is None:
+            self._session_open_vix = current_vix
+            logger.info(f"EventDetector: VIX session baseline set to {current_vix:.1f}")
+
+        self._last_vix = current_vix
+
+        if self._vix_spike_emitted:
+            return
+
+        for basis, reference in (("session_open", self._session_open_vix), ("rolling", rolling)):
+            if not reference or reference <= 0 or current_vix <= reference:
+                continue  # VIX flat or falling — no risk event
+            change_pct = (current_vix - reference) / reference * 100
+            if change_pct < self.vix_spike_threshold_pct:
+                continue
+            logger.warning(
+                f"VIX SPIKE DETECTED: {reference:.1f} -> "
+                f"{current_vix:.1f} (+{change_pct:.1f}%, vs {basis})"
+            )
+            payload = {
+                "breach_type": "vix_spike",
+                "vix_session_open": self._session_open_vix,
+                "vix_current": current_vix,
+                "change_pct": round(change_pct, 2),
+            }
+            if rolling is not None:
+                payload["vix_rolling_baseline"] = round(rolling, 4)
+                payload["baseline"] = basis
+            self._stamp_latency(payload, observed_at)
+            self.event_bus.emit(EventType.RISK_LIMIT_BREACH, payload=payload)
+            self._vix_spike_emitted = True
+            return
+
+    def _stamp_latency(self, payload: dict, observed_at: Optional[datetime]) -> None:
+        """Record tick -> emit latency in the payload and the in-memory samples."""
+        if observed_at is None:
+            return
+        latency_ms = max(
+            0.0, (datetime.now(timezone.utc) - observed_at).total_seconds() * 1000.0
+        )
+        payload["detection_latency_ms"] = round(latency_ms, 1)
+        self._detection_latencies.append(latency_ms)
+
+    def _emit_breach(
+        self,
+        position_id: str,
+        payload: dict,
+        observed_at: Optional[datetime] = None,
+    ) -> bool:
+        """Emit a position RISK_LIMIT_BREACH unless one is on cooldown.
+
+        Uses two dedup layers:
+        1. In-memory cooldown dict (fast, covers steady-state)
+        2. DB check for recent events (covers daemon restarts)
+
+        Returns:
+            True if the event was emitted
+        """
+        # Dedup layer 1: in-memory cooldown
+        if self._is_breach_on_cooldown(position_id):
+            logger.debug(
+                f"Suppressing RISK_LIMIT_BREACH for {position_id} (cooldown active)"
+            )
+            return False
+
+        # Dedup layer 2: DB check for recent events (survives restart)
+        if self._has_recent_breach_event(position_id):
+            logger.debug(
+                f"Suppressing RISK_LIMIT_BREACH for {position_id} (recent event in DB)"
+            )
+            # Backfill in-memory cooldown from DB
+            self._breach_emitted[position_id] = datetime.utcnow()
+            return False
+
+        logger.warning(f"Critical alert: {payload.get('message')}")
+        self._stamp_latency(payload, observed_at)
+        self.event_bus.emit(EventType.RISK_LIMIT_BREACH, payload=payload)
+        # Record emission time for cooldown
+        self._breach_emitted[position_id] = datetime.utcnow()
+        return True
+
     async def _check_critical_alerts(self) -> None:
         """Check positions for critical alerts (approaching stop loss).
 
@@ -185,28 +487,9 @@ class EventDetector:
 
             for alert in critical_alerts:
                 if alert.alert_type in ("stop_loss", "assignment_risk"):
-                    # Dedup layer 1: in-memory cooldown
-                    if self._is_breach_on_cooldown(alert.position_id):
-                        logger.debug(
-                            f"Suppressing RISK_LIMIT_BREACH for "
-                            f"{alert.position_id} (cooldown active)"
-                        )
-                        continue
-
-                    # Dedup layer 2: DB check for recent events (survives restart)
-                    if self._has_recent_breach_event(alert.position_id):
-                        logger.debug(
-                            f"Suppressing RISK_LIMIT_BREACH for "
-                            f"{alert.position_id} (recent event in DB)"
-                        )
-                        # Backfill in-memory cooldown from DB
-                        self._breach_emitted[alert.position_id] = datetime.utcnow()
-                        continue
-
-                    logger.warning(f"Critical alert: {alert.message}")
-                    self.event_bus.emit(
-                        EventType.RISK_LIMIT_BREACH,
-                        payload={
+                    self._emit_breach(
+                        alert.position_id,
+                        {
                             "breach_type": f"critical_{alert.alert_type}",
                             "position_id": alert.position_id,
                             "message": alert.message,
@@ -214,8 +497,6 @@ class EventDetector:
                             "threshold": alert.threshold,
                         },
                     )
-                    # Record emission time for cooldown
-                    self._breach_emitted[alert.position_id] = datetime.utcnow()
 
         except Exception as e:
             logger.debug(f"Position alert check failed: {e}")
@@ -260,3 +541,43 @@ class EventDetector:
         except Exception as e:
             logger.debug(f"Could not check recent breach events: {e}")
             return False
+
+
+def load_detection_latency_summary(session, days: int = 7) -> dict:
+    """Summarise tick -> emit latency of recent tick-driven breach events.
+
+    Args:
+        session: SQLAlchemy session
+        days: Look-back window in days
+
+    Returns:
+        {"days", "overall": summary, "by_breach_type": {type: summary}}
+    """
+    from src.utils.timezone import utc_now
+
+    cutoff = utc_now() - timedelta(days=days)
+    events = (
+        session.query(DaemonEvent)
+        .filter(
+            DaemonEvent.event_type == EventType.RISK_LIMIT_BREACH.value,
+            DaemonEvent.created_at >= cutoff,
+        )
+        .all()
+    )
+    overall: list[float] = []
+    by_type: dict[str, list[float]] = {}
+    for event in events:
+        payload = event.payload or {}
+        latency = payload.get("detection_latency_ms")
+        if latency is None:
+            continue
+        overall.append(latency)
+        by_type.setdefault(payload.get("breach_type", "unknown"), []).append(latency)
+    return {
+        "days": days,
+        "overall": summarize_latencies(overall, include_histogram=True),
+        "by_breach_type": {
+            breach_type: summarize_latencies(values)
+            for breach_type, values in sorted(by_type.items())
+        },
+    }
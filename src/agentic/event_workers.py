@@ -0,0 +1,133 @@
+"""Concurrent event processing for the agentic daemon.
+
+The daemon used to process events strictly one at a time, so a slow Claude
+call for one POSITION_EXIT_CHECK held up every other pending check.
+EventWorkerPool runs claimed events on a bounded set of asyncio workers:
+
+- At most ``max_workers`` events are in flight; submit() waits for a free
+  slot, so the event stream is throttled rather than buffered.
+- Events for the same trade/position share an ordering lane and run one
+  at a time, in claim order. Events without a trade/position (MARKET_OPEN,
+  SCHEDULED_CHECK, learning events, ...) share the "daemon" lane, so
+  daemon-wide work stays sequential.
+- Per-event-type limits cap how many events of a type run at once.
+
+Usage:
+    pool = EventWorkerPool(handle, max_workers=4, type_limits={"POSITION_EXIT_CHECK": 3})
+    async for event in event_bus.stream(claim=True):
+        await pool.submit(event)
+    await pool.drain()
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from loguru import logger
+
+from src.data.models import DaemonEvent
+
+# Lane shared by events that are not tied to a single trade/position
+DAEMON_LANE = "daemon"
+
+
+def ordering_key(event: DaemonEvent) -> str:
+    """Lane in which an event must be processed sequentially.
+
+    Args:
+        event: Daemon event
+
+    Returns:
+        "trade:<id>", "position:<id>", or DAEMON_LANE
+    """
+    payload = event.payload or {}
+    if payload.get("trade_id"):
+        return f"trade:{payload['trade_id']}"
+    if payload.get("position_id"):
+        return f"position:{payload['position_id']}"
+    return DAEMON_LANE
+
+
+class EventWorkerPool:
+    """Bounded asyncio worker pool with per-lane ordering and per-type limits."""
+
+    def __init__(
+        self,
+        handler: Callable[[DaemonEvent], Awaitable[None]],
+        max_workers: int = 4,
+        type_limits: Optional[dict[str, int]] = None,
+    ):
+        """Initialize worker pool.
+
+        Args:
+            handler: Coroutine function processing one (already claimed) event
+            max_workers: Maximum events processed concurrently
+            type_limits: Event type -> maximum concurrent events of that type
+        """
+        self.handler = handler
+        self.max_workers = max_workers
+        self._slots = asyncio.Semaphore(max_workers)
+        self._type_limits = {
+            event_type: asyncio.Semaphore(limit)
+            for event_type, limit in (type_limits or {}).items()
+        }
+        # lane -> (lock, number of events queued or running in the lane)
+        self._lanes: dict[str, tuple[asyncio.Lock, int]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """Events submitted and not yet finished."""
+        return len(self._tasks)
+
+    async def submit(self, event: DaemonEvent) -> None:
+        """Schedule an event, waiting until a worker slot is free."""
+        await self._slots.acquire()
+        lane = ordering_key(event)
+        lock, count = self._lanes.get(lane) or (asyncio.Lock(), 0)
+        self._lanes[lane] = (lock, count + 1)
+        task = asyncio.create_task(self._run(event, lane, lock))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, event: DaemonEvent, lane: str, lock: asyncio.Lock) -> None:
+        try:
+            # Lane first, then type: the holder of a type slot never waits
+            # on anything else, so the two cannot deadlock.
+            async with lock:
+                type_limit = self._type_limits.get(event.event_type)
+                if type_limit is None:
+                    await self.handler(event)
+                else:
+                    async with type_limit:
+                        await self.handler(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Event worker failed on {event.event_type} (id={event.id}): {e}")
+        finally:
+            lock, count = self._lanes[lane]
+            if count <= 1:
+                del self._lanes[lane]
+            else:
+                self._lanes[lane] = (lock, count - 1)
+            self._slots.release()
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for in-flight events to finish.
+
+        Args:
+            timeout: Seconds to wait; remaining events are cancelled after it
+
+        Returns:
+            True if every event finished before the timeout
+        """
+        if not self._tasks:
+            return True
+        done, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"Cancelled {len(pending)} in-flight events at shutdown")
+            await asyncio.gather(*pending, return_exceptions=True)
+        return not pending
@@ -0,0 +1,240 @@
+"""Decision memo for per-position exit checks.
+
+A material position gets a POSITION_EXIT_CHECK on every scheduled cycle.
+Each one used to pay for full context enrichment (market data, option
+quotes) and a Claude call, even when the position had not moved since the
+last check and Claude had just answered MONITOR_ONLY.
+
+The memo keys each trade's last MONITOR_ONLY decision by a cheap
+fingerprint computed from the event payload and cached state only (P&L
+bucket, DTE, earnings flag, VIX regime from working memory, autonomy
+level), before any enrichment. A check whose fingerprint matches a fresh
+entry reuses the decision and skips both enrichment and reasoning.
+
+Entries expire after a TTL and are dropped by fills, closes, risk alerts
+and session boundaries, so anything that could change the answer forces a
+new call. Hits are written to decision_audit with the original call's cost
+as ``saved_cost_usd``, which the cost views aggregate.
+
+Usage:
+    memo = ExitDecisionMemo(ttl_seconds=900)
+    fp = exit_check_fingerprint(event.payload, vix=18.2, autonomy_level=2)
+    entry = memo.lookup(trade_id, fp)       # None on miss
+    memo.store(trade_id, fp, decision, cost_usd=0.012, audit_id=audit.id)
+    memo.invalidate_for_event("ORDER_FILLED")
+"""
+
+import hashlib
+import json
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from src.agentic.reasoning_engine import DecisionOutput
+from src.data.models import DecisionAudit
+from src.utils.timezone import utc_now
+
+DECISION_SOURCE = "exit_memo"
+
+# P&L bucket width (percentage points). The exit grey zone (+50..+75%,
+# -100..-300%) spans several buckets, so a real move still re-asks Claude.
+EXIT_MEMO_PNL_STEP_PCT = 10.0
+
+# Events after which no memoized exit decision can be trusted
+INVALIDATING_EVENTS = frozenset(
+    {
+        "ORDER_FILLED",
+        "POSITION_CLOSED",
+        "RISK_LIMIT_BREACH",
+        "MARKET_OPEN",
+        "MARKET_CLOSE",
+        "TWS_RECONNECTED",
+    }
+)
+
+# Executed actions that change positions
+INVALIDATING_ACTIONS = frozenset(
+    {"EXECUTE_TRADES", "CLOSE_POSITION", "CLOSE_ALL_POSITIONS"}
+)
+
+
+def vix_regime(vix: Any) -> str:
+    """VIX regime bucket — matches the VIX Regime Table thresholds."""
+    try:
+        value = float(vix or 0)
+    except (ValueError, TypeError):
+        value = 0.0
+    if value < 15:
+        return "low"
+    if value < 20:
+        return "normal"
+    if value < 30:
+        return "elevated"
+    if value < 40:
+        return "high"
+    return "extreme"
+
+
+def exit_check_fingerprint(
+    payload: dict, vix: Any = None, autonomy_level: Any = None
+) -> Optional[str]:
+    """Fingerprint of the inputs that decide a position exit check.
+
+    Args:
+        payload: POSITION_EXIT_CHECK event payload
+        vix: Last known VIX (cached, not fetched)
+        autonomy_level: Current autonomy level
+
+    Returns:
+        Short hex digest, or None if the payload lacks trade_id/pnl_pct
+    """
+    trade_id = payload.get("trade_id")
+    try:
+        pnl_pct = float(payload.get("pnl_pct"))
+    except (ValueError, TypeError):
+        return None
+    if not trade_id:
+        return None
+
+    essential = {
+        "trade_id": str(trade_id),
+        "pnl_bucket": math.floor(pnl_pct / EXIT_MEMO_PNL_STEP_PCT),
+        "dte": payload.get("dte"),
+        "earnings_in_dte": payload.get("earnings_in_dte"),
+        "vix_regime": vix_regime(vix),
+        "autonomy": autonomy_level if isinstance(autonomy_level, int) else None,
+    }
+    raw = json.dumps(essential, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+@dataclass
+class MemoEntry:
+    """A memoized exit decision for one trade."""
+
+    fingerprint: str
+    decision: DecisionOutput
+    cost_usd: float
+    audit_id: Optional[int]
+    stored_at: float
+
+
+class ExitDecisionMemo:
+    """Per-trade memo of MONITOR_ONLY exit decisions, keyed by fingerprint."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize memo.
+
+        Args:
+            ttl_seconds: Maximum age of a reused decision (0 disables the memo)
+            clock: Time source (seconds)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, MemoEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved_usd = 0.0
+
+    def lookup(self, trade_id: str, fingerprint: Optional[str]) -> Optional[MemoEntry]:
+        """Fresh entry for the trade with the same fingerprint, or None."""
+        entry = self._entries.get(str(trade_id))
+        if (
+            entry is None
+            or fingerprint is None
+            or entry.fingerprint != fingerprint
+            or self._clock() - entry.stored_at >= self.ttl_seconds
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.saved_usd += entry.cost_usd
+        return entry
+
+    def age_seconds(self, entry: MemoEntry) -> float:
+        return self._clock() - entry.stored_at
+
+    def store(
+        self,
+        trade_id: str,
+        fingerprint: Optional[str],
+        decision: DecisionOutput,
+        cost_usd: float,
+        audit_id: Optional[int] = None,
+    ) -> None:
+        """Memoize a MONITOR_ONLY decision (other actions are never reused)."""
+        if fingerprint is None or self.ttl_seconds <= 0:
+            return
+        if decision.action != "MONITOR_ONLY":
+            self._entries.pop(str(trade_id), None)
+            return
+        self._entries[str(trade_id)] = MemoEntry(
+            fingerprint=fingerprint,
+            decision=decision,
+            cost_usd=cost_usd,
+            audit_id=audit_id,
+            stored_at=self._clock(),
+        )
+
+    def invalidate(self, trade_id: Optional[str] = None) -> None:
+        """Drop one trade's entry, or every entry."""
+        if trade_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(str(trade_id), None)
+
+    def invalidate_for_event(self, event_type: Optional[str]) -> None:
+        if event_type in INVALIDATING_EVENTS:
+            self.invalidate()
+
+    def invalidate_for_action(self, action: Optional[str]) -> None:
+        if action in INVALIDATING_ACTIONS:
+            self.invalidate()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def load_exit_memo_summary(db: Session, days: int = 1) -> dict:
+    """Aggregate exit-check memo hits from decision_audit.
+
+    Args:
+        db: SQLAlchemy session
+        days: Lookback window
+
+    Returns:
+        {"exit_checks", "memo_hits", "hit_rate", "saved_usd", "days"}
+    """
+    cutoff = utc_now() - timedelta(days=days)
+    rows = (
+        db.query(DecisionAudit.decision_metadata)
+        .filter(
+            DecisionAudit.event_type == "POSITION_EXIT_CHECK",
+            DecisionAudit.timestamp >= cutoff,
+        )
+        .all()
+    )
+    hits = 0
+    saved = 0.0
+    for (meta,) in rows:
+        if isinstance(meta, dict) and meta.get("decision_source") == DECISION_SOURCE:
+            hits += 1
+            saved += float(meta.get("saved_cost_usd") or 0.0)
+    return {
+        "exit_checks": len(rows),
+        "memo_hits": hits,
+        "hit_rate": round(hits / len(rows), 4) if rows else 0.0,
+        "saved_usd": round(saved, 4),
+        "days": days,
+    }
@@ -6,7 +6,8 @@ verify that market conditions haven't changed significantly since context
 was built, that order parameters are within configured bounds, and that
 we're not exceeding rate limits.
 
-Cost: 1 IBKR data request for live state diff.
+Cost: none when the shared market-conditions snapshot is fresh, else 1 IBKR
+data request for live state diff.
 """
 
 from __future__ import annotations
@@ -42,6 +43,9 @@ class ExecutionGate:
     5. Earnings proximity: blocks execution when earnings are imminent
     """
 
+    # Oldest shared market-conditions snapshot accepted before an order
+    LIVE_DATA_MAX_AGE_SECONDS = 15.0
+
     def __init__(self):
         self._order_timestamps: deque = deque(maxlen=100)
 
@@ -476,12 +480,14 @@ class ExecutionGate:
         )
 
     def _fetch_live_data(self, ibkr_client) -> tuple[float, float]:
-        """Fetch live VIX and SPY from IBKR using sync ib_async calls.
+        """Fetch live VIX and SPY, from the shared snapshot when fresh enough.
 
-        Uses the synchronous ib_async API directly (qualifyContracts + reqMktData
-        + sleep) rather than going through async MarketConditionMonitor. This avoids
-        the event loop deadlock that occurs when trying to run async code from a
-        sync method while the daemon's asyncio loop is already running.
+        Reads the streamed market-conditions snapshot if it is no older than
+        LIVE_DATA_MAX_AGE_SECONDS. Otherwise uses the synchronous ib_async API
+        directly (qualifyContracts + reqMktData + sleep) rather than going
+        through async MarketConditionMonitor. This avoids the event loop
+        deadlock that occurs when trying to run async code from a sync method
+        while the daemon's asyncio loop is already running.
 
         Args:
             ibkr_client: Connected IBKR client (must have .ib attribute)
@@ -491,6 +497,14 @@ class ExecutionGate:
         """
         from ib_async import Index, Stock
 
+        from src.services.market_conditions import get_market_conditions_service
+
+        snapshot = get_market_conditions_service(ibkr_client).snapshot(
+            max_age_seconds=self.LIVE_DATA_MAX_AGE_SECONDS
+        )
+        if snapshot is not None:
+            return snapshot.vix, snapshot.spy_price
+
         ib = ibkr_client.ib
         live_vix = 20.0  # conservative default
         live_spy = 0.0
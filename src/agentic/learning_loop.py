@@ -6,6 +6,7 @@ Extends existing LearningOrchestrator with:
 3. Outcome feedback: links closed positions to originating decisions
 """
 
+import asyncio
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -112,7 +113,8 @@ class LearningLoop:
         # Run Claude reflection
         if guardrail_summary:
             trades_data.append({"guardrail_summary": guardrail_summary})
-        report = self.engine.reflect(decisions_data, trades_data)
+        # Sonnet call takes seconds: keep it off the daemon's event loop
+        report = await asyncio.to_thread(self.engine.reflect, decisions_data, trades_data)
         report["date"] = str(today)
         report["decisions_count"] = len(decisions_data)
         report["trades_count"] = len(trades_data)
@@ -127,16 +129,25 @@ class LearningLoop:
 
         return report
 
-    def run_weekly_learning(self) -> dict:
+    def run_weekly_learning(self, db_session: Optional[Session] = None) -> dict:
         """Run the weekly learning cycle via existing LearningOrchestrator.
 
+        Args:
+            db_session: Session to run on instead of the loop's own, for
+                running the cycle on a worker thread
+
         Returns:
             Learning report summary dict
         """
         logger.info("Running weekly learning cycle...")
 
+        orchestrator = self.orchestrator
+        if db_session is not None:
+            orchestrator = LearningOrchestrator(db_session)
+            orchestrator.auto_apply_threshold = self.orchestrator.auto_apply_threshold
+
         try:
-            report = self.orchestrator.run_weekly_analysis()
+            report = orchestrator.run_weekly_analysis()
 
             summary = {
                 "timestamp": str(report.timestamp),
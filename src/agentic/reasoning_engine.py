@@ -3,21 +3,32 @@
 Wraps existing BaseAgent. Assembles structured prompts from ReasoningContext,
 calls Claude (Opus for reasoning, Sonnet for reflection), parses DecisionOutput.
 CostTracker records every API call with daily cap enforcement.
+
+Reasoning responses are streamed: actions are surfaced to the caller as
+soon as they are complete (see action_stream), and the time to the first
+action is recorded with the call.
 """
 
 import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Optional
 
 from loguru import logger
 from sqlalchemy.orm import Session
 from sqlalchemy import func as sa_func
+from sqlalchemy.exc import IntegrityError
 
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import BaseAgent, cache_savings_usd
+from src.agentic.action_stream import EarlyAction, IncrementalActionParser
 from src.agentic.config import ClaudeConfig
 from src.agentic.working_memory import ReasoningContext
-from src.data.models import ClaudeApiCost
+from src.data.models import ClaudeApiCost, ClaudeDailyCost
+from src.utils.latency import percentile
 from src.utils.timezone import utc_now
 
 
@@ -281,11 +292,27 @@ REFLECTION_SYSTEM_PROMPT = (
 # Valid actions for position exit checks (subset of VALID_ACTIONS)
 POSITION_EXIT_ACTIONS = {"CLOSE_POSITION", "MONITOR_ONLY"}
 
+# Output budget per position in a batched exit check (reasoning + JSON)
+EXIT_BATCH_TOKENS_PER_POSITION = 400
+
 # Valid actions for scheduled checks (same as VALID_ACTIONS — per-position exits
 # are handled separately via POSITION_EXIT_ACTIONS)
 SCHEDULED_CHECK_ACTIONS = VALID_ACTIONS
 
 
+def exit_check_positions(payload: Optional[dict]) -> list[dict]:
+    """Per-position payloads of a POSITION_EXIT_CHECK event.
+
+    A batched check carries ``{"positions": [...]}``; a single check is
+    its own (only) position.
+    """
+    payload = payload or {}
+    positions = payload.get("positions")
+    if isinstance(positions, list):
+        return [p for p in positions if isinstance(p, dict)]
+    return [payload] if payload else []
+
+
 @dataclass
 class DecisionOutput:
     """Parsed output from Claude reasoning."""
@@ -303,22 +330,121 @@ class CostTracker:
 
     Records every API call to claude_api_costs table and checks
     daily totals before allowing new calls.
+
+    With a session_factory, each read/write uses a short-lived session of
+    its own, so the tracker is safe to use from the worker threads Claude
+    calls run on.
+
+    The day's running total is kept in memory, so most can_call() checks do
+    no database work. It is seeded once per UTC day from the
+    claude_daily_costs counter row, and record() increments that row in the
+    same transaction as the cost row and adopts the incremented value.
+    Spend recorded by other processes (dashboard, scanner) is picked up by
+    re-reading the counter row (a primary-key lookup) once the cached total
+    is older than refresh_seconds.
     """
 
-    def __init__(self, db_session: Session, daily_cap_usd: float = 10.0):
+    def __init__(
+        self,
+        db_session: Session,
+        daily_cap_usd: float = 10.0,
+        session_factory: Optional[Callable[[], Session]] = None,
+        refresh_seconds: float = 30.0,
+    ):
         self.db = db_session
         self.daily_cap_usd = daily_cap_usd
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._day: Optional[date] = None
+        self._total = 0.0
+        self._loaded_at = 0.0
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        if self.session_factory is None:
+            yield self.db
+            return
+        session = self.session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
 
     def get_daily_total(self) -> float:
         """Get today's total Claude API cost in USD."""
         today = utc_now().date()
+        now = time.monotonic()
+        with self._lock:
+            seeded = self._day == today
+            if seeded and now - self._loaded_at < self.refresh_seconds:
+                return self._total
+        with self._session() as db:
+            # Later reads only need the counter row; no row means no spend yet
+            if seeded:
+                total = self._load_counter(db, today)
+            else:
+                total = self._load_total(db, today)
+        with self._lock:
+            if self._day != today:
+                self._day, self._total = today, total
+            elif total is not None:
+                self._total = max(self._total, total)
+            self._loaded_at = now
+            return self._total
+
+    @classmethod
+    def _load_total(cls, db: Session, day: date) -> float:
+        counter = cls._load_counter(db, day)
+        if counter is not None:
+            return counter
+        return cls._range_total(db, day)
+
+    @staticmethod
+    def _load_counter(db: Session, day: date) -> Optional[float]:
+        return (
+            db.query(ClaudeDailyCost.total_usd)
+            .filter(ClaudeDailyCost.day == day)
+            .scalar()
+        )
+
+    @staticmethod
+    def _range_total(db: Session, day: date) -> float:
+        # Range on the raw column so the timestamp index is used
+        day_start = datetime.combine(day, datetime.min.time())
         result = (
-            self.db.query(sa_func.sum(ClaudeApiCost.cost_usd))
-            .filter(sa_func.date(ClaudeApiCost.timestamp) == today)
+            db.query(sa_func.sum(ClaudeApiCost.cost_usd))
+            .filter(
+                ClaudeApiCost.timestamp >= day_start,
+                ClaudeApiCost.timestamp < day_start + timedelta(days=1),
+            )
             .scalar()
         )
         return result or 0.0
 
+    @classmethod
+    def _increment(cls, db: Session, day: date, cost_usd: float) -> float:
+        """Add cost_usd to the day's counter row and return the new total."""
+        updated = (
+            db.query(ClaudeDailyCost)
+            .filter(ClaudeDailyCost.day == day)
+            .update(
+                {ClaudeDailyCost.total_usd: ClaudeDailyCost.total_usd + cost_usd},
+                synchronize_session=False,
+            )
+        )
+        if not updated:
+            # First call of the day: seed from anything already logged
+            total = cls._range_total(db, day) + cost_usd
+            db.add(ClaudeDailyCost(day=day, total_usd=total))
+            db.flush()
+            return total
+        return (
+            db.query(ClaudeDailyCost.total_usd)
+            .filter(ClaudeDailyCost.day == day)
+            .scalar()
+        )
+
     def can_call(self) -> bool:
         """Check if we're under the daily cost cap."""
         return self.get_daily_total() < self.daily_cap_usd
@@ -331,30 +457,162 @@ class CostTracker:
         output_tokens: int,
         cost_usd: float,
         decision_audit_id: Optional[int] = None,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        latency_ms: Optional[float] = None,
+        first_action_ms: Optional[float] = None,
     ) -> None:
         """Record an API call cost.
 
         Args:
             model: Model ID used
             purpose: reasoning, reflection, or embedding
-            input_tokens: Input token count
+            input_tokens: Uncached input token count
             output_tokens: Output token count
             cost_usd: Estimated cost in USD
             decision_audit_id: Optional FK to decision_audit
+            cache_creation_tokens: Input tokens written to the prompt cache
+            cache_read_tokens: Input tokens read from the prompt cache
+            latency_ms: API round trip
+            first_action_ms: Streamed calls: request start to first action
         """
-        daily_total = self.get_daily_total() + cost_usd
-        record = ClaudeApiCost(
-            timestamp=utc_now(),
-            model=model,
-            purpose=purpose,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_usd=cost_usd,
-            daily_total_usd=daily_total,
-            decision_audit_id=decision_audit_id,
+        timestamp = utc_now()
+        day = timestamp.date()
+        with self._session() as db:
+            for attempt in range(2):
+                try:
+                    daily_total = self._increment(db, day, cost_usd)
+                    record = ClaudeApiCost(
+                        timestamp=timestamp,
+                        model=model,
+                        purpose=purpose,
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        cache_creation_tokens=cache_creation_tokens,
+                        cache_read_tokens=cache_read_tokens,
+                        latency_ms=latency_ms,
+                        first_action_ms=first_action_ms,
+                        cost_usd=cost_usd,
+                        daily_total_usd=daily_total,
+                        decision_audit_id=decision_audit_id,
+                    )
+                    db.add(record)
+                    db.commit()
+                    break
+                except IntegrityError:
+                    # Another process created today's counter row first
+                    db.rollback()
+                    if attempt:
+                        raise
+
+        with self._lock:
+            if self._day == day:
+                # Totals only grow; a slower concurrent record may finish last
+                self._total = max(self._total, daily_total)
+            else:
+                self._day, self._total = day, daily_total
+            self._loaded_at = time.monotonic()
+
+
+def load_streaming_summary(db: Session, days: int = 1) -> dict:
+    """Time to first action for streamed reasoning calls.
+
+    Args:
+        db: SQLAlchemy session
+        days: Lookback window
+
+    Returns:
+        {"streamed_calls", "first_action_p50_ms", "first_action_p95_ms",
+        "completion_p50_ms", "head_start_pct" (share of the p50 completion
+        time by which the action was known earlier), "days"}
+    """
+    cutoff = utc_now() - timedelta(days=days)
+    rows = (
+        db.query(ClaudeApiCost.first_action_ms, ClaudeApiCost.latency_ms)
+        .filter(
+            ClaudeApiCost.timestamp >= cutoff,
+            ClaudeApiCost.first_action_ms.isnot(None),
         )
-        self.db.add(record)
-        self.db.commit()
+        .all()
+    )
+    first = [r[0] for r in rows]
+    completion = [r[1] for r in rows if r[1] is not None]
+    first_p50 = percentile(first, 50)
+    completion_p50 = percentile(completion, 50)
+    return {
+        "streamed_calls": len(rows),
+        "first_action_p50_ms": first_p50,
+        "first_action_p95_ms": percentile(first, 95),
+        "completion_p50_ms": completion_p50,
+        "head_start_pct": (
+            round((1 - first_p50 / completion_p50) * 100, 1)
+            if first_p50 is not None and completion_p50
+            else None
+        ),
+        "days": days,
+    }
+
+
+def load_prompt_cache_summary(db: Session, days: int = 1) -> dict:
+    """Prompt-cache effectiveness over recent Claude calls.
+
+    Args:
+        db: SQLAlchemy session
+        days: Lookback window
+
+    Returns:
+        {"calls", "cached_calls", "cache_hit_ratio" (share of prompt tokens
+        read from cache), "cache_read_tokens", "cache_creation_tokens",
+        "saved_usd", "cost_reduction_pct", "latency_p50_cached_ms",
+        "latency_p50_uncached_ms", "latency_reduction_pct", "days"}
+    """
+    cutoff = utc_now() - timedelta(days=days)
+    rows = (
+        db.query(
+            ClaudeApiCost.model,
+            ClaudeApiCost.input_tokens,
+            ClaudeApiCost.cache_creation_tokens,
+            ClaudeApiCost.cache_read_tokens,
+            ClaudeApiCost.latency_ms,
+            ClaudeApiCost.cost_usd,
+        )
+        .filter(ClaudeApiCost.timestamp >= cutoff)
+        .all()
+    )
+
+    prompt_tokens = read_tokens = creation_tokens = 0
+    cost = saved = 0.0
+    cached_latency: list[float] = []
+    uncached_latency: list[float] = []
+    for model, input_tokens, creation, read, latency_ms, cost_usd in rows:
+        creation, read = creation or 0, read or 0
+        prompt_tokens += (input_tokens or 0) + creation + read
+        read_tokens += read
+        creation_tokens += creation
+        cost += cost_usd or 0.0
+        saved += cache_savings_usd(model, creation, read)
+        if latency_ms is not None:
+            (cached_latency if read else uncached_latency).append(latency_ms)
+
+    cached_p50 = percentile(cached_latency, 50)
+    uncached_p50 = percentile(uncached_latency, 50)
+    return {
+        "calls": len(rows),
+        "cached_calls": sum(1 for r in rows if r[3]),
+        "cache_hit_ratio": round(read_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
+        "cache_read_tokens": read_tokens,
+        "cache_creation_tokens": creation_tokens,
+        "saved_usd": round(saved, 4),
+        "cost_reduction_pct": round(saved / (cost + saved) * 100, 1) if cost + saved > 0 else 0.0,
+        "latency_p50_cached_ms": cached_p50,
+        "latency_p50_uncached_ms": uncached_p50,
+        "latency_reduction_pct": (
+            round((1 - cached_p50 / uncached_p50) * 100, 1)
+            if cached_p50 is not None and uncached_p50
+            else None
+        ),
+        "days": days,
+    }
 
 
 class ClaudeReasoningEngine:
@@ -369,6 +627,7 @@ class ClaudeReasoningEngine:
         db_session: Session,
         config: Optional[ClaudeConfig] = None,
         entry_days: Optional[list[str]] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
     ):
         """Initialize reasoning engine.
 
@@ -376,10 +635,14 @@ class ClaudeReasoningEngine:
             db_session: SQLAlchemy session for cost tracking
             config: Claude configuration (uses defaults if None)
             entry_days: Configurable entry days (default Monday, Tuesday)
+            session_factory: Per-call sessions for cost tracking, for when
+                reason()/reflect() run on worker threads
         """
         self.db = db_session
         self.config = config or ClaudeConfig()
-        self.cost_tracker = CostTracker(db_session, self.config.daily_cost_cap_usd)
+        self.cost_tracker = CostTracker(
+            db_session, self.config.daily_cost_cap_usd, session_factory=session_factory
+        )
         base_prompt = self.config.reasoning_system_prompt or REASONING_SYSTEM_PROMPT
         self.system_prompt = self._inject_entry_days(
             base_prompt, entry_days or ["Monday", "Tuesday"]
@@ -465,6 +728,7 @@ class ClaudeReasoningEngine:
         context: ReasoningContext,
         event_type: str,
         event_payload: Optional[dict] = None,
+        on_early_action: Optional[Callable[[EarlyAction], None]] = None,
     ) -> list[DecisionOutput]:
         """Run Claude reasoning on the given context.
 
@@ -475,6 +739,10 @@ class ClaudeReasoningEngine:
             context: Assembled reasoning context
             event_type: The triggering event type
             event_payload: Optional event-specific data
+            on_early_action: With streaming, called (on the calling thread)
+                with each valid action as soon as it is complete, before
+                the reasoning finishes. Advisory only: the returned
+                decisions are what counts.
 
         Returns:
             List of DecisionOutput (one per action in the plan).
@@ -491,30 +759,80 @@ class ClaudeReasoningEngine:
                 metadata={"decision_source": "fallback_cost_cap"},
             )]
 
-        # Select prompt variant based on event type
+        # Select prompt variant based on event type. With prompt caching the
+        # stable prefix (system prompt with the strategy rules, then pattern
+        # summaries) is sent as cached blocks ahead of the per-event message.
         is_position_check = event_type == "POSITION_EXIT_CHECK"
-        if is_position_check:
+        batch_positions = (
+            exit_check_positions(event_payload)
+            if is_position_check and "positions" in (event_payload or {})
+            else []
+        )
+        cache_prefix = [] if self.config.prompt_caching else None
+        max_tokens = self.config.max_tokens
+        if batch_positions:
+            # Same system prompt as a single check, so the cached prefix is shared
+            system_prompt = self.config.position_exit_system_prompt or POSITION_EXIT_SYSTEM_PROMPT
+            user_message = self._build_batched_exit_message(context, batch_positions)
+            max_tokens = max(
+                max_tokens, EXIT_BATCH_TOKENS_PER_POSITION * len(batch_positions)
+            )
+        elif is_position_check:
             system_prompt = self.config.position_exit_system_prompt or POSITION_EXIT_SYSTEM_PROMPT
             user_message = self._build_position_exit_message(
                 context, event_payload or {}
             )
         else:
             system_prompt = self.system_prompt
-            user_message = self._build_user_message(context, event_type, event_payload)
+            if cache_prefix is not None:
+                cache_prefix.append(context.patterns_prompt_string())
+            user_message = self._build_user_message(
+                context, event_type, event_payload,
+                include_patterns=cache_prefix is None,
+            )
+
+        # Valid actions by event type
+        if is_position_check:
+            allowed = POSITION_EXIT_ACTIONS
+        elif event_type in ("SCHEDULED_CHECK", "MARKET_OPEN"):
+            allowed = SCHEDULED_CHECK_ACTIONS
+        else:
+            allowed = None
+        # A single exit check is about one trade, known before Claude names it
+        stream_trade_id = (
+            (event_payload or {}).get("trade_id")
+            if is_position_check and not batch_positions
+            else None
+        )
 
         # Call Claude with retry
         for attempt in range(2):  # max 2 attempts
             try:
+                parser = on_text = on_attempt = None
+                if self.config.streaming:
+                    parser = IncrementalActionParser(default_trade_id=stream_trade_id)
+                    on_text = self._early_action_listener(
+                        parser, allowed or VALID_ACTIONS, on_early_action
+                    )
+                    # BaseAgent retries internally: start each of its
+                    # attempts with a fresh scan and clock
+                    on_attempt = parser.reset
                 response = self._reasoning_agent.send_message(
                     system_prompt=system_prompt,
                     user_message=user_message,
-                    max_tokens=self.config.max_tokens,
+                    max_tokens=max_tokens,
                     temperature=self.config.temperature,
+                    cache_prefix=cache_prefix,
+                    on_text=on_text,
+                    on_attempt=on_attempt,
                 )
 
                 # Record cost
+                cache_creation = response.get("cache_creation_input_tokens", 0)
+                cache_read = response.get("cache_read_input_tokens", 0)
                 cost = self._reasoning_agent.estimate_cost(
-                    response["input_tokens"], response["output_tokens"]
+                    response["input_tokens"], response["output_tokens"],
+                    cache_creation, cache_read,
                 )
                 self.cost_tracker.record(
                     model=self.config.reasoning_model,
@@ -522,25 +840,38 @@ class ClaudeReasoningEngine:
                     input_tokens=response["input_tokens"],
                     output_tokens=response["output_tokens"],
                     cost_usd=cost,
+                    cache_creation_tokens=cache_creation,
+                    cache_read_tokens=cache_read,
+                    latency_ms=response.get("latency_ms"),
+                    first_action_ms=parser.first_action_ms if parser else None,
                 )
 
                 # Parse response — restrict valid actions by event type
-                if is_position_check:
-                    allowed = POSITION_EXIT_ACTIONS
-                elif event_type in ("SCHEDULED_CHECK", "MARKET_OPEN"):
-                    allowed = SCHEDULED_CHECK_ACTIONS
-                else:
-                    allowed = None
                 decisions = self._parse_response(
                     response["content"],
                     valid_actions=allowed,
                 )
+                if decisions and batch_positions:
+                    # One decision per batched position; each is charged its
+                    # share of the call for the exit memo
+                    decisions = self._match_batch_decisions(decisions, batch_positions)
+                    share = round(cost / len(batch_positions), 6)
+                    for d in decisions:
+                        d.metadata["exit_batch_size"] = len(batch_positions)
+                        if not d.metadata.get("decision_source"):
+                            d.metadata["call_cost_usd"] = share
+                    return decisions
                 if decisions:
                     # For position exit checks, ensure trade_id is in metadata
                     if is_position_check and event_payload:
                         for d in decisions:
                             if not d.metadata.get("trade_id"):
                                 d.metadata["trade_id"] = event_payload.get("trade_id", "")
+                    # Per-call cost, so a memoized exit decision knows what
+                    # reusing it saves
+                    if is_position_check:
+                        for d in decisions:
+                            d.metadata["call_cost_usd"] = round(cost, 6)
                     return decisions
 
                 if attempt == 0:
@@ -562,6 +893,31 @@ class ClaudeReasoningEngine:
             metadata={"decision_source": "fallback_api_error"},
         )]
 
+    @staticmethod
+    def _early_action_listener(
+        parser: IncrementalActionParser,
+        allowed: set[str],
+        on_early_action: Optional[Callable[[EarlyAction], None]],
+    ) -> Callable[[str], None]:
+        """Stream callback: feed the parser, pass on valid early actions."""
+
+        def on_text(text: str) -> None:
+            for early in parser.feed(text):
+                if early.action not in allowed:
+                    continue
+                logger.info(
+                    f"Early action {early.action} for {early.trade_id or '-'} "
+                    f"after {early.elapsed_ms:.0f}ms"
+                )
+                if on_early_action is None:
+                    continue
+                try:
+                    on_early_action(early)
+                except Exception as e:
+                    logger.warning(f"Early action handler failed: {e}")
+
+        return on_text
+
     def reflect(self, decisions_today: list[dict], trades_today: list[dict]) -> dict:
         """Run EOD reflection using Sonnet.
 
@@ -609,6 +965,7 @@ class ClaudeReasoningEngine:
         context: ReasoningContext,
         event_type: str,
         event_payload: Optional[dict] = None,
+        include_patterns: bool = True,
     ) -> str:
         """Build the user message for Claude from context and event."""
         parts = [
@@ -618,7 +975,7 @@ class ClaudeReasoningEngine:
         if event_payload:
             parts.append(f"\n## Event Data\n{json.dumps(event_payload, indent=2, default=str)}")
 
-        parts.append(f"\n{context.to_prompt_string()}")
+        parts.append(f"\n{context.to_prompt_string(include_patterns=include_patterns)}")
 
         parts.append(
             "\n## Instructions\n"
@@ -754,6 +1111,144 @@ class ClaudeReasoningEngine:
 
         return "\n".join(parts)
 
+    def _build_batched_exit_message(
+        self,
+        context: ReasoningContext,
+        positions: list[dict],
+    ) -> str:
+        """Build one user message for several position exit checks.
+
+        Market and portfolio context is stated once; each position gets a
+        compact table row plus its escalation reason, and Claude returns
+        one decision per trade_id.
+
+        Args:
+            context: Full reasoning context (we extract selectively)
+            positions: Per-position POSITION_EXIT_CHECK payloads
+
+        Returns:
+            User message string for Claude
+        """
+        by_trade = {pos.get("trade_id"): pos for pos in context.open_positions}
+        shared = positions[0]
+
+        def fmt(val, fmt_str=".2f", suffix=""):
+            if val is None:
+                return "?"
+            try:
+                return f"{val:{fmt_str}}{suffix}"
+            except (ValueError, TypeError):
+                return str(val)
+
+        parts = [
+            f"## {len(positions)} Positions Under Evaluation",
+            "",
+            "Evaluate each position independently. Hard rules do not apply to "
+            "any of them; each was escalated for genuine ambiguity.",
+            "",
+            "**Shared Context**",
+            f"- VIX current: {context.market_context.get('vix', 'Unknown')}",
+            f"- Portfolio delta: {fmt(shared.get('portfolio_delta'))}",
+            f"- Margin utilisation: {fmt(shared.get('margin_utilisation_pct'), '.1f', '%')}",
+            f"- Is OpEx week: {'Yes' if shared.get('is_opex_week') else 'No'}",
+            "",
+            "**Positions** (delta and IV shown entry->now; ? = unknown)",
+            "| trade_id | option | exp (DTE) | qty | premium entry->now | P&L | "
+            "delta | delta trend | to strike | stock trend | IV | IV trend | earnings in DTE |",
+            "|---|---|---|---|---|---|---|---|---|---|---|---|---|",
+        ]
+        for p in positions:
+            trade_id = p.get("trade_id", "UNKNOWN")
+            pos = by_trade.get(trade_id) or {}
+            snap = p.get("snapshot") or {}
+            option_code = "C" if str(p.get("option_type", "PUT")).upper() in ("CALL", "C") else "P"
+            parts.append(
+                f"| {trade_id} | {p.get('symbol', 'UNKNOWN')} {p.get('strike', 0)}{option_code} "
+                f"| {pos.get('expiration', '?')} ({p.get('dte', '?')}) "
+                f"| {pos.get('contracts', '?')} "
+                f"| {pos.get('entry_premium', '?')}->{snap.get('current_premium', '?')} "
+                f"| {fmt(p.get('pnl_pct'), '+.1f', '%')} "
+                f"| {fmt(snap.get('entry_delta'), '.3f')}->{fmt(snap.get('delta'), '.3f')} "
+                f"| {snap.get('delta_trend', '?')} "
+                f"| {fmt(snap.get('distance_to_strike_pct'), '.1f', '%')} "
+                f"| {snap.get('stock_trend', '?')} "
+                f"| {fmt(snap.get('entry_iv'), '.1f')}->{fmt(snap.get('iv'), '.1f')} "
+                f"| {snap.get('iv_trend', '?')} "
+                f"| {self._format_earnings(p)} |"
+            )
+
+        parts += ["", "## Why the Rule Engine Escalated Each Position"]
+        for p in positions:
+            parts.append(
+                f"- {p.get('trade_id', 'UNKNOWN')}: "
+                f"{p.get('escalation_reason', 'No specific reason provided')} "
+                f"({p.get('sector_context', 'Unknown')})"
+            )
+
+        parts += [
+            "",
+            "## Response Format",
+            "Respond with ONLY valid JSON containing exactly one action per trade_id above:",
+            "```json",
+            "{",
+            '  "assessment": "one sentence on what these positions have in common, if anything",',
+            '  "actions": [',
+            "    {",
+            '      "metadata": {"trade_id": "<trade_id from the table>"},',
+            '      "action": "CLOSE_POSITION" or "MONITOR_ONLY",',
+            "      \"confidence\": 0.0-1.0,",
+            '      "reasoning": "SYMBOL STRIKEtype exp=DATE (DTE=N): OBSERVATION: ... TENSION: ... RESOLUTION: ...",',
+            '      "key_factors": ["the 2-3 factors that drove your decision"],',
+            '      "risks_considered": ["risks on the other side of your decision"],',
+            '      "learning_signal": "one sentence on what pattern this decision represents"',
+            "    }",
+            "  ]",
+            "}",
+            "```",
+        ]
+
+        return "\n".join(parts)
+
+    @staticmethod
+    def _match_batch_decisions(
+        decisions: list[DecisionOutput], positions: list[dict]
+    ) -> list[DecisionOutput]:
+        """Align a batched response with the positions that were asked about.
+
+        Keeps the first decision per batched trade_id, drops decisions for
+        trades that were not in the batch, and falls back to MONITOR_ONLY for
+        positions Claude did not answer. Returned in batch order.
+        """
+        assessment = ""
+        for d in decisions:
+            assessment = d.metadata.pop("_plan_assessment", None) or assessment
+
+        wanted = [str(p.get("trade_id")) for p in positions if p.get("trade_id")]
+        by_trade: dict[str, DecisionOutput] = {}
+        for d in decisions:
+            tid = str(d.metadata.get("trade_id") or "")
+            if tid not in wanted:
+                logger.warning(f"Batched exit decision for unknown trade '{tid}' dropped")
+            elif tid not in by_trade:
+                by_trade[tid] = d
+
+        results = []
+        for tid in wanted:
+            d = by_trade.get(tid)
+            if d is None:
+                logger.warning(f"Batched exit check returned no decision for {tid}")
+                d = DecisionOutput(
+                    action="MONITOR_ONLY",
+                    confidence=1.0,
+                    reasoning=f"No decision returned for {tid} in batched exit check.",
+                    key_factors=["batch_missing_decision"],
+                    metadata={"decision_source": "fallback_batch_missing", "trade_id": tid},
+                )
+            results.append(d)
+        if results and assessment:
+            results[0].metadata["_plan_assessment"] = assessment
+        return results
+
     def _format_earnings(self, payload: dict) -> str:
         """Format earnings proximity for the position exit message.
 
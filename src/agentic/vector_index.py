@@ -0,0 +1,334 @@
+"""Local vector index for past-decision similarity search.
+
+WorkingMemory.retrieve_similar_context used to work only on PostgreSQL
+with pgvector; on SQLite it returned nothing, since no vectors were stored.
+This index runs in-process on any backend:
+
+- float32 unit vectors in a memory-mapped file next to a row-id file, so
+  the index survives restarts without rebuilding from the database;
+- exact search (one matrix-vector product) while the index is small, then
+  an inverted-file (IVF) structure once it passes ``train_threshold``
+  vectors. Vectors are clustered around ~sqrt(n) centroids, and a query
+  scans only the ``nprobe`` closest lists. Inserts go straight into their
+  list, and the centroids are retrained each time the index doubles;
+- ``hash_embedding``, a local text embedding (hashed word unigrams and
+  bigrams), so decisions can be indexed and queried offline without an
+  embedding API.
+
+Scores are cosine distances (1 - cosine similarity), matching pgvector's
+``<=>`` operator, so callers see the same values on either path.
+
+Vectors from different embedding sources are not comparable even when their
+lengths match, so each index records the name of its embedder in meta.json
+and refuses to reopen under another one.
+
+Usage:
+    index = LocalVectorIndex(dim=256, path="data/decision_index")
+    index.add(embedding_row_id, index.embed("CLOSE_POSITION AAPL 180P ..."))
+    index.search(index.embed("AAPL put near strike"), k=5)  # [(id, distance)]
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from loguru import logger
+
+DEFAULT_DIM = 256
+DEFAULT_NPROBE = 16
+IVF_TRAIN_THRESHOLD = 10_000
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+INITIAL_CAPACITY = 1024
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[._-][a-z0-9]+)*")
+
+_VECTORS_FILE = "vectors.f32"
+_IDS_FILE = "ids.i64"
+_META_FILE = "meta.json"
+_CENTROIDS_FILE = "centroids.npy"
+
+HASH_EMBEDDER = "hash"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def hash_embedding(text: str, dim: int = DEFAULT_DIM) -> np.ndarray:
+    """Embed text locally by hashing words and word pairs into ``dim`` buckets.
+
+    Deterministic across processes (blake2b, not the salted built-in
+    hash). Texts sharing symbols, actions and phrasing land close together,
+    which is what decision recall needs; it is not a semantic model.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vec = np.zeros(dim, dtype=np.float32)
+    for feature in features:
+        h = int.from_bytes(
+            hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+        )
+        vec[h % dim] += 1.0 if h >> 63 else -1.0
+    return _normalize(vec)
+
+
+class LocalVectorIndex:
+    """Approximate k-NN over float32 vectors, optionally memory-mapped."""
+
+    def __init__(
+        self,
+        dim: int = DEFAULT_DIM,
+        path: Optional[Union[str, Path]] = None,
+        embed_fn: Optional[Callable[[str], np.ndarray]] = None,
+        nprobe: int = DEFAULT_NPROBE,
+        train_threshold: int = IVF_TRAIN_THRESHOLD,
+        embedder: str = HASH_EMBEDDER,
+    ):
+        """Initialize index.
+
+        Args:
+            dim: Vector dimension
+            path: Directory for the memory-mapped files (None = in memory)
+            embed_fn: Text embedding function (defaults to hash_embedding)
+            nprobe: IVF lists scanned per query
+            train_threshold: Vectors needed before switching from exact search
+            embedder: Name of the embedding source behind the stored vectors;
+                a custom embed_fn needs a name of its own
+
+        Raises:
+            ValueError: If an existing index has another dim or embedder
+        """
+        if embed_fn is not None and embedder == HASH_EMBEDDER:
+            raise ValueError("A custom embed_fn needs its own embedder name")
+        self.dim = dim
+        self.path = Path(path) if path else None
+        self.embedder = embedder
+        self.embed_fn = embed_fn or (lambda text: hash_embedding(text, dim))
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.count = 0
+        self.max_id = 0
+        self._lock = threading.Lock()
+
+        # IVF state (None until trained)
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: list[list[int]] = []
+        self._list_arrays: dict[int, np.ndarray] = {}
+        self._trained_at = 0
+
+        if self.path is None:
+            self._vectors = np.zeros((INITIAL_CAPACITY, dim), dtype=np.float32)
+            self._ids = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        else:
+            self._open()
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_fn(text)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta_file = self.path / _META_FILE
+        capacity = INITIAL_CAPACITY
+        if meta_file.exists():
+            meta = json.loads(meta_file.read_text())
+            if meta["dim"] != self.dim:
+                raise ValueError(
+                    f"Vector index at {self.path} has dim {meta['dim']}, expected {self.dim}"
+                )
+            # Indexes written before the embedder was recorded only held hash vectors
+            stored = meta.get("embedder", HASH_EMBEDDER)
+            if stored != self.embedder:
+                raise ValueError(
+                    f"Vector index at {self.path} holds {stored!r} embeddings, "
+                    f"expected {self.embedder!r}"
+                )
+            self.count = meta["count"]
+            capacity = max(meta["capacity"], INITIAL_CAPACITY)
+            self._trained_at = meta.get("trained_at", 0)
+        self._map(capacity)
+        if self.count:
+            self.max_id = int(self._ids[: self.count].max())
+        centroids_file = self.path / _CENTROIDS_FILE
+        if self._trained_at and centroids_file.exists():
+            # Reuse the saved clustering; only list membership is rebuilt
+            self._set_centroids(np.load(centroids_file))
+            self._assign_all()
+        elif self.count >= self.train_threshold:
+            self._train()
+
+    def _map(self, capacity: int) -> None:
+        for name, width in ((_VECTORS_FILE, self.dim * 4), (_IDS_FILE, 8)):
+            file = self.path / name
+            if not file.exists() or file.stat().st_size < capacity * width:
+                with open(file, "ab") as f:
+                    f.truncate(capacity * width)
+        self._vectors = np.memmap(
+            self.path / _VECTORS_FILE, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+        self._ids = np.memmap(self.path / _IDS_FILE, dtype=np.int64, mode="r+", shape=(capacity,))
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        if self.path is None:
+            vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+            ids = np.zeros(capacity, dtype=np.int64)
+            vectors[: self.count] = self._vectors[: self.count]
+            ids[: self.count] = self._ids[: self.count]
+            self._vectors, self._ids = vectors, ids
+        else:
+            self._vectors.flush()
+            self._ids.flush()
+            self._map(capacity)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self._vectors.flush()
+        self._ids.flush()
+        # Count is written last, so a crash mid-insert leaves the old count
+        meta = {
+            "dim": self.dim,
+            "embedder": self.embedder,
+            "count": self.count,
+            "capacity": len(self._ids),
+            "trained_at": self._trained_at,
+        }
+        tmp = self.path / (_META_FILE + ".tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, self.path / _META_FILE)
+
+    # ------------------------------------------------------------------
+    # Inserts
+    # ------------------------------------------------------------------
+
+    def add(self, item_id: int, vector: Sequence[float]) -> None:
+        """Insert one vector under an integer id (e.g. decision_embeddings.id)."""
+        self.add_many([item_id], [vector])
+
+    def add_many(self, item_ids: Sequence[int], vectors: Sequence[Sequence[float]]) -> None:
+        """Insert a batch of vectors, persisting once."""
+        if not len(item_ids):
+            return
+        batch = _normalize(np.asarray(vectors, dtype=np.float32).reshape(len(item_ids), -1))
+        if batch.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim vectors, got {batch.shape[1]}")
+        with self._lock:
+            start = self.count
+            self._ensure_capacity(start + len(batch))
+            self._vectors[start : start + len(batch)] = batch
+            self._ids[start : start + len(batch)] = item_ids
+            self.count += len(batch)
+            self.max_id = max(self.max_id, int(max(item_ids)))
+
+            if self.trained and self.count < 2 * self._trained_at:
+                self._assign(range(start, self.count))
+            elif self.count >= self.train_threshold:
+                self._train()
+            self._save()
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def _nearest_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1)
+
+    def _assign(self, rows: range) -> None:
+        rows = np.arange(rows.start, rows.stop)
+        labels = self._nearest_centroids(self._vectors[rows])
+        order = np.argsort(labels, kind="stable")
+        centroids, starts = np.unique(labels[order], return_index=True)
+        for centroid, group in zip(centroids, np.split(rows[order], starts[1:])):
+            self._lists[centroid].extend(group.tolist())
+            self._list_arrays.pop(int(centroid), None)
+
+    def _assign_all(self) -> None:
+        chunk = 65_536
+        for start in range(0, self.count, chunk):
+            self._assign(range(start, min(self.count, start + chunk)))
+
+    def _set_centroids(self, centroids: np.ndarray) -> None:
+        self._centroids = centroids
+        self._lists = [[] for _ in range(len(centroids))]
+        self._list_arrays = {}
+
+    def _train(self) -> None:
+        """Spherical k-means on a sample, then assign every vector to a list."""
+        n = self.count
+        nlist = max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(0)
+        sample_size = min(n, nlist * KMEANS_SAMPLE_PER_LIST)
+        sample = np.asarray(self._vectors[np.sort(rng.choice(n, sample_size, replace=False))])
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = _normalize(sums)
+
+        self._set_centroids(centroids)
+        self._assign_all()
+        self._trained_at = n
+        if self.path is not None:
+            tmp = self.path / (_CENTROIDS_FILE + ".tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, centroids)
+            os.replace(tmp, self.path / _CENTROIDS_FILE)
+        logger.info(f"Vector index trained: {n} vectors in {nlist} lists")
+
+    def _list_rows(self, centroid: int) -> np.ndarray:
+        rows = self._list_arrays.get(centroid)
+        if rows is None:
+            rows = np.asarray(self._lists[centroid], dtype=np.int64)
+            self._list_arrays[centroid] = rows
+        return rows
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, vector: Sequence[float], k: int = 5) -> list[tuple[int, float]]:
+        """k nearest ids by cosine distance, closest first."""
+        query = _normalize(np.asarray(vector, dtype=np.float32).reshape(-1))
+        if query.shape[0] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim query, got {query.shape[0]}")
+        with self._lock:
+            if not self.count or k <= 0:
+                return []
+            if self.trained:
+                nprobe = min(self.nprobe, len(self._lists))
+                probe = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+                rows = np.concatenate([self._list_rows(int(c)) for c in probe])
+            else:
+                rows = np.arange(self.count)
+            if not len(rows):
+                return []
+            scores = self._vectors[rows] @ query
+            top = min(k, len(rows))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+            return [
+                (int(self._ids[rows[i]]), float(1.0 - scores[i])) for i in best
+            ]
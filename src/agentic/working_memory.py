@@ -1,11 +1,19 @@
 """Crash-safe working memory for the agentic daemon.
 
-PostgreSQL-backed context store using single-row upsert pattern.
-Loads prior state on startup (never starts empty if history exists).
-Supports pgvector semantic search for past decision retrieval.
+PostgreSQL-backed context store. Every change is appended to the
+working_memory_deltas journal as one small typed row, so a write costs the
+same however much history is held; the single working_memory row is a
+snapshot that the journal is periodically compacted into. On startup the
+snapshot is loaded and newer deltas are replayed (never starts empty if
+history exists), and the recovery time is reported.
+Past-decision similarity search uses a LocalVectorIndex when one is
+attached (any backend), otherwise pgvector on PostgreSQL.
+DB-backed context sections are cached in a ContextSectionCache and only
+rebuilt when an event invalidates them.
 """
 
 import json
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -14,18 +22,32 @@ from typing import Any, Optional
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from src.agentic.context_sections import (
+    SECTION_PATTERNS,
+    SECTION_POSITIONS,
+    SECTION_RECENT_TRADES,
+    ContextSectionCache,
+    sections_for_event,
+)
+from src.agentic.vector_index import LocalVectorIndex
 from src.data.models import (
     DecisionAudit,
     DecisionEmbedding,
     Pattern,
     Position,
     Trade,
+    WorkingMemoryDelta,
     WorkingMemoryRow,
 )
 from src.utils.timezone import utc_now
 
 # Maximum recent decisions to keep in memory
 MAX_RECENT_DECISIONS = 50
+MAX_ANOMALIES = 20
+MAX_REFLECTIONS = 30
+
+# Journal rows appended before they are folded into the snapshot
+COMPACT_EVERY_DELTAS = 200
 
 
 @dataclass
@@ -69,12 +91,32 @@ class ReasoningContext:
     # Data limitations (set by ContextValidator)
     data_limitations: list[str] = field(default_factory=list)
 
-    def to_prompt_string(self) -> str:
+    def patterns_prompt_string(self) -> str:
+        """Active pattern summaries (changes only with weekly learning).
+
+        Stable across events, so the reasoning engine can send it as a
+        cached prompt block ahead of the per-event context.
+        """
+        if not self.active_patterns:
+            return ""
+        lines = [f"## Active Patterns ({len(self.active_patterns)}) [source: pattern detector]"]
+        for p in self.active_patterns[:5]:
+            lines.append(
+                f"  - {p.get('name', '?')}: win_rate={p.get('win_rate', '?')}, "
+                f"confidence={p.get('confidence', '?')}"
+            )
+        return "\n".join(lines)
+
+    def to_prompt_string(self, include_patterns: bool = True) -> str:
         """Serialize context to a structured prompt string for Claude.
 
         Includes symbol scope, data timestamp, and data limitations
         to ground Claude's reasoning in the provided data.
 
+        Args:
+            include_patterns: Include active patterns (False when they are
+                sent separately as a cached block)
+
         Returns:
             Formatted string for inclusion in Claude prompt
         """
@@ -169,13 +211,8 @@ class ReasoningContext:
             for key in other_keys:
                 sections.append(f"  - {key}: {self.market_context[key]}")
 
-        if self.active_patterns:
-            sections.append(f"\n## Active Patterns ({len(self.active_patterns)}) [source: pattern detector]")
-            for p in self.active_patterns[:5]:
-                sections.append(
-                    f"  - {p.get('name', '?')}: win_rate={p.get('win_rate', '?')}, "
-                    f"confidence={p.get('confidence', '?')}"
-                )
+        if self.active_patterns and include_patterns:
+            sections.append(f"\n{self.patterns_prompt_string()}")
 
         if self.recent_decisions:
             sections.append(f"\n## Recent Decisions ({len(self.recent_decisions)}) [source: decision audit]")
@@ -247,22 +284,37 @@ class ReasoningContext:
 class WorkingMemory:
     """PostgreSQL-backed context store with crash-safe state.
 
-    Uses single-row upsert pattern in working_memory table.
-    Loads prior state on startup so the daemon never starts empty
-    if history exists.
+    Changes are journaled as typed deltas in working_memory_deltas and
+    compacted into the single working_memory snapshot row every
+    COMPACT_EVERY_DELTAS deltas. Loading replays the journal over the
+    snapshot, so the daemon never starts empty if history exists.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        context_cache: Optional[ContextSectionCache] = None,
+        vector_index: Optional[LocalVectorIndex] = None,
+    ):
         """Initialize working memory from database.
 
         Args:
             db_session: SQLAlchemy session
+            context_cache: Section cache for assemble_context (new if None)
+            vector_index: Local index for similarity search (pgvector if None)
         """
         self.db = db_session
+        self.context_cache = context_cache or ContextSectionCache()
+        self.vector_index = vector_index
+        self._last_delta_id = 0
+        self._pending_deltas = 0
+        self.replayed_deltas = 0
+        self.recovery_ms = 0.0
         self._load_from_db()
 
     def _load_from_db(self) -> None:
-        """Load state from database on startup."""
+        """Load the snapshot and replay newer journal deltas."""
+        start = time.perf_counter()
         row = self.db.query(WorkingMemoryRow).get(1)
         if row:
             self.strategy_state = row.strategy_state or {}
@@ -274,10 +326,6 @@ class WorkingMemory:
             self.autonomy_level = row.autonomy_level
             self.reflection_reports = row.reflection_reports or []
             self.last_scheduled_fingerprint: str = row.last_scheduled_fingerprint or ""
-            logger.info(
-                f"Working memory loaded: autonomy=L{self.autonomy_level}, "
-                f"decisions={len(self.recent_decisions)}"
-            )
         else:
             self.strategy_state: dict = {}
             self.market_context: dict = {}
@@ -286,10 +334,59 @@ class WorkingMemory:
             self.autonomy_level: int = 1
             self.reflection_reports: list = []
             self.last_scheduled_fingerprint: str = ""
+
+        deltas = (
+            self.db.query(WorkingMemoryDelta)
+            .order_by(WorkingMemoryDelta.id)
+            .all()
+        )
+        for delta in deltas:
+            self._apply(delta.kind, delta.payload)
+            self._last_delta_id = delta.id
+        self.replayed_deltas = self._pending_deltas = len(deltas)
+        self.recovery_ms = round((time.perf_counter() - start) * 1000.0, 1)
+
+        if row or deltas:
+            logger.info(
+                f"Working memory loaded: autonomy=L{self.autonomy_level}, "
+                f"decisions={len(self.recent_decisions)}, "
+                f"replayed {self.replayed_deltas} deltas in {self.recovery_ms}ms"
+            )
+        else:
             logger.info("Working memory initialized (empty)")
 
+    def _apply(self, kind: str, payload: Any) -> None:
+        """Apply one journal delta to the in-memory state."""
+        if kind == "decision":
+            self.recent_decisions.append(payload)
+        elif kind == "anomaly":
+            self.anomalies = (self.anomalies + [payload])[-MAX_ANOMALIES:]
+        elif kind == "reflection":
+            self.reflection_reports = (self.reflection_reports + [payload])[-MAX_REFLECTIONS:]
+        elif kind == "market_context":
+            self.market_context = payload or {}
+        elif kind == "strategy_state":
+            self.strategy_state = payload or {}
+        elif kind == "autonomy_level":
+            self.autonomy_level = payload["level"]
+        elif kind == "scheduled_fingerprint":
+            self.last_scheduled_fingerprint = payload["fingerprint"]
+        else:
+            logger.warning(f"Unknown working memory delta kind: {kind}")
+
+    def _record(self, kind: str, payload: Any) -> None:
+        """Apply a change and append it to the journal (compacting as due)."""
+        self._apply(kind, payload)
+        delta = WorkingMemoryDelta(kind=kind, payload=payload)
+        self.db.add(delta)
+        self.db.commit()
+        self._last_delta_id = delta.id
+        self._pending_deltas += 1
+        if self._pending_deltas >= COMPACT_EVERY_DELTAS:
+            self.save()
+
     def save(self) -> None:
-        """Persist current state to database (upsert)."""
+        """Write the snapshot row (upsert) and drop the journal it covers."""
         row = self.db.query(WorkingMemoryRow).get(1)
         if row is None:
             row = WorkingMemoryRow(id=1)
@@ -304,7 +401,12 @@ class WorkingMemory:
         row.last_scheduled_fingerprint = self.last_scheduled_fingerprint
         row.updated_at = utc_now()
 
+        if self._last_delta_id:
+            self.db.query(WorkingMemoryDelta).filter(
+                WorkingMemoryDelta.id <= self._last_delta_id
+            ).delete(synchronize_session=False)
         self.db.commit()
+        self._pending_deltas = 0
 
     def add_decision(self, decision: dict) -> None:
         """Add a decision to recent history (FIFO, max 50).
@@ -312,8 +414,7 @@ class WorkingMemory:
         Args:
             decision: Decision data dictionary
         """
-        self.recent_decisions.append(decision)
-        self.save()
+        self._record("decision", decision)
 
     def update_market_context(self, context: dict) -> None:
         """Update market context.
@@ -321,8 +422,7 @@ class WorkingMemory:
         Args:
             context: Market context data
         """
-        self.market_context = context
-        self.save()
+        self._record("market_context", context)
 
     def update_strategy_state(self, state: dict) -> None:
         """Update strategy state.
@@ -330,8 +430,7 @@ class WorkingMemory:
         Args:
             state: Strategy state data
         """
-        self.strategy_state = state
-        self.save()
+        self._record("strategy_state", state)
 
     def set_autonomy_level(self, level: int) -> None:
         """Set the current autonomy level.
@@ -339,11 +438,18 @@ class WorkingMemory:
         Args:
             level: Autonomy level (1-4)
         """
-        self.autonomy_level = max(1, min(4, level))
-        self.save()
+        self._record("autonomy_level", {"level": max(1, min(4, level))})
+
+    def set_scheduled_fingerprint(self, fingerprint: str) -> None:
+        """Record the context fingerprint of the last reasoned SCHEDULED_CHECK.
+
+        Args:
+            fingerprint: SHA256 of the material context fields
+        """
+        self._record("scheduled_fingerprint", {"fingerprint": fingerprint})
 
     def add_anomaly(self, anomaly: dict) -> None:
-        """Record an anomaly.
+        """Record an anomaly (keeps the last 20).
 
         Args:
             anomaly: Anomaly description
@@ -351,13 +457,10 @@ class WorkingMemory:
         from src.utils.timezone import market_now
 
         anomaly["timestamp"] = market_now().strftime("%Y-%m-%d %H:%M:%S %Z")
-        self.anomalies.append(anomaly)
-        # Keep only last 20 anomalies
-        self.anomalies = self.anomalies[-20:]
-        self.save()
+        self._record("anomaly", anomaly)
 
     def add_reflection(self, reflection: dict) -> None:
-        """Add an EOD reflection report.
+        """Add an EOD reflection report (keeps the last 30).
 
         Args:
             reflection: Reflection report data
@@ -365,19 +468,22 @@ class WorkingMemory:
         from src.utils.timezone import market_now
 
         reflection["timestamp"] = market_now().strftime("%Y-%m-%d %H:%M:%S %Z")
-        self.reflection_reports.append(reflection)
-        # Keep only last 30 reflections
-        self.reflection_reports = self.reflection_reports[-30:]
-        self.save()
+        self._record("reflection", reflection)
 
-    def assemble_context(self, event_type: Optional[str] = None) -> ReasoningContext:
-        """Build full reasoning context for Claude.
+    def assemble_context(
+        self,
+        event_type: Optional[str] = None,
+        sections: Optional[frozenset] = None,
+    ) -> ReasoningContext:
+        """Build reasoning context for Claude.
 
-        Queries open positions, patterns, experiments from existing models
-        and combines with working memory state.
+        Combines working memory state with the DB-backed sections the event
+        type needs (open positions, patterns, recent trades). Sections are
+        served from the context cache unless an event invalidated them.
 
         Args:
             event_type: Optional event type for context-specific data
+            sections: Sections to assemble (default: sections_for_event)
 
         Returns:
             ReasoningContext ready for prompt assembly
@@ -390,7 +496,28 @@ class WorkingMemory:
             anomalies=self.anomalies,
         )
 
-        # Query open positions
+        self.context_cache.invalidate_for_event(event_type)
+        if sections is None:
+            sections = sections_for_event(event_type)
+
+        builders = (
+            (SECTION_POSITIONS, self._load_positions),
+            (SECTION_PATTERNS, self._load_patterns),
+            (SECTION_RECENT_TRADES, self._load_recent_trades),
+        )
+        for section, builder in builders:
+            if section in sections:
+                for name, value in (self.context_cache.build(section, builder) or {}).items():
+                    setattr(ctx, name, value)
+
+        # Latest reflection
+        if self.reflection_reports:
+            ctx.latest_reflection = self.reflection_reports[-1]
+
+        return ctx
+
+    def _load_positions(self) -> Optional[dict]:
+        """Open option positions, held stock and covered-call annotations."""
         try:
             from src.utils.timezone import trading_date
 
@@ -400,7 +527,7 @@ class WorkingMemory:
                 .filter(Trade.exit_date.is_(None))
                 .all()
             )
-            ctx.open_positions = [
+            open_positions = [
                 {
                     "trade_id": t.trade_id,
                     "symbol": t.symbol,
@@ -414,11 +541,14 @@ class WorkingMemory:
                 }
                 for t in open_trades
             ]
-            ctx.positions_summary = (
-                f"{len(open_trades)} open positions"
-            )
         except Exception as e:
             logger.warning(f"Could not query open positions: {e}")
+            return None
+
+        section = {
+            "open_positions": open_positions,
+            "positions_summary": f"{len(open_trades)} open positions",
+        }
 
         # Query held stock positions and detect covered calls
         try:
@@ -430,7 +560,7 @@ class WorkingMemory:
                 .filter(StockPosition.closed_date.is_(None))
                 .all()
             )
-            ctx.held_stocks = [
+            section["held_stocks"] = [
                 {
                     "symbol": sp.symbol,
                     "shares": sp.shares,
@@ -453,7 +583,7 @@ class WorkingMemory:
                 }
                 for pair in pairs
             }
-            for pos in ctx.open_positions:
+            for pos in open_positions:
                 cc_info = cc_map.get(pos.get("trade_id"))
                 if cc_info:
                     pos["is_covered_call"] = True
@@ -463,7 +593,10 @@ class WorkingMemory:
         except Exception as e:
             logger.debug(f"Could not query stock positions / covered calls: {e}")
 
-        # Query active patterns
+        return section
+
+    def _load_patterns(self) -> Optional[dict]:
+        """Top active patterns by confidence."""
         try:
             patterns = (
                 self.db.query(Pattern)
@@ -472,7 +605,11 @@ class WorkingMemory:
                 .limit(10)
                 .all()
             )
-            ctx.active_patterns = [
+        except Exception as e:
+            logger.warning(f"Could not query patterns: {e}")
+            return None
+        return {
+            "active_patterns": [
                 {
                     "name": p.pattern_name,
                     "type": p.pattern_type,
@@ -483,10 +620,10 @@ class WorkingMemory:
                 }
                 for p in patterns
             ]
-        except Exception as e:
-            logger.warning(f"Could not query patterns: {e}")
+        }
 
-        # Recent closed trades
+    def _load_recent_trades(self) -> Optional[dict]:
+        """Last 10 closed trades."""
         try:
             recent = (
                 self.db.query(Trade)
@@ -495,7 +632,11 @@ class WorkingMemory:
                 .limit(10)
                 .all()
             )
-            ctx.recent_trades = [
+        except Exception as e:
+            logger.warning(f"Could not query recent trades: {e}")
+            return None
+        return {
+            "recent_trades": [
                 {
                     "symbol": t.symbol,
                     "entry_date": str(t.entry_date),
@@ -506,27 +647,27 @@ class WorkingMemory:
                 }
                 for t in recent
             ]
-        except Exception as e:
-            logger.warning(f"Could not query recent trades: {e}")
-
-        # Latest reflection
-        if self.reflection_reports:
-            ctx.latest_reflection = self.reflection_reports[-1]
-
-        return ctx
+        }
 
     def store_embedding(
-        self, decision_audit_id: int, text_content: str, embedding: Optional[list[float]] = None
+        self,
+        decision_audit_id: int,
+        text_content: str,
+        embedding: Optional[list[float]] = None,
+        embedding_source: Optional[str] = None,
     ) -> None:
         """Store a decision embedding for semantic search.
 
         On PostgreSQL with pgvector, stores the vector embedding.
-        On SQLite, stores only the text content (no vector search).
+        With a local vector index, also adds the embedding there if it
+        comes from the index's embedder; otherwise text_content is
+        re-embedded locally.
 
         Args:
             decision_audit_id: FK to decision_audit table
             text_content: The text that was embedded
             embedding: Optional 1536-dim embedding vector
+            embedding_source: Embedder that produced ``embedding``
         """
         record = DecisionEmbedding(
             decision_audit_id=decision_audit_id,
@@ -549,22 +690,83 @@ class WorkingMemory:
 
         self.db.commit()
 
+        if self.vector_index is not None:
+            vector = self._index_vector(embedding, text_content, embedding_source)
+            if vector is not None:
+                self.vector_index.add(record.id, vector)
+
+    def _index_vector(
+        self,
+        embedding: Optional[list[float]],
+        text: Optional[str],
+        source: Optional[str],
+    ) -> Optional[list[float]]:
+        """A vector in the local index's space, or None if there is no input.
+
+        A given embedding is used only if it comes from the index's own
+        embedder; a length match alone does not make two spaces comparable.
+        """
+        if embedding and source == self.vector_index.embedder:
+            if len(embedding) == self.vector_index.dim:
+                return embedding
+        if text:
+            return self.vector_index.embed(text)
+        return None
+
+    def sync_vector_index(self) -> int:
+        """Add decision_embeddings rows newer than the local index to it.
+
+        Backfills a new index from stored text, and picks up rows written by
+        other processes. Returns the number of rows added.
+        """
+        if self.vector_index is None:
+            return 0
+        rows = (
+            self.db.query(DecisionEmbedding.id, DecisionEmbedding.text_content)
+            .filter(DecisionEmbedding.id > self.vector_index.max_id)
+            .order_by(DecisionEmbedding.id)
+            .all()
+        )
+        if rows:
+            self.vector_index.add_many(
+                [row[0] for row in rows],
+                [self.vector_index.embed(row[1]) for row in rows],
+            )
+        return len(rows)
+
     def retrieve_similar_context(
-        self, query_embedding: list[float], k: int = 5
+        self,
+        query_embedding: Optional[list[float]] = None,
+        k: int = 5,
+        query_text: Optional[str] = None,
+        embedding_source: Optional[str] = None,
     ) -> list[dict]:
-        """Retrieve similar past decisions using pgvector cosine similarity.
+        """Retrieve similar past decisions by cosine similarity.
 
-        Feature-gated: only works on PostgreSQL with pgvector.
-        Returns empty list on SQLite.
+        Uses the local vector index when one is attached and the query fits
+        it (an embedding from the index's embedder, or query_text to embed
+        locally). Otherwise falls back to pgvector, which only works on
+        PostgreSQL; returns empty list on SQLite.
 
         Args:
-            query_embedding: 1536-dim query vector
+            query_embedding: Query vector (1536-dim for pgvector)
             k: Number of results to return
+            query_text: Text to embed locally when no usable vector is given
+            embedding_source: Embedder that produced ``query_embedding``
 
         Returns:
             List of similar decision dicts with reasoning and action
         """
-        if not self.db.bind or self.db.bind.dialect.name != "postgresql":
+        if self.vector_index is not None:
+            vector = self._index_vector(query_embedding, query_text, embedding_source)
+            if vector is not None:
+                return self._search_vector_index(vector, k)
+
+        if (
+            not query_embedding
+            or not self.db.bind
+            or self.db.bind.dialect.name != "postgresql"
+        ):
             return []
 
         try:
@@ -599,3 +801,37 @@ class WorkingMemory:
         except Exception as e:
             logger.warning(f"Semantic search failed: {e}")
             return []
+
+    def _search_vector_index(self, vector: list[float], k: int) -> list[dict]:
+        # Over-fetch so ids whose rows were purged still leave k results
+        hits = self.vector_index.search(vector, k * 2)
+        if not hits:
+            return []
+        rows = (
+            self.db.query(
+                DecisionEmbedding.id,
+                DecisionEmbedding.text_content,
+                DecisionAudit.action,
+                DecisionAudit.reasoning,
+                DecisionAudit.confidence,
+            )
+            .join(DecisionAudit, DecisionAudit.id == DecisionEmbedding.decision_audit_id)
+            .filter(DecisionEmbedding.id.in_([item_id for item_id, _ in hits]))
+            .all()
+        )
+        by_id = {row[0]: row for row in rows}
+        results = []
+        for item_id, distance in hits:
+            row = by_id.get(item_id)
+            if row is None:
+                continue
+            results.append(
+                {
+                    "text": row[1],
+                    "action": row[2],
+                    "reasoning": row[3],
+                    "confidence": row[4],
+                    "distance": distance,
+                }
+            )
+        return results[:k]
@@ -3,27 +3,46 @@
 Provides client initialization, model selection, retry logic,
 and cost tracking for all AI agent interactions.
 
-A module-level threading lock serialises all Claude API calls so that
-concurrent callers (e.g. reasoning + CRO running in separate
-asyncio.to_thread workers) do not fire duplicate requests during
-credit exhaustion or rate-limit back-off.
+Calls go through the process-wide LlmLimiter (src.agents.llm_limiter):
+up to N requests in flight, within request and token per-minute budgets.
+Agents with the same API key share one client, so its HTTP connection
+pool is reused across reasoning, reflection, CRO and analysis calls. A
+circuit breaker still stops every caller after a credit/auth failure.
+
+Callers can pass stable prompt blocks as ``cache_prefix``: the system
+prompt and each prefix block are then marked for Anthropic prompt caching,
+so repeated calls only pay full price for the volatile message.
+
+With ``on_text`` the response is streamed and each text chunk is handed
+to the callback as it arrives, so callers can act on the start of a long
+completion; the return value is the same either way.
 """
 
+import asyncio
 import threading
 import time
+from collections.abc import Callable
 from typing import Optional
 
-from anthropic import Anthropic, APIError, APITimeoutError, BadRequestError, RateLimitError
+import httpx
+from anthropic import (
+    Anthropic,
+    APIError,
+    APITimeoutError,
+    BadRequestError,
+    DefaultHttpxClient,
+    RateLimitError,
+)
 from loguru import logger
 
+from src.agents.llm_limiter import estimate_tokens, get_limiter
 from src.config.base import get_config
 
 
-# Serialise all Claude API calls across agent instances.
-# This prevents duplicate concurrent requests when credits are
-# exhausted or the API is rate-limiting — each caller waits its
-# turn instead of independently retrying in parallel.
-_api_lock = threading.Lock()
+# One client (and HTTP connection pool) per API key, shared by all agents
+_clients: dict[str, Anthropic] = {}
+_clients_lock = threading.Lock()
+_POOL_CONNECTIONS = 16
 
 # Circuit breaker: when a credit/auth error is hit, block all calls
 # for this many seconds to avoid hammering the API.
@@ -36,6 +55,52 @@ _PRICING = {
     "claude-sonnet-4-5-20250929": {"input": 3.00, "output": 15.00},
     "claude-opus-4-6": {"input": 15.00, "output": 75.00},
 }
+_DEFAULT_PRICING = {"input": 3.00, "output": 15.00}
+
+# Prompt-cache pricing relative to the input price (5-minute cache)
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+# The API accepts at most 4 cache breakpoints; the system prompt uses one
+_MAX_CACHE_PREFIX_BLOCKS = 3
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _shared_client(api_key: str) -> Anthropic:
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = Anthropic(
+                api_key=api_key,
+                http_client=DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=_POOL_CONNECTIONS,
+                        max_keepalive_connections=_POOL_CONNECTIONS,
+                    )
+                ),
+            )
+            _clients[api_key] = client
+        return client
+
+
+def _usage_tokens(usage, name: str) -> int:
+    """Token count from the usage object (0 when the field is absent)."""
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def cache_savings_usd(
+    model: str, cache_creation_tokens: int, cache_read_tokens: int
+) -> float:
+    """Dollars saved by prompt caching vs. sending the same tokens uncached.
+
+    Reads cost 10% of input instead of 100%; writes cost 25% extra.
+    """
+    price = _PRICING.get(model, _DEFAULT_PRICING)["input"]
+    return (
+        cache_read_tokens * (1.0 - CACHE_READ_MULTIPLIER)
+        - cache_creation_tokens * (CACHE_WRITE_MULTIPLIER - 1.0)
+    ) * price / 1_000_000
 
 
 class BaseAgent:
@@ -68,7 +133,7 @@ class BaseAgent:
                 "Anthropic API key required for AI agent features. "
                 "Set ANTHROPIC_API_KEY in your .env file."
             )
-        self.client = Anthropic(api_key=api_key)
+        self.client = _shared_client(api_key)
         self.model = model
         self.max_retries = max_retries
         self.timeout = timeout
@@ -76,7 +141,31 @@ class BaseAgent:
         # Cost tracking
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cache_creation_tokens = 0
+        self.total_cache_read_tokens = 0
         self.total_requests = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _build_request(
+        system_prompt: str, user_message: str, cache_prefix: Optional[list[str]]
+    ) -> tuple:
+        """Build (system, messages), marking stable blocks for prompt caching."""
+        if cache_prefix is None:
+            return system_prompt, [{"role": "user", "content": user_message}]
+
+        system = [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}]
+        content = []
+        blocks = [b for b in cache_prefix if b]
+        for i, block in enumerate(blocks):
+            entry = {"type": "text", "text": block}
+            # Breakpoints on the last few stable blocks (the cache matches
+            # the longest marked prefix, so earlier blocks are covered)
+            if i >= len(blocks) - _MAX_CACHE_PREFIX_BLOCKS:
+                entry["cache_control"] = _EPHEMERAL
+            content.append(entry)
+        content.append({"type": "text", "text": user_message})
+        return system, [{"role": "user", "content": content}]
 
     def send_message(
         self,
@@ -84,12 +173,15 @@ class BaseAgent:
         user_message: str,
         max_tokens: int = 4096,
         temperature: float = 0.3,
+        cache_prefix: Optional[list[str]] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+        on_attempt: Optional[Callable[[], None]] = None,
     ) -> dict:
         """Send a message to Claude with retry logic.
 
-        All calls are serialised through a module-level lock so that
-        concurrent callers (reasoning, CRO, reflection) cannot fire
-        duplicate requests during credit exhaustion or rate limiting.
+        Each attempt holds a slot of the process-wide LlmLimiter, which
+        bounds in-flight requests and keeps within the request and token
+        per-minute budgets; other callers proceed concurrently.
 
         A circuit breaker trips on credit/auth errors (401/403) and
         blocks all callers for 60 seconds, preventing a storm of
@@ -100,16 +192,26 @@ class BaseAgent:
             user_message: The user/data message
             max_tokens: Maximum response tokens
             temperature: Sampling temperature (lower = more deterministic)
+            cache_prefix: Stable blocks sent ahead of user_message. When
+                given (even empty), the system prompt and these blocks are
+                marked for prompt caching.
+            on_text: Stream the response, passing each text chunk to this
+                callback (a retried attempt streams again from the start)
+            on_attempt: Called once a request slot is held, right before
+                each attempt is sent, so streaming callers can reset their
+                state and clock per attempt
 
         Returns:
-            Dict with 'content', 'input_tokens', 'output_tokens', 'model'
+            Dict with 'content', 'input_tokens' (uncached), 'output_tokens',
+            'cache_creation_input_tokens', 'cache_read_input_tokens',
+            'latency_ms', 'model'
 
         Raises:
             APIError: After all retries exhausted
         """
         global _circuit_breaker_until
 
-        # Check circuit breaker before acquiring the lock
+        # Check circuit breaker before waiting for a slot
         remaining = _circuit_breaker_until - time.monotonic()
         if remaining > 0:
             raise APIError(
@@ -119,96 +221,155 @@ class BaseAgent:
             )
 
         last_error = None
-
-        with _api_lock:
-            for attempt in range(1, self.max_retries + 1):
-                # Re-check circuit breaker inside retry loop
-                if _circuit_breaker_until > time.monotonic():
-                    raise APIError(
-                        message="Circuit breaker tripped during retry — aborting",
-                        request=None,
-                        body=None,
-                    )
-
-                try:
-                    response = self.client.messages.create(
-                        model=self.model,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        system=system_prompt,
-                        messages=[{"role": "user", "content": user_message}],
-                        timeout=self.timeout,
-                    )
-
-                    input_tokens = response.usage.input_tokens
-                    output_tokens = response.usage.output_tokens
+        system, messages = self._build_request(system_prompt, user_message, cache_prefix)
+        limiter = get_limiter()
+        estimated = estimate_tokens(system_prompt, user_message, *(cache_prefix or ()))
+
+        for attempt in range(1, self.max_retries + 1):
+            # Re-check circuit breaker inside retry loop
+            if _circuit_breaker_until > time.monotonic():
+                raise APIError(
+                    message="Circuit breaker tripped during retry — aborting",
+                    request=None,
+                    body=None,
+                )
+
+            wait = 0.0
+            try:
+                request = dict(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system,
+                    messages=messages,
+                    timeout=self.timeout,
+                )
+                with limiter.slot(estimated):
+                    if on_attempt is not None:
+                        on_attempt()
+                    started = time.perf_counter()
+                    if on_text is None:
+                        response = self.client.messages.create(**request)
+                    else:
+                        with self.client.messages.stream(**request) as stream:
+                            for text in stream.text_stream:
+                                on_text(text)
+                            response = stream.get_final_message()
+                    latency_ms = (time.perf_counter() - started) * 1000.0
+
+                input_tokens = response.usage.input_tokens
+                output_tokens = response.usage.output_tokens
+                cache_creation = _usage_tokens(response.usage, "cache_creation_input_tokens")
+                cache_read = _usage_tokens(response.usage, "cache_read_input_tokens")
+                if isinstance(input_tokens, int):
+                    limiter.settle(estimated, input_tokens + cache_creation + cache_read)
+                with self._stats_lock:
                     self.total_input_tokens += input_tokens
                     self.total_output_tokens += output_tokens
+                    self.total_cache_creation_tokens += cache_creation
+                    self.total_cache_read_tokens += cache_read
                     self.total_requests += 1
 
-                    content = response.content[0].text if response.content else ""
-
-                    cost = self.estimate_cost(input_tokens, output_tokens)
-                    logger.info(
-                        f"CLAUDE API CALL: model={self.model}, "
-                        f"tokens={input_tokens}in/{output_tokens}out, "
-                        f"cost=${cost:.4f}, "
-                        f"session_total=${self.session_cost:.4f}"
+                content = response.content[0].text if response.content else ""
+
+                cost = self.estimate_cost(
+                    input_tokens, output_tokens, cache_creation, cache_read
+                )
+                cache_note = (
+                    f", cache={cache_read}read/{cache_creation}write"
+                    if cache_prefix is not None
+                    else ""
+                )
+                logger.info(
+                    f"CLAUDE API CALL: model={self.model}, "
+                    f"tokens={input_tokens}in/{output_tokens}out{cache_note}, "
+                    f"cost=${cost:.4f}, latency={latency_ms:.0f}ms, "
+                    f"session_total=${self.session_cost:.4f}"
+                )
+
+                return {
+                    "content": content,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "cache_creation_input_tokens": cache_creation,
+                    "cache_read_input_tokens": cache_read,
+                    "latency_ms": latency_ms,
+                    "model": self.model,
+                }
+
+            except RateLimitError as e:
+                last_error = e
+                wait = min(2 ** attempt, 30)
+                logger.warning(f"Rate limited (attempt {attempt}/{self.max_retries}), waiting {wait}s")
+
+            except APITimeoutError as e:
+                last_error = e
+                logger.warning(f"Timeout (attempt {attempt}/{self.max_retries})")
+
+            except BadRequestError:
+                raise  # 400 errors are not retryable
+
+            except APIError as e:
+                last_error = e
+                if e.status_code and e.status_code in (401, 403):
+                    # Credit exhaustion or auth failure — trip circuit breaker
+                    _circuit_breaker_until = time.monotonic() + _CIRCUIT_BREAKER_COOLDOWN
+                    logger.error(
+                        f"Credit/auth error ({e.status_code}), "
+                        f"circuit breaker tripped for {_CIRCUIT_BREAKER_COOLDOWN:.0f}s"
                     )
-
-                    return {
-                        "content": content,
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                        "model": self.model,
-                    }
-
-                except RateLimitError as e:
-                    last_error = e
+                    raise
+                elif e.status_code and e.status_code >= 500:
                     wait = min(2 ** attempt, 30)
-                    logger.warning(f"Rate limited (attempt {attempt}/{self.max_retries}), waiting {wait}s")
-                    time.sleep(wait)
-
-                except APITimeoutError as e:
-                    last_error = e
-                    logger.warning(f"Timeout (attempt {attempt}/{self.max_retries})")
-
-                except BadRequestError:
-                    raise  # 400 errors are not retryable
-
-                except APIError as e:
-                    last_error = e
-                    if e.status_code and e.status_code in (401, 403):
-                        # Credit exhaustion or auth failure — trip circuit breaker
-                        _circuit_breaker_until = time.monotonic() + _CIRCUIT_BREAKER_COOLDOWN
-                        logger.error(
-                            f"Credit/auth error ({e.status_code}), "
-                            f"circuit breaker tripped for {_CIRCUIT_BREAKER_COOLDOWN:.0f}s"
-                        )
-                        raise
-                    elif e.status_code and e.status_code >= 500:
-                        wait = min(2 ** attempt, 30)
-                        logger.warning(f"Server error {e.status_code} (attempt {attempt}/{self.max_retries}), waiting {wait}s")
-                        time.sleep(wait)
-                    else:
-                        raise
+                    logger.warning(f"Server error {e.status_code} (attempt {attempt}/{self.max_retries}), waiting {wait}s")
+                else:
+                    raise
+
+            # Back off outside the slot so other callers keep going
+            if wait:
+                time.sleep(wait)
 
         raise last_error  # type: ignore[misc]
 
-    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    async def send_message_async(self, *args, **kwargs) -> dict:
+        """send_message() for coroutines: runs on a worker thread.
+
+        The limiter, not the caller, bounds how many run at once.
+        """
+        return await asyncio.to_thread(self.send_message, *args, **kwargs)
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+    ) -> float:
         """Estimate cost for a request in dollars.
 
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_creation_tokens: Input tokens written to the prompt cache
+            cache_read_tokens: Input tokens read from the prompt cache
 
         Returns:
             Estimated cost in USD
         """
-        pricing = _PRICING.get(self.model, {"input": 3.00, "output": 15.00})
-        return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+        pricing = _PRICING.get(self.model, _DEFAULT_PRICING)
+        input_equivalent = (
+            input_tokens
+            + cache_creation_tokens * CACHE_WRITE_MULTIPLIER
+            + cache_read_tokens * CACHE_READ_MULTIPLIER
+        )
+        return (input_equivalent * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
 
     @property
     def session_cost(self) -> float:
         """Total estimated cost for this agent's session."""
-        return self.estimate_cost(self.total_input_tokens, self.total_output_tokens)
+        return self.estimate_cost(
+            self.total_input_tokens,
+            self.total_output_tokens,
+            self.total_cache_creation_tokens,
+            self.total_cache_read_tokens,
+        )
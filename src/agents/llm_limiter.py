@@ -0,0 +1,173 @@
+"""Process-wide concurrency and rate limiting for Claude API calls.
+
+Every Claude call used to pass through one module-level lock, so
+reasoning, reflection, CRO and performance-analysis calls queued behind
+each other even when the API had headroom. LlmLimiter replaces it:
+
+- up to ``max_concurrency`` requests in flight at once;
+- token buckets for requests per minute and input tokens per minute, so
+  bursts stay under the account's rate limits instead of hitting 429s;
+- queue wait and in-flight counts, to size the concurrency from data.
+
+Callers are threads (BaseAgent.send_message runs via asyncio.to_thread),
+so the limiter blocks with a condition variable rather than awaiting.
+
+Usage:
+    limiter = get_limiter()
+    with limiter.slot(estimated_tokens=3000):
+        response = client.messages.create(...)
+    limiter.settle(estimated_tokens=3000, actual_tokens=2650)
+    limiter.stats()  # {"in_flight", "waiting", "queue_wait_ms": {...}, ...}
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+from src.utils.latency import elapsed_ms, summarize_latencies
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_MINUTE = 50
+DEFAULT_TOKENS_PER_MINUTE = 80_000
+
+# Rough prompt size estimate before the API reports the real count
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(*texts: str) -> int:
+    return sum(len(t or "") for t in texts) // CHARS_PER_TOKEN + 1
+
+
+class TokenBucket:
+    """Budget of units per minute that refills continuously."""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_seconds(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available (0 if now).
+
+        Requests larger than the bucket only wait for a full bucket.
+        """
+        self._refill()
+        needed = min(amount, self.capacity)
+        if self.available >= needed:
+            return 0.0
+        return (needed - self.available) / self.rate
+
+    def take(self, amount: float) -> None:
+        """Spend units; a negative balance is paid back by refill."""
+        self._refill()
+        self.available -= amount
+
+
+class LlmLimiter:
+    """Bounded in-flight Claude requests with per-minute rate budgets."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize limiter.
+
+        Args:
+            max_concurrency: Requests allowed in flight at once
+            requests_per_minute: Request budget
+            tokens_per_minute: Input-token budget
+            clock: Time source (seconds)
+        """
+        self.max_concurrency = max_concurrency
+        self.requests = TokenBucket(requests_per_minute, clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock)
+        self._cond = threading.Condition()
+        self.in_flight = 0
+        self.waiting = 0
+        self._waits: deque[float] = deque(maxlen=1000)
+
+    @contextmanager
+    def slot(self, estimated_tokens: int = 0) -> Iterator[None]:
+        """Hold one in-flight slot, waiting for concurrency and rate budget."""
+        start = time.perf_counter()
+        with self._cond:
+            self.waiting += 1
+            try:
+                while True:
+                    if self.in_flight < self.max_concurrency:
+                        wait = max(
+                            self.requests.wait_seconds(1),
+                            self.tokens.wait_seconds(estimated_tokens),
+                        )
+                        if wait <= 0:
+                            break
+                        self._cond.wait(timeout=min(wait, 1.0))
+                    else:
+                        self._cond.wait()
+                self.requests.take(1)
+                self.tokens.take(estimated_tokens)
+                self.in_flight += 1
+            finally:
+                self.waiting -= 1
+        self._waits.append(elapsed_ms(start))
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token budget once the API reports the real count."""
+        with self._cond:
+            self.tokens.take(actual_tokens - estimated_tokens)
+
+    def queue_wait_summary(self) -> dict:
+        """p50/p95/p99/max of time spent waiting for a slot (ms)."""
+        return summarize_latencies(list(self._waits))
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "queue_wait_ms": self.queue_wait_summary(),
+        }
+
+
+_limiter: Optional[LlmLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> LlmLimiter:
+    """The process-wide limiter (created with defaults on first use)."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = LlmLimiter()
+        return _limiter
+
+
+def configure_limiter(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+    tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+) -> LlmLimiter:
+    """Replace the process-wide limiter (call before the first request)."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = LlmLimiter(max_concurrency, requests_per_minute, tokens_per_minute)
+        return _limiter
@@ -151,6 +151,14 @@ class TechnicalIndicatorCalculator:
 
         return indicators
 
+    @staticmethod
+    def history_duration(days: int) -> str:
+        """IBKR duration string covering `days` trading days of bars.
+
+        Requests slightly more days to account for weekends/holidays.
+        """
+        return f"{days + 30} D"
+
     def _fetch_historical_bars(self, symbol: str, days: int):
         """Fetch historical daily bars from IBKR.
 
@@ -171,8 +179,7 @@ class TechnicalIndicatorCalculator:
                 return None
 
             # Request historical data
-            # Request slightly more days to account for weekends/holidays
-            duration = f"{days + 30} D"
+            duration = self.history_duration(days)
             bars = self.ibkr.get_historical_bars(
                 qualified[0],
                 end_date_time="",
@@ -62,6 +62,16 @@ class MarketDataProvider(Protocol):
 
     def get_contract_details(self, symbol: str) -> dict | None: ...
 
+    def subscribe_market_data(
+        self,
+        contract: Any,
+        generic_tick_list: str = "",
+        snapshot: bool = False,
+        regulatory_snapshot: bool = False,
+    ) -> Any: ...
+
+    def cancel_market_data(self, contract: Any) -> None: ...
+
 
 @runtime_checkable
 class ContractFactory(Protocol):
@@ -94,6 +104,8 @@ class ContractFactory(Protocol):
 
     def qualify_contract(self, contract: Any) -> Any | None: ...
 
+    def qualify_contracts_batch(self, *contracts: Any) -> list: ...
+
 
 @runtime_checkable
 class OrderManager(Protocol):
@@ -120,6 +132,7 @@ class AccountProvider(Protocol):
     def get_positions(self) -> list: ...
     def get_portfolio(self) -> list: ...
     def get_trades(self) -> list: ...
+    def get_open_trades(self) -> list: ...
     def get_orders(self) -> list: ...
     def get_fills(self) -> list: ...
     def get_executions(self) -> list: ...
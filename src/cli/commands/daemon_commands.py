@@ -2,7 +2,7 @@
 
 Provides Typer subgroup `daemon` with commands:
 start, status, context, pause, resume, override, set-autonomy, audit, costs,
-emergency-stop, watchdog, install-service, uninstall-service
+retention, emergency-stop, watchdog, install-service, uninstall-service
 """
 
 import json
@@ -120,36 +120,41 @@ def daemon_context() -> None:
     init_database()
 
     with get_db_session() as db:
-        from src.data.models import WorkingMemoryRow
+        from src.agentic.working_memory import WorkingMemory
+        from src.data.models import WorkingMemoryDelta, WorkingMemoryRow
 
         row = db.query(WorkingMemoryRow).get(1)
-        if not row:
+        if not row and not db.query(WorkingMemoryDelta).first():
             console.print("[dim]No working memory found[/dim]")
             return
 
+        # Snapshot plus any journaled changes not yet compacted
+        memory = WorkingMemory(db)
+
         console.print("[bold]Working Memory Context[/bold]\n")
-        console.print(f"Autonomy Level: L{row.autonomy_level}")
-        console.print(f"Last Updated: {row.updated_at}")
+        console.print(f"Autonomy Level: L{memory.autonomy_level}")
+        console.print(f"Last Snapshot: {row.updated_at if row else 'never'}")
+        console.print(f"Journaled Changes: {memory.replayed_deltas}")
 
-        if row.strategy_state:
+        if memory.strategy_state:
             console.print("\n[cyan]Strategy State:[/cyan]")
-            console.print(json.dumps(row.strategy_state, indent=2, default=str))
+            console.print(json.dumps(memory.strategy_state, indent=2, default=str))
 
-        if row.market_context:
+        if memory.market_context:
             console.print("\n[cyan]Market Context:[/cyan]")
-            console.print(json.dumps(row.market_context, indent=2, default=str))
+            console.print(json.dumps(memory.market_context, indent=2, default=str))
 
-        if row.recent_decisions:
-            console.print(f"\n[cyan]Recent Decisions ({len(row.recent_decisions)}):[/cyan]")
-            for d in (row.recent_decisions or [])[-5:]:
+        if memory.recent_decisions:
+            console.print(f"\n[cyan]Recent Decisions ({len(memory.recent_decisions)}):[/cyan]")
+            for d in list(memory.recent_decisions)[-5:]:
                 console.print(
                     f"  [{d.get('timestamp', '?')}] {d.get('action', '?')} "
                     f"(conf={d.get('confidence', '?')})"
                 )
 
-        if row.anomalies:
-            console.print(f"\n[yellow]Anomalies ({len(row.anomalies)}):[/yellow]")
-            for a in row.anomalies[-5:]:
+        if memory.anomalies:
+            console.print(f"\n[yellow]Anomalies ({len(memory.anomalies)}):[/yellow]")
+            for a in memory.anomalies[-5:]:
                 console.print(f"  - {a.get('description', str(a))}")
 
 
@@ -201,7 +206,8 @@ def daemon_set_autonomy(
     init_database()
 
     with get_db_session() as db:
-        from src.data.models import DaemonHealth, WorkingMemoryRow
+        from src.agentic.working_memory import WorkingMemory
+        from src.data.models import DaemonHealth
 
         # Update health table
         health = db.query(DaemonHealth).get(1)
@@ -209,15 +215,8 @@ def daemon_set_autonomy(
             health.autonomy_level = level
             health.message = f"Autonomy set to L{level} by CLI"
 
-        # Update working memory (create row if needed)
-        row = db.query(WorkingMemoryRow).get(1)
-        if row is None:
-            row = WorkingMemoryRow(id=1, autonomy_level=level)
-            db.add(row)
-        else:
-            row.autonomy_level = level
-
-        db.commit()
+        # Journal the change so it replays after any earlier deltas
+        WorkingMemory(db).set_autonomy_level(level)
         console.print(f"[green]Autonomy level set to L{level}[/green]")
 
 
@@ -276,6 +275,11 @@ def daemon_costs() -> None:
     from sqlalchemy import func as sa_func
 
     with get_db_session() as db:
+        from src.agentic.exit_memo import load_exit_memo_summary
+        from src.agentic.reasoning_engine import (
+            load_prompt_cache_summary,
+            load_streaming_summary,
+        )
         from src.data.models import ClaudeApiCost
 
         today = date.today()
@@ -314,7 +318,91 @@ def daemon_costs() -> None:
         table.add_row("All Time", f"${all_time:.4f}")
         table.add_row("Calls Today", str(total_calls_today))
 
+        memo = load_exit_memo_summary(db, days=1)
+        if memo["exit_checks"]:
+            table.add_row(
+                "Exit Memo Hits",
+                f"{memo['memo_hits']}/{memo['exit_checks']} ({memo['hit_rate']:.0%})",
+            )
+            table.add_row("Exit Memo Saved", f"${memo['saved_usd']:.4f}")
+
+        cache = load_prompt_cache_summary(db, days=1)
+        if cache["calls"]:
+            table.add_row("Prompt Cache Hit", f"{cache['cache_hit_ratio']:.0%} of prompt tokens")
+            table.add_row(
+                "Prompt Cache Saved",
+                f"${cache['saved_usd']:.4f} ({cache['cost_reduction_pct']:.0f}% of cost)",
+            )
+            if cache["latency_reduction_pct"] is not None:
+                table.add_row("Cached Latency", f"p50 {cache['latency_reduction_pct']:.0f}% lower")
+
+        streaming = load_streaming_summary(db, days=1)
+        if streaming["streamed_calls"]:
+            head_start = (
+                f" ({streaming['head_start_pct']:.0f}% early)"
+                if streaming["head_start_pct"] is not None
+                else ""
+            )
+            table.add_row(
+                "First Action",
+                f"p50 {streaming['first_action_p50_ms']:.0f}ms, "
+                f"p95 {streaming['first_action_p95_ms']:.0f}ms{head_start}",
+            )
+
+        console.print(table)
+
+
+@daemon_app.command(name="retention")
+def daemon_retention(
+    archive: bool = typer.Option(
+        False, "--archive", help="Archive eligible rows (default: report only)"
+    ),
+) -> None:
+    """Show daemon table sizes and archive rows past their retention age."""
+    init_database()
+
+    from src.services.retention import RetentionService
+
+    def _fmt_bytes(n):
+        if n is None:
+            return "-"
+        for unit in ("B", "KB", "MB", "GB"):
+            if n < 1024:
+                return f"{n:.0f}{unit}"
+            n /= 1024
+        return f"{n:.1f}TB"
+
+    with get_db_session() as db:
+        service = RetentionService(db)
+        results = {r.table: r for r in service.run(dry_run=not archive)}
+
+        table = Table(title="Daemon Table Retention")
+        table.add_column("Table", style="cyan")
+        table.add_column("Keep (days)", justify="right")
+        table.add_column("Rows", justify="right")
+        table.add_column("Size", justify="right")
+        table.add_column("Archived rows", justify="right")
+        table.add_column("Archive size", justify="right")
+        table.add_column("Archived now" if archive else "Eligible", justify="right")
+        table.add_column("Rows/s", justify="right")
+
+        days = {p.table: p.retention_days for p in service.policies}
+        for size in service.table_sizes():
+            result = results[size["table"]]
+            table.add_row(
+                size["table"],
+                str(days[size["table"]]),
+                str(size["rows"]),
+                _fmt_bytes(size["bytes"]),
+                "-" if size["archive_rows"] is None else str(size["archive_rows"]),
+                _fmt_bytes(size["archive_bytes"]),
+                str(result.rows_archived),
+                f"{result.rows_per_second:.0f}" if archive and result.rows_archived else "-",
+            )
+
         console.print(table)
+        if not archive:
+            console.print("[dim]Report only — pass --archive to move eligible rows[/dim]")
 
 
 @daemon_app.command(name="emergency-stop")
@@ -218,6 +218,8 @@ class ValidationDisplay:
             return "[yellow]\u26a0 ADJUSTED[/yellow]"
         elif status == ValidationStatus.STALE:
             return "[red]\u2717 STALE[/red]"
+        elif status == ValidationStatus.TIMED_OUT:
+            return "[red]\u23f1 TIMED OUT[/red]"
         else:
             return f"[dim]{status.value}[/dim]"
 
@@ -790,7 +790,9 @@ def trade(
         position_monitor = PositionMonitor(client, strategy_config)
         risk_governor = RiskGovernor(client, position_monitor, config)
         order_executor = OrderExecutor(client, config, dry_run=dry_run, risk_governor=risk_governor)
-        exit_manager = ExitManager(client, position_monitor, strategy_config)
+        exit_manager = ExitManager(
+            client, position_monitor, strategy_config, risk_governor=risk_governor
+        )
         entry_snapshot_service = EntrySnapshotService(client, timeout=10)
 
         # STEP 2: Create validator for IBKR enrichment
@@ -1033,13 +1035,20 @@ def trade(
         trades_executed = 0
         trades_rejected = 0
 
+        # Joint portfolio check: trades that only fit one at a time are dropped
+        # here (WhatIf margin is still verified per trade below)
+        batch_check = risk_governor.pre_trade_check_batch(
+            top_opportunities, use_whatif=False
+        )
+        batch_rejections = {id(o): v for o, v in batch_check.rejected}
+
         for i, opp in enumerate(top_opportunities, 1):
             console.print(
                 f"[cyan]Trade {i}/{len(top_opportunities)}: {opp.symbol} ${opp.strike}[/cyan]"
             )
 
             # Risk check
-            risk_check = risk_governor.pre_trade_check(opp)
+            risk_check = batch_rejections.get(id(opp)) or risk_governor.pre_trade_check(opp)
 
             if not risk_check.approved:
                 console.print(f"  [yellow]✗ Rejected: {risk_check.reason}[/yellow]")
@@ -1454,8 +1463,15 @@ def auto_monitor(
 
                     with get_db_session() as eod_session:
                         from src.data.repositories import TradeRepository
+                        from src.services.reconciliation_watermark import (
+                            ReconciliationWatermarkStore,
+                        )
                         eod_trade_repo = TradeRepository(eod_session)
-                        reconciler = OrderReconciliation(client, eod_trade_repo)
+                        reconciler = OrderReconciliation(
+                            client,
+                            eod_trade_repo,
+                            watermarks=ReconciliationWatermarkStore(eod_session),
+                        )
 
                         # 1. Order reconciliation (sync fill prices, statuses, commissions)
                         eod_report = asyncio.run(reconciler.sync_all_orders())
@@ -2008,35 +2024,30 @@ def emergency_stop(
                 console.print(f"Found {len(positions)} positions to close\n")
 
                 # Use ExitManager to properly close all positions
-                exit_manager = ExitManager(client, position_monitor, strategy_config)
-                results = exit_manager.emergency_exit_all()
+                exit_manager = ExitManager(
+                    client, position_monitor, strategy_config, risk_governor=risk_governor
+                )
+                report = exit_manager.emergency_flatten()
 
                 # Display results
-                success_count = 0
-                for result in results:
-                    position = next(
-                        (p for p in positions if p.position_id == result.position_id),
-                        None,
-                    )
-                    if position:
-                        if result.success:
-                            console.print(
-                                f"Closing {position.symbol} ${position.strike} {position.option_type}..."
-                            )
-                            console.print(
-                                f"  [green]✓ Close order placed (Order ID: {result.order_id})[/green]"
-                            )
-                            success_count += 1
-                        else:
-                            console.print(
-                                f"Closing {position.symbol} ${position.strike} {position.option_type}..."
-                            )
-                            console.print(
-                                f"  [red]✗ Failed to close: {result.error_message}[/red]"
-                            )
+                for leg in report.legs:
+                    t = leg.target
+                    console.print(f"Closing {t.symbol} ${t.strike} {t.right}...")
+                    if leg.status == "filled":
+                        console.print(
+                            f"  [green]✓ Filled @ ${leg.fill_price:.2f} in "
+                            f"{leg.filled_at:.1f}s (Order ID: {leg.order_id})[/green]"
+                        )
+                    elif leg.status == "working":
+                        console.print(
+                            f"  [yellow]⏳ Still working @ ${leg.limit_price or 0:.2f} "
+                            f"(Order ID: {leg.order_id})[/yellow]"
+                        )
+                    else:
+                        console.print(f"  [red]✗ Failed to close: {leg.error}[/red]")
 
                 console.print(
-                    f"\n[bold yellow]Liquidation complete: {success_count}/{len(results)} positions closed.[/bold yellow]"
+                    f"\n[bold yellow]Liquidation complete: {report.summary()}[/bold yellow]"
                 )
                 console.print(
                     "[yellow]Run 'nakedtrader monitor' to verify positions are closed.[/yellow]"
@@ -4435,6 +4446,9 @@ def sync_orders(
     import_orphans: bool = typer.Option(
         False, "--import-orphans", help="Import orphan orders from IBKR into database"
     ),
+    full: bool = typer.Option(
+        False, "--full", help="Resync the full TWS history (ignore the watermark)"
+    ),
 ):
     """Sync order status between database and TWS.
 
@@ -4442,10 +4456,15 @@ def sync_orders(
     Updates database with actual fill prices, status, and commissions.
     Optionally imports orphan orders (in IBKR but not in database).
 
+    Today's sync only processes executions newer than the last sync's
+    watermark (shared with the daemon and dashboard); use --full to
+    re-read everything.
+
     Example:
         nakedtrader sync
         nakedtrader sync --date 2026-02-03
         nakedtrader sync --import-orphans
+        nakedtrader sync --full
     """
     console.print("\n[bold cyan]Order Reconciliation[/bold cyan]\n")
 
@@ -4493,13 +4512,22 @@ def sync_orders(
 
             # Create reconciliation service
             from src.services.order_reconciliation import OrderReconciliation
+            from src.services.reconciliation_watermark import (
+                ReconciliationWatermarkStore,
+            )
             import asyncio
 
-            reconciler = OrderReconciliation(ibkr_client, trade_repo)
+            reconciler = OrderReconciliation(
+                ibkr_client,
+                trade_repo,
+                watermarks=ReconciliationWatermarkStore(session),
+            )
 
             # Run reconciliation
             console.print("[yellow]⏳ Fetching orders from TWS...[/yellow]")
-            report = asyncio.run(reconciler.sync_all_orders(sync_date, include_filled))
+            report = asyncio.run(
+                reconciler.sync_all_orders(sync_date, include_filled, full=full)
+            )
 
             # Display report
             _display_reconciliation_report(report, console)
@@ -5186,10 +5214,14 @@ def list_trades(
 
 def _display_reconciliation_report(report, console):
     """Display reconciliation report in rich table format."""
-    console.print(f"\n[bold]Order Sync Report - {report.date}[/bold]\n")
+    mode = getattr(report, "mode", "full")
+    console.print(f"\n[bold]Order Sync Report - {report.date}[/bold] ({mode})\n")
 
     # Summary
+    console.print(f"New executions: [cyan]{getattr(report, 'new_executions', 0)}[/cyan]")
     console.print(f"Total synced: [cyan]{len(report.reconciled)}[/cyan]")
+    if getattr(report, "unchanged", 0):
+        console.print(f"Unchanged (skipped): [dim]{report.unchanged}[/dim]")
     console.print(
         f"Discrepancies found: [yellow]{report.total_discrepancies}[/yellow]"
     )
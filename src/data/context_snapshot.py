@@ -25,6 +25,8 @@ class MarketContext:
         new_lows: Number of stocks at 52-week lows
         sector_leaders: Top performing sectors [(sector, change_pct), ...]
         sector_laggards: Bottom performing sectors [(sector, change_pct), ...]
+        missing_fields: Fields left at their defaults because IBKR did not
+            deliver them before the capture deadline
     """
 
     timestamp: datetime
@@ -39,6 +41,7 @@ class MarketContext:
     new_lows: int | None = None
     sector_leaders: list[tuple[str, float]] = field(default_factory=list)
     sector_laggards: list[tuple[str, float]] = field(default_factory=list)
+    missing_fields: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -55,6 +58,7 @@ class MarketContext:
             "new_lows": self.new_lows,
             "sector_leaders": self.sector_leaders,
             "sector_laggards": self.sector_laggards,
+            "missing_fields": self.missing_fields,
         }
 
     @classmethod
@@ -73,6 +77,7 @@ class MarketContext:
             new_lows=data.get("new_lows"),
             sector_leaders=data.get("sector_leaders", []),
             sector_laggards=data.get("sector_laggards", []),
+            missing_fields=data.get("missing_fields", []),
         )
 
 
@@ -100,6 +105,8 @@ class UnderlyingContext:
         relative_volume: volume / avg_volume
         support_levels: Identified support price levels
         resistance_levels: Identified resistance price levels
+        missing_fields: Fields left at their defaults because IBKR did not
+            deliver them before the capture deadline
     """
 
     symbol: str
@@ -121,6 +128,7 @@ class UnderlyingContext:
     relative_volume: float = 0.0
     support_levels: list[float] = field(default_factory=list)
     resistance_levels: list[float] = field(default_factory=list)
+    missing_fields: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -144,6 +152,7 @@ class UnderlyingContext:
             "relative_volume": self.relative_volume,
             "support_levels": self.support_levels,
             "resistance_levels": self.resistance_levels,
+            "missing_fields": self.missing_fields,
         }
 
     @classmethod
@@ -169,6 +178,7 @@ class UnderlyingContext:
             relative_volume=data.get("relative_volume", 0.0),
             support_levels=data.get("support_levels", []),
             resistance_levels=data.get("resistance_levels", []),
+            missing_fields=data.get("missing_fields", []),
         )
 
 
@@ -0,0 +1,51 @@
+"""Add order_latency table
+
+Per-order lifecycle timings (decision, contract ready, submitted, TWS ack,
+first partial, filled, modifies) recorded by RapidFireExecutor and
+aggregated into per-stage percentiles on the dashboard.
+
+Revision ID: l3m4n5o6p7q8
+Revises: k2l3m4n5o6p7
+Create Date: 2026-03-02 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "l3m4n5o6p7q8"
+down_revision: Union[str, None] = "k2l3m4n5o6p7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "order_latency",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("batch_id", sa.String(36), nullable=False),
+        sa.Column("opportunity_id", sa.Integer(), nullable=True),
+        sa.Column("symbol", sa.String(10), nullable=False),
+        sa.Column("strike", sa.Float(), nullable=True),
+        sa.Column("order_id", sa.Integer(), nullable=True),
+        sa.Column("final_status", sa.String(30), nullable=True),
+        sa.Column("decision_at", sa.DateTime(), nullable=False),
+        sa.Column("contract_ready_ms", sa.Float(), nullable=True),
+        sa.Column("submitted_ms", sa.Float(), nullable=True),
+        sa.Column("acked_ms", sa.Float(), nullable=True),
+        sa.Column("first_partial_ms", sa.Float(), nullable=True),
+        sa.Column("filled_ms", sa.Float(), nullable=True),
+        sa.Column("modify_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("modify_ms", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_order_latency_batch_id", "order_latency", ["batch_id"])
+    op.create_index("ix_order_latency_decision_at", "order_latency", ["decision_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_order_latency_decision_at", table_name="order_latency")
+    op.drop_index("ix_order_latency_batch_id", table_name="order_latency")
+    op.drop_table("order_latency")
@@ -0,0 +1,50 @@
+"""Add reconciliation_watermarks table
+
+Persisted execution watermark (last execId/permId and execution time) so
+order reconciliation only processes executions newer than the previous
+run, shared between the daemon, dashboard and CLI.
+
+Revision ID: m4n5o6p7q8r9
+Revises: l3m4n5o6p7q8
+Create Date: 2026-03-03 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "m4n5o6p7q8r9"
+down_revision: Union[str, None] = "l3m4n5o6p7q8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reconciliation_watermarks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("last_exec_id", sa.String(64), nullable=True),
+        sa.Column("last_perm_id", sa.Integer(), nullable=True),
+        sa.Column("last_exec_time", sa.DateTime(), nullable=True),
+        sa.Column("boundary_exec_ids", sa.JSON(), nullable=True),
+        sa.Column("last_sync_at", sa.DateTime(), nullable=True),
+        sa.Column("last_full_sync_at", sa.DateTime(), nullable=True),
+        sa.Column("last_summary", sa.JSON(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_reconciliation_watermarks_scope",
+        "reconciliation_watermarks",
+        ["scope"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_reconciliation_watermarks_scope", table_name="reconciliation_watermarks"
+    )
+    op.drop_table("reconciliation_watermarks")
@@ -0,0 +1,32 @@
+"""Add missing_context_fields to trade_exit_snapshots
+
+Exit context (exit IV, stock price, VIX) is captured against a deadline;
+fields that did not arrive in time are recorded here instead of being
+indistinguishable from never-requested data.
+
+Revision ID: n5o6p7q8r9s0
+Revises: m4n5o6p7q8r9
+Create Date: 2026-03-06 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n5o6p7q8r9s0"
+down_revision: Union[str, None] = "m4n5o6p7q8r9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "trade_exit_snapshots",
+        sa.Column("missing_context_fields", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("trade_exit_snapshots", "missing_context_fields")
@@ -0,0 +1,44 @@
+"""Add partial indexes for the hot paths of retained tables
+
+The event claim/poll path only reads pending daemon_events, and the
+approval views only read decisions awaiting a human; partial indexes keep
+both lookups small however much history the tables hold. Old rows are
+moved out by src.services.retention.
+
+Revision ID: o6p7q8r9s0t1
+Revises: n5o6p7q8r9s0
+Create Date: 2026-03-07 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o6p7q8r9s0t1"
+down_revision: Union[str, None] = "n5o6p7q8r9s0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_daemon_events_pending",
+        "daemon_events",
+        ["priority", "created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_decision_audit_awaiting_human",
+        "decision_audit",
+        ["timestamp"],
+        postgresql_where=sa.text("human_decision IS NULL AND executed = false"),
+        sqlite_where=sa.text("human_decision IS NULL AND executed = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_decision_audit_awaiting_human", table_name="decision_audit")
+    op.drop_index("ix_daemon_events_pending", table_name="daemon_events")
@@ -0,0 +1,34 @@
+"""Add prompt-cache token and latency columns to claude_api_costs
+
+Reasoning calls mark their stable prompt prefix for Anthropic prompt
+caching. Cache writes and reads are billed differently from plain input,
+so they are recorded separately, with the call latency, to report the
+cache hit ratio and what it saves.
+
+Revision ID: q8r9s0t1u2v3
+Revises: p7q8r9s0t1u2
+Create Date: 2026-03-09 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q8r9s0t1u2v3"
+down_revision: Union[str, None] = "p7q8r9s0t1u2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("claude_api_costs", sa.Column("cache_creation_tokens", sa.Integer(), nullable=True))
+    op.add_column("claude_api_costs", sa.Column("cache_read_tokens", sa.Integer(), nullable=True))
+    op.add_column("claude_api_costs", sa.Column("latency_ms", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("claude_api_costs", "latency_ms")
+    op.drop_column("claude_api_costs", "cache_read_tokens")
+    op.drop_column("claude_api_costs", "cache_creation_tokens")
@@ -0,0 +1,29 @@
+"""Add time-to-first-action column to claude_api_costs
+
+Reasoning responses are streamed and parsed incrementally, so the first
+decided action is known before the reasoning text finishes. The delay from
+request start to that point is recorded per call next to the full latency.
+
+Revision ID: r9s0t1u2v3w4
+Revises: q8r9s0t1u2v3
+Create Date: 2026-03-10 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r9s0t1u2v3w4"
+down_revision: Union[str, None] = "q8r9s0t1u2v3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("claude_api_costs", sa.Column("first_action_ms", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("claude_api_costs", "first_action_ms")
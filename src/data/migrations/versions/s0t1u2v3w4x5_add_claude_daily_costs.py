@@ -0,0 +1,35 @@
+"""Add claude_daily_costs running-total table
+
+The daily cost cap was checked with a SUM over claude_api_costs before
+every Claude call. Each cost insert now also increments a per-day counter
+row, which the cap check reads once and then tracks in memory.
+
+Revision ID: s0t1u2v3w4x5
+Revises: r9s0t1u2v3w4
+Create Date: 2026-03-11 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s0t1u2v3w4x5"
+down_revision: Union[str, None] = "r9s0t1u2v3w4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "claude_daily_costs",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("total_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=True, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("claude_daily_costs")
@@ -17,6 +17,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -986,6 +987,7 @@ class TradeExitSnapshot(Base):
 
     # Metadata
     captured_at = Column(DateTime, nullable=False)
+    missing_context_fields = Column(JSON, nullable=True)  # Exit context not received before the deadline
 
     # Relationships
     trade = relationship("Trade", backref="exit_snapshot", uselist=False)
@@ -1124,6 +1126,14 @@ class DaemonEvent(Base):
 
     __table_args__ = (
         Index("ix_daemon_events_status_priority", "status", "priority", "created_at"),
+        # Claim/poll path only ever reads pending rows
+        Index(
+            "ix_daemon_events_pending",
+            "priority",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1182,6 +1192,16 @@ class DecisionAudit(Base):
 
     created_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        # Decisions awaiting human approval (dashboard, `daemon pending`)
+        Index(
+            "ix_decision_audit_awaiting_human",
+            "timestamp",
+            postgresql_where=text("human_decision IS NULL AND executed = false"),
+            sqlite_where=text("human_decision IS NULL AND executed = 0"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<DecisionAudit(id={self.id}, action={self.action}, confidence={self.confidence})>"
 
@@ -1210,6 +1230,26 @@ class WorkingMemoryRow(Base):
         return f"<WorkingMemory(id={self.id}, autonomy_level={self.autonomy_level})>"
 
 
+class WorkingMemoryDelta(Base):
+    """Append-only journal of working memory changes.
+
+    Each change (a decision, an anomaly, a market context update, ...) is
+    one small typed row. WorkingMemory replays the rows newer than the
+    working_memory snapshot on startup and folds them into the snapshot
+    when compacting.
+    """
+
+    __tablename__ = "working_memory_deltas"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(30), nullable=False)  # decision, anomaly, market_context, ...
+    payload = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<WorkingMemoryDelta(id={self.id}, kind={self.kind})>"
+
+
 class DecisionEmbedding(Base):
     """Semantic search index for past decisions.
 
@@ -1275,8 +1315,12 @@ class ClaudeApiCost(Base):
     timestamp = Column(DateTime, nullable=False, server_default=func.now(), index=True)
     model = Column(String(100), nullable=False)
     purpose = Column(String(50), nullable=False, index=True)  # reasoning, reflection, embedding
-    input_tokens = Column(Integer, nullable=False)
+    input_tokens = Column(Integer, nullable=False)  # Uncached input only
     output_tokens = Column(Integer, nullable=False)
+    cache_creation_tokens = Column(Integer, nullable=True, default=0)  # Prompt prefix written to cache
+    cache_read_tokens = Column(Integer, nullable=True, default=0)  # Prompt prefix served from cache
+    latency_ms = Column(Float, nullable=True)  # API round trip
+    first_action_ms = Column(Float, nullable=True)  # Streamed: request start to first complete action
     cost_usd = Column(Float, nullable=False)
     daily_total_usd = Column(Float, nullable=True)  # Running daily total at time of call
     decision_audit_id = Column(Integer, ForeignKey("decision_audit.id"), nullable=True)
@@ -1289,6 +1333,24 @@ class ClaudeApiCost(Base):
         return f"<ClaudeApiCost(id={self.id}, model={self.model}, cost=${self.cost_usd:.4f})>"
 
 
+class ClaudeDailyCost(Base):
+    """Running Claude API spend per UTC day.
+
+    One row per day, incremented in the same transaction as each
+    claude_api_costs insert. The daily cap check reads this counter
+    (cached in memory per process) instead of summing the cost log.
+    """
+
+    __tablename__ = "claude_daily_costs"
+
+    day = Column(Date, primary_key=True)
+    total_usd = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, nullable=True, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<ClaudeDailyCost(day={self.day}, total=${self.total_usd:.4f})>"
+
+
 class GuardrailMetric(Base):
     """Daily guardrail performance metrics.
 
@@ -1356,3 +1418,71 @@ class DaemonNotification(Base):
 
     def __repr__(self) -> str:
         return f"<DaemonNotification(key={self.notification_key}, status={self.status}, count={self.occurrence_count})>"
+
+
+# ============================================================================
+# Execution Telemetry
+# ============================================================================
+
+
+class OrderLatencyRecord(Base):
+    """Per-order lifecycle timings captured by RapidFireExecutor.
+
+    One compact row per submitted order. Stage columns are millisecond
+    offsets from the execution decision (monotonic clock), so rows can be
+    aggregated into per-stage p50/p95/p99 without timezone arithmetic.
+    """
+
+    __tablename__ = "order_latency"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    batch_id = Column(String(36), nullable=False, index=True)  # One execute_all() call
+    opportunity_id = Column(Integer, nullable=True)
+    symbol = Column(String(10), nullable=False)
+    strike = Column(Float, nullable=True)
+    order_id = Column(Integer, nullable=True)  # Final IBKR order ID (after modifies)
+    final_status = Column(String(30), nullable=True)
+
+    decision_at = Column(DateTime, nullable=False, index=True)  # UTC wall clock
+    contract_ready_ms = Column(Float, nullable=True)
+    submitted_ms = Column(Float, nullable=True)
+    acked_ms = Column(Float, nullable=True)  # First PreSubmitted/Submitted from TWS
+    first_partial_ms = Column(Float, nullable=True)
+    filled_ms = Column(Float, nullable=True)
+    modify_count = Column(Integer, nullable=False, default=0)
+    modify_ms = Column(JSON, nullable=True)  # Cancel-and-replace round-trips
+
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<OrderLatencyRecord(symbol={self.symbol}, order_id={self.order_id}, filled_ms={self.filled_ms})>"
+
+
+# ============================================================================
+# Reconciliation State
+# ============================================================================
+
+
+class ReconciliationWatermark(Base):
+    """Execution watermark for incremental order reconciliation.
+
+    One row per scope. Shared by every process that reconciles orders (the
+    daemon's EOD sync, the dashboard's Sync Orders button, the CLI), so an
+    execution processed by one is not re-processed by the next.
+    """
+
+    __tablename__ = "reconciliation_watermarks"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    scope = Column(String(50), unique=True, nullable=False, index=True)  # e.g. "orders"
+    last_exec_id = Column(String(64), nullable=True)
+    last_perm_id = Column(Integer, nullable=True)
+    last_exec_time = Column(DateTime, nullable=True)  # UTC, newest execution seen
+    boundary_exec_ids = Column(JSON, nullable=True)  # execIds at last_exec_time
+    last_sync_at = Column(DateTime, nullable=True)
+    last_full_sync_at = Column(DateTime, nullable=True)
+    last_summary = Column(JSON, nullable=True)  # Counts from the last sync
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<ReconciliationWatermark(scope={self.scope}, last_exec_time={self.last_exec_time})>"
@@ -0,0 +1,449 @@
+"""Deadline-bound emergency flatten for the kill switch.
+
+Closing positions one at a time through ExitManager.execute_exit() costs a
+database lookup, a contract qualification, a quote and a blocking fill wait
+per position. Emergency flatten works on the whole book at once:
+
+1. Cancel every working order with one global cancel
+2. Qualify all closing contracts in one batch and stream their quotes
+3. Submit every BUY-to-close at a marketable limit (the ask) back to back
+4. Poll all legs together, tracking acknowledgement and fill times, and
+   re-price unfilled legs one step more aggressive on a fixed schedule
+5. Stop at the hard deadline and report time-to-flat
+
+Escalation modifies the working order in place rather than cancelling and
+replacing it, so a leg can never fill twice and reverse the position. Legs
+still working at the deadline are left working for the caller to track.
+
+Example:
+    >>> flattener = EmergencyFlattener(ibkr_client)
+    >>> report = flattener.flatten(targets, reason="Kill switch")
+    >>> print(report.summary())
+"""
+
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+from src.broker.types import LimitOrder, MarketOrder
+
+TERMINAL_REJECTED = ("Cancelled", "Inactive", "ApiCancelled")
+WORKING = ("PreSubmitted", "Submitted")
+
+
+def _round_to_penny(price: float) -> float:
+    return round(price, 2)
+
+
+@dataclass
+class FlattenConfig:
+    """Emergency flatten timing and pricing.
+
+    Attributes:
+        deadline_seconds: Hard deadline for the whole flatten (default 30s)
+        quote_wait_seconds: Max wait for streaming asks before pricing (default 1s)
+        poll_interval_seconds: Status poll interval (default 0.25s)
+        escalation_interval_seconds: Time between re-pricing steps (default 3s)
+        escalation_step_pct: Step as a fraction of the initial limit (default 10%)
+        min_escalation_step: Minimum step in dollars (default $0.05)
+        max_escalations: Re-pricing steps per leg (default 5)
+    """
+
+    deadline_seconds: float = 30.0
+    quote_wait_seconds: float = 1.0
+    poll_interval_seconds: float = 0.25
+    escalation_interval_seconds: float = 3.0
+    escalation_step_pct: float = 0.10
+    min_escalation_step: float = 0.05
+    max_escalations: int = 5
+
+    @classmethod
+    def from_env(cls) -> "FlattenConfig":
+        """Load configuration from environment variables.
+
+        Returns:
+            FlattenConfig instance with values from .env
+        """
+        return cls(
+            deadline_seconds=float(os.getenv("EMERGENCY_FLATTEN_DEADLINE_SECONDS", "30")),
+            escalation_interval_seconds=float(
+                os.getenv("EMERGENCY_FLATTEN_ESCALATION_SECONDS", "3")
+            ),
+            escalation_step_pct=float(os.getenv("EMERGENCY_FLATTEN_STEP_PCT", "0.10")),
+            max_escalations=int(os.getenv("EMERGENCY_FLATTEN_MAX_ESCALATIONS", "5")),
+        )
+
+
+@dataclass
+class FlattenTarget:
+    """A short option position to buy back.
+
+    Attributes:
+        position_id: Canonical position key
+        symbol: Underlying symbol
+        strike: Strike price
+        expiration: Expiration (YYYYMMDD)
+        right: "P" or "C"
+        quantity: Contracts to buy back
+        reference_price: Last known premium, used when no ask is available
+    """
+
+    position_id: str
+    symbol: str
+    strike: float
+    expiration: str
+    right: str
+    quantity: int
+    reference_price: float | None = None
+
+
+@dataclass
+class FlattenLeg:
+    """Progress of one closing order.
+
+    Times are seconds since the flatten started.
+
+    Attributes:
+        target: Position being closed
+        status: pending, submitted, acknowledged, filled, working, failed or dry_run
+        contract: Qualified contract
+        trade: ib_async Trade for the working order
+        limit_price: Current limit (None for a market order)
+        step: Re-pricing step in dollars
+        escalations: Re-pricing steps applied
+        submitted_at: When the order was sent
+        acked_at: When TWS acknowledged the order
+        filled_at: When the order filled
+        fill_price: Average fill price
+        error: Failure reason
+    """
+
+    target: FlattenTarget
+    status: str = "pending"
+    contract: Any = None
+    trade: Any = None
+    ticker: Any = None
+    limit_price: float | None = None
+    step: float = 0.0
+    escalations: int = 0
+    last_priced_at: float = 0.0
+    submitted_at: float | None = None
+    acked_at: float | None = None
+    filled_at: float | None = None
+    fill_price: float | None = None
+    error: str | None = None
+
+    @property
+    def order_id(self) -> int | None:
+        """Order ID of the working or filled order."""
+        return self.trade.order.orderId if self.trade is not None else None
+
+    @property
+    def active(self) -> bool:
+        """Whether the leg still needs monitoring."""
+        return self.status in ("submitted", "acknowledged")
+
+
+@dataclass
+class FlattenReport:
+    """Outcome and timings of an emergency flatten.
+
+    Attributes:
+        legs: One entry per position
+        started_at: Wall-clock start
+        cancel_sweep_seconds: Time spent on the global cancel
+        submit_seconds: Start until the last closing order was sent
+        elapsed_seconds: Total time spent
+        deadline_seconds: Deadline that applied
+    """
+
+    legs: list[FlattenLeg] = field(default_factory=list)
+    started_at: datetime = field(default_factory=datetime.now)
+    cancel_sweep_seconds: float = 0.0
+    submit_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    deadline_seconds: float = 0.0
+
+    @property
+    def filled(self) -> list[FlattenLeg]:
+        return [leg for leg in self.legs if leg.status == "filled"]
+
+    @property
+    def unfilled(self) -> list[FlattenLeg]:
+        return [leg for leg in self.legs if leg.status != "filled"]
+
+    @property
+    def all_flat(self) -> bool:
+        """Whether every leg filled."""
+        return not self.unfilled
+
+    @property
+    def time_to_flat_seconds(self) -> float | None:
+        """Start until the last fill, or None if the book is not flat."""
+        if not self.all_flat:
+            return None
+        return max((leg.filled_at or 0.0 for leg in self.legs), default=0.0)
+
+    def summary(self) -> str:
+        """One-line summary for logs and CLI output."""
+        flat = self.time_to_flat_seconds
+        working = sum(1 for leg in self.legs if leg.status == "working")
+        failed = sum(1 for leg in self.legs if leg.status == "failed")
+        return (
+            f"{len(self.filled)}/{len(self.legs)} filled, {working} working, "
+            f"{failed} failed — "
+            + (f"flat in {flat:.1f}s" if flat is not None else "NOT FLAT")
+            + f" (cancel sweep {self.cancel_sweep_seconds:.2f}s, "
+            f"all submitted by {self.submit_seconds:.2f}s, "
+            f"deadline {self.deadline_seconds:.0f}s)"
+        )
+
+
+class EmergencyFlattener:
+    """Close a set of short option positions concurrently against a deadline."""
+
+    def __init__(self, ibkr_client, config: FlattenConfig | None = None):
+        """Initialize flattener.
+
+        Args:
+            ibkr_client: Connected IBKR client
+            config: Flatten configuration. If None, loads from env.
+        """
+        self.client = ibkr_client
+        self.config = config or FlattenConfig.from_env()
+
+    def flatten(
+        self, targets: list[FlattenTarget], reason: str = "emergency_exit"
+    ) -> FlattenReport:
+        """Cancel all working orders, then close every target.
+
+        Args:
+            targets: Positions to buy back
+            reason: Reason recorded on the orders
+
+        Returns:
+            FlattenReport with per-leg status and timings
+        """
+        start = time.monotonic()
+        deadline = start + self.config.deadline_seconds
+        report = FlattenReport(
+            legs=[FlattenLeg(target=t) for t in targets],
+            deadline_seconds=self.config.deadline_seconds,
+        )
+
+        self._cancel_all(reason)
+        report.cancel_sweep_seconds = time.monotonic() - start
+
+        try:
+            if report.legs:
+                self._qualify(report.legs)
+                self._price(report.legs)
+                for leg in report.legs:
+                    if leg.contract is not None:
+                        self._submit(leg, reason, start)
+                report.submit_seconds = time.monotonic() - start
+                logger.warning(
+                    f"Emergency flatten: {sum(1 for leg in report.legs if leg.active)} "
+                    f"closing orders submitted in {report.submit_seconds:.2f}s"
+                )
+                self._monitor(report.legs, reason, start, deadline)
+        finally:
+            for leg in report.legs:
+                if leg.ticker is not None and leg.contract is not None:
+                    self.client.cancel_market_data(leg.contract)
+
+        for leg in report.legs:
+            if leg.active:
+                leg.status = "working"
+        report.elapsed_seconds = time.monotonic() - start
+        logger.critical(f"Emergency flatten: {report.summary()}")
+        return report
+
+    def _cancel_all(self, reason: str) -> None:
+        """Cancel every working order, one request if the broker supports it."""
+        try:
+            if self.client.cancel_all_orders(reason=f"Emergency flatten: {reason}"):
+                return
+        except Exception as e:
+            logger.error(f"Global cancel failed, cancelling orders individually: {e}")
+
+        try:
+            for trade in self.client.get_open_trades():
+                self.client.cancel_order_sync(
+                    trade.order.orderId, reason=f"Emergency flatten: {reason}"
+                )
+        except Exception as e:
+            logger.error(f"Cancel sweep failed: {e}")
+
+    def _qualify(self, legs: list[FlattenLeg]) -> None:
+        """Qualify every closing contract in one batch request."""
+        contracts = [
+            self.client.get_option_contract(
+                symbol=leg.target.symbol,
+                expiration=leg.target.expiration,
+                strike=leg.target.strike,
+                right=leg.target.right,
+            )
+            for leg in legs
+        ]
+        try:
+            qualified = list(self.client.qualify_contracts_batch(*contracts))
+        except Exception as e:
+            logger.error(f"Emergency flatten: qualification failed: {e}")
+            qualified = []
+
+        for i, leg in enumerate(legs):
+            contract = qualified[i] if i < len(qualified) else None
+            if contract is not None and getattr(contract, "conId", 0):
+                leg.contract = contract
+            else:
+                leg.status = "failed"
+                leg.error = "Failed to qualify contract"
+
+    def _price(self, legs: list[FlattenLeg]) -> None:
+        """Stream quotes for all legs at once and set marketable limits."""
+        live = [leg for leg in legs if leg.contract is not None]
+        for leg in live:
+            try:
+                leg.ticker = self.client.subscribe_market_data(leg.contract)
+            except Exception as e:
+                logger.debug(f"{leg.target.symbol}: quote subscription failed: {e}")
+
+        wait_until = time.monotonic() + self.config.quote_wait_seconds
+        while time.monotonic() < wait_until and any(
+            _ask(leg.ticker) is None for leg in live if leg.ticker is not None
+        ):
+            self.client.wait(0.1)
+
+        for leg in live:
+            ask = _ask(leg.ticker)
+            reference = ask or leg.target.reference_price
+            if not reference or reference <= 0:
+                # No price at all: fall back to a market order
+                leg.limit_price = None
+                continue
+            leg.step = max(
+                self.config.min_escalation_step,
+                reference * self.config.escalation_step_pct,
+            )
+            # At the ask; without one, a step through the last known premium
+            leg.limit_price = _round_to_penny(ask if ask else reference + leg.step)
+
+    def _submit(self, leg: FlattenLeg, reason: str, start: float) -> None:
+        """Send the closing order for a leg without waiting for it."""
+        quantity = leg.target.quantity
+        if leg.trade is not None:
+            remaining = getattr(leg.trade.orderStatus, "remaining", 0) or 0
+            if 0 < remaining < quantity:
+                quantity = int(remaining)
+
+        if leg.limit_price is None:
+            order = MarketOrder(action="BUY", totalQuantity=quantity)
+        else:
+            order = LimitOrder(
+                action="BUY", totalQuantity=quantity, lmtPrice=leg.limit_price
+            )
+        order.tif = "DAY"
+
+        try:
+            leg.trade = self.client.place_order_sync(
+                leg.contract, order, reason=f"EMERGENCY flatten: {reason}"
+            )
+        except Exception as e:
+            leg.status = "failed"
+            leg.error = f"Order placement failed: {e}"
+            return
+
+        now = time.monotonic() - start
+        leg.status = "submitted"
+        leg.submitted_at = now
+        leg.last_priced_at = now
+
+    def _monitor(
+        self, legs: list[FlattenLeg], reason: str, start: float, deadline: float
+    ) -> None:
+        """Poll all legs until flat or the deadline, re-pricing on schedule."""
+        while time.monotonic() < deadline and any(leg.active for leg in legs):
+            self.client.wait(self.config.poll_interval_seconds)
+            now = time.monotonic() - start
+
+            for leg in legs:
+                if not leg.active:
+                    continue
+                status = leg.trade.orderStatus.status
+
+                if status == "Filled":
+                    leg.status = "filled"
+                    leg.filled_at = now
+                    leg.acked_at = leg.acked_at if leg.acked_at is not None else now
+                    leg.fill_price = leg.trade.orderStatus.avgFillPrice
+                    logger.warning(
+                        f"  ✓ {leg.target.symbol} ${leg.target.strike} flat "
+                        f"@ ${leg.fill_price:.2f} in {now:.2f}s"
+                    )
+                elif status in TERMINAL_REJECTED:
+                    # Dead order: resubmit one step more aggressive
+                    why = getattr(leg.trade.orderStatus, "whyHeld", "") or status
+                    if leg.escalations >= self.config.max_escalations:
+                        leg.status = "failed"
+                        leg.error = f"Order {status}: {why}"
+                        continue
+                    logger.warning(
+                        f"  ✗ {leg.target.symbol} closing order {status} ({why}) "
+                        f"— resubmitting"
+                    )
+                    self._step_price(leg)
+                    self._submit(leg, reason, start)
+                else:
+                    if status in WORKING and leg.acked_at is None:
+                        leg.acked_at = now
+                        leg.status = "acknowledged"
+                    if now - leg.last_priced_at >= self.config.escalation_interval_seconds:
+                        self._escalate(leg, now)
+
+    def _step_price(self, leg: FlattenLeg) -> None:
+        """Move a leg's limit one step up (never below the live ask)."""
+        leg.escalations += 1
+        if leg.limit_price is None:
+            return
+        price = leg.limit_price + leg.step
+        ask = _ask(leg.ticker)
+        if ask is not None:
+            price = max(price, ask)
+        leg.limit_price = _round_to_penny(price)
+
+    def _escalate(self, leg: FlattenLeg, now: float) -> None:
+        """Re-price an unfilled working order in place."""
+        leg.last_priced_at = now
+        if leg.limit_price is None or leg.escalations >= self.config.max_escalations:
+            return
+        previous = leg.limit_price
+        self._step_price(leg)
+        try:
+            leg.trade = self.client.modify_order_sync(
+                leg.trade,
+                leg.limit_price,
+                reason=(
+                    f"Emergency flatten escalation "
+                    f"{leg.escalations}/{self.config.max_escalations}"
+                ),
+            ) or leg.trade
+            logger.warning(
+                f"  ↑ {leg.target.symbol} ${leg.target.strike}: "
+                f"${previous:.2f} → ${leg.limit_price:.2f} at {now:.1f}s"
+            )
+        except Exception as e:
+            logger.error(f"{leg.target.symbol}: escalation failed: {e}")
+
+
+def _ask(ticker) -> float | None:
+    """Valid ask from a streaming ticker, else None."""
+    ask = getattr(ticker, "ask", None) if ticker is not None else None
+    if not isinstance(ask, (int, float)) or math.isnan(ask) or ask <= 0:
+        return None
+    return float(ask)
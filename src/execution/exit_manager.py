@@ -17,9 +17,22 @@ from loguru import logger
 
 from src.config.baseline_strategy import BaselineStrategy
 from src.data.models import Trade
+from src.execution.emergency_flatten import (
+    EmergencyFlattener,
+    FlattenConfig,
+    FlattenLeg,
+    FlattenReport,
+    FlattenTarget,
+)
 from src.execution.position_monitor import PositionMonitor, PositionStatus
+from src.execution.risk_governor import RiskGovernor
 from src.utils.calc import calc_pnl, calc_pnl_pct
-from src.utils.position_key import _normalize_right, position_key_from_trade
+from src.utils.position_key import (
+    _normalize_right,
+    canonical_position_key,
+    position_key_from_contract,
+    position_key_from_trade,
+)
 from src.utils.timezone import us_eastern_now
 from src.broker.protocols import BrokerClient
 
@@ -111,6 +124,7 @@ class ExitManager:
         position_monitor: PositionMonitor,
         config: BaselineStrategy,
         dry_run: bool = False,
+        risk_governor: RiskGovernor | None = None,
     ):
         """Initialize exit manager.
 
@@ -119,15 +133,20 @@ class ExitManager:
             position_monitor: Position monitor instance
             config: Strategy configuration
             dry_run: If True, prevent all DB writes and order placements
+            risk_governor: Risk governor to notify of filled exits
         """
         self.ibkr_client = ibkr_client
         self.position_monitor = position_monitor
         self.config = config
         self.dry_run = dry_run
+        self.risk_governor = risk_governor
         # Track positions with in-flight exit orders to prevent duplicates
         # position_id -> (order_id, exit_reason)
         self._exit_orders_placed: dict[str, tuple[int, str]] = {}
 
+        # Contracts qualified by prepare_exit(), consumed by execute_exit()
+        self._prepared_contracts: dict[str, object] = {}
+
         # Track consecutive stale-data checks per position.
         # Incremented each time _evaluate_position sees stale data;
         # reset to 0 when a valid quote arrives.
@@ -217,6 +236,62 @@ class ExitManager:
 
         return decisions
 
+    async def prepare_exit(self, position_id: str) -> bool:
+        """Pre-flight checks for a likely exit, without placing an order.
+
+        Qualifies the option contract, so an exit that is decided while the
+        reasoning is still streaming skips the qualify round-trip in
+        execute_exit(). Runs on the event loop, so it only reads the cached
+        IBKR positions and qualifies asynchronously; the quote is refreshed
+        by execute_exit() itself.
+
+        Args:
+            position_id: Position that may be exited
+
+        Returns:
+            bool: True if the contract is qualified and cached
+        """
+        if position_id in self._exit_orders_placed:
+            return False
+        try:
+            held = next(
+                (
+                    p.contract
+                    for p in self.ibkr_client.get_positions()
+                    if position_key_from_contract(p.contract) == position_id
+                ),
+                None,
+            )
+            if held is None:
+                return False
+            contract = self.ibkr_client.get_option_contract(
+                symbol=held.symbol,
+                expiration=held.lastTradeDateOrContractMonth,
+                strike=held.strike,
+                right=held.right,
+            )
+            qualified = await self.ibkr_client.qualify_contracts_async(contract)
+        except Exception as e:
+            logger.debug(f"Exit pre-flight failed for {position_id}: {e}")
+            return False
+        if not qualified:
+            return False
+        self._prepared_contracts[position_id] = qualified[0]
+        logger.info(f"Exit pre-flight ready for {position_id}")
+        return True
+
+    def discard_prepared_exits(self, position_ids: list[str]) -> None:
+        """Drop pre-flight contracts whose exit was never executed.
+
+        Only the given positions are dropped: other events may have
+        pre-flights of their own in flight.
+
+        Args:
+            position_ids: Positions prepared by the caller
+        """
+        for position_id in position_ids:
+            self._prepared_contracts.pop(position_id, None)
+
     def execute_exit(
         self, position_id: str, decision: ExitDecision
     ) -> ExitResult:
@@ -308,16 +383,19 @@ class ExitManager:
                 position_status, decision.exit_type, decision.limit_price
             )
 
-            # Get option contract with actual expiration date
-            contract = self.ibkr_client.get_option_contract(
-                symbol=position_status.symbol,
-                expiration=position_status.expiration_date,
-                strike=position_status.strike,
-                right="P" if position_status.option_type == "P" else "C",
-            )
+            # Contract qualified by prepare_exit(), else qualify it now
+            qualified = self._prepared_contracts.pop(position_id, None)
+            if qualified is None:
+                # Get option contract with actual expiration date
+                contract = self.ibkr_client.get_option_contract(
+                    symbol=position_status.symbol,
+                    expiration=position_status.expiration_date,
+                    strike=position_status.strike,
+                    right="P" if position_status.option_type == "P" else "C",
+                )
 
-            # Qualify contract
-            qualified = self.ibkr_client.qualify_contract(contract)
+                # Qualify contract
+                qualified = self.ibkr_client.qualify_contract(contract)
             if not qualified:
                 return ExitResult(
                     success=False,
@@ -342,21 +420,7 @@ class ExitManager:
             self._exit_orders_placed[position_id] = (trade.order.orderId, decision.reason)
 
             # Mark position as "exit pending" in DB so get_all_positions() excludes it
-            try:
-                from src.data.database import get_db_session
-
-                with get_db_session() as session:
-                    trade_record = self._find_trade_by_position_id(session, position_id)
-                    if trade_record:
-                        trade_record.order_id = trade.order.orderId
-                        trade_record.tws_status = "Submitted"
-                        session.commit()
-                        logger.info(
-                            f"Marked {position_id} as exit-pending in DB "
-                            f"(order_id={trade.order.orderId})"
-                        )
-            except Exception as e:
-                logger.error(f"Failed to mark exit-pending in DB: {e}")
+            self._mark_exit_pending_in_db(position_id, trade.order.orderId)
 
             # Wait for order to be processed and poll for fill status
             # Market orders can fill in milliseconds, but may show PendingSubmit initially
@@ -406,6 +470,7 @@ class ExitManager:
                                 trade_record.profit_pct = calc_pnl_pct(trade_record.profit_loss, trade_record.entry_premium, trade_record.contracts)
 
                                 session.commit()
+                                self._report_close(trade_record)
 
                                 # Capture comprehensive exit snapshot
                                 exit_service = ExitSnapshotService(self.ibkr_client, session)
@@ -585,7 +650,9 @@ class ExitManager:
             )
 
     def emergency_exit_all(self) -> list[ExitResult]:
-        """Execute emergency exit for all positions using market orders.
+        """Execute emergency exit for all positions.
+
+        Runs emergency_flatten() and returns one ExitResult per position.
 
         Returns:
             list[ExitResult]: Results for each position
@@ -594,62 +661,170 @@ class ExitManager:
             >>> results = manager.emergency_exit_all()
             >>> print(f"Exited {len(results)} positions")
         """
+        return self.flatten_results(self.emergency_flatten())
+
+    def emergency_flatten(
+        self,
+        reason: str = "emergency_exit",
+        config: FlattenConfig | None = None,
+    ) -> FlattenReport:
+        """Flatten every open position concurrently against a hard deadline.
+
+        Cancels all working orders in one sweep, submits every closing order
+        at a marketable limit at once and escalates unfilled legs on a
+        schedule (see EmergencyFlattener). Fills are recorded in the DB;
+        legs still working at the deadline are tracked as pending exits.
+
+        Args:
+            reason: Exit reason recorded on filled positions
+            config: Flatten configuration. If None, loads from env.
+
+        Returns:
+            FlattenReport with per-position status and time-to-flat
+        """
         logger.critical("=" * 80)
         logger.critical("🚨 EMERGENCY EXIT ALL POSITIONS - LIQUIDATING ALL HOLDINGS 🚨")
         logger.critical("=" * 80)
 
         positions = self.position_monitor.get_all_positions()
-        logger.warning(f"Found {len(positions)} positions to liquidate")
+        targets = self._flatten_targets(positions)
+        logger.warning(f"Found {len(targets)} positions to liquidate")
 
-        results = []
-        success_count = 0
-        failed_count = 0
-
-        for i, position in enumerate(positions, 1):
-            logger.warning(
-                f"[{i}/{len(positions)}] Emergency exit: {position.symbol} "
-                f"${position.strike} {position.option_type} "
-                f"(Position ID: {position.position_id})"
+        if self.dry_run:
+            for target in targets:
+                logger.info(
+                    f"[DRY RUN] Would flatten {target.quantity}x {target.symbol} "
+                    f"${target.strike} {target.right}"
+                )
+            return FlattenReport(
+                legs=[FlattenLeg(target=t, status="dry_run") for t in targets]
             )
 
-            decision = ExitDecision(
-                should_exit=True,
-                reason="emergency_exit",
-                exit_type="market",
-                urgency="critical",
-                message=f"Emergency exit for {position.symbol}",
-            )
+        # The cancel sweep kills every tracked exit order
+        previously_pending = set(self._exit_orders_placed)
+        self._exit_orders_placed.clear()
 
-            result = self.execute_exit(position.position_id, decision)
-            results.append(result)
+        report = EmergencyFlattener(self.ibkr_client, config).flatten(targets, reason)
 
-            if result.success:
-                success_count += 1
-                if result.exit_price:
-                    logger.warning(
-                        f"  ✓ Exit successful - filled @ ${result.exit_price:.2f} "
-                        f"(Order ID: {result.order_id})"
-                    )
-                else:
-                    logger.warning(
-                        f"  ✓ Exit order placed successfully "
-                        f"(Order ID: {result.order_id}) - waiting for fill"
-                    )
+        for leg in report.legs:
+            position_id = leg.target.position_id
+            previously_pending.discard(position_id)
+            if leg.status == "filled":
+                self._record_fill_in_db(position_id, leg.fill_price, reason)
+            elif leg.status == "working":
+                self._exit_orders_placed[position_id] = (leg.order_id, reason)
+                self._mark_exit_pending_in_db(position_id, leg.order_id)
+                logger.error(
+                    f"  ⏳ {leg.target.symbol} ${leg.target.strike} still working "
+                    f"@ ${leg.limit_price or 0:.2f} at deadline "
+                    f"(Order ID: {leg.order_id})"
+                )
             else:
-                failed_count += 1
                 logger.error(
-                    f"  ✗ Exit failed: {result.error_message} "
-                    f"(Position ID: {position.position_id})"
+                    f"  ✗ Exit failed: {leg.error} (Position ID: {position_id})"
                 )
+        for position_id in previously_pending:
+            self._clear_pending_exit_in_db(position_id)
 
         logger.critical("=" * 80)
-        logger.critical(
-            f"EMERGENCY EXIT COMPLETE: "
-            f"{success_count} successful, {failed_count} failed out of {len(results)} total"
-        )
+        logger.critical(f"EMERGENCY EXIT COMPLETE: {report.summary()}")
         logger.critical("=" * 80)
 
-        return results
+        return report
+
+    @staticmethod
+    def flatten_results(report: FlattenReport) -> list[ExitResult]:
+        """Convert a FlattenReport to one ExitResult per position.
+
+        Working orders count as successful, as in execute_exit().
+
+        Args:
+            report: Report from emergency_flatten()
+
+        Returns:
+            list[ExitResult]: Results for each position
+        """
+        return [
+            ExitResult(
+                success=leg.status in ("filled", "working", "dry_run"),
+                position_id=leg.target.position_id,
+                order_id=leg.order_id,
+                exit_price=leg.fill_price,
+                exit_reason="emergency_exit",
+                error_message=leg.error,
+            )
+            for leg in report.legs
+        ]
+
+    def _flatten_targets(self, positions: list[PositionStatus]) -> list[FlattenTarget]:
+        """Build flatten targets from DB positions and broker holdings.
+
+        DB positions are capped at the broker's short quantity and skipped if
+        the broker shows them long (buying would add exposure). Broker short
+        option positions with no DB position, such as exit-pending ones whose
+        orders the cancel sweep is about to kill, are added.
+
+        Args:
+            positions: Open positions from PositionMonitor
+
+        Returns:
+            list[FlattenTarget]: Positions to buy back
+        """
+        broker: dict[str, tuple] = {}
+        try:
+            for ib_pos in self.ibkr_client.get_positions():
+                contract = ib_pos.contract
+                if getattr(contract, "secType", None) == "OPT":
+                    broker[position_key_from_contract(contract)] = (
+                        contract,
+                        int(ib_pos.position),
+                    )
+        except Exception as e:
+            logger.error(f"Could not read broker positions for flatten: {e}")
+
+        targets = []
+        for position in positions:
+            quantity = position.contracts
+            key = canonical_position_key(
+                position.symbol,
+                position.strike,
+                position.expiration_date,
+                position.option_type,
+            )
+            if key in broker:
+                _, held = broker.pop(key)
+                if held >= 0:
+                    logger.error(
+                        f"Skipping {position.position_id}: broker shows no short "
+                        f"position ({held})"
+                    )
+                    continue
+                quantity = min(quantity, -held)
+            targets.append(
+                FlattenTarget(
+                    position_id=position.position_id,
+                    symbol=position.symbol,
+                    strike=position.strike,
+                    expiration=position.expiration_date,
+                    right=_normalize_right(position.option_type),
+                    quantity=quantity,
+                    reference_price=position.current_premium,
+                )
+            )
+
+        for key, (contract, held) in broker.items():
+            if held < 0:
+                targets.append(
+                    FlattenTarget(
+                        position_id=key,
+                        symbol=contract.symbol,
+                        strike=float(contract.strike),
+                        expiration=contract.lastTradeDateOrContractMonth,
+                        right=_normalize_right(contract.right),
+                        quantity=-held,
+                    )
+                )
+        return targets
 
     def check_pending_exits(self) -> dict[str, str]:
         """Check status of all pending exit orders and update DB accordingly.
@@ -758,6 +933,7 @@ class ExitManager:
                 trade_record.tws_status = None
 
                 session.commit()
+                self._report_close(trade_record)
                 logger.info(
                     f"Recorded exit fill for {position_id}: "
                     f"P&L=${trade_record.profit_loss:.2f} ({trade_record.profit_pct:.1%})"
@@ -779,6 +955,43 @@ class ExitManager:
         except Exception as e:
             logger.error(f"Failed to record fill in DB for {position_id}: {e}", exc_info=True)
 
+    def _report_close(self, trade_record: Trade) -> None:
+        """Tell the risk governor a position closed, with its realized P&L."""
+        if self.risk_governor is None:
+            return
+        try:
+            self.risk_governor.record_position_closed(
+                trade_record.symbol,
+                trade_record.strike,
+                trade_record.expiration,
+                trade_record.profit_loss or 0.0,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update risk state for closed {trade_record.symbol}: {e}")
+
+    def _mark_exit_pending_in_db(self, position_id: str, order_id: int) -> None:
+        """Mark a position as exit-pending so get_all_positions() excludes it.
+
+        Args:
+            position_id: Position identifier
+            order_id: Working exit order ID
+        """
+        try:
+            from src.data.database import get_db_session
+
+            with get_db_session() as session:
+                trade_record = self._find_trade_by_position_id(session, position_id)
+                if trade_record:
+                    trade_record.order_id = order_id
+                    trade_record.tws_status = "Submitted"
+                    session.commit()
+                    logger.info(
+                        f"Marked {position_id} as exit-pending in DB "
+                        f"(order_id={order_id})"
+                    )
+        except Exception as e:
+            logger.error(f"Failed to mark exit-pending in DB: {e}")
+
     def _clear_pending_exit_in_db(self, position_id: str) -> None:
         """Clear pending exit markers in DB so position becomes re-evaluable.
 
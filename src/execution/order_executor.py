@@ -493,8 +493,11 @@ class OrderExecutor:
             if self.trade_repository:
                 self._save_trade_to_db(opportunity, trade, filled=True)
 
-            # Post-trade margin verification
+            # Update in-memory risk state, then verify post-trade margin
             if self.risk_governor:
+                self.risk_governor.record_fill(
+                    opportunity.symbol, opportunity.strike, opportunity.expiration
+                )
                 self.risk_governor.verify_post_trade_margin(symbol=opportunity.symbol)
 
             return OrderResult(
@@ -513,6 +516,10 @@ class OrderExecutor:
             logger.error(
                 f"✗ Order {trade.orderStatus.status}: {trade.orderStatus.status}"
             )
+            if self.risk_governor:
+                self.risk_governor.record_order_cancelled(
+                    opportunity.symbol, opportunity.strike, opportunity.expiration
+                )
 
             return OrderResult(
                 success=False,
@@ -653,6 +660,13 @@ class OrderExecutor:
             )
             if success:
                 logger.info(f"✓ Order {order_id} cancelled")
+                contract = target_trade.contract
+                if self.risk_governor and hasattr(contract, "strike"):
+                    self.risk_governor.record_order_cancelled(
+                        contract.symbol,
+                        contract.strike,
+                        contract.lastTradeDateOrContractMonth,
+                    )
             return success
 
         except Exception as e:
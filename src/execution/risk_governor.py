@@ -11,8 +11,11 @@ This module enforces risk limits and circuit breakers:
 - Emergency shutdown capability
 """
 
+import copy
 import json
+import math
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -24,6 +27,7 @@ from loguru import logger
 from src.config.base import Config
 from src.config.exchange_profile import get_active_profile
 from src.execution.position_monitor import PositionMonitor
+from src.execution.risk_state import RiskState, contract_key
 from src.utils.timezone import us_trading_date
 from src.services.kill_switch import KillSwitch
 from src.strategies.base import TradeOpportunity
@@ -52,6 +56,14 @@ def _trading_date_utc_bounds(trading_dt: date) -> tuple[datetime, datetime]:
     return utc_start, utc_end
 
 
+def _file_mtime_ns(path: Path | str) -> int | None:
+    """File modification time in ns, or None if the file does not exist."""
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 @dataclass
 class RiskLimitCheck:
     """Result of risk limit check.
@@ -100,6 +112,31 @@ class PostTradeMarginResult:
     verification_failed: bool = False
 
 
+@dataclass
+class BatchRiskCheck:
+    """Result of a joint pre-trade check over a list of opportunities.
+
+    Attributes:
+        opportunities: Opportunities in the order they were checked
+        verdicts: RiskLimitCheck per opportunity, aligned with opportunities
+    """
+
+    opportunities: list[TradeOpportunity]
+    verdicts: list[RiskLimitCheck]
+
+    @property
+    def admitted(self) -> list[TradeOpportunity]:
+        """Opportunities that can all be placed together without breaching a limit."""
+        return [o for o, v in zip(self.opportunities, self.verdicts) if v.approved]
+
+    @property
+    def rejected(self) -> list[tuple[TradeOpportunity, RiskLimitCheck]]:
+        """Rejected opportunities with the limit that rejected them."""
+        return [
+            (o, v) for o, v in zip(self.opportunities, self.verdicts) if not v.approved
+        ]
+
+
 class RiskGovernor:
     """Enforce risk limits and circuit breakers.
 
@@ -155,10 +192,19 @@ class RiskGovernor:
         self._last_health_check: datetime | None = None
 
         # Risk limits from scanner_settings.yaml — hot-reloaded every
-        # SETTINGS_RELOAD_INTERVAL_SECONDS at the top of pre_trade_check().
+        # SETTINGS_RELOAD_INTERVAL_SECONDS at the top of pre_trade_check()
+        # (only re-parsed when the file's mtime changed).
         self.SETTINGS_RELOAD_INTERVAL_SECONDS = 30
         self._settings_loaded_at: float = 0.0
+        self._settings_mtime: int | None = None
         self._apply_scanner_settings()
+
+        # In-memory risk state (positions, pending orders, realized P&L).
+        # Built on first check, reconciled against IBKR and the DB every
+        # RISK_STATE_RECONCILE_SECONDS and updated incrementally in between.
+        self.RISK_STATE_RECONCILE_SECONDS = 60
+        self._risk_state: RiskState | None = None
+        self._subscribe_portfolio_updates()
         self.MIN_EXCESS_LIQUIDITY_PCT = 0.10  # Safety invariant — keep hardcoded
 
         # Weekly/drawdown tracking (persisted to JSON file)
@@ -188,9 +234,10 @@ class RiskGovernor:
 
     def _apply_scanner_settings(self) -> None:
         """Load risk limits from scanner_settings.yaml and update instance attrs."""
-        from src.agentic.scanner_settings import load_scanner_settings
+        from src.agentic.scanner_settings import DEFAULT_PATH, load_scanner_settings
 
         scanner = load_scanner_settings()
+        self._settings_mtime = _file_mtime_ns(DEFAULT_PATH)
         rg = scanner.risk_governor
         budget = scanner.budget
 
@@ -213,8 +260,17 @@ class RiskGovernor:
         risk limits take effect within SETTINGS_RELOAD_INTERVAL_SECONDS
         without restarting the process.
         """
-        if time.monotonic() - self._settings_loaded_at >= self.SETTINGS_RELOAD_INTERVAL_SECONDS:
-            self._apply_scanner_settings()
+        from src.agentic.scanner_settings import DEFAULT_PATH
+
+        if time.monotonic() - self._settings_loaded_at < self.SETTINGS_RELOAD_INTERVAL_SECONDS:
+            return
+
+        if _file_mtime_ns(DEFAULT_PATH) == self._settings_mtime:
+            # Unchanged on disk — skip the YAML parse, restart the TTL
+            self._settings_loaded_at = time.monotonic()
+            return
+
+        self._apply_scanner_settings()
 
     def pre_trade_check(self, opportunity: TradeOpportunity) -> RiskLimitCheck:
         """Check all risk limits before placing trade.
@@ -230,6 +286,10 @@ class RiskGovernor:
         8. Bid-ask spread within limits
         9. Margin utilization within limits
 
+        Position, pending-order and realized P&L inputs come from the
+        in-memory RiskState (see reconcile_risk_state()), so checking many
+        trades in a row does not re-query IBKR or the database per trade.
+
         Args:
             opportunity: Trade opportunity to check
 
@@ -321,6 +381,168 @@ class RiskGovernor:
             utilization_pct=0.0,
         )
 
+    def pre_trade_check_batch(
+        self,
+        opportunities: list[TradeOpportunity],
+        use_whatif: bool = True,
+    ) -> BatchRiskCheck:
+        """Check a whole candidate list jointly against portfolio limits.
+
+        Unlike calling pre_trade_check() per candidate, every candidate is
+        evaluated on top of the candidates admitted before it, so two trades
+        that together breach max positions, trades per day, sector
+        concentration or margin cannot both pass.
+
+        Candidates are admitted greedily in list order (pass them ranked
+        best-first). Rejected candidates are re-tried against the final
+        admitted set until nothing changes, so the admitted subset is
+        maximal: no rejected candidate could be added without breaching a
+        limit. Account-wide checks (halt, daily/weekly loss, drawdown) run
+        once for the batch; IBKR and the DB are not queried per candidate
+        apart from the optional WhatIf margin.
+
+        Args:
+            opportunities: Candidates in priority order
+            use_whatif: Verify margin with IBKR WhatIf (one call per
+                candidate). Disable for fast rescans to use upstream estimates.
+
+        Returns:
+            BatchRiskCheck with per-candidate verdicts and the admitted subset
+
+        Example:
+            >>> batch = governor.pre_trade_check_batch(ranked)
+            >>> for opp in batch.admitted:
+            ...     execute_trade(opp)
+        """
+        self._reload_settings_if_stale()
+        self._reset_daily_counters_if_needed()
+
+        count = len(opportunities)
+        if count == 0:
+            return BatchRiskCheck(opportunities=[], verdicts=[])
+
+        # Account-wide checks — identical for every candidate
+        if self._trading_halted:
+            account_check = RiskLimitCheck(
+                approved=False,
+                reason=f"Trading halted: {self._halt_reason}",
+                limit_name="trading_halt",
+                current_value=1,
+                limit_value=0,
+                utilization_pct=100.0,
+            )
+        else:
+            account_check = None
+            for check in (
+                self._check_daily_loss_limit,
+                self._check_weekly_loss_limit,
+                self._check_max_drawdown,
+            ):
+                result = check()
+                if not result.approved:
+                    account_check = result
+                    break
+
+        if account_check is not None:
+            return BatchRiskCheck(
+                opportunities=list(opportunities), verdicts=[account_check] * count
+            )
+
+        verdicts: list[RiskLimitCheck | None] = [None] * count
+        keys = [
+            contract_key(o.symbol, o.strike, o.expiration) for o in opportunities
+        ]
+
+        # Per-candidate checks that do not depend on the rest of the batch
+        seen_keys: set = set()
+        for i, opp in enumerate(opportunities):
+            if keys[i] is not None and keys[i] in seen_keys:
+                verdicts[i] = RiskLimitCheck(
+                    approved=False,
+                    reason=f"Duplicate in batch: {opp.symbol} ${opp.strike} {opp.expiration}",
+                    limit_name="duplicate_check",
+                    current_value=1,
+                    limit_value=0,
+                    utilization_pct=100.0,
+                )
+                continue
+            seen_keys.add(keys[i])
+
+            for check in (
+                self._check_duplicate_contract,
+                self._check_earnings_risk,
+                self._check_spread,
+            ):
+                result = check(opp)
+                if not result.approved:
+                    verdicts[i] = result
+                    break
+
+        # Portfolio checks against a simulated state that grows as we admit
+        state = copy.deepcopy(self._get_risk_state())
+        trades_today = self._trades_today
+        committed_margin = 0.0
+
+        whatif_cache: dict[int, Optional[float]] = {}
+
+        def whatif_lookup(opp: TradeOpportunity) -> Optional[float]:
+            if not use_whatif:
+                return None
+            if id(opp) not in whatif_cache:
+                whatif_cache[id(opp)] = self._get_whatif_margin(opp)
+            return whatif_cache[id(opp)]
+
+        pending = [i for i in range(count) if verdicts[i] is None]
+        last_rejection: dict[int, RiskLimitCheck] = {}
+        admitted_any = True
+        while pending and admitted_any:
+            admitted_any = False
+            still_pending = []
+            for i in pending:
+                opp = opportunities[i]
+                check = self._check_max_positions(state)
+                if check.approved:
+                    check = self._check_max_positions_per_day(trades_today)
+                if check.approved:
+                    check = self._check_sector_concentration(opp, state)
+                margin = 0.0
+                if check.approved:
+                    check, margin = self._evaluate_margin(
+                        opp, committed_margin, whatif_lookup
+                    )
+
+                if not check.approved:
+                    last_rejection[i] = check
+                    still_pending.append(i)
+                    continue
+
+                verdicts[i] = RiskLimitCheck(
+                    approved=True,
+                    reason="All risk checks passed (batch)",
+                    limit_name="all_checks",
+                    current_value=0,
+                    limit_value=100,
+                    utilization_pct=0.0,
+                )
+                if keys[i] is not None:
+                    state.add_position(keys[i])
+                else:
+                    state.count_position(opportunities[i].symbol)
+                trades_today += 1
+                committed_margin += margin
+                admitted_any = True
+            pending = still_pending
+
+        for i in pending:
+            verdicts[i] = last_rejection[i]
+
+        batch = BatchRiskCheck(opportunities=list(opportunities), verdicts=verdicts)
+        logger.info(
+            f"Batch pre-trade check: {len(batch.admitted)}/{count} admitted "
+            f"(margin committed ${committed_margin:,.0f})"
+        )
+        return batch
+
     def record_trade(self, opportunity: TradeOpportunity) -> None:
         """Record a trade for daily tracking.
 
@@ -330,6 +552,138 @@ class RiskGovernor:
         self._trades_today += 1
         logger.debug(f"Trades today: {self._trades_today}/{self.MAX_POSITIONS_PER_DAY}")
 
+        # The order is working until filled — block duplicates immediately
+        key = contract_key(opportunity.symbol, opportunity.strike, opportunity.expiration)
+        if self._risk_state is not None and key is not None:
+            self._risk_state.add_pending(key)
+
+    def record_fill(self, symbol: str, strike: float, expiration) -> None:
+        """Record a filled entry order in the in-memory risk state.
+
+        Args:
+            symbol: Underlying symbol
+            strike: Strike price
+            expiration: Expiration (date, datetime, YYYY-MM-DD or YYYYMMDD)
+        """
+        key = contract_key(symbol, strike, expiration)
+        if self._risk_state is not None and key is not None:
+            self._risk_state.add_position(key)
+            logger.debug(
+                f"Risk state: +{symbol} ${strike} "
+                f"({self._risk_state.position_count} positions)"
+            )
+
+    def record_order_cancelled(self, symbol: str, strike: float, expiration) -> None:
+        """Record an entry order that was cancelled, rejected or expired unfilled.
+
+        Args:
+            symbol: Underlying symbol
+            strike: Strike price
+            expiration: Expiration (date, datetime, YYYY-MM-DD or YYYYMMDD)
+        """
+        key = contract_key(symbol, strike, expiration)
+        if self._risk_state is not None and key is not None:
+            self._risk_state.remove_pending(key)
+            logger.debug(f"Risk state: order for {symbol} ${strike} no longer pending")
+
+    def _subscribe_portfolio_updates(self) -> None:
+        """Stream per-position unrealized P&L into the risk state."""
+        try:
+            self.ibkr_client.portfolio_event += self._on_portfolio_update
+        except Exception as e:
+            logger.debug(
+                f"Portfolio updates unavailable, unrealized P&L refreshes on reconcile: {e}"
+            )
+
+    def _on_portfolio_update(self, item) -> None:
+        """Apply one streamed PortfolioItem to the risk state's unrealized P&L."""
+        state = self._risk_state
+        contract = getattr(item, "contract", None)
+        if state is None or getattr(contract, "secType", "") != "OPT":
+            return
+        key = contract_key(
+            contract.symbol, contract.strike, contract.lastTradeDateOrContractMonth
+        )
+        pnl = item.unrealizedPNL
+        if key is None or pnl is None or math.isnan(pnl):
+            return
+        state.set_position_unrealized(key, float(pnl) if item.position else None)
+
+    def record_position_closed(
+        self, symbol: str, strike: float, expiration, realized_pnl: float
+    ) -> None:
+        """Record a closed position and its realized P&L in the risk state.
+
+        Args:
+            symbol: Underlying symbol
+            strike: Strike price
+            expiration: Expiration (date, datetime, YYYY-MM-DD or YYYYMMDD)
+            realized_pnl: Realized P&L of the close in dollars
+        """
+        key = contract_key(symbol, strike, expiration)
+        if self._risk_state is not None and key is not None:
+            self._risk_state.remove_position(key, realized_pnl)
+            logger.debug(
+                f"Risk state: -{symbol} ${strike} (realized ${realized_pnl:+,.0f}, "
+                f"today ${self._risk_state.realized_pnl:+,.0f})"
+            )
+
+    def update_account_summary(self, summary: dict) -> None:
+        """Store a freshly fetched account summary as the cached value.
+
+        Lets callers that already hold a current summary (e.g. post-trade
+        margin verification) refresh the cache without another IBKR call.
+
+        Args:
+            summary: Account summary dict from the broker
+        """
+        if summary:
+            self._account_health_cache = summary
+            self._last_health_check = datetime.now()
+
+    def reconcile_risk_state(self) -> RiskState:
+        """Rebuild the in-memory risk state from IBKR and the database.
+
+        Runs automatically when the state is older than
+        RISK_STATE_RECONCILE_SECONDS or the trading day rolls over. Call it
+        directly after out-of-band changes (e.g. manual trades in TWS).
+
+        Returns:
+            The rebuilt RiskState
+        """
+        positions = self.position_monitor.get_all_positions()
+
+        try:
+            # Fresh open orders (don't rely on the ib_async cache)
+            open_orders = list(self.ibkr_client.request_open_orders())
+        except Exception as e:
+            logger.warning(f"Failed to load open orders for risk state: {e}", exc_info=True)
+            open_orders = []
+
+        self._risk_state = RiskState.build(
+            trading_date=us_trading_date(),
+            positions=positions,
+            open_orders=open_orders,
+            realized_pnl=self._get_realized_daily_pnl(),
+        )
+        logger.debug(
+            f"Risk state reconciled: {self._risk_state.position_count} positions, "
+            f"{len(self._risk_state.pending_keys)} pending orders, "
+            f"realized ${self._risk_state.realized_pnl:+,.0f}"
+        )
+        return self._risk_state
+
+    def _get_risk_state(self) -> RiskState:
+        """Return the in-memory risk state, reconciling it when stale."""
+        state = self._risk_state
+        if (
+            state is None
+            or state.trading_date != us_trading_date()
+            or state.is_stale(self.RISK_STATE_RECONCILE_SECONDS)
+        ):
+            state = self.reconcile_risk_state()
+        return state
+
     def _get_cached_account_summary(self, force_refresh: bool = False) -> dict:
         """Get account summary, using cache if fresh.
 
@@ -472,13 +826,13 @@ class RiskGovernor:
                         + unrealized (from IBKR, open positions)
 
         Survives process restarts because realized PnL comes from the database.
+        Both are read from the in-memory risk state: realized P&L is updated
+        on closes, unrealized P&L by streamed portfolio updates between
+        reconciliations.
         """
-        # Unrealized PnL from currently open positions
-        positions = self.position_monitor.get_all_positions()
-        unrealized_pnl = sum(p.current_pnl for p in positions)
-
-        # Realized PnL from trades closed today (persisted in DB)
-        realized_pnl = self._get_realized_daily_pnl()
+        state = self._get_risk_state()
+        unrealized_pnl = state.unrealized_pnl
+        realized_pnl = state.realized_pnl
 
         total_pnl = realized_pnl + unrealized_pnl
 
@@ -726,14 +1080,16 @@ class RiskGovernor:
             else 0,
         )
 
-    def _check_max_positions(self) -> RiskLimitCheck:
+    def _check_max_positions(self, state: RiskState | None = None) -> RiskLimitCheck:
         """Check maximum position limit.
 
+        Args:
+            state: Risk state to evaluate against (default: current state)
+
         Returns:
             RiskLimitCheck: Check result
         """
-        positions = self.position_monitor.get_all_positions()
-        current_positions = len(positions)
+        current_positions = (state or self._get_risk_state()).position_count
 
         if current_positions >= self.MAX_POSITIONS:
             return RiskLimitCheck(
@@ -756,18 +1112,26 @@ class RiskGovernor:
             else 0,
         )
 
-    def _check_max_positions_per_day(self) -> RiskLimitCheck:
+    def _check_max_positions_per_day(
+        self, trades_today: int | None = None
+    ) -> RiskLimitCheck:
         """Check maximum trades per day limit.
 
+        Args:
+            trades_today: Trade count to evaluate (default: recorded count)
+
         Returns:
             RiskLimitCheck: Check result
         """
-        if self._trades_today >= self.MAX_POSITIONS_PER_DAY:
+        if trades_today is None:
+            trades_today = self._trades_today
+
+        if trades_today >= self.MAX_POSITIONS_PER_DAY:
             return RiskLimitCheck(
                 approved=False,
-                reason=f"Max trades per day reached: {self._trades_today}/{self.MAX_POSITIONS_PER_DAY}",
+                reason=f"Max trades per day reached: {trades_today}/{self.MAX_POSITIONS_PER_DAY}",
                 limit_name="max_trades_per_day",
-                current_value=self._trades_today,
+                current_value=trades_today,
                 limit_value=self.MAX_POSITIONS_PER_DAY,
                 utilization_pct=100.0,
             )
@@ -776,15 +1140,15 @@ class RiskGovernor:
             approved=True,
             reason="Daily trade count within limit",
             limit_name="max_trades_per_day",
-            current_value=self._trades_today,
+            current_value=trades_today,
             limit_value=self.MAX_POSITIONS_PER_DAY,
-            utilization_pct=(self._trades_today / self.MAX_POSITIONS_PER_DAY * 100)
+            utilization_pct=(trades_today / self.MAX_POSITIONS_PER_DAY * 100)
             if self.MAX_POSITIONS_PER_DAY > 0
             else 0,
         )
 
     def _check_sector_concentration(
-        self, opportunity: TradeOpportunity
+        self, opportunity: TradeOpportunity, state: RiskState | None = None
     ) -> RiskLimitCheck:
         """Check sector concentration limit.
 
@@ -794,6 +1158,7 @@ class RiskGovernor:
 
         Args:
             opportunity: New trade opportunity
+            state: Risk state to evaluate against (default: current state)
 
         Returns:
             RiskLimitCheck: Check result
@@ -802,11 +1167,11 @@ class RiskGovernor:
 
         new_sector = get_sector(opportunity.symbol)
 
-        # Count existing positions per sector
-        positions = self.position_monitor.get_all_positions()
+        # Existing positions per sector (maintained in the risk state)
+        state = state or self._get_risk_state()
 
         # Skip check for small portfolios — can't diversify with ≤3 positions
-        total_after = len(positions) + 1
+        total_after = state.position_count + 1
         if total_after <= 3:
             logger.debug(
                 f"Sector check: skipped (only {total_after} positions, need >3)"
@@ -820,13 +1185,8 @@ class RiskGovernor:
                 utilization_pct=0.0,
             )
 
-        sector_counts: dict[str, int] = {}
-        for pos in positions:
-            sector = get_sector(pos.symbol)
-            sector_counts[sector] = sector_counts.get(sector, 0) + 1
-
         # Calculate concentration with the new trade included
-        current_in_sector = sector_counts.get(new_sector, 0)
+        current_in_sector = state.sector_counts.get(new_sector, 0)
         new_count = current_in_sector + 1
 
         concentration = new_count / total_after
@@ -920,28 +1280,51 @@ class RiskGovernor:
         Returns:
             RiskLimitCheck: Check result
         """
+        check, _ = self._evaluate_margin(opportunity)
+        return check
+
+    def _evaluate_margin(
+        self,
+        opportunity: TradeOpportunity,
+        committed_margin: float = 0.0,
+        whatif_lookup: Callable[[TradeOpportunity], Optional[float]] | None = None,
+    ) -> tuple[RiskLimitCheck, float]:
+        """Evaluate margin limits for a trade on top of already-committed margin.
+
+        Args:
+            opportunity: New trade opportunity
+            committed_margin: Margin already claimed by other trades in the
+                same batch (reduces available funds)
+            whatif_lookup: WhatIf margin source (default: _get_whatif_margin)
+
+        Returns:
+            Tuple of (RiskLimitCheck, margin required by this trade)
+        """
         # Get account margin info (uses 5-minute cache)
         account_summary = self._get_cached_account_summary()
-        available_funds = account_summary.get("AvailableFunds", 0)
+        available_funds = account_summary.get("AvailableFunds", 0) - committed_margin
         buying_power = account_summary.get("BuyingPower", 0)
         net_liquidation = account_summary.get("NetLiquidation", 0)
 
         # Layer 1: Fast reject using upstream estimate
         estimated_margin = opportunity.margin_required
+        required_margin = estimated_margin
 
         if estimated_margin > available_funds:
-            return RiskLimitCheck(
-                approved=False,
-                reason=f"Insufficient margin: need ${estimated_margin:,.0f}, have ${available_funds:,.0f}",
-                limit_name="margin_utilization",
-                current_value=estimated_margin,
-                limit_value=available_funds,
-                utilization_pct=100.0,
+            return (
+                RiskLimitCheck(
+                    approved=False,
+                    reason=f"Insufficient margin: need ${estimated_margin:,.0f}, have ${available_funds:,.0f}",
+                    limit_name="margin_utilization",
+                    current_value=estimated_margin,
+                    limit_value=available_funds,
+                    utilization_pct=100.0,
+                ),
+                required_margin,
             )
 
         # Layer 2: WhatIf API verification
-        required_margin = estimated_margin
-        whatif_margin = self._get_whatif_margin(opportunity)
+        whatif_margin = (whatif_lookup or self._get_whatif_margin)(opportunity)
 
         if whatif_margin is not None:
             delta = whatif_margin - estimated_margin
@@ -953,17 +1336,20 @@ class RiskGovernor:
 
             # Re-check with WhatIf margin (may now exceed available funds)
             if required_margin > available_funds:
-                return RiskLimitCheck(
-                    approved=False,
-                    reason=(
-                        f"Insufficient margin (WhatIf): need ${required_margin:,.0f}, "
-                        f"have ${available_funds:,.0f} "
-                        f"(estimate was ${estimated_margin:,.0f})"
+                return (
+                    RiskLimitCheck(
+                        approved=False,
+                        reason=(
+                            f"Insufficient margin (WhatIf): need ${required_margin:,.0f}, "
+                            f"have ${available_funds:,.0f} "
+                            f"(estimate was ${estimated_margin:,.0f})"
+                        ),
+                        limit_name="margin_utilization",
+                        current_value=required_margin,
+                        limit_value=available_funds,
+                        utilization_pct=100.0,
                     ),
-                    limit_name="margin_utilization",
-                    current_value=required_margin,
-                    limit_value=available_funds,
-                    utilization_pct=100.0,
+                    required_margin,
                 )
         else:
             logger.warning(
@@ -979,48 +1365,57 @@ class RiskGovernor:
                     f"Trade rejected: margin impact ${required_margin:,.0f} exceeds "
                     f"{self.MAX_MARGIN_PER_TRADE_PCT:.0%} cap (${per_trade_cap:,.0f})"
                 )
-                return RiskLimitCheck(
-                    approved=False,
-                    reason=(
-                        f"Single trade margin ${required_margin:,.0f} exceeds "
-                        f"{self.MAX_MARGIN_PER_TRADE_PCT:.0%} per-trade cap "
-                        f"(${per_trade_cap:,.0f} of ${net_liquidation:,.0f} NetLiq)"
+                return (
+                    RiskLimitCheck(
+                        approved=False,
+                        reason=(
+                            f"Single trade margin ${required_margin:,.0f} exceeds "
+                            f"{self.MAX_MARGIN_PER_TRADE_PCT:.0%} per-trade cap "
+                            f"(${per_trade_cap:,.0f} of ${net_liquidation:,.0f} NetLiq)"
+                        ),
+                        limit_name="per_trade_margin_cap",
+                        current_value=required_margin,
+                        limit_value=per_trade_cap,
+                        utilization_pct=(required_margin / per_trade_cap) * 100,
                     ),
-                    limit_name="per_trade_margin_cap",
-                    current_value=required_margin,
-                    limit_value=per_trade_cap,
-                    utilization_pct=(required_margin / per_trade_cap) * 100,
+                    required_margin,
                 )
 
         # Check margin utilization percentage
         if buying_power > 0:
             utilization = (buying_power - available_funds + required_margin) / buying_power
             if utilization > self.MAX_MARGIN_UTILIZATION:
-                return RiskLimitCheck(
-                    approved=False,
-                    reason=f"Margin utilization too high: {utilization:.1%} (limit: {self.MAX_MARGIN_UTILIZATION:.1%})",
-                    limit_name="margin_utilization",
-                    current_value=utilization * 100,
-                    limit_value=self.MAX_MARGIN_UTILIZATION * 100,
-                    utilization_pct=100.0,
+                return (
+                    RiskLimitCheck(
+                        approved=False,
+                        reason=f"Margin utilization too high: {utilization:.1%} (limit: {self.MAX_MARGIN_UTILIZATION:.1%})",
+                        limit_name="margin_utilization",
+                        current_value=utilization * 100,
+                        limit_value=self.MAX_MARGIN_UTILIZATION * 100,
+                        utilization_pct=100.0,
+                    ),
+                    required_margin,
                 )
 
         # Check ExcessLiquidity ratio (6.2A)
-        excess_liquidity = account_summary.get("ExcessLiquidity", 0)
+        excess_liquidity = account_summary.get("ExcessLiquidity", 0) - committed_margin
         if net_liquidation > 0:
             excess_ratio = excess_liquidity / net_liquidation
             if excess_ratio < self.MIN_EXCESS_LIQUIDITY_PCT:
-                return RiskLimitCheck(
-                    approved=False,
-                    reason=(
-                        f"ExcessLiquidity dangerously low: "
-                        f"${excess_liquidity:,.0f} ({excess_ratio:.0%} of NLV) "
-                        f"— minimum {self.MIN_EXCESS_LIQUIDITY_PCT:.0%} required"
+                return (
+                    RiskLimitCheck(
+                        approved=False,
+                        reason=(
+                            f"ExcessLiquidity dangerously low: "
+                            f"${excess_liquidity:,.0f} ({excess_ratio:.0%} of NLV) "
+                            f"— minimum {self.MIN_EXCESS_LIQUIDITY_PCT:.0%} required"
+                        ),
+                        limit_name="excess_liquidity",
+                        current_value=excess_ratio * 100,
+                        limit_value=self.MIN_EXCESS_LIQUIDITY_PCT * 100,
+                        utilization_pct=100.0,
                     ),
-                    limit_name="excess_liquidity",
-                    current_value=excess_ratio * 100,
-                    limit_value=self.MIN_EXCESS_LIQUIDITY_PCT * 100,
-                    utilization_pct=100.0,
+                    required_margin,
                 )
             elif excess_ratio < 0.20:
                 logger.warning(
@@ -1028,13 +1423,16 @@ class RiskGovernor:
                     f"({excess_ratio:.0%} of NLV) — approaching danger zone"
                 )
 
-        return RiskLimitCheck(
-            approved=True,
-            reason="Margin utilization within limit",
-            limit_name="margin_utilization",
-            current_value=0,
-            limit_value=self.MAX_MARGIN_UTILIZATION * 100,
-            utilization_pct=0.0,
+        return (
+            RiskLimitCheck(
+                approved=True,
+                reason="Margin utilization within limit",
+                limit_name="margin_utilization",
+                current_value=0,
+                limit_value=self.MAX_MARGIN_UTILIZATION * 100,
+                utilization_pct=0.0,
+            ),
+            required_margin,
         )
 
     def _get_whatif_margin(self, opportunity: TradeOpportunity) -> Optional[float]:
@@ -1070,111 +1468,47 @@ class RiskGovernor:
         Returns:
             RiskLimitCheck: Check result
         """
-        from datetime import datetime
-
-        # Parse expiration date from opportunity
-        if isinstance(opportunity.expiration, str):
-            opp_exp_date = datetime.strptime(opportunity.expiration, "%Y-%m-%d").date()
-        elif isinstance(opportunity.expiration, datetime):
-            opp_exp_date = opportunity.expiration.date()
-        else:
-            opp_exp_date = opportunity.expiration
-
-        # Check 1: Open positions
         try:
-            positions = self.position_monitor.get_all_positions()
-            logger.debug(f"Checking {len(positions)} open positions for duplicates")
-
-            for pos in positions:
-                # Parse position expiration (PositionStatus uses expiration_date in YYYYMMDD format)
-                if hasattr(pos, 'expiration_date') and pos.expiration_date:
-                    # expiration_date is in YYYYMMDD format
-                    pos_exp_str = str(pos.expiration_date)
-                    if len(pos_exp_str) == 8:
-                        pos_exp_date = datetime.strptime(pos_exp_str, "%Y%m%d").date()
-                    else:
-                        continue
-                else:
-                    continue
-
-                logger.debug(
-                    f"Open position: {pos.symbol} ${pos.strike} {pos_exp_date} "
-                    f"(checking against {opportunity.symbol} ${opportunity.strike} {opp_exp_date})"
-                )
-
-                # Check for exact match
-                if (
-                    pos.symbol == opportunity.symbol
-                    and abs(pos.strike - opportunity.strike) < 0.01  # Float comparison
-                    and pos_exp_date == opp_exp_date
-                ):
-                    logger.warning(
-                        f"Found duplicate open position: {pos.symbol} ${pos.strike} {pos_exp_date}"
-                    )
-                    return RiskLimitCheck(
-                        approved=False,
-                        reason=f"Duplicate position: Already have open position for {opportunity.symbol} ${opportunity.strike} {opportunity.expiration}",
-                        limit_name="duplicate_check",
-                        current_value=1,
-                        limit_value=0,
-                        utilization_pct=100.0,
-                    )
+            state = self._get_risk_state()
         except Exception as e:
-            logger.warning(f"Failed to check open positions for duplicates: {e}", exc_info=True)
-
-        # Check 2: Pending orders
-        try:
-            # Request fresh open orders data (don't rely on cache)
-            open_orders = self.ibkr_client.request_open_orders()
-
-            logger.debug(f"Checking {len(open_orders)} pending orders for duplicates")
-
-            # openOrders() returns Trade objects with .contract and .order attributes
-            for trade_obj in open_orders:
-                # Access contract from Trade object
-                if not hasattr(trade_obj, 'contract'):
-                    logger.debug(f"Trade object has no contract attribute: {type(trade_obj)}")
-                    continue
-
-                contract = trade_obj.contract
-
-                # Check if it's an option contract
-                if hasattr(contract, 'strike') and hasattr(contract, 'lastTradeDateOrContractMonth'):
-                    # Parse contract expiration (format: YYYYMMDD)
-                    exp_str = str(contract.lastTradeDateOrContractMonth)
-                    if len(exp_str) == 8:
-                        try:
-                            contract_exp_date = datetime.strptime(exp_str, "%Y%m%d").date()
-                        except ValueError:
-                            logger.debug(f"Failed to parse expiration date: {exp_str}")
-                            continue
-                    else:
-                        continue
-
-                    logger.debug(
-                        f"Pending order: {contract.symbol} ${contract.strike} {contract_exp_date} "
-                        f"(checking against {opportunity.symbol} ${opportunity.strike} {opp_exp_date})"
-                    )
+            logger.warning(f"Failed to load risk state for duplicate check: {e}", exc_info=True)
+            state = None
+        key = contract_key(opportunity.symbol, opportunity.strike, opportunity.expiration)
+        if key is None:
+            logger.warning(
+                f"Unparseable expiration {opportunity.expiration!r} for "
+                f"{opportunity.symbol} — skipping duplicate check"
+            )
+        elif state is not None:
+            # Check 1: Open positions
+            if state.has_position(key):
+                logger.warning(
+                    f"Found duplicate open position: {opportunity.symbol} "
+                    f"${opportunity.strike} {key[2]}"
+                )
+                return RiskLimitCheck(
+                    approved=False,
+                    reason=f"Duplicate position: Already have open position for {opportunity.symbol} ${opportunity.strike} {opportunity.expiration}",
+                    limit_name="duplicate_check",
+                    current_value=1,
+                    limit_value=0,
+                    utilization_pct=100.0,
+                )
 
-                    # Check for exact match
-                    if (
-                        contract.symbol == opportunity.symbol
-                        and abs(contract.strike - opportunity.strike) < 0.01
-                        and contract_exp_date == opp_exp_date
-                    ):
-                        logger.warning(
-                            f"Found duplicate pending order: {contract.symbol} ${contract.strike} {contract_exp_date}"
-                        )
-                        return RiskLimitCheck(
-                            approved=False,
-                            reason=f"Duplicate order: Already have pending order for {opportunity.symbol} ${opportunity.strike} {opportunity.expiration}",
-                            limit_name="duplicate_check",
-                            current_value=1,
-                            limit_value=0,
-                            utilization_pct=100.0,
-                        )
-        except Exception as e:
-            logger.warning(f"Failed to check pending orders for duplicates: {e}", exc_info=True)
+            # Check 2: Pending orders
+            if state.has_pending(key):
+                logger.warning(
+                    f"Found duplicate pending order: {opportunity.symbol} "
+                    f"${opportunity.strike} {key[2]}"
+                )
+                return RiskLimitCheck(
+                    approved=False,
+                    reason=f"Duplicate order: Already have pending order for {opportunity.symbol} ${opportunity.strike} {opportunity.expiration}",
+                    limit_name="duplicate_check",
+                    current_value=1,
+                    limit_value=0,
+                    utilization_pct=100.0,
+                )
 
         # No duplicates found
         return RiskLimitCheck(
@@ -1271,6 +1605,7 @@ class RiskGovernor:
         """
         try:
             account_summary = self.ibkr_client.get_account_summary()
+            self.update_account_summary(account_summary)
 
             available_funds = account_summary.get("AvailableFunds", 0)
             excess_liquidity = account_summary.get("ExcessLiquidity", 0)
@@ -1346,4 +1681,5 @@ class RiskGovernor:
         if today > self._last_reset_date:
             logger.info("New trading day: resetting daily counters")
             self._trades_today = self._load_trades_today_from_db()
+            self._risk_state = None
             self._last_reset_date = today
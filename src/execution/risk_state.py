@@ -0,0 +1,209 @@
+"""In-memory risk state for RiskGovernor limit checks.
+
+Holds everything the per-trade limit checks need that would otherwise be
+re-queried on every ``pre_trade_check()`` call:
+
+- Open position count, contract keys and per-sector counts (IBKR portfolio)
+- Pending order contract keys (IBKR open orders)
+- Unrealized P&L of open positions (refreshed on every daily-loss check)
+- Realized P&L for the current trading day (database)
+
+The state is rebuilt from the authoritative sources by
+``RiskGovernor.reconcile_risk_state()`` (periodically and on demand) and
+updated incrementally in between as orders are placed, cancelled, filled
+and closed,
+so checking a batch of trades costs one reconciliation instead of several
+queries per trade.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from loguru import logger
+
+from src.data.sector_map import get_sector
+
+ContractKey = tuple[str, float, date]
+
+
+def contract_key(
+    symbol: str, strike: float, expiration: Any
+) -> ContractKey | None:
+    """Normalize an option contract to a hashable (symbol, strike, expiry) key.
+
+    Args:
+        symbol: Underlying symbol
+        strike: Strike price (rounded to the cent)
+        expiration: date, datetime, "YYYY-MM-DD" or "YYYYMMDD"
+
+    Returns:
+        Contract key, or None if the expiration cannot be parsed
+    """
+    if isinstance(expiration, datetime):
+        exp_date = expiration.date()
+    elif isinstance(expiration, date):
+        exp_date = expiration
+    else:
+        exp_str = str(expiration or "")
+        try:
+            if len(exp_str) == 8 and exp_str.isdigit():
+                exp_date = datetime.strptime(exp_str, "%Y%m%d").date()
+            else:
+                exp_date = datetime.strptime(exp_str, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    return (symbol, round(float(strike), 2), exp_date)
+
+
+def _position_key(pos: Any) -> ContractKey | None:
+    """Contract key of a PositionStatus (expiration_date is YYYYMMDD)."""
+    exp_str = str(getattr(pos, "expiration_date", "") or "")
+    if len(exp_str) != 8:
+        return None
+    return contract_key(pos.symbol, pos.strike, exp_str)
+
+
+@dataclass
+class RiskState:
+    """Snapshot of portfolio risk inputs, kept current between reconciliations.
+
+    Attributes:
+        trading_date: Trading day the snapshot belongs to
+        position_count: Number of open positions
+        position_keys: Contract keys of open option positions
+        pending_keys: Contract keys of working (unfilled) orders
+        sector_counts: Open positions per sector
+        unrealized_pnl: Unrealized P&L of open positions at last refresh
+        position_pnl: Unrealized P&L per contract key (removed on close)
+        realized_pnl: Realized P&L for trades closed today
+        reconciled_at: time.monotonic() of the last full reconciliation
+    """
+
+    trading_date: date
+    position_count: int = 0
+    position_keys: set[ContractKey] = field(default_factory=set)
+    pending_keys: set[ContractKey] = field(default_factory=set)
+    sector_counts: dict[str, int] = field(default_factory=dict)
+    unrealized_pnl: float = 0.0
+    position_pnl: dict[ContractKey, float] = field(default_factory=dict)
+    realized_pnl: float = 0.0
+    reconciled_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(
+        cls,
+        trading_date: date,
+        positions: list,
+        open_orders: list,
+        realized_pnl: float,
+    ) -> "RiskState":
+        """Build state from the authoritative sources.
+
+        Args:
+            trading_date: Current trading day
+            positions: PositionStatus list from PositionMonitor
+            open_orders: Trade objects from the broker's open orders
+            realized_pnl: Realized P&L for trades closed today
+
+        Returns:
+            Fresh RiskState
+        """
+        state = cls(trading_date=trading_date, realized_pnl=realized_pnl)
+        state.position_count = len(positions)
+
+        state.refresh_unrealized(positions)
+        for pos in positions:
+            sector = get_sector(pos.symbol)
+            state.sector_counts[sector] = state.sector_counts.get(sector, 0) + 1
+
+            key = _position_key(pos)
+            if key:
+                state.position_keys.add(key)
+
+        for trade_obj in open_orders:
+            contract = getattr(trade_obj, "contract", None)
+            if contract is None or not hasattr(contract, "strike"):
+                continue
+            exp_str = str(getattr(contract, "lastTradeDateOrContractMonth", "") or "")
+            if len(exp_str) != 8:
+                continue
+            key = contract_key(contract.symbol, contract.strike, exp_str)
+            if key:
+                state.pending_keys.add(key)
+
+        return state
+
+    def refresh_unrealized(self, positions: list) -> None:
+        """Replace unrealized P&L with current values from open positions.
+
+        Args:
+            positions: PositionStatus list from PositionMonitor
+        """
+        self.unrealized_pnl = 0.0
+        self.position_pnl = {}
+        for pos in positions:
+            self.unrealized_pnl += pos.current_pnl
+            key = _position_key(pos)
+            if key:
+                self.position_pnl[key] = self.position_pnl.get(key, 0.0) + pos.current_pnl
+
+    def set_position_unrealized(self, key: ContractKey, pnl: float | None) -> None:
+        """Replace one position's unrealized P&L (None drops the position).
+
+        Args:
+            key: Contract key of the position
+            pnl: Current unrealized P&L in dollars
+        """
+        previous = self.position_pnl.pop(key, 0.0)
+        if pnl is not None:
+            self.position_pnl[key] = pnl
+        self.unrealized_pnl += (pnl or 0.0) - previous
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        """Whether the last reconciliation is older than max_age_seconds."""
+        return time.monotonic() - self.reconciled_at >= max_age_seconds
+
+    def has_position(self, key: ContractKey) -> bool:
+        """Whether an open position exists for the contract."""
+        return key in self.position_keys
+
+    def has_pending(self, key: ContractKey) -> bool:
+        """Whether a working order exists for the contract."""
+        return key in self.pending_keys
+
+    def add_pending(self, key: ContractKey) -> None:
+        """Record an order placed for the contract."""
+        self.pending_keys.add(key)
+
+    def remove_pending(self, key: ContractKey) -> None:
+        """Record an order for the contract that ended without a fill."""
+        self.pending_keys.discard(key)
+
+    def add_position(self, key: ContractKey) -> None:
+        """Record a fill that opened a position in the contract."""
+        self.pending_keys.discard(key)
+        if key in self.position_keys:
+            return
+        self.position_keys.add(key)
+        self.count_position(key[0])
+
+    def count_position(self, symbol: str) -> None:
+        """Count an open position toward the position and sector totals."""
+        self.position_count += 1
+        sector = get_sector(symbol)
+        self.sector_counts[sector] = self.sector_counts.get(sector, 0) + 1
+
+    def remove_position(self, key: ContractKey, realized_pnl: float = 0.0) -> None:
+        """Record a closed position; its unrealized P&L becomes realized."""
+        self.realized_pnl += realized_pnl
+        self.unrealized_pnl -= self.position_pnl.pop(key, 0.0)
+        if key not in self.position_keys:
+            logger.debug(f"Risk state: closed {key} was not tracked as open")
+            return
+        self.position_keys.discard(key)
+        self.position_count = max(0, self.position_count - 1)
+        sector = get_sector(key[0])
+        if self.sector_counts.get(sector, 0) > 0:
+            self.sector_counts[sector] -= 1
@@ -269,6 +269,7 @@ class AdaptiveOrderExecutor:
         staged: StagedOpportunity,
         contract: Contract,
         quote: LiveQuote,
+        order: LimitOrder | None = None,
     ) -> OrderResult:
         """Place order using Adaptive Algo, fallback to LIMIT if needed.
 
@@ -280,6 +281,8 @@ class AdaptiveOrderExecutor:
             staged: Staged trade opportunity
             contract: Qualified contract
             quote: Live quote with calculated limit
+            order: Order pre-built before the open (see execution_prewarm);
+                only its limit price is set here
 
         Returns:
             OrderResult with placement details
@@ -370,8 +373,14 @@ class AdaptiveOrderExecutor:
                 f"live ${quote.limit:.2f} vs staged ${staged.staged_limit_price:.2f} — proceeding with caution"
             )
 
+        if order is not None:
+            # Pre-built during pre-warm — only the live limit is applied now
+            order.lmtPrice = quote.limit
+            order_type_used = (
+                "Adaptive" if getattr(order, "algoStrategy", "") == "Adaptive" else "LIMIT"
+            )
         # Primary: Adaptive Algo (if enabled)
-        if self.use_adaptive:
+        elif self.use_adaptive:
             order = self.create_adaptive_order(
                 contracts=staged.staged_contracts,
                 floor_price=quote.limit,  # Use live-calculated price as floor
@@ -395,7 +404,7 @@ class AdaptiveOrderExecutor:
             # Check for immediate rejection (Adaptive not supported)
             await asyncio.sleep(0.3)
 
-            if trade.orderStatus.status == "Inactive" and self.use_adaptive:
+            if trade.orderStatus.status == "Inactive" and order_type_used == "Adaptive":
                 logger.warning(
                     f"{staged.symbol}: Adaptive Algo rejected, falling back to LIMIT"
                 )
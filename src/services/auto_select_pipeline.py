@@ -811,7 +811,7 @@ def run_auto_select_pipeline(
         )
         portfolio_candidates.append(pc)
 
-    # Step 10: Greedy portfolio selection within budget
+    # Step 10: Optimal portfolio selection within budget
     _update_scan_progress(db, "SELECTING")
     selected, skipped, warnings = build_auto_select_portfolio(
         portfolio_candidates,
@@ -26,6 +26,11 @@ from typing import Optional
 from loguru import logger
 
 from src.agentic.scanner_settings import ScannerSettings
+from src.services.portfolio_optimizer import (
+    DEFAULT_TIME_BUDGET_MS,
+    SelectionItem,
+    optimize_selection,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -674,23 +679,28 @@ def build_auto_select_portfolio(
     available_budget: float,
     max_positions: int = 10,
     max_per_sector: int = 5,
+    time_budget_ms: float = DEFAULT_TIME_BUDGET_MS,
 ) -> tuple[list[PortfolioCandidate], list[PortfolioCandidate], list[str]]:
-    """Greedy portfolio selection by composite score within budget.
+    """Optimal portfolio selection by composite score within budget.
 
-    Sorts candidates by composite_score descending, then greedily selects
-    trades that fit within the available margin budget while respecting
-    position and sector limits.
+    Chooses the set of candidates with the highest total composite score
+    that fits within the available margin budget while respecting position,
+    sector and one-per-symbol limits (see portfolio_optimizer). Unlike greedy
+    selection, a high-margin candidate is not taken if two smaller ones are
+    worth more together. The result is never worse than greedy selection by
+    composite score.
 
     Args:
         candidates: List of PortfolioCandidates with composite_score set.
         available_budget: Maximum total margin for all selected trades.
         max_positions: Maximum number of trades in portfolio.
         max_per_sector: Maximum trades per sector.
+        time_budget_ms: Hard limit on optimization time.
 
     Returns:
         Tuple of (selected, skipped, warnings):
         - selected: Candidates chosen for portfolio (with selected=True,
-          portfolio_rank set).
+          portfolio_rank set), ordered by composite score descending.
         - skipped: Candidates not chosen (with skip_reason set).
         - warnings: List of warning messages.
     """
@@ -702,52 +712,59 @@ def build_auto_select_portfolio(
         candidates, key=lambda c: c.composite_score, reverse=True
     )
 
+    for candidate in sorted_candidates:
+        candidate.total_margin = candidate.margin * candidate.contracts
+
+    result = optimize_selection(
+        [
+            SelectionItem(
+                value=c.composite_score,
+                weight=c.total_margin,
+                symbol=c.symbol,
+                sector=c.sector or "Unknown",
+            )
+            for c in sorted_candidates
+        ],
+        budget=available_budget,
+        max_positions=max_positions,
+        max_per_sector=max_per_sector,
+        time_budget_ms=time_budget_ms,
+    )
+    logger.info(f"Auto-select portfolio selection — {result.summary()}")
+    chosen = set(result.selected)
+
     selected: list[PortfolioCandidate] = []
     skipped: list[PortfolioCandidate] = []
     warnings: list[str] = []
 
-    used_budget = 0.0
     sector_counts: dict[str, int] = {}
     seen_symbols: set[str] = set()
 
-    for candidate in sorted_candidates:
-        # Check max positions
-        if len(selected) >= max_positions:
-            candidate.skip_reason = "max_positions"
-            candidate.selected = False
-            skipped.append(candidate)
+    for i, candidate in enumerate(sorted_candidates):
+        if i in chosen:
+            candidate.selected = True
+            candidate.skip_reason = None
+            candidate.portfolio_rank = len(selected) + 1
+            sector = candidate.sector or "Unknown"
+            sector_counts[sector] = sector_counts.get(sector, 0) + 1
+            seen_symbols.add(candidate.symbol)
+            selected.append(candidate)
+
+    for i, candidate in enumerate(sorted_candidates):
+        if i in chosen:
             continue
+        candidate.selected = False
 
-        # Check duplicate symbol
-        if candidate.symbol in seen_symbols:
+        # Report the limit that keeps this candidate out of the final set
+        if len(selected) >= max_positions:
+            candidate.skip_reason = "max_positions"
+        elif candidate.symbol in seen_symbols:
             candidate.skip_reason = "duplicate_symbol"
-            candidate.selected = False
-            skipped.append(candidate)
-            continue
-
-        # Check sector limit
-        sector = candidate.sector or "Unknown"
-        if sector_counts.get(sector, 0) >= max_per_sector:
+        elif sector_counts.get(candidate.sector or "Unknown", 0) >= max_per_sector:
             candidate.skip_reason = "max_per_sector"
-            candidate.selected = False
-            skipped.append(candidate)
-            continue
-
-        # Check budget
-        candidate.total_margin = candidate.margin * candidate.contracts
-        if used_budget + candidate.total_margin > available_budget:
+        else:
             candidate.skip_reason = "budget_exceeded"
-            candidate.selected = False
-            skipped.append(candidate)
-            continue
-
-        # Select this candidate
-        candidate.selected = True
-        candidate.portfolio_rank = len(selected) + 1
-        used_budget += candidate.total_margin
-        sector_counts[sector] = sector_counts.get(sector, 0) + 1
-        seen_symbols.add(candidate.symbol)
-        selected.append(candidate)
+        skipped.append(candidate)
 
     if not selected and candidates:
         warnings.append("No candidates fit within the available budget")
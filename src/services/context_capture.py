@@ -2,16 +2,57 @@
 
 This module provides services for capturing complete market and underlying
 context at trade decision time for learning engine analysis.
+
+Quotes for every symbol are subscribed at once and awaited together against
+a single deadline. Whatever has not arrived by then is left at its default
+and listed in the context's ``missing_fields``. Complete market contexts are
+cached for the current minute, shared by every service on the same client.
 """
 
+import dataclasses
+import math
+import time
 import uuid
 from datetime import datetime
 
 from loguru import logger
 
 from src.data.context_snapshot import DecisionContext, MarketContext, UnderlyingContext
+from src.services.market_data_cache import MarketDataCache, get_market_data_cache
 from src.strategies.base import TradeOpportunity
 
+MARKET_SYMBOLS = ("SPY", "QQQ", "VIX")
+
+# (symbol, price field, change field) for each market-wide input
+_MARKET_FIELDS = (
+    ("SPY", "spy_price", "spy_change_pct"),
+    ("QQQ", "qqq_price", "qqq_change_pct"),
+    ("VIX", "vix", "vix_change_pct"),
+)
+
+_MARKET_CONTEXT_KEY = ("context", "market")
+
+
+def _number(value) -> float | None:
+    """Return a finite number, or None for missing/NaN/non-numeric values."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return None if math.isnan(value) else value
+
+
+def _price(ticker) -> float | None:
+    """Positive market price from a ticker, or None."""
+    if ticker is None:
+        return None
+    price = _number(ticker.marketPrice())
+    return price if price and price > 0 else None
+
+
+def _change_pct(price: float | None, close: float | None) -> float | None:
+    if price is None or not close or close <= 0:
+        return None
+    return (price - close) / close
+
 
 class ContextCaptureService:
     """Capture and store decision context for learning.
@@ -22,15 +63,25 @@ class ContextCaptureService:
     - Decision metadata (source, ranking, strategy params)
     """
 
-    def __init__(self, ibkr_client, timeout: int = 10):
+    def __init__(
+        self,
+        ibkr_client,
+        timeout: int = 10,
+        poll_interval: float = 0.25,
+        cache: MarketDataCache | None = None,
+    ):
         """Initialize context capture service.
 
         Args:
             ibkr_client: IBKR client for market data
-            timeout: Timeout in seconds for data capture
+            timeout: Deadline in seconds for all quotes of one capture
+            poll_interval: Seconds between checks for outstanding quotes
+            cache: Per-minute cache. If None, uses the cache shared by the client.
         """
         self.ibkr = ibkr_client
         self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.cache = cache if cache is not None else get_market_data_cache(ibkr_client)
 
     def capture_market_context(self) -> MarketContext:
         """Capture current market-wide context.
@@ -41,67 +92,184 @@ class ContextCaptureService:
         - VIX (Volatility Index)
 
         Returns:
-            MarketContext with market data
+            MarketContext with market data. Inputs that did not arrive before
+            the deadline are listed in missing_fields.
+        """
+        cached = self._cached_market_context()
+        if cached is not None:
+            return cached
+
+        timestamp = datetime.now()
+        tickers = self._stream(MARKET_SYMBOLS)
+        try:
+            return self._build_market_context(tickers, timestamp)
+        finally:
+            self._release(tickers)
 
-        Raises:
-            TimeoutError: If data fetch exceeds timeout
+    def capture_underlying_context(self, symbol: str) -> UnderlyingContext:
+        """Capture context for specific underlying.
+
+        Fetches data for the underlying symbol including:
+        - Current price and OHLC
+        - Volume metrics
+        - Moving averages (if available)
+        - Trend indicators
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            UnderlyingContext with underlying data. Inputs that did not arrive
+            before the deadline are listed in missing_fields.
         """
         timestamp = datetime.now()
+        tickers = self._stream((symbol,))
+        try:
+            return self._build_underlying_context(symbol, tickers[symbol], timestamp)
+        finally:
+            self._release(tickers)
+
+    def capture_full_context(
+        self,
+        opportunity: TradeOpportunity,
+        strategy_params: dict,
+        rank_info: dict,
+    ) -> DecisionContext:
+        """Capture complete decision context.
 
+        Args:
+            opportunity: Trade opportunity being considered
+            strategy_params: Strategy configuration at decision time
+            rank_info: Ranking information (position, score, factors)
+
+        Returns:
+            DecisionContext with complete context
+        """
+        # Generate unique decision ID
+        decision_id = self._generate_decision_id()
+
+        # Stream market and underlying quotes together (market from cache
+        # if it was captured earlier this minute)
+        timestamp = datetime.now()
+        market = self._cached_market_context()
+        symbols = (opportunity.symbol,) if market else (opportunity.symbol, *MARKET_SYMBOLS)
+        tickers = self._stream(symbols)
         try:
-            # Get SPY data
-            spy_ticker = self.ibkr.ticker("SPY")
-            spy_price = spy_ticker.marketPrice()
-            spy_close = spy_ticker.close
-            spy_change_pct = (
-                (spy_price - spy_close) / spy_close
-                if spy_close and spy_close > 0
-                else 0.0
+            if market is None:
+                market = self._build_market_context(tickers, timestamp)
+            underlying = self._build_underlying_context(
+                opportunity.symbol, tickers[opportunity.symbol], timestamp
             )
+        finally:
+            self._release(tickers)
 
-            # Get QQQ data
-            qqq_ticker = self.ibkr.ticker("QQQ")
-            qqq_price = qqq_ticker.marketPrice()
-            qqq_close = qqq_ticker.close
-            qqq_change_pct = (
-                (qqq_price - qqq_close) / qqq_close
-                if qqq_close and qqq_close > 0
-                else 0.0
-            )
+        # Build decision context
+        context = DecisionContext(
+            decision_id=decision_id,
+            timestamp=datetime.now(),
+            market=market,
+            underlying=underlying,
+            strategy_params=strategy_params,
+            source=rank_info.get("source", "unknown"),
+            rank_position=rank_info.get("position", 0),
+            rank_score=rank_info.get("score", 0.0),
+            rank_factors=rank_info.get("factors", {}),
+            ai_confidence_score=None,  # Can be added later
+            ai_reasoning=None,
+        )
 
-            # Get VIX data
-            vix_ticker = self.ibkr.ticker("VIX")
-            vix = vix_ticker.marketPrice()
-            vix_close = vix_ticker.close
-            vix_change_pct = (
-                (vix - vix_close) / vix_close if vix_close and vix_close > 0 else 0.0
-            )
+        logger.info(
+            f"Captured full decision context: {decision_id}",
+            extra={
+                "decision_id": decision_id,
+                "symbol": opportunity.symbol,
+                "source": context.source,
+                "missing_fields": market.missing_fields + underlying.missing_fields,
+            },
+        )
+
+        return context
+
+    def _stream(self, symbols) -> dict:
+        """Subscribe every symbol, then wait until all have prices or time runs out.
+
+        Args:
+            symbols: Symbols to subscribe
+
+        Returns:
+            Dict of symbol -> live ticker (None if the subscription failed)
+        """
+        tickers = {}
+        for symbol in symbols:
+            try:
+                tickers[symbol] = self.ibkr.ticker(symbol)
+            except Exception as e:
+                logger.warning(f"Failed to subscribe {symbol}: {e}")
+                tickers[symbol] = None
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            pending = [s for s, t in tickers.items() if t is not None and _price(t) is None]
+            if not pending:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"Context capture deadline expired waiting for {pending}")
+                break
+            self.ibkr.wait(self.poll_interval)
+        return tickers
+
+    def _release(self, tickers: dict) -> None:
+        for ticker in tickers.values():
+            if ticker is None:
+                continue
+            try:
+                self.ibkr.cancel_market_data(ticker.contract)
+            except Exception as e:
+                logger.debug(f"Failed to cancel market data stream: {e}")
+
+    def _cached_market_context(self) -> MarketContext | None:
+        cached = self.cache.get(_MARKET_CONTEXT_KEY)
+        return dataclasses.replace(cached) if cached is not None else None
+
+    def _build_market_context(self, tickers: dict, timestamp: datetime) -> MarketContext:
+        """Build the market context from streamed tickers (complete ones are cached)."""
+        try:
+            values, missing = {}, []
+            for symbol, price_field, change_field in _MARKET_FIELDS:
+                ticker = tickers.get(symbol)
+                price = _price(ticker)
+                change = _change_pct(price, _number(ticker.close) if ticker else None)
+                if price is None:
+                    missing.append(price_field)
+                if change is None:
+                    missing.append(change_field)
+                values[price_field] = price or 0.0
+                values[change_field] = change or 0.0
 
             market_context = MarketContext(
                 timestamp=timestamp,
-                spy_price=spy_price or 0.0,
-                spy_change_pct=spy_change_pct,
-                qqq_price=qqq_price or 0.0,
-                qqq_change_pct=qqq_change_pct,
-                vix=vix or 0.0,
-                vix_change_pct=vix_change_pct,
+                **values,
                 # Optional fields can be added later with more data sources
                 advance_decline_ratio=None,
                 new_highs=None,
                 new_lows=None,
                 sector_leaders=[],
                 sector_laggards=[],
+                missing_fields=missing,
             )
 
             logger.info(
                 "Captured market context",
                 extra={
-                    "spy_price": spy_price,
-                    "qqq_price": qqq_price,
-                    "vix": vix,
+                    "spy_price": market_context.spy_price,
+                    "qqq_price": market_context.qqq_price,
+                    "vix": market_context.vix,
+                    "missing_fields": missing,
                 },
             )
 
+            if not missing:
+                self.cache.put(_MARKET_CONTEXT_KEY, dataclasses.replace(market_context))
             return market_context
 
         except Exception as e:
@@ -115,47 +283,42 @@ class ContextCaptureService:
                 qqq_change_pct=0.0,
                 vix=0.0,
                 vix_change_pct=0.0,
+                missing_fields=[f for _, p, c in _MARKET_FIELDS for f in (p, c)],
             )
 
-    def capture_underlying_context(self, symbol: str) -> UnderlyingContext:
-        """Capture context for specific underlying.
-
-        Fetches data for the underlying symbol including:
-        - Current price and OHLC
-        - Volume metrics
-        - Moving averages (if available)
-        - Trend indicators
-
-        Args:
-            symbol: Stock ticker symbol
-
-        Returns:
-            UnderlyingContext with underlying data
-
-        Raises:
-            TimeoutError: If data fetch exceeds timeout
-        """
-        timestamp = datetime.now()
-
+    def _build_underlying_context(
+        self, symbol: str, ticker, timestamp: datetime
+    ) -> UnderlyingContext:
+        """Build the underlying context from a streamed ticker."""
         try:
-            # Get ticker data
-            ticker = self.ibkr.ticker(symbol)
+            if ticker is None:
+                raise ValueError("no market data subscription")
 
             # Basic price data
-            current_price = ticker.marketPrice() or 0.0
-            open_price = ticker.open or current_price
-            high_price = ticker.high or current_price
-            low_price = ticker.low or current_price
-            previous_close = ticker.close or current_price
+            price = _price(ticker)
+            current_price = price or 0.0
+            open_price = _number(ticker.open) or current_price
+            high_price = _number(ticker.high) or current_price
+            low_price = _number(ticker.low) or current_price
+            previous_close = _number(ticker.close) or current_price
 
             # Volume data
-            volume = ticker.volume or 0
-            avg_volume = ticker.avgVolume or 0
+            volume = _number(ticker.volume) or 0
+            avg_volume = _number(ticker.avgVolume) or 0
             relative_volume = volume / avg_volume if avg_volume > 0 else 0.0
 
+            missing = []
+            if price is None:
+                missing.append("current_price")
+            if _number(ticker.close) is None:
+                missing.append("previous_close")
+            if not avg_volume:
+                missing.append("avg_volume_20d")
+
             # Calculate simple trend direction
-            trend_direction = "unknown"
-            if current_price > previous_close * 1.02:
+            if price is None or "previous_close" in missing:
+                trend_direction = "unknown"
+            elif current_price > previous_close * 1.02:
                 trend_direction = "uptrend"
             elif current_price < previous_close * 0.98:
                 trend_direction = "downtrend"
@@ -190,6 +353,7 @@ class ContextCaptureService:
                 historical_vol_20d=None,
                 support_levels=[],
                 resistance_levels=[],
+                missing_fields=missing,
             )
 
             logger.info(
@@ -199,6 +363,7 @@ class ContextCaptureService:
                     "price": current_price,
                     "volume": volume,
                     "trend": trend_direction,
+                    "missing_fields": missing,
                 },
             )
 
@@ -215,57 +380,9 @@ class ContextCaptureService:
                 high_price=0.0,
                 low_price=0.0,
                 previous_close=0.0,
+                missing_fields=["current_price", "previous_close", "avg_volume_20d"],
             )
 
-    def capture_full_context(
-        self,
-        opportunity: TradeOpportunity,
-        strategy_params: dict,
-        rank_info: dict,
-    ) -> DecisionContext:
-        """Capture complete decision context.
-
-        Args:
-            opportunity: Trade opportunity being considered
-            strategy_params: Strategy configuration at decision time
-            rank_info: Ranking information (position, score, factors)
-
-        Returns:
-            DecisionContext with complete context
-        """
-        # Generate unique decision ID
-        decision_id = self._generate_decision_id()
-
-        # Capture market and underlying context
-        market = self.capture_market_context()
-        underlying = self.capture_underlying_context(opportunity.symbol)
-
-        # Build decision context
-        context = DecisionContext(
-            decision_id=decision_id,
-            timestamp=datetime.now(),
-            market=market,
-            underlying=underlying,
-            strategy_params=strategy_params,
-            source=rank_info.get("source", "unknown"),
-            rank_position=rank_info.get("position", 0),
-            rank_score=rank_info.get("score", 0.0),
-            rank_factors=rank_info.get("factors", {}),
-            ai_confidence_score=None,  # Can be added later
-            ai_reasoning=None,
-        )
-
-        logger.info(
-            f"Captured full decision context: {decision_id}",
-            extra={
-                "decision_id": decision_id,
-                "symbol": opportunity.symbol,
-                "source": context.source,
-            },
-        )
-
-        return context
-
     def _generate_decision_id(self) -> str:
         """Generate unique decision ID.
 
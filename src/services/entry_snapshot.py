@@ -6,8 +6,18 @@ with emphasis on the 8 critical fields with ~80% predictive power.
 
 Phase 2.6B - Technical Indicators
 Extended to capture 18 additional technical indicator fields for pattern detection.
+
+Snapshots are captured in batches: every option and every shared quote
+(underlyings, SPY, VIX, QQQ, IWM) is streamed at once and collected in one
+polling loop with per-component deadlines, and market-wide inputs come from
+the per-minute MarketDataCache. EntrySnapshotQueue runs the capture in the
+background so the execution path only enqueues a request.
 """
 
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Optional
 
@@ -17,8 +27,59 @@ from sqlalchemy.orm import Session
 from src.data.models import TradeEntrySnapshot
 from src.analysis.technical_indicators import TechnicalIndicatorCalculator
 from src.services.market_context import MarketContextService
+from src.services.market_data_cache import CachedMarketData, MarketDataCache, contract_key
 from src.services.earnings_service import get_cached_earnings
-from src.utils.market_data import safe_field
+from src.utils.market_data import safe_field, ticker_market_data
+
+# Lookback for technical indicators (bars are prefetched with the same duration)
+TECHNICAL_LOOKBACK_DAYS = 100
+
+
+@dataclass
+class SnapshotRequest:
+    """Inputs for one entry snapshot (see capture_entry_snapshot)."""
+
+    trade_id: int
+    opportunity_id: Optional[int]
+    symbol: str
+    strike: float
+    expiration: datetime
+    option_type: str
+    entry_premium: float
+    contracts: int
+    stock_price: float
+    dte: int
+    source: str = "scan"
+    strike_selection_method: Optional[str] = None
+    original_strike: Optional[float] = None
+    live_delta_at_selection: Optional[float] = None
+    scanner_fallback: Optional[dict] = None
+
+
+@dataclass
+class _Capture:
+    """One snapshot in a batch, with its option stream."""
+
+    request: SnapshotRequest
+    snapshot: TradeEntrySnapshot
+    option_contract: object = None
+    option_ticker: object = None
+
+
+@dataclass
+class _CaptureBatch:
+    """Streams opened for a batch of snapshots."""
+
+    captures: list[_Capture]
+    market_is_open: bool
+    shared: dict = field(default_factory=dict)  # contract key -> (contract, ticker)
+    started: float = field(default_factory=time.monotonic)
+    waited: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        # Waited time guards against clocks that do not advance during waits
+        return max(time.monotonic() - self.started, self.waited)
 
 
 class EntrySnapshotService:
@@ -36,15 +97,26 @@ class EntrySnapshotService:
     9. Metadata (4 fields) - Timestamp, quality score
     """
 
-    def __init__(self, ibkr_client, timeout: int = 10):
+    def __init__(
+        self,
+        ibkr_client,
+        timeout: int = 10,
+        cache: MarketDataCache | None = None,
+    ):
         """Initialize entry snapshot service.
 
         Args:
             ibkr_client: IBKR client for market data and Greeks
             timeout: Timeout in seconds for data capture
+            cache: Market input cache. If None, uses the cache shared by
+                every service on this client.
         """
         self.ibkr = ibkr_client
         self.timeout = timeout
+        self.market = CachedMarketData(ibkr_client, cache)
+        self.greeks_timeout = float(os.getenv("SNAPSHOT_GREEKS_TIMEOUT", "5.0"))
+        self.quote_timeout = float(os.getenv("SNAPSHOT_QUOTE_TIMEOUT", "3.0"))
+        self.poll_interval = 0.25
 
     def capture_entry_snapshot(
         self,
@@ -85,35 +157,78 @@ class EntrySnapshotService:
         Returns:
             TradeEntrySnapshot with all captured data
         """
-        logger.info(
-            f"Capturing entry snapshot for {symbol} ${strike} {option_type}",
-            extra={
-                "symbol": symbol,
-                "strike": strike,
-                "expiration": expiration,
-                "dte": dte,
-            },
-        )
-
-        # Initialize snapshot with required fields
-        snapshot = TradeEntrySnapshot(
+        request = SnapshotRequest(
             trade_id=trade_id,
             opportunity_id=opportunity_id,
             symbol=symbol,
             strike=strike,
-            expiration=expiration.date() if hasattr(expiration, "date") else expiration,
+            expiration=expiration,
             option_type=option_type,
             entry_premium=entry_premium,
+            contracts=contracts,
             stock_price=stock_price,
             dte=dte,
-            contracts=contracts,
-            captured_at=datetime.now(),
             source=source,
             strike_selection_method=strike_selection_method,
             original_strike=original_strike,
             live_delta_at_selection=live_delta_at_selection,
+            scanner_fallback=scanner_fallback,
         )
+        return self.capture_entry_snapshots([request])[0]
+
+    def capture_entry_snapshots(
+        self, requests: list[SnapshotRequest]
+    ) -> list[TradeEntrySnapshot]:
+        """Capture entry snapshots for several trades at once.
+
+        All option and shared quote streams are opened together and polled
+        in one loop, so a burst of fills costs about as much as one.
+
+        Args:
+            requests: Snapshot inputs, one per trade
+
+        Returns:
+            Snapshots in the same order as requests
+        """
+        if not requests:
+            return []
+        batch = self._start_batch(requests)
+        try:
+            while not self._batch_settled(batch):
+                self.ibkr.wait(self.poll_interval)
+                batch.waited += self.poll_interval
+        finally:
+            self._collect_streams(batch)
+        return self._finish_batch(batch)
+
+    async def capture_entry_snapshots_async(
+        self, requests: list[SnapshotRequest]
+    ) -> list[TradeEntrySnapshot]:
+        """Async capture_entry_snapshots() that yields to the event loop.
 
+        Daily bars for every symbol are fetched concurrently while the
+        quote streams fill, and the polling loop awaits instead of blocking.
+
+        Args:
+            requests: Snapshot inputs, one per trade
+
+        Returns:
+            Snapshots in the same order as requests
+        """
+        if not requests:
+            return []
+        batch = self._start_batch(requests)
+        try:
+            await self._prefetch_history(requests)
+            while not self._batch_settled(batch):
+                await asyncio.sleep(self.poll_interval)
+                batch.waited += self.poll_interval
+        finally:
+            self._collect_streams(batch)
+        return self._finish_batch(batch)
+
+    def _start_batch(self, requests: list[SnapshotRequest]) -> _CaptureBatch:
+        """Create snapshots and open every option and shared quote stream."""
         # Check if market is open - many data points require market hours
         market_status = self.ibkr.is_market_open()
         market_is_open = market_status.get("is_open", False)
@@ -124,29 +239,187 @@ class EntrySnapshotService:
                 f"Greeks, IV, and margin calculations require market hours."
             )
 
-        # Qualify option contract ONCE (reused for pricing, Greeks, liquidity)
-        try:
-            qualified_option = self._qualify_option_contract(
-                symbol, strike, expiration, option_type
-            )
-        except Exception as e:
-            qualified_option = None
-            logger.info(f"Failed to qualify option contract: {e}")
+        batch = _CaptureBatch(
+            captures=[_Capture(r, self._new_snapshot(r)) for r in requests],
+            market_is_open=market_is_open,
+        )
 
-        # Capture pricing + Greeks + liquidity from a SINGLE subscription
-        if qualified_option:
+        # Qualify all option contracts in ONE request
+        pending = []
+        for capture in batch.captures:
+            r = capture.request
+            try:
+                pending.append(
+                    (capture, self._option_contract(r.symbol, r.strike, r.expiration, r.option_type))
+                )
+            except Exception as e:
+                logger.info(f"Failed to qualify option contract: {e}")
+        if pending:
             try:
-                self._capture_option_data(snapshot, qualified_option, market_is_open)
+                qualified = self.ibkr.qualify_contracts_batch(*[c for _, c in pending])
+            except Exception as e:
+                logger.info(f"Failed to qualify option contracts: {e}")
+                qualified = []
+            for (capture, _), contract in zip(pending, qualified or []):
+                if contract is not None and getattr(contract, "conId", 0):
+                    capture.option_contract = contract
+
+        # Pricing + Greeks + liquidity from a SINGLE subscription per option
+        for capture in batch.captures:
+            r = capture.request
+            if capture.option_contract is None:
+                logger.warning(
+                    f"Could not qualify option contract for {r.symbol} ${r.strike} — "
+                    f"skipping pricing, Greeks, and liquidity capture"
+                )
+                continue
+            try:
+                capture.option_ticker = self.ibkr.subscribe_market_data(
+                    capture.option_contract
+                )
             except Exception as e:
                 logger.info(f"Failed to capture option data: {e}")
-        else:
-            logger.warning(
-                f"Could not qualify option contract for {symbol} ${strike} — "
-                f"skipping pricing, Greeks, and liquidity capture"
-            )
 
+        # Shared quotes not already cached this minute
+        for contract in self._shared_contracts(requests):
+            key = contract_key(contract)
+            if key in batch.shared or self.market.has_market_data(contract):
+                continue
+            try:
+                batch.shared[key] = (contract, self.ibkr.subscribe_market_data(contract))
+            except Exception as e:
+                logger.debug(f"Failed to stream {contract.symbol}: {e}")
+
+        return batch
+
+    def _shared_contracts(self, requests: list[SnapshotRequest]) -> list:
+        """Underlying and market-wide contracts read by every snapshot."""
+        from ib_async import Stock, Index
+
+        contracts = []
+        for symbol in dict.fromkeys(r.symbol for r in requests):
+            try:
+                contracts.append(self.ibkr.get_stock_contract(symbol))
+            except Exception as e:
+                logger.debug(f"Failed to build stock contract for {symbol}: {e}")
+        contracts += [
+            Stock("SPY", "SMART", "USD"),
+            Index("VIX", "CBOE", "USD"),
+            Stock("QQQ", "SMART", "USD"),
+            Stock("IWM", "SMART", "USD"),
+        ]
+        return contracts
+
+    def _batch_settled(self, batch: _CaptureBatch) -> bool:
+        """Whether every stream has data or passed its component deadline."""
+        elapsed = batch.elapsed
+        options_done = elapsed >= self.greeks_timeout or all(
+            self._option_ready(c.option_ticker, batch.market_is_open)
+            for c in batch.captures
+            if c.option_ticker is not None
+        )
+        quotes_done = elapsed >= self.quote_timeout or all(
+            ticker_market_data(contract, ticker) is not None
+            for contract, ticker in batch.shared.values()
+        )
+        return options_done and quotes_done
+
+    @staticmethod
+    def _option_ready(ticker, market_is_open: bool) -> bool:
+        # Greeks are the slowest to arrive; outside market hours only quotes come
+        if market_is_open:
+            greeks = getattr(ticker, "modelGreeks", None)
+            return bool(greeks) and greeks.delta is not None
+        return safe_field(ticker, "bid") is not None and safe_field(ticker, "ask") is not None
+
+    def _collect_streams(self, batch: _CaptureBatch) -> None:
+        """Apply option data, cache shared quotes and cancel every stream."""
+        elapsed = batch.elapsed
+        for capture in batch.captures:
+            if capture.option_ticker is None:
+                continue
+            try:
+                self._apply_option_ticker(
+                    capture.snapshot, capture.option_ticker, batch.market_is_open, elapsed
+                )
+            except Exception as e:
+                logger.info(f"Failed to capture option data: {e}")
+            self.ibkr.cancel_market_data(capture.option_contract)
+
+        for contract, ticker in batch.shared.values():
+            # None marks the quote unavailable for the rest of the minute
+            self.market.put_market_data(contract, ticker_market_data(contract, ticker))
+            self.ibkr.cancel_market_data(contract)
+
+    async def _prefetch_history(self, requests: list[SnapshotRequest]) -> None:
+        """Fetch daily bars for every symbol concurrently into the cache."""
+        from ib_async import Stock
+
+        duration = TechnicalIndicatorCalculator.history_duration(TECHNICAL_LOOKBACK_DAYS)
+        stocks = [
+            Stock(symbol, "SMART", "USD")
+            for symbol in dict.fromkeys(r.symbol for r in requests)
+        ]
+        stocks = [s for s in stocks if not self.market.has_historical_bars(s, duration)]
+        if not stocks:
+            return
         try:
-            self._capture_volatility_data(snapshot, symbol, strike, expiration, option_type)
+            qualified = await self.ibkr.qualify_contracts_async(*stocks)
+            qualified = [c for c in qualified if getattr(c, "conId", 0)]
+            bars = await self.ibkr.get_historical_bars_batch(qualified, duration=duration)
+        except Exception as e:
+            logger.debug(f"Historical bar prefetch failed: {e}")
+            return
+        for contract, contract_bars in zip(qualified, bars):
+            self.market.put_historical_bars(contract, contract_bars, duration)
+
+    def _finish_batch(self, batch: _CaptureBatch) -> list[TradeEntrySnapshot]:
+        """Run the remaining (cached or per-trade) components for each snapshot."""
+        return [
+            self._complete_snapshot(c.snapshot, c.request, batch.market_is_open)
+            for c in batch.captures
+        ]
+
+    def _new_snapshot(self, r: SnapshotRequest) -> TradeEntrySnapshot:
+        """Initialize snapshot with required fields."""
+        logger.info(
+            f"Capturing entry snapshot for {r.symbol} ${r.strike} {r.option_type}",
+            extra={
+                "symbol": r.symbol,
+                "strike": r.strike,
+                "expiration": r.expiration,
+                "dte": r.dte,
+            },
+        )
+        return TradeEntrySnapshot(
+            trade_id=r.trade_id,
+            opportunity_id=r.opportunity_id,
+            symbol=r.symbol,
+            strike=r.strike,
+            expiration=r.expiration.date() if hasattr(r.expiration, "date") else r.expiration,
+            option_type=r.option_type,
+            entry_premium=r.entry_premium,
+            stock_price=r.stock_price,
+            dte=r.dte,
+            contracts=r.contracts,
+            captured_at=datetime.now(),
+            source=r.source,
+            strike_selection_method=r.strike_selection_method,
+            original_strike=r.original_strike,
+            live_delta_at_selection=r.live_delta_at_selection,
+        )
+
+    def _complete_snapshot(
+        self,
+        snapshot: TradeEntrySnapshot,
+        r: SnapshotRequest,
+        market_is_open: bool,
+    ) -> TradeEntrySnapshot:
+        """Capture the non-streaming components and score the snapshot."""
+        symbol = r.symbol
+
+        try:
+            self._capture_volatility_data(snapshot, symbol, r.strike, r.expiration, r.option_type)
         except Exception as e:
             logger.info(f"Failed to capture volatility data: {e}")
 
@@ -172,14 +445,15 @@ class EntrySnapshotService:
 
         try:
             self._calculate_margin_and_efficiency(
-                snapshot, symbol, strike, expiration, option_type, contracts, entry_premium
+                snapshot, symbol, r.strike, r.expiration, r.option_type,
+                r.contracts, r.entry_premium,
             )
         except Exception as e:
             logger.info(f"Failed to capture margin data: {e}")
 
         # Phase 2.6B: Capture technical indicators
         try:
-            self._capture_technical_indicators(snapshot, symbol, stock_price)
+            self._capture_technical_indicators(snapshot, symbol, r.stock_price)
         except Exception as e:
             logger.info(f"Failed to capture technical indicators: {e}")
 
@@ -211,8 +485,8 @@ class EntrySnapshotService:
                 logger.debug(f"DTE recalculation failed: {e}")
 
         # Apply scanner fallback for fields that are still None
-        if scanner_fallback:
-            self._apply_scanner_fallback(snapshot, scanner_fallback)
+        if r.scanner_fallback:
+            self._apply_scanner_fallback(snapshot, r.scanner_fallback)
 
         # Calculate derived fields
         self._calculate_derived_fields(snapshot)
@@ -241,14 +515,14 @@ class EntrySnapshotService:
 
         return snapshot
 
-    def _qualify_option_contract(
+    def _option_contract(
         self,
         symbol: str,
         strike: float,
         expiration: datetime,
         option_type: str,
     ):
-        """Qualify option contract once for reuse across capture methods.
+        """Build the (unqualified) option contract for a snapshot.
 
         Args:
             symbol: Stock symbol
@@ -257,12 +531,11 @@ class EntrySnapshotService:
             option_type: PUT or CALL
 
         Returns:
-            Qualified contract or None if qualification fails
+            Option contract
         """
         exp_str = expiration.strftime("%Y%m%d") if isinstance(expiration, datetime) else expiration
         right = "P" if option_type == "PUT" else "C"
-        contract = self.ibkr.get_option_contract(symbol, exp_str, strike, right=right)
-        return self.ibkr.qualify_contract(contract)
+        return self.ibkr.get_option_contract(symbol, exp_str, strike, right=right)
 
     def _capture_option_data(
         self,
@@ -272,8 +545,8 @@ class EntrySnapshotService:
     ) -> None:
         """Capture pricing, Greeks, and liquidity from a single subscription.
 
-        Replaces separate _capture_option_pricing, _capture_greeks, and
-        _capture_liquidity methods. Uses one reqMktData call and a polling
+        Single-contract version of the batch streaming in
+        capture_entry_snapshots(). Uses one reqMktData call and a polling
         loop that waits for modelGreeks (the slowest field to populate).
 
         Args:
@@ -281,17 +554,14 @@ class EntrySnapshotService:
             qualified_contract: Already-qualified option contract
             market_is_open: Whether regular trading session is active
         """
-        import os
-        import time as time_mod
-
         ticker = self.ibkr.subscribe_market_data(qualified_contract)
 
         # Poll until modelGreeks arrive or timeout
         greeks_timeout = float(os.getenv("SNAPSHOT_GREEKS_TIMEOUT", "5.0"))
         poll_interval = 0.5
-        start = time_mod.time()
+        start = time.time()
 
-        while (time_mod.time() - start) < greeks_timeout:
+        while (time.time() - start) < greeks_timeout:
             self.ibkr.wait(poll_interval)
 
             # Greeks are the slowest to arrive — break early when they're ready
@@ -303,8 +573,26 @@ class EntrySnapshotService:
             ):
                 break
 
-        elapsed = time_mod.time() - start
+        self._apply_option_ticker(snapshot, ticker, market_is_open, time.time() - start)
+
+        # Cancel subscription
+        self.ibkr.cancel_market_data(qualified_contract)
 
+    def _apply_option_ticker(
+        self,
+        snapshot: TradeEntrySnapshot,
+        ticker,
+        market_is_open: bool,
+        elapsed: float,
+    ) -> None:
+        """Copy pricing, Greeks, and liquidity from an option ticker.
+
+        Args:
+            snapshot: Snapshot object to populate
+            ticker: Option ticker (streaming subscription)
+            market_is_open: Whether regular trading session is active
+            elapsed: Seconds waited for the ticker (for logging)
+        """
         # ── Pricing ──
         bid = safe_field(ticker, "bid")
         ask = safe_field(ticker, "ask")
@@ -348,9 +636,6 @@ class EntrySnapshotService:
         if snapshot.option_volume and snapshot.open_interest and snapshot.open_interest > 0:
             snapshot.volume_oi_ratio = snapshot.option_volume / snapshot.open_interest
 
-        # Cancel subscription
-        self.ibkr.cancel_market_data(qualified_contract)
-
     def _capture_volatility_data(
         self,
         snapshot: TradeEntrySnapshot,
@@ -387,7 +672,7 @@ class EntrySnapshotService:
         """
         # Get stock contract
         stock_contract = self.ibkr.get_stock_contract(symbol)
-        data = self.ibkr.get_market_data(stock_contract)
+        data = self.market.get_market_data(stock_contract)
         if not data:
             return
 
@@ -450,7 +735,7 @@ class EntrySnapshotService:
         # Get SPY data
         try:
             spy_contract = Stock("SPY", "SMART", "USD")
-            data = self.ibkr.get_market_data(spy_contract)
+            data = self.market.get_market_data(spy_contract)
             if data:
                 snapshot.spy_price = data["last"]
                 spy_close = data.get("close")
@@ -462,7 +747,7 @@ class EntrySnapshotService:
         # Get VIX data (CRITICAL FIELD #4)
         try:
             vix_contract = Index("VIX", "CBOE", "USD")
-            data = self.ibkr.get_market_data(vix_contract)
+            data = self.market.get_market_data(vix_contract)
             if data:
                 snapshot.vix = data["last"]
                 vix_close = data.get("close")
@@ -592,8 +877,10 @@ class EntrySnapshotService:
             symbol: Stock symbol
             stock_price: Current stock price
         """
-        calculator = TechnicalIndicatorCalculator(self.ibkr)
-        indicators = calculator.calculate_all(symbol, stock_price, lookback_days=100)
+        calculator = TechnicalIndicatorCalculator(self.market)
+        indicators = calculator.calculate_all(
+            symbol, stock_price, lookback_days=TECHNICAL_LOOKBACK_DAYS
+        )
 
         # Copy indicator values to snapshot
         snapshot.rsi_14 = indicators.rsi_14
@@ -633,7 +920,7 @@ class EntrySnapshotService:
             snapshot: Snapshot object to populate
             symbol: Stock symbol
         """
-        market_service = MarketContextService(self.ibkr)
+        market_service = MarketContextService(self.market)
         context = market_service.capture_context(symbol, snapshot.vix, snapshot.spy_change_pct)
 
         # Copy market context to snapshot
@@ -746,3 +1033,81 @@ class EntrySnapshotService:
             session.rollback()
             logger.error(f"Failed to save entry snapshot: {e}", exc_info=True)
             raise
+
+
+class EntrySnapshotQueue:
+    """Capture entry snapshots in the background, batching bursts of fills.
+
+    submit() only records the request; a worker task on the running event
+    loop captures everything queued so far with
+    capture_entry_snapshots_async() and saves each snapshot in its own
+    session. Callers await join() before shutting down.
+
+    Example:
+        >>> queue = EntrySnapshotQueue(EntrySnapshotService(client))
+        >>> queue.submit(request)   # returns immediately
+        >>> await queue.join()      # at end of session
+    """
+
+    def __init__(self, service: EntrySnapshotService):
+        """Initialize queue.
+
+        Args:
+            service: Service used to capture and save snapshots
+        """
+        self.service = service
+        self._pending: list[SnapshotRequest] = []
+        self._worker: asyncio.Task | None = None
+        self.captured = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Requests not yet picked up by the worker."""
+        return len(self._pending)
+
+    def submit(self, request: SnapshotRequest) -> None:
+        """Queue a snapshot and make sure a worker is running.
+
+        Must be called from the event loop thread.
+        """
+        self._pending.append(request)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+
+    async def join(self) -> None:
+        """Wait until every queued snapshot has been captured and saved."""
+        while self._worker is not None and not self._worker.done():
+            await self._worker
+
+    async def _drain(self) -> None:
+        while self._pending:
+            # Let the rest of a burst queue up before capturing
+            await asyncio.sleep(0)
+            batch, self._pending = self._pending, []
+            started = time.monotonic()
+            try:
+                snapshots = await self.service.capture_entry_snapshots_async(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.warning(f"⚠ Entry snapshot batch of {len(batch)} failed: {e}")
+                continue
+            self._save(snapshots)
+            logger.info(
+                f"📸 {len(snapshots)} entry snapshot(s) captured in "
+                f"{time.monotonic() - started:.1f}s"
+            )
+
+    def _save(self, snapshots: list[TradeEntrySnapshot]) -> None:
+        from src.data.database import get_db_session
+
+        with get_db_session() as session:
+            for snapshot in snapshots:
+                try:
+                    self.service.save_snapshot(snapshot, session)
+                    self.captured += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(
+                        f"⚠ Entry snapshot save failed for {snapshot.symbol}: {e}"
+                    )
@@ -0,0 +1,220 @@
+"""Order lifecycle latency telemetry for rapid-fire execution.
+
+Records per-order timestamps for each stage of the execution path so slow
+fills can be attributed to our code, TWS acknowledgement, or the market:
+
+    decision → contract_ready → submitted → acked → first_partial → filled
+                                        └── modify (cancel-and-replace) ×N
+
+Offsets are measured on the monotonic clock relative to the decision and
+persisted as one compact ``order_latency`` row per order. The dashboard
+aggregates them into per-segment p50/p95/p99 histograms.
+
+Telemetry never blocks execution: persistence failures are logged and dropped.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from loguru import logger
+
+from src.utils.latency import elapsed_ms, summarize_latencies
+from src.utils.timezone import utc_now
+
+# Stage names in lifecycle order (decision is the implicit zero point)
+LATENCY_STAGES = ("contract_ready", "submitted", "acked", "first_partial", "filled")
+
+# TWS statuses that count as acknowledgement of a new order
+ACK_STATUSES = ("PreSubmitted", "Submitted")
+
+# Segments reported on the dashboard: (name, from_stage, to_stage)
+LATENCY_SEGMENTS = (
+    ("decision_to_contract", "decision", "contract_ready"),
+    ("contract_to_submit", "contract_ready", "submitted"),
+    ("submit_to_ack", "submitted", "acked"),
+    ("submit_to_first_partial", "submitted", "first_partial"),
+    ("submit_to_fill", "submitted", "filled"),
+    ("decision_to_fill", "decision", "filled"),
+)
+
+
+@dataclass
+class OrderLatency:
+    """Lifecycle timings for one order.
+
+    Attributes:
+        symbol: Stock symbol
+        strike: Strike price
+        opportunity_id: Staged opportunity ID (None for ad-hoc orders)
+        order_id: Latest IBKR order ID (changes on cancel-and-replace)
+        decision_at: UTC wall-clock time of the execution decision
+        stage_ms: First time each stage was reached, ms after decision
+        modify_ms: Duration of each cancel-and-replace round-trip
+        final_status: Last known TWS status
+    """
+
+    symbol: str
+    strike: float
+    opportunity_id: int | None = None
+    order_id: int | None = None
+    decision_at: datetime = field(default_factory=utc_now)
+    stage_ms: dict[str, float] = field(default_factory=dict)
+    modify_ms: list[float] = field(default_factory=list)
+    final_status: str | None = None
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+
+    def mark(self, stage: str) -> None:
+        """Record the first time a stage is reached (later calls are ignored)."""
+        if stage not in self.stage_ms:
+            self.stage_ms[stage] = elapsed_ms(self._t0)
+
+    def on_status(self, status: str, filled_qty: float = 0) -> None:
+        """Update stages from a TWS order status callback."""
+        self.final_status = status
+        if status in ACK_STATUSES or status == "Filled":
+            self.mark("acked")
+        if filled_qty and filled_qty > 0:
+            self.mark("first_partial")
+        if status == "Filled":
+            self.mark("filled")
+
+    def record_modify(self, started: float) -> None:
+        """Record a cancel-and-replace that started at ``started`` (perf_counter)."""
+        self.modify_ms.append(round(elapsed_ms(started), 1))
+
+
+class LatencyRecorder:
+    """Collects OrderLatency records for one execution session and persists them.
+
+    Example:
+        >>> recorder = LatencyRecorder()
+        >>> lat = recorder.start(staged)
+        >>> lat.mark("contract_ready")
+        >>> recorder.flush()
+    """
+
+    def __init__(self) -> None:
+        self.batch_id = str(uuid4())
+        self._records: list[OrderLatency] = []
+
+    def start(self, staged) -> OrderLatency:
+        """Start timing an order at the execution decision.
+
+        Args:
+            staged: StagedOpportunity (or any object with symbol/strike/id)
+        """
+        latency = OrderLatency(
+            symbol=staged.symbol,
+            strike=staged.strike,
+            opportunity_id=getattr(staged, "id", None),
+        )
+        self._records.append(latency)
+        return latency
+
+    @property
+    def records(self) -> list[OrderLatency]:
+        """Records not yet flushed."""
+        return list(self._records)
+
+    def flush(self) -> int:
+        """Persist collected records to ``order_latency`` and clear them.
+
+        Only orders that reached submission are stored; skipped trades carry
+        no lifecycle information. Each flush is written as one batch.
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        rows = [r for r in self._records if "submitted" in r.stage_ms]
+        self._records.clear()
+        if not rows:
+            return 0
+        batch_id, self.batch_id = self.batch_id, str(uuid4())
+
+        try:
+            from src.data.database import get_db_session
+            from src.data.models import OrderLatencyRecord
+
+            with get_db_session() as session:
+                for r in rows:
+                    session.add(
+                        OrderLatencyRecord(
+                            batch_id=batch_id,
+                            opportunity_id=r.opportunity_id,
+                            symbol=r.symbol,
+                            strike=r.strike,
+                            order_id=r.order_id,
+                            final_status=r.final_status,
+                            decision_at=r.decision_at,
+                            contract_ready_ms=_rounded(r.stage_ms.get("contract_ready")),
+                            submitted_ms=_rounded(r.stage_ms.get("submitted")),
+                            acked_ms=_rounded(r.stage_ms.get("acked")),
+                            first_partial_ms=_rounded(r.stage_ms.get("first_partial")),
+                            filled_ms=_rounded(r.stage_ms.get("filled")),
+                            modify_count=len(r.modify_ms),
+                            modify_ms=r.modify_ms or None,
+                        )
+                    )
+            logger.debug(f"Persisted {len(rows)} order latency records (batch {batch_id[:8]})")
+            return len(rows)
+        except Exception as e:
+            logger.warning(f"Could not persist order latency records: {e}")
+            return 0
+
+
+def _rounded(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+def summarize_order_latency(rows: list) -> dict:
+    """Aggregate order_latency rows into per-segment percentiles.
+
+    Args:
+        rows: OrderLatencyRecord rows (or objects with the same attributes)
+
+    Returns:
+        Dict with ``orders``, ``segments`` ({name: count/p50/p95/p99/max/histogram})
+        and ``modify`` (cancel-and-replace round-trip summary)
+    """
+    segments = {}
+    for name, start, end in LATENCY_SEGMENTS:
+        samples = []
+        for row in rows:
+            t_start = 0.0 if start == "decision" else getattr(row, f"{start}_ms")
+            t_end = getattr(row, f"{end}_ms")
+            if t_start is not None and t_end is not None:
+                samples.append(max(0.0, t_end - t_start))
+        segments[name] = summarize_latencies(samples, include_histogram=True)
+
+    modify_samples = [ms for row in rows for ms in (row.modify_ms or [])]
+    return {
+        "orders": len(rows),
+        "segments": segments,
+        "modify": summarize_latencies(modify_samples, include_histogram=True),
+    }
+
+
+def load_latency_summary(session, days: int = 30) -> dict:
+    """Load recent order_latency rows and summarise them for the dashboard.
+
+    Args:
+        session: SQLAlchemy session
+        days: Look-back window in days
+
+    Returns:
+        summarize_order_latency() output plus ``days`` and ``batches``
+    """
+    from src.data.models import OrderLatencyRecord
+
+    cutoff = utc_now() - timedelta(days=days)
+    rows = (
+        session.query(OrderLatencyRecord)
+        .filter(OrderLatencyRecord.decision_at >= cutoff)
+        .all()
+    )
+    summary = summarize_order_latency(rows)
+    summary["days"] = days
+    summary["batches"] = len({r.batch_id for r in rows})
+    return summary
@@ -0,0 +1,253 @@
+"""Pre-warmed market-open execution path.
+
+Moves every piece of Tier 1 preparation that does not depend on the opening
+print out of the 9:30 critical window. During the last minutes before the
+open the prewarmer:
+
+- Qualifies and caches every staged contract
+- Opens streaming quote subscriptions (tickers update in place)
+- Precomputes what-if margin for each trade
+- Pre-builds the Adaptive/LIMIT ``Order`` objects
+- Caches the account summary and market data health for pre-flight checks
+
+At the open RapidFireExecutor only reads the live ticker, sets the final
+limit on the pre-built order and submits. Trades whose strike changed after
+pre-warm (e.g. adaptive strike selection) simply miss the cache and take the
+normal qualify-and-quote path.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+from src.broker.protocols import BrokerClient
+from src.services.premarket_validator import StagedOpportunity
+from src.tools.ibkr_client import Quote
+
+
+def contract_key(symbol: str, strike: float, expiration: Any) -> tuple[str, float, str]:
+    """Cache key for an option contract: (symbol, strike, YYYYMMDD)."""
+    if isinstance(expiration, str):
+        exp_str = expiration.replace("-", "")
+    else:
+        exp_str = expiration.strftime("%Y%m%d")
+    return (symbol, round(float(strike), 4), exp_str)
+
+
+def staged_key(staged: StagedOpportunity) -> tuple[str, float, str]:
+    """Cache key for a staged opportunity's current strike."""
+    return contract_key(staged.symbol, staged.strike, staged.expiration)
+
+
+@dataclass
+class PrewarmedTrade:
+    """Everything Tier 1 needs for one trade, prepared before the open.
+
+    Attributes:
+        staged: Staged opportunity at pre-warm time
+        contract: Qualified option contract
+        ticker: Streaming ticker (None if subscription failed)
+        order: Pre-built order; only lmtPrice is set at the open
+        whatif_margin: IBKR what-if initial margin (None if unavailable)
+    """
+
+    staged: StagedOpportunity
+    contract: Any
+    ticker: Any | None = None
+    order: Any | None = None
+    whatif_margin: float | None = None
+
+    def snapshot_quote(self) -> Quote:
+        """Read the current bid/ask from the streaming ticker (no round-trip).
+
+        Returns:
+            Quote; ``is_valid`` is False when the ticker has no usable bid/ask
+        """
+        ticker = self.ticker
+        if ticker is None:
+            return Quote(bid=0, ask=0, is_valid=False, reason="No subscription")
+
+        bid = _positive(getattr(ticker, "bid", None))
+        ask = _positive(getattr(ticker, "ask", None))
+        if bid and ask:
+            return Quote(
+                bid=bid,
+                ask=ask,
+                last=_positive(getattr(ticker, "last", None)),
+                volume=getattr(ticker, "volume", None),
+                timestamp=datetime.now(),
+                is_valid=True,
+            )
+        return Quote(bid=0, ask=0, is_valid=False, reason="No streaming bid/ask yet")
+
+
+@dataclass
+class PrewarmCache:
+    """Result of a pre-warm pass, consumed by the scheduler and executor.
+
+    Attributes:
+        trades: Prewarmed trades keyed by contract_key()
+        account_summary: Account summary captured during pre-warm
+        market_data_health: (is_healthy, error) from check_market_data_health
+        started_at: When pre-warm started
+        duration_seconds: Wall time spent pre-warming
+        failed: Symbols that could not be pre-warmed, with reasons
+        released: True once the quote subscriptions have been cancelled
+    """
+
+    trades: dict[tuple[str, float, str], PrewarmedTrade] = field(default_factory=dict)
+    account_summary: dict | None = None
+    market_data_health: tuple[bool, str | None] | None = None
+    started_at: datetime = field(default_factory=datetime.now)
+    duration_seconds: float = 0.0
+    failed: dict[str, str] = field(default_factory=dict)
+    released: bool = False
+
+    def get(self, staged: StagedOpportunity) -> PrewarmedTrade | None:
+        """Look up a prewarmed trade for the staged opportunity's current strike."""
+        if self.released:
+            return None
+        return self.trades.get(staged_key(staged))
+
+    def whatif_margin(self, staged: StagedOpportunity) -> float | None:
+        """Pre-computed what-if margin for the staged opportunity's current strike."""
+        entry = self.get(staged)
+        return entry.whatif_margin if entry else None
+
+    def release(self, client: BrokerClient) -> None:
+        """Cancel all streaming subscriptions opened during pre-warm (idempotent)."""
+        if self.released:
+            return
+        for entry in self.trades.values():
+            if entry.ticker is not None:
+                client.cancel_market_data(entry.contract)
+        self.released = True
+        logger.debug(f"Released {len(self.trades)} pre-warm quote subscriptions")
+
+
+class ExecutionPrewarmer:
+    """Prepare Tier 1 trades before the open.
+
+    Example:
+        >>> prewarmer = ExecutionPrewarmer(client, adaptive_executor)
+        >>> cache = await prewarmer.prewarm(staged_trades)
+        >>> report = await rapid_fire.execute_all(staged_trades, prewarm=cache)
+        >>> cache.release(client)
+    """
+
+    def __init__(self, ibkr_client: BrokerClient, adaptive_executor):
+        """Initialize prewarmer.
+
+        Args:
+            ibkr_client: Connected broker client
+            adaptive_executor: AdaptiveOrderExecutor used to pre-build orders
+        """
+        self.client = ibkr_client
+        self.adaptive_executor = adaptive_executor
+
+    async def prewarm(self, staged_trades: list[StagedOpportunity]) -> PrewarmCache:
+        """Qualify, subscribe, price margin and pre-build orders for all trades.
+
+        Individual failures never abort the pass: a trade that cannot be
+        pre-warmed is recorded in ``failed`` and executes via the normal path.
+
+        Args:
+            staged_trades: Trades expected to execute at the open
+
+        Returns:
+            PrewarmCache
+        """
+        cache = PrewarmCache()
+        start = time.perf_counter()
+
+        contracts = []
+        for staged in staged_trades:
+            _, _, exp_str = staged_key(staged)
+            contracts.append(
+                self.client.get_option_contract(
+                    symbol=staged.symbol,
+                    expiration=exp_str,
+                    strike=staged.strike,
+                    right="P",
+                )
+            )
+
+        try:
+            qualified = await self.client.qualify_contracts_async(*contracts)
+        except Exception as e:
+            logger.warning(f"Pre-warm qualification failed: {e}")
+            qualified = []
+
+        by_key = {
+            contract_key(c.symbol, c.strike, c.lastTradeDateOrContractMonth): c
+            for c in qualified
+        }
+
+        for staged in staged_trades:
+            contract = by_key.get(staged_key(staged))
+            if contract is None:
+                cache.failed[staged.symbol] = "Contract not qualified"
+                continue
+
+            entry = PrewarmedTrade(staged=staged, contract=contract)
+
+            try:
+                entry.ticker = self.client.subscribe_market_data(contract)
+            except Exception as e:
+                logger.debug(f"{staged.symbol}: quote subscription failed: {e}")
+
+            try:
+                entry.whatif_margin = self.client.get_actual_margin(
+                    contract, quantity=staged.staged_contracts
+                )
+            except Exception as e:
+                logger.debug(f"{staged.symbol}: what-if margin failed: {e}")
+
+            entry.order = self._build_order(staged)
+            cache.trades[staged_key(staged)] = entry
+
+        try:
+            cache.account_summary = self.client.get_account_summary()
+        except Exception as e:
+            logger.debug(f"Pre-warm account summary failed: {e}")
+
+        try:
+            cache.market_data_health = self.client.check_market_data_health()
+        except Exception as e:
+            logger.debug(f"Pre-warm market data health check failed: {e}")
+
+        cache.duration_seconds = time.perf_counter() - start
+        logger.info(
+            f"🔥 Pre-warm complete: {len(cache.trades)}/{len(staged_trades)} trades ready "
+            f"in {cache.duration_seconds:.1f}s"
+            + (f" ({len(cache.failed)} fall back to live path)" if cache.failed else "")
+        )
+        return cache
+
+    def _build_order(self, staged: StagedOpportunity):
+        """Pre-build the order at the staged limit; the open only re-prices it."""
+        if self.adaptive_executor.use_adaptive:
+            return self.adaptive_executor.create_adaptive_order(
+                contracts=staged.staged_contracts,
+                floor_price=staged.staged_limit_price,
+            )
+        return self.adaptive_executor.create_limit_order(
+            contracts=staged.staged_contracts,
+            limit_price=staged.staged_limit_price,
+        )
+
+
+def _positive(value) -> float | None:
+    """Return value if it is a finite positive number, else None."""
+    if value is None:
+        return None
+    try:
+        if math.isnan(value) or value <= 0:
+            return None
+    except TypeError:
+        return None
+    return float(value)
@@ -172,6 +172,8 @@ class ExecutionReport:
         total_premium: Total premium from fills
         total_margin: Total margin used
         warnings: Any warnings generated
+        open_to_last_submission_seconds: Open bell to last Tier 1 submission
+        prewarmed_count: Trades prepared by the pre-warm phase
     """
 
     execution_date: datetime
@@ -191,6 +193,8 @@ class ExecutionReport:
     total_premium: float = 0.0
     total_margin: float = 0.0
     warnings: list[str] = field(default_factory=list)
+    open_to_last_submission_seconds: float | None = None
+    prewarmed_count: int = 0
 
     @property
     def duration_seconds(self) -> float:
@@ -5,6 +5,9 @@ Captures comprehensive exit data when trades close, including outcome analysis,
 path statistics, and derived learning features.
 """
 
+import math
+import os
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -13,7 +16,9 @@ from loguru import logger
 from sqlalchemy.orm import Session
 
 from src.data.models import Trade, TradeEntrySnapshot, TradeExitSnapshot, PositionSnapshot
+from src.services.market_data_cache import CachedMarketData
 from src.utils.calc import calc_pnl, calc_pnl_pct
+from src.utils.market_data import ticker_market_data
 from src.utils.timezone import utc_now
 
 
@@ -37,15 +42,29 @@ class ExitSnapshotService:
     monitoring to exit, computing derived features for learning engine.
     """
 
-    def __init__(self, ibkr_client, db_session: Session):
+    def __init__(
+        self,
+        ibkr_client,
+        db_session: Session,
+        context_timeout: float | None = None,
+    ):
         """Initialize exit snapshot service.
 
         Args:
             ibkr_client: IBKR client for market data
             db_session: Database session
+            context_timeout: Deadline in seconds for exit IV, stock price and
+                VIX together. Defaults to EXIT_SNAPSHOT_CONTEXT_TIMEOUT or 3.
         """
         self.ibkr = ibkr_client
         self.db = db_session
+        self.market = CachedMarketData(ibkr_client)
+        self.context_timeout = (
+            context_timeout
+            if context_timeout is not None
+            else float(os.getenv("EXIT_SNAPSHOT_CONTEXT_TIMEOUT", "3"))
+        )
+        self.poll_interval = 0.25
 
     def capture_exit_snapshot(
         self,
@@ -157,44 +176,97 @@ class ExitSnapshotService:
     ) -> None:
         """Capture market context at exit (IV, stock price, VIX).
 
+        The option, stock and VIX quotes are streamed together and awaited
+        against one deadline; stock and VIX quotes captured by another
+        service this minute are reused. Fields still missing when the
+        deadline expires are listed in snapshot.missing_context_fields.
+
         Args:
             snapshot: Exit snapshot to populate
             trade: Trade object
         """
-        # Get option contract
-        contract = self.ibkr.get_option_contract(
-            trade.symbol,
-            trade.expiration.strftime("%Y-%m-%d"),
-            trade.strike,
-            right="P" if trade.option_type == "PUT" else "C",
-        )
-
-        # Qualify and get data
-        qualified = self.ibkr.qualify_contracts_batch(contract)
-        if qualified and qualified[0] is not None:
-            ticker = self.ibkr.subscribe_market_data(qualified[0])
-            self.ibkr.wait(2)
-
-            # Capture exit IV
-            if ticker.modelGreeks and ticker.modelGreeks.impliedVol:
-                snapshot.exit_iv = ticker.modelGreeks.impliedVol
+        streams = {}  # field -> (contract, ticker)
+        missing = []
+
+        contracts = {
+            "exit_iv": self._exit_option_contract(trade),
+            "stock_price_at_exit": Stock(trade.symbol, "SMART", "USD"),
+            "vix_at_exit": Index("VIX", "CBOE", "USD"),
+        }
+        for field, contract in contracts.items():
+            if contract is None:
+                missing.append(field)
+                continue
+            if field != "exit_iv" and self.market.has_market_data(contract):
+                data = self.market.get_market_data(contract)
+                if data:
+                    setattr(snapshot, field, data["last"])
+                else:
+                    missing.append(field)
+                continue
+            try:
+                streams[field] = (contract, self.ibkr.subscribe_market_data(contract))
+            except Exception as e:
+                logger.debug(f"Failed to subscribe {contract.symbol} at exit: {e}")
+                missing.append(field)
 
-            self.ibkr.cancel_market_data(qualified[0])
-
-        # Get stock price at exit
-        stock = Stock(trade.symbol, "SMART", "USD")
-        stock_data = self.ibkr.get_market_data(stock)
-        if stock_data:
-            snapshot.stock_price_at_exit = stock_data["last"]
+        try:
+            deadline = time.monotonic() + self.context_timeout
+            values = self._read_exit_streams(streams)
+            while len(values) < len(streams) and time.monotonic() < deadline:
+                self.ibkr.wait(self.poll_interval)
+                values = self._read_exit_streams(streams)
+        finally:
+            for contract, _ticker in streams.values():
+                self.ibkr.cancel_market_data(contract)
+
+        for field, (contract, ticker) in streams.items():
+            if field not in values:
+                missing.append(field)
+                continue
+            setattr(snapshot, field, values[field])
+            if field != "exit_iv":
+                self.market.put_market_data(contract, ticker_market_data(contract, ticker))
+
+        snapshot.missing_context_fields = missing or None
+        if missing:
+            logger.warning(
+                f"Exit context for {trade.symbol} trade {trade.id} incomplete "
+                f"after {self.context_timeout:.0f}s: missing {missing}"
+            )
 
-        # Get VIX at exit
+    def _exit_option_contract(self, trade: Trade):
+        """Qualified option contract for the trade, or None."""
         try:
-            vix_contract = Index("VIX", "CBOE", "USD")
-            vix_data = self.ibkr.get_market_data(vix_contract)
-            if vix_data:
-                snapshot.vix_at_exit = vix_data["last"]
+            contract = self.ibkr.get_option_contract(
+                trade.symbol,
+                trade.expiration.strftime("%Y-%m-%d"),
+                trade.strike,
+                right="P" if trade.option_type == "PUT" else "C",
+            )
+            qualified = self.ibkr.qualify_contracts_batch(contract)
         except Exception as e:
-            logger.debug(f"Failed to capture VIX at exit: {e}")
+            logger.debug(f"Failed to qualify exit option for {trade.symbol}: {e}")
+            return None
+        if qualified and qualified[0] is not None:
+            return qualified[0]
+        return None
+
+    @staticmethod
+    def _read_exit_streams(streams: dict) -> dict:
+        """Values available so far from the exit streams, by snapshot field."""
+        values = {}
+        for field, (contract, ticker) in streams.items():
+            if field == "exit_iv":
+                greeks = ticker.modelGreeks
+                iv = greeks.impliedVol if greeks else None
+                if isinstance(iv, (int, float)) and not math.isnan(iv) and iv > 0:
+                    values[field] = iv
+            else:
+                data = ticker_market_data(contract, ticker)
+                if data and data["last"]:
+                    values[field] = data["last"]
+        return values
 
     def _calculate_context_changes(
         self, snapshot: TradeExitSnapshot, trade: Trade
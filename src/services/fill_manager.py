@@ -376,6 +376,7 @@ class FillManager:
         Returns:
             True if replacement order placed successfully
         """
+        modify_start = time.perf_counter()
         try:
             old_order_id = pending.order_id
 
@@ -446,6 +447,10 @@ class FillManager:
                 pending_orders.pop(old_order_id, None)
                 pending_orders[new_id] = pending
 
+                if pending.latency:
+                    pending.latency.record_modify(modify_start)
+                    pending.latency.order_id = new_id
+
                 logger.info(
                     f"{pending.staged.symbol}: Replacement order #{new_id} "
                     f"for {remaining_qty} contracts @ ${new_limit:.2f}"
@@ -492,6 +497,7 @@ class FillManager:
             )
             return False
 
+        modify_start = time.perf_counter()
         try:
             old_id = pending.order_id
 
@@ -534,6 +540,10 @@ class FillManager:
                 pending_orders.pop(old_id, None)
                 pending_orders[new_id] = pending
 
+                if pending.latency:
+                    pending.latency.record_modify(modify_start)
+                    pending.latency.order_id = new_id
+
                 logger.info(
                     f"{pending.staged.symbol}: Adjustment #{adjustment_number} "
                     f"${current_limit:.2f} → ${new_limit:.2f}"
@@ -15,19 +15,35 @@ Usage:
 
     if conditions.conditions_favorable:
         await execute_orders()
+
+Readers that only need the volatility complex and SPY (daemon enrichment,
+execution gate, event detector) share one streaming snapshot instead:
+
+    service = get_market_conditions_service(ibkr_client)
+    conditions = await service.current(max_age_seconds=60)
 """
 
 import asyncio
 import os
 import statistics
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from weakref import WeakKeyDictionary
 from zoneinfo import ZoneInfo
 
-from src.broker.types import Contract
+from src.broker.types import Contract, Index, Stock
 from loguru import logger
 
 from src.broker.protocols import BrokerClient
+from src.utils.market_data import last_tick
+
+ET = ZoneInfo("America/New_York")
+
+# Conservative fallbacks when a volatility quote is unavailable
+VIX_DEFAULT = 20.0
+VVIX_DEFAULT = 90.0  # normal VIX stability
+VIX3M_DEFAULT = 22.0  # slightly above VIX default = contango
 
 
 @dataclass
@@ -46,6 +62,8 @@ class MarketConditions:
         conditions_favorable: True if conditions good for execution
         reason: Human-readable explanation of favorable/unfavorable assessment
         warnings: Non-fatal warning messages (e.g. VVIX elevated but not extreme)
+        source: "poll" for a one-off fetch, "stream" for the shared snapshot
+            (whose timestamp is the oldest tick it was built from)
     """
     timestamp: datetime
     vix: float
@@ -58,6 +76,11 @@ class MarketConditions:
     term_structure: str = ""
     term_structure_ratio: float = 0.0
     warnings: list[str] = field(default_factory=list)
+    source: str = "poll"
+
+    def age_seconds(self) -> float:
+        """Seconds since the data was observed."""
+        return (datetime.now(ET) - self.timestamp).total_seconds()
 
     def __str__(self) -> str:
         """Format conditions for logging."""
@@ -144,19 +167,11 @@ class MarketConditionMonitor:
         Returns:
             MarketConditions with favorable flag and detailed reason
         """
-        now = datetime.now(ZoneInfo("America/New_York"))
+        now = datetime.now(ET)
 
         # Fetch volatility complex (VIX + VVIX + VIX3M) in parallel
         vix, vvix, vix3m = await self._get_volatility_complex()
 
-        # Calculate term structure
-        if vix3m > 0:
-            term_structure_ratio = round(vix / vix3m, 3)
-            term_structure = "backwardation" if term_structure_ratio > 1.0 else "contango"
-        else:
-            term_structure_ratio = 0.0
-            term_structure = "unknown"
-
         # Get SPY price (market direction indicator)
         spy_price = await self._get_spy_price()
 
@@ -165,13 +180,51 @@ class MarketConditionMonitor:
         if sample_contracts:
             avg_spread = await self._calculate_average_spread(sample_contracts)
 
+        conditions = self.assess(now, vix, vvix, vix3m, spy_price, avg_spread)
+
+        logger.debug(str(conditions))
+
+        return conditions
+
+    def assess(
+        self,
+        timestamp: datetime,
+        vix: float,
+        vvix: float,
+        vix3m: float,
+        spy_price: float,
+        avg_spread: float = 0.0,
+        source: str = "poll",
+    ) -> MarketConditions:
+        """Build MarketConditions (term structure and verdict) from raw inputs.
+
+        Args:
+            timestamp: When the inputs were observed (ET)
+            vix: VIX level
+            vvix: VVIX level
+            vix3m: VIX3M level
+            spy_price: SPY price (0.0 if unavailable)
+            avg_spread: Average spread across sample contracts
+            source: "poll" or "stream"
+
+        Returns:
+            MarketConditions with favorable flag and detailed reason
+        """
+        # Calculate term structure
+        if vix3m > 0:
+            term_structure_ratio = round(vix / vix3m, 3)
+            term_structure = "backwardation" if term_structure_ratio > 1.0 else "contango"
+        else:
+            term_structure_ratio = 0.0
+            term_structure = "unknown"
+
         # Evaluate if conditions favorable
         favorable, reason, warnings = self._evaluate_conditions(
             vix, vvix, vix3m, term_structure_ratio, avg_spread
         )
 
-        conditions = MarketConditions(
-            timestamp=now,
+        return MarketConditions(
+            timestamp=timestamp,
             vix=vix,
             vvix=vvix,
             vix3m=vix3m,
@@ -182,12 +235,9 @@ class MarketConditionMonitor:
             conditions_favorable=favorable,
             reason=reason,
             warnings=warnings,
+            source=source,
         )
 
-        logger.debug(str(conditions))
-
-        return conditions
-
     def _evaluate_conditions(
         self,
         vix: float,
@@ -282,13 +332,7 @@ class MarketConditionMonitor:
             - VVIX default: 90.0 (normal VIX stability)
             - VIX3M default: 22.0 (slightly above VIX default = contango)
         """
-        VIX_DEFAULT = 20.0
-        VVIX_DEFAULT = 90.0
-        VIX3M_DEFAULT = 22.0
-
         try:
-            from ib_async import Index
-
             contracts = [
                 Index("VIX", "CBOE"),
                 Index("VVIX", "CBOE"),
@@ -352,16 +396,10 @@ class MarketConditionMonitor:
         Returns:
             Current SPY price, or 0.0 if unavailable or not applicable
         """
-        from src.config.exchange_profile import get_active_profile
-
-        profile = get_active_profile()
-        if profile.code != "US":
-            logger.debug(f"SPY not applicable for {profile.code} market — skipping")
+        if not _spy_applicable():
             return 0.0
 
         try:
-            from ib_async import Stock
-
             spy_contract = Stock("SPY", "SMART", "USD")
             qualified = await self.client.qualify_contracts_async(spy_contract)
 
@@ -427,3 +465,182 @@ class MarketConditionMonitor:
         # No valid spreads
         logger.warning("No valid spreads found in sample")
         return 0.0
+
+
+def _spy_applicable() -> bool:
+    """SPY is a US-listed ETF and is not meaningful on other exchanges."""
+    from src.config.exchange_profile import get_active_profile
+
+    profile = get_active_profile()
+    if profile.code != "US":
+        logger.debug(f"SPY not applicable for {profile.code} market — skipping")
+        return False
+    return True
+
+
+class MarketConditionsService:
+    """Shared market-conditions snapshot built from streaming subscriptions.
+
+    Keeps VIX, VVIX, VIX3M and SPY subscribed and assesses the latest ticks
+    on demand, so the daemon, the execution gate and the event detector read
+    one snapshot instead of each making its own IBKR round-trips.
+
+    Freshness contract: the snapshot's timestamp is the time of the oldest
+    tick it depends on (VIX, and SPY when streaming). Every reader states the
+    maximum age it accepts; snapshot() returns None when the data is older
+    or not streaming yet, and current() then falls back to a one-off
+    MarketConditionMonitor.check_conditions().
+
+    Example:
+        service = get_market_conditions_service(ibkr_client)
+        conditions = service.snapshot(max_age_seconds=15)  # None if stale
+    """
+
+    VOLATILITY_SYMBOLS = ("VIX", "VVIX", "VIX3M")
+
+    def __init__(self, ibkr_client: BrokerClient, resubscribe_seconds: float = 60.0):
+        """Initialize service (subscriptions open on start() or first read).
+
+        Args:
+            ibkr_client: Connected IBKRClient instance
+            resubscribe_seconds: How long the stream may go without a fresh
+                tick before the subscriptions are re-opened
+        """
+        self.client = ibkr_client
+        self.resubscribe_seconds = resubscribe_seconds
+        self._tickers: dict[str, object] = {}
+        self._started_at: float | None = None
+        self.monitor = MarketConditionMonitor(ibkr_client)
+        self.stream_reads = 0
+        self.fallback_reads = 0
+
+    @property
+    def streaming(self) -> bool:
+        """Whether the VIX subscription is open."""
+        return "VIX" in self._tickers
+
+    def ticker(self, symbol: str):
+        """Live ticker for a streamed symbol (VIX, VVIX, VIX3M, SPY), or None."""
+        return self._tickers.get(symbol)
+
+    def start(self) -> bool:
+        """Open the streaming subscriptions (no-op if already streaming).
+
+        Returns:
+            True if at least VIX is streaming
+        """
+        if self.streaming:
+            return True
+        self._started_at = time.monotonic()
+        try:
+            contracts = [Index(s, "CBOE", "USD") for s in self.VOLATILITY_SYMBOLS]
+            if _spy_applicable():
+                contracts.append(Stock("SPY", "SMART", "USD"))
+            qualified = self.client.qualify_contracts_batch(*contracts)
+            for contract in qualified or []:
+                if contract is not None and getattr(contract, "conId", 0):
+                    self._tickers[contract.symbol] = self.client.subscribe_market_data(
+                        contract
+                    )
+        except Exception as e:
+            logger.warning(f"Market conditions stream unavailable: {e}")
+        if not self.streaming:
+            logger.warning("Market conditions stream: VIX not available")
+            self.stop()
+            return False
+        logger.info(f"Market conditions streaming: {', '.join(self._tickers)}")
+        return True
+
+    def stop(self) -> None:
+        """Cancel the streaming subscriptions."""
+        for ticker in self._tickers.values():
+            try:
+                self.client.cancel_market_data(ticker.contract)
+            except Exception as e:
+                logger.debug(f"Failed to cancel market conditions stream: {e}")
+        self._tickers = {}
+
+    def snapshot(self, max_age_seconds: float) -> MarketConditions | None:
+        """Latest streamed conditions, if no older than max_age_seconds.
+
+        Args:
+            max_age_seconds: Oldest data the caller accepts
+
+        Returns:
+            MarketConditions (source="stream"), or None if not streaming or stale
+        """
+        if not self.streaming:
+            if (
+                self._started_at is not None
+                and time.monotonic() - self._started_at < self.resubscribe_seconds
+            ):
+                return None
+            if not self.start():
+                return None
+
+        conditions = self._assess_stream()
+        age = conditions.age_seconds() if conditions else None
+        if age is None or age > max_age_seconds:
+            if (age is None or age > self.resubscribe_seconds) and (
+                time.monotonic() - self._started_at > self.resubscribe_seconds
+            ):
+                # No ticks for a while: the subscriptions may have died with
+                # a reconnect, so re-open them
+                logger.info("Market conditions stream stale — resubscribing")
+                self.stop()
+                self.start()
+            return None
+        self.stream_reads += 1
+        return conditions
+
+    async def current(self, max_age_seconds: float) -> MarketConditions:
+        """Streamed conditions if fresh enough, else a one-off fetch.
+
+        Args:
+            max_age_seconds: Oldest streamed data the caller accepts
+
+        Returns:
+            MarketConditions
+        """
+        conditions = self.snapshot(max_age_seconds)
+        if conditions is not None:
+            return conditions
+        self.fallback_reads += 1
+        return await self.monitor.check_conditions()
+
+    def _assess_stream(self) -> MarketConditions | None:
+        vix, vix_time = last_tick(self._tickers.get("VIX"))
+        if vix is None:
+            return None
+        tick_times = [vix_time]
+
+        vvix, _ = last_tick(self._tickers.get("VVIX"))
+        vix3m, _ = last_tick(self._tickers.get("VIX3M"))
+        spy, spy_time = last_tick(self._tickers.get("SPY"))
+        if spy is not None:
+            tick_times.append(spy_time)
+
+        return self.monitor.assess(
+            min(tick_times).astimezone(ET),
+            vix,
+            vvix or VVIX_DEFAULT,
+            vix3m or VIX3M_DEFAULT,
+            spy or 0.0,
+            source="stream",
+        )
+
+
+_services: "WeakKeyDictionary[object, MarketConditionsService]" = WeakKeyDictionary()
+
+
+def get_market_conditions_service(ibkr_client: BrokerClient) -> MarketConditionsService:
+    """Return the market-conditions service shared by this client connection."""
+    try:
+        service = _services.get(ibkr_client)
+        if service is None:
+            service = MarketConditionsService(ibkr_client)
+            _services[ibkr_client] = service
+        return service
+    except TypeError:
+        # Client cannot be weakly referenced: no sharing
+        return MarketConditionsService(ibkr_client)
@@ -0,0 +1,226 @@
+"""Per-minute cache for market inputs shared across snapshots.
+
+Every entry snapshot used to fetch the same market-wide inputs (SPY, VIX,
+QQQ, IWM, the sector ETF, daily bars, sector fundamentals) from IBKR, one
+blocking request at a time. A burst of fills at the open therefore repeated
+identical requests once per trade.
+
+MarketDataCache keeps those reads for the current wall-clock minute, and
+CachedMarketData wraps an IBKR client so that existing consumers
+(MarketContextService, TechnicalIndicatorCalculator, EntrySnapshotService,
+ExitSnapshotService) get cached results without code changes, and
+ContextCaptureService caches its complete market contexts here too. One
+cache is shared per client connection, so every service built on the same
+client sees the same minute.
+
+Option quotes and Greeks are never cached: they are specific to a trade
+and must reflect the fill.
+
+Example:
+    >>> market = CachedMarketData(ibkr_client)
+    >>> vix = market.get_market_data(Index("VIX", "CBOE", "USD"))  # IBKR
+    >>> vix = market.get_market_data(Index("VIX", "CBOE", "USD"))  # cached
+"""
+
+import time
+from typing import Any, Callable, Hashable
+from weakref import WeakKeyDictionary
+
+from loguru import logger
+
+_MISSING = object()
+
+
+class MarketDataCache:
+    """Values cached until the current wall-clock minute ends."""
+
+    def __init__(self, ttl_seconds: int = 60, clock: Callable[[], float] = time.time):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Bucket length; entries expire when the bucket rolls
+            clock: Time source (seconds since epoch)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _bucket(self) -> int:
+        return int(self._clock() // self.ttl_seconds)
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISSING (a cached None is a hit)."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self._bucket():
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return _MISSING
+
+    def contains(self, key: Hashable) -> bool:
+        """Whether the key is cached for this minute (no hit/miss counted)."""
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] == self._bucket()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for this minute, or default."""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a value (None records 'unavailable') until the minute ends."""
+        bucket = self._bucket()
+        if len(self._entries) > 512:
+            self._entries = {k: e for k, e in self._entries.items() if e[0] == bucket}
+        self._entries[key] = (bucket, value)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value, fetching and caching it on a miss.
+
+        Empty results (None, empty list) are returned but not cached, so the
+        next caller retries.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+        value = fetch()
+        if value:
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_caches: "WeakKeyDictionary[Any, MarketDataCache]" = WeakKeyDictionary()
+
+
+def get_market_data_cache(ibkr_client) -> MarketDataCache:
+    """Return the cache shared by everything using this client connection."""
+    try:
+        cache = _caches.get(ibkr_client)
+        if cache is None:
+            cache = MarketDataCache()
+            _caches[ibkr_client] = cache
+        return cache
+    except TypeError:
+        # Client cannot be weakly referenced: cache per caller
+        return MarketDataCache()
+
+
+def contract_key(contract) -> tuple:
+    """Cache key for an underlying, index or ETF contract."""
+    return (
+        getattr(contract, "secType", None),
+        getattr(contract, "symbol", None),
+        getattr(contract, "currency", None),
+    )
+
+
+class CachedMarketData:
+    """IBKR client wrapper answering shared market reads from a MarketDataCache.
+
+    get_market_data(), get_historical_bars() (for bars ending now) and
+    get_fundamental_data() are cached for the current minute; every other
+    attribute passes through to the wrapped client.
+    """
+
+    def __init__(self, ibkr_client, cache: MarketDataCache | None = None):
+        """Initialize wrapper.
+
+        Args:
+            ibkr_client: IBKR client to wrap
+            cache: Cache to use. If None, uses the cache shared by the client.
+        """
+        self.client = ibkr_client
+        self.cache = cache if cache is not None else get_market_data_cache(ibkr_client)
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+    def get_market_data(self, contract, snapshot: bool = True) -> dict | None:
+        """Cached IBKRClient.get_market_data()."""
+        return self.cache.get_or_fetch(
+            ("quote", contract_key(contract)),
+            lambda: self.client.get_market_data(contract, snapshot=snapshot),
+        )
+
+    def get_historical_bars(
+        self,
+        contract,
+        duration: str = "30 D",
+        bar_size: str = "1 day",
+        what_to_show: str = "TRADES",
+        use_rth: bool = True,
+        end_date_time: str = "",
+    ) -> list:
+        """Cached IBKRClient.get_historical_bars() for bars ending now."""
+
+        def fetch():
+            return self.client.get_historical_bars(
+                contract,
+                duration=duration,
+                bar_size=bar_size,
+                what_to_show=what_to_show,
+                use_rth=use_rth,
+                end_date_time=end_date_time,
+            )
+
+        if end_date_time:
+            return fetch()
+        return self.cache.get_or_fetch(
+            bars_key(contract, duration, bar_size, what_to_show, use_rth), fetch
+        )
+
+    def get_fundamental_data(
+        self, contract, report_type: str = "ReportsFinSummary"
+    ) -> str | None:
+        """Cached IBKRClient.get_fundamental_data()."""
+        return self.cache.get_or_fetch(
+            ("fundamental", contract_key(contract), report_type),
+            lambda: self.client.get_fundamental_data(contract, report_type=report_type),
+        )
+
+    def put_market_data(self, contract, data: dict | None) -> None:
+        """Record a quote fetched elsewhere (None marks it unavailable)."""
+        self.cache.put(("quote", contract_key(contract)), data)
+
+    def has_market_data(self, contract) -> bool:
+        """Whether a quote for the contract is cached this minute."""
+        return self.cache.contains(("quote", contract_key(contract)))
+
+    def put_historical_bars(
+        self,
+        contract,
+        bars: list,
+        duration: str,
+        bar_size: str = "1 day",
+        what_to_show: str = "TRADES",
+        use_rth: bool = True,
+    ) -> None:
+        """Record bars fetched elsewhere."""
+        if bars:
+            self.cache.put(
+                bars_key(contract, duration, bar_size, what_to_show, use_rth), bars
+            )
+        else:
+            logger.debug(f"No historical bars to cache for {contract.symbol}")
+
+    def has_historical_bars(
+        self,
+        contract,
+        duration: str,
+        bar_size: str = "1 day",
+        what_to_show: str = "TRADES",
+        use_rth: bool = True,
+    ) -> bool:
+        """Whether bars for the contract are cached this minute."""
+        return self.cache.contains(
+            bars_key(contract, duration, bar_size, what_to_show, use_rth)
+        )
+
+
+def bars_key(contract, duration, bar_size, what_to_show, use_rth) -> tuple:
+    return ("bars", contract_key(contract), duration, bar_size, what_to_show, use_rth)
@@ -16,6 +16,10 @@ Uses comprehensive IBKR methods:
 - ib.executions() - Execution details
 - ib.fills() - Fill details with commissions
 - ib.positions() - Current positions
+
+Order syncs are incremental when a ReconciliationWatermarkStore is supplied:
+only executions newer than the persisted watermark are processed, and a full
+history resync is available with ``sync_all_orders(full=True)``.
 """
 
 from dataclasses import dataclass, field
@@ -25,6 +29,11 @@ from loguru import logger
 
 from src.services.assignment_detector import AssignmentEvent
 from src.broker.protocols import BrokerClient
+from src.services.reconciliation_watermark import (
+    ReconciliationWatermarkStore,
+    Watermark,
+    execution_time_utc,
+)
 from src.utils.calc import calc_pnl, calc_pnl_pct
 from src.utils.position_key import (
     canonical_position_key,
@@ -88,6 +97,9 @@ class ReconciliationReport:
         reconciled: List of reconciled trades
         orphans: Orders in TWS but not in database
         missing_in_tws: Orders in database but not in TWS
+        mode: "full" (entire TWS history) or "incremental" (since watermark)
+        new_executions: Executions not seen by a previous sync
+        unchanged: Matched orders skipped because nothing changed (incremental)
         total_discrepancies: Number of discrepancies found
         total_resolved: Number of discrepancies resolved
     """
@@ -96,6 +108,9 @@ class ReconciliationReport:
     reconciled: list[ReconciledTrade] = field(default_factory=list)
     orphans: list = field(default_factory=list)
     missing_in_tws: list = field(default_factory=list)
+    mode: str = "full"
+    new_executions: int = 0
+    unchanged: int = 0
 
     @property
     def total_reconciled(self) -> int:
@@ -215,6 +230,72 @@ class PositionReconciliationReport:
         self.in_db_not_ibkr.append((contract_key, db_trade))
 
 
+@dataclass
+class ExecutionIndex:
+    """Hash indexes over IBKR Fill objects.
+
+    Replaces per-order list scans with O(1) lookups by orderId, permId and
+    canonical position key, and deduplicates fills by execId.
+
+    Attributes:
+        by_order_id: orderId -> fills
+        by_perm_id: permId -> fills
+        by_position_key: canonical position key -> fills
+        exec_ids: execIds already indexed
+    """
+
+    by_order_id: dict[int, list] = field(default_factory=dict)
+    by_perm_id: dict[int, list] = field(default_factory=dict)
+    by_position_key: dict[str, list] = field(default_factory=dict)
+    exec_ids: set = field(default_factory=set)
+
+    @classmethod
+    def build(cls, fills: list) -> "ExecutionIndex":
+        """Index a list of fills."""
+        index = cls()
+        for fill in fills:
+            index.add(fill)
+        return index
+
+    def add(self, fill) -> bool:
+        """Index a fill; returns False if its execId was already indexed."""
+        ex = fill.execution
+        exec_id = getattr(ex, "execId", None)
+        if exec_id is not None:
+            if exec_id in self.exec_ids:
+                return False
+            self.exec_ids.add(exec_id)
+        if ex.orderId:
+            self.by_order_id.setdefault(ex.orderId, []).append(fill)
+        if ex.permId:
+            self.by_perm_id.setdefault(ex.permId, []).append(fill)
+        try:
+            key = position_key_from_contract(fill.contract)
+            self.by_position_key.setdefault(key, []).append(fill)
+        except Exception:
+            pass
+        return True
+
+    def fills_for(self, order_id: int | None, perm_id: int | None) -> list:
+        """Fills for an order, by orderId first and then permId."""
+        fills = self.by_order_id.get(order_id, []) if order_id else []
+        if not fills and perm_id:
+            fills = self.by_perm_id.get(perm_id, [])
+        return fills
+
+    def touches(self, ib_trade) -> bool:
+        """Whether any indexed fill belongs to the order or its contract."""
+        order = ib_trade.order
+        if order.orderId and order.orderId in self.by_order_id:
+            return True
+        if order.permId and order.permId in self.by_perm_id:
+            return True
+        try:
+            return position_key_from_contract(ib_trade.contract) in self.by_position_key
+        except Exception:
+            return False
+
+
 class OrderReconciliation:
     """Reconcile database order records with TWS state.
 
@@ -228,15 +309,24 @@ class OrderReconciliation:
         >>> print(f"Found {report.total_discrepancies} discrepancies")
     """
 
-    def __init__(self, ibkr_client: BrokerClient, trade_repository=None):
+    def __init__(
+        self,
+        ibkr_client: BrokerClient,
+        trade_repository=None,
+        watermarks: ReconciliationWatermarkStore | None = None,
+    ):
         """Initialize order reconciliation.
 
         Args:
             ibkr_client: IBKR client for querying TWS
             trade_repository: Repository for database operations (optional)
+            watermarks: Execution watermark store. When provided, syncs are
+                incremental (only executions newer than the previous sync);
+                without it every sync reads the full TWS history.
         """
         self.client = ibkr_client
         self.trade_repo = trade_repository
+        self.watermarks = watermarks
 
         logger.debug("OrderReconciliation initialized")
 
@@ -244,18 +334,27 @@ class OrderReconciliation:
         self,
         sync_date: date | None = None,
         include_filled: bool = True,
+        full: bool = False,
     ) -> ReconciliationReport:
         """Sync all orders from a given date (default: today).
 
         Steps:
-        1. Query TWS for all orders, trades, executions, fills
-        2. Match to database records by order_id
+        1. Query TWS for trades, executions and fills
+        2. Match to database records by order_id (hash indexes)
         3. Update database with actual status, fill price, commission
         4. Generate discrepancy report
 
+        With a watermark store, today's sync is incremental: TWS is asked
+        only for executions since the watermark, completed orders from prior
+        sessions are fetched only when a new execution needs them, and
+        matched orders that are already in sync and have no new executions
+        are skipped. Pass ``full=True`` (or sync a past date) to re-read the
+        entire TWS history.
+
         Args:
             sync_date: Date to sync (default: today)
             include_filled: Include filled orders in sync (default: True)
+            full: Force a full history resync (ignores the watermark)
 
         Returns:
             ReconciliationReport with complete reconciliation details
@@ -269,9 +368,17 @@ class OrderReconciliation:
         if sync_date is None:
             sync_date = us_trading_date()
 
-        logger.info(f"Starting order reconciliation for {sync_date}")
+        watermark = self.watermarks.load() if self.watermarks else None
+        incremental = (
+            not full
+            and watermark is not None
+            and sync_date == us_trading_date()
+        )
+        mode = "incremental" if incremental else "full"
+
+        logger.info(f"Starting order reconciliation for {sync_date} ({mode})")
 
-        report = ReconciliationReport(date=sync_date)
+        report = ReconciliationReport(date=sync_date, mode=mode)
 
         # Get comprehensive data from IBKR
         logger.debug("Fetching trades from TWS (current session)...")
@@ -297,65 +404,57 @@ class OrderReconciliation:
         except Exception as e:
             logger.warning(f"Failed to fetch open trades: {e}")
 
-        # Also fetch completed orders from previous sessions.
-        # reqCompletedOrders returns filled/cancelled orders from prior sessions.
-        logger.debug("Fetching completed orders from TWS (all sessions)...")
-        try:
-            completed_trades = self.client.get_completed_orders(api_only=False)
-            logger.info(f"TWS completed orders (prior sessions): {len(completed_trades)}")
-
-            # Merge, deduplicating by order ID
-            for ct in completed_trades:
-                if ct.order.orderId not in seen_order_ids:
-                    ib_trades.append(ct)
-                    seen_order_ids.add(ct.order.orderId)
-        except Exception as e:
-            logger.warning(f"Failed to fetch completed orders: {e}")
-
-        logger.debug("Fetching executions from TWS...")
-        ib_executions = self.client.get_executions()
-
-        logger.debug("Fetching fills from TWS...")
-        ib_fills = self.client.get_fills()
-
         # Fetch reqExecutions (active server request — returns fills with real
         # orderIds, permIds, and actual fill prices even for prior-session orders).
+        # Incremental syncs only ask for executions since the watermark.
         # This is additive: if it fails, the existing flow works as before.
         req_exec_fills = []
         try:
             logger.debug("Fetching reqExecutions from TWS (server request)...")
-            result = self.client.get_req_executions()
-            req_exec_fills = list(result)
-            logger.info(f"reqExecutions returned {len(req_exec_fills)} fills")
+            if incremental:
+                since = watermark.last_exec_time or watermark.last_sync_at
+                result = self.client.get_req_executions(since=since)
+                req_exec_fills = [f for f in result if watermark.is_new(f)]
+            else:
+                result = self.client.get_req_executions()
+                req_exec_fills = list(result)
+            logger.info(f"reqExecutions returned {len(req_exec_fills)} new fills")
         except Exception as e:
             logger.warning(f"reqExecutions failed (non-fatal, continuing): {e}")
 
-        # Build reqExecutions lookups by orderId, permId, and contract key
-        req_exec_by_order_id = {}   # orderId -> list[Fill]
-        req_exec_by_perm_id = {}    # permId  -> list[Fill]
-        req_exec_by_contract = {}   # (symbol, strike, exp_date) -> list[Fill]
-        for fill in req_exec_fills:
-            ex = fill.execution
-            oid = ex.orderId
-            pid = ex.permId
-            if oid and oid != 0:
-                req_exec_by_order_id.setdefault(oid, []).append(fill)
-            if pid and pid != 0:
-                req_exec_by_perm_id.setdefault(pid, []).append(fill)
-            # Contract key for fallback matching
+        # Index reqExecutions by orderId, permId and position key
+        req_index = ExecutionIndex.build(req_exec_fills)
+        report.new_executions = len(req_exec_fills)
+
+        # Also fetch completed orders from previous sessions.
+        # reqCompletedOrders returns filled/cancelled orders from prior sessions.
+        # Incremental syncs skip this server request unless a new execution
+        # belongs to an order we have no Trade object for.
+        seen_perm_ids = {t.order.permId for t in ib_trades if t.order.permId}
+        need_completed = not incremental or any(
+            pid not in seen_perm_ids for pid in req_index.by_perm_id
+        )
+        if need_completed:
+            logger.debug("Fetching completed orders from TWS (all sessions)...")
             try:
-                c = fill.contract
-                exp_str = str(c.lastTradeDateOrContractMonth)
-                if len(exp_str) == 8:
-                    from datetime import date as _d
-                    exp = _d(int(exp_str[:4]), int(exp_str[4:6]), int(exp_str[6:8]))
-                else:
-                    from datetime import date as _d
-                    exp = _d.fromisoformat(exp_str)
-                ckey = (c.symbol, float(c.strike), exp)
-                req_exec_by_contract.setdefault(ckey, []).append(fill)
-            except Exception:
-                pass
+                completed_trades = self.client.get_completed_orders(api_only=False)
+                logger.info(
+                    f"TWS completed orders (prior sessions): {len(completed_trades)}"
+                )
+
+                # Merge, deduplicating by order ID
+                for ct in completed_trades:
+                    if ct.order.orderId not in seen_order_ids:
+                        ib_trades.append(ct)
+                        seen_order_ids.add(ct.order.orderId)
+            except Exception as e:
+                logger.warning(f"Failed to fetch completed orders: {e}")
+
+        logger.debug("Fetching executions from TWS...")
+        ib_executions = self.client.get_executions()
+
+        logger.debug("Fetching fills from TWS...")
+        ib_fills = self.client.get_fills()
 
         # Enrich completed orders that have orderId=0 or avgFillPrice=0
         # by looking up their permId in reqExecutions.
@@ -367,7 +466,7 @@ class OrderReconciliation:
 
                 # Restore real orderId from reqExecutions via permId
                 if (not order.orderId or order.orderId == 0) and order.permId:
-                    perm_fills = req_exec_by_perm_id.get(order.permId, [])
+                    perm_fills = req_index.by_perm_id.get(order.permId, [])
                     if perm_fills:
                         real_oid = perm_fills[0].execution.orderId
                         if real_oid and real_oid != 0:
@@ -381,11 +480,7 @@ class OrderReconciliation:
                 # Restore fill price from reqExecutions if avgFillPrice=0
                 if (not status.avgFillPrice or status.avgFillPrice == 0):
                     # Try by orderId first, then permId
-                    fills_for_order = []
-                    if order.orderId and order.orderId != 0:
-                        fills_for_order = req_exec_by_order_id.get(order.orderId, [])
-                    if not fills_for_order and order.permId:
-                        fills_for_order = req_exec_by_perm_id.get(order.permId, [])
+                    fills_for_order = req_index.fills_for(order.orderId, order.permId)
 
                     if fills_for_order:
                         # Weighted average fill price
@@ -410,18 +505,20 @@ class OrderReconciliation:
 
         # Merge reqExecutions fills into fills_by_order so _reconcile_single()
         # has access to commission and fill data from reqExecutions.
+        # Deduplicate by execId with one set per order (no rescans).
+        exec_ids_by_order: dict[int, set] = {}
+        for oid, order_fills in fills_by_order.items():
+            exec_ids_by_order[oid] = {
+                f.execution.execId for f in order_fills
+                if hasattr(f, 'execution') and hasattr(f.execution, 'execId')
+            }
         for fill in req_exec_fills:
             oid = fill.execution.orderId
             if oid and oid != 0:
-                if oid not in fills_by_order:
-                    fills_by_order[oid] = []
-                # Avoid duplicates (same execId)
-                existing_exec_ids = {
-                    f.execution.execId for f in fills_by_order[oid]
-                    if hasattr(f, 'execution') and hasattr(f.execution, 'execId')
-                }
-                if fill.execution.execId not in existing_exec_ids:
-                    fills_by_order[oid].append(fill)
+                known = exec_ids_by_order.setdefault(oid, set())
+                if fill.execution.execId not in known:
+                    fills_by_order.setdefault(oid, []).append(fill)
+                    known.add(fill.execution.execId)
 
         # Get all orders from database (if repository available)
         if self.trade_repo:
@@ -462,6 +559,7 @@ class OrderReconciliation:
 
             # Reconcile each trade from IBKR
             reconciled_db_ids = set()
+            failed_trades = []
             for ib_trade in ib_trades:
                 order_id = ib_trade.order.orderId
                 db_trade = None
@@ -486,16 +584,31 @@ class OrderReconciliation:
 
                 if db_trade:
                     reconciled_db_ids.add(db_trade.id)
+
+                    # Incremental: nothing new for an order already in sync
+                    if incremental and not self._needs_sync(
+                        db_trade, ib_trade, req_index
+                    ):
+                        report.unchanged += 1
+                        continue
+
                     executions = executions_by_order.get(order_id, [])
                     fills = fills_by_order.get(order_id, [])
 
-                    discrepancy, fill_price, commission = self._reconcile_single(
-                        db_trade,
-                        ib_trade,
-                        executions,
-                        fills,
-                    )
+                    try:
+                        discrepancy, fill_price, commission = self._reconcile_single(
+                            db_trade,
+                            ib_trade,
+                            executions,
+                            fills,
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to reconcile order {order_id}: {e}")
+                        failed_trades.append(ib_trade)
+                        continue
                     report.add_reconciled(db_trade, ib_trade, discrepancy, fill_price, commission)
+                    if discrepancy is not None and not discrepancy.resolved:
+                        failed_trades.append(ib_trade)
                 else:
                     # No match in today's trades — check if this order's contract
                     # matches ANY open position in the DB (entered on a different date).
@@ -586,8 +699,27 @@ class OrderReconciliation:
                     f"{ib_trade.orderStatus.status}"
                 )
 
+        if self.watermarks:
+            advanced = watermark or Watermark()
+            advanced.advance(self._fills_before_failures(req_exec_fills, failed_trades))
+            self.watermarks.save(
+                advanced,
+                full=not incremental,
+                summary={
+                    "date": sync_date.isoformat(),
+                    "mode": mode,
+                    "new_executions": report.new_executions,
+                    "reconciled": report.total_reconciled,
+                    "unchanged": report.unchanged,
+                    "discrepancies": report.total_discrepancies,
+                    "orphans": len(report.orphans),
+                    "missing_in_tws": len(report.missing_in_tws),
+                },
+            )
+
         logger.info(
-            f"Sync complete: {report.total_reconciled} synced, "
+            f"Sync complete ({mode}): {report.total_reconciled} synced, "
+            f"{report.unchanged} unchanged, {report.new_executions} new executions, "
             f"{report.total_discrepancies} discrepancies, "
             f"{len(report.orphans)} orphans, "
             f"{len(report.missing_in_tws)} not in TWS history"
@@ -595,6 +727,22 @@ class OrderReconciliation:
 
         return report
 
+    def _needs_sync(self, db_trade, ib_trade, new_executions: ExecutionIndex) -> bool:
+        """Whether a matched order must be reconciled in an incremental sync.
+
+        Args:
+            db_trade: Matched database trade
+            ib_trade: Trade object from TWS
+            new_executions: Executions newer than the watermark
+
+        Returns:
+            True if the order has new executions or its status differs
+        """
+        if new_executions.touches(ib_trade):
+            return True
+        db_status = (getattr(db_trade, "tws_status", None) or "").lower()
+        return db_status != str(ib_trade.orderStatus.status).lower()
+
     async def import_orphan_orders(
         self,
         orphan_trades: list,
@@ -893,16 +1041,69 @@ class OrderReconciliation:
         # Apply updates to database
         if updates and self.trade_repo:
             try:
-                for field, value in updates.items():
-                    if hasattr(db_trade, field):
-                        setattr(db_trade, field, value)
+                for attr, value in updates.items():
+                    if hasattr(db_trade, attr):
+                        setattr(db_trade, attr, value)
                 self.trade_repo.update(db_trade)
                 logger.info(f"Database updated for order {db_trade.order_id}: {list(updates.keys())}")
             except Exception as e:
                 logger.error(f"Failed to update database for order {db_trade.order_id}: {e}")
+                # Still report what TWS says, but unresolved so the
+                # watermark is held and the next sync retries this order
+                if discrepancy is None:
+                    discrepancy = Discrepancy(
+                        type="DB_UPDATE_FAILED",
+                        field=", ".join(updates),
+                        db_value=None,
+                        tws_value=None,
+                    )
+                discrepancy.resolved = False
+                discrepancy.resolution = f"Database update failed: {e}"
 
         return discrepancy, tws_fill_price, total_commission
 
+    @staticmethod
+    def _fills_before_failures(fills: list, failed_trades: list) -> list:
+        """Fills the watermark may move past after a sync.
+
+        Stops at the earliest fill of any order that failed to reconcile,
+        so the next incremental sync fetches those fills again. A failed
+        fill without a timestamp holds the watermark where it is.
+
+        Args:
+            fills: Fills fetched by this sync
+            failed_trades: IBKR trades whose reconcile raised or left an
+                unresolved discrepancy
+
+        Returns:
+            Fills strictly older than the first failed fill
+        """
+        if not failed_trades:
+            return fills
+
+        failed_order_ids = {t.order.orderId for t in failed_trades if t.order.orderId}
+        failed_perm_ids = {t.order.permId for t in failed_trades if t.order.permId}
+        failed_times = [
+            execution_time_utc(f)
+            for f in fills
+            if f.execution.orderId in failed_order_ids
+            or f.execution.permId in failed_perm_ids
+        ]
+        if not failed_times:
+            return fills
+        if any(t is None for t in failed_times):
+            return []
+
+        cutoff = min(failed_times)
+        logger.warning(
+            f"Holding reconciliation watermark before {cutoff} "
+            f"({len(failed_trades)} order(s) failed to reconcile)"
+        )
+        return [
+            f for f in fills
+            if (t := execution_time_utc(f)) is not None and t < cutoff
+        ]
+
     def _group_executions_by_order(self, executions) -> dict[int, list]:
         """Group executions by order ID.
 
@@ -7,7 +7,7 @@ with an estimate fallback for offline mode.
 Key features:
 - Gets actual margin via whatIfOrder (not just estimates)
 - Shows before/after re-ranking when actual margin differs from estimates
-- Greedy algorithm to maximize margin efficiency within budget
+- Optimal selection to maximize expected premium within budget
 - Enforces sector concentration limits
 - Flags trades using estimated margin for later verification
 """
@@ -20,6 +20,12 @@ from loguru import logger
 
 from src.utils.timezone import utc_now
 
+from src.services.portfolio_optimizer import (
+    DEFAULT_TIME_BUDGET_MS,
+    SelectionItem,
+    SelectionResult,
+    optimize_selection,
+)
 from src.services.strike_finder import StrikeCandidate
 
 
@@ -36,6 +42,7 @@ class PortfolioConfig:
         max_sector_concentration: Max trades per sector (default 3)
         max_budget_utilization: Warn if budget > this % used (default 0.80)
         high_iv_threshold: IV rank above this triggers warning (default 0.60)
+        selection_time_budget_ms: Hard limit on portfolio optimization time
     """
 
     margin_budget_pct: float = 0.50
@@ -44,6 +51,7 @@ class PortfolioConfig:
     max_sector_concentration: int = 3
     max_budget_utilization: float = 0.80
     high_iv_threshold: float = 0.60
+    selection_time_budget_ms: float = DEFAULT_TIME_BUDGET_MS
 
     @classmethod
     def from_env(cls) -> "PortfolioConfig":
@@ -169,6 +177,7 @@ class PortfolioPlan:
         warnings: List of warning messages
         created_at: When the plan was created
         ibkr_connected: Whether IBKR was connected during planning
+        selection: Optimizer report (gain over greedy, optimality gap)
     """
 
     trades: list[StagedTrade]
@@ -182,6 +191,7 @@ class PortfolioPlan:
     warnings: list[str]
     created_at: datetime = field(default_factory=utc_now)
     ibkr_connected: bool = True
+    selection: SelectionResult | None = None
 
     @property
     def budget_utilization(self) -> float:
@@ -212,7 +222,8 @@ class PortfolioBuilder:
     1. Get actual margin for each candidate via whatIfOrder
     2. Calculate margin efficiency (premium / margin)
     3. Rank by efficiency (highest first)
-    4. Greedily select trades that fit within budget and constraints
+    4. Select the premium-maximizing set of trades within budget and
+       constraints (branch-and-bound, never worse than greedy)
 
     Example:
         >>> builder = PortfolioBuilder(ibkr_client)
@@ -263,7 +274,7 @@ class PortfolioBuilder:
         2. Get ACTUAL margin for each candidate (via whatIfOrder if connected)
         3. Calculate margin efficiency for each: premium_income / total_margin
         4. Sort by margin efficiency (highest first = best use of capital)
-        5. Greedily select trades within constraints
+        5. Select the set with the highest expected premium within constraints
 
         Args:
             candidates: List of StrikeCandidate objects to consider
@@ -321,24 +332,9 @@ class PortfolioBuilder:
             reverse=True,  # Highest efficiency first
         )
 
-        # Step 6: Greedy selection (using available_budget after accounting for staged trades)
-        selected_trades: list[StagedTrade] = []
-        skipped_trades: list[StagedTrade] = []
-        warnings: list[str] = []
-        cumulative_margin = 0.0
-        sector_counts: dict[str, int] = {}
-        selected_symbols: set[str] = set()
-
-        # Add warning if many trades already staged
-        if already_staged_count > 0:
-            warnings.append(
-                f"Note: {already_staged_count} trades already staged "
-                f"(${already_staged_margin:,.0f} margin) - "
-                f"budget reduced to ${available_budget:,.0f} for new trades"
-            )
-
+        # Step 6: Trade metrics per candidate (in efficiency order)
+        metrics: list[tuple[float, float, float]] = []
         for rank, candidate in enumerate(sorted_candidates, start=1):
-            # Calculate trade metrics
             margin_per_contract = candidate.effective_margin
             contracts = candidate.contracts
             total_margin = margin_per_contract * contracts
@@ -368,22 +364,74 @@ class PortfolioBuilder:
                     margin_per_contract = fallback
                     total_margin = fallback * contracts
 
-            # Check constraints (using available_budget, not original budget)
-            skip_reason = self._check_constraints(
-                candidate=candidate,
-                total_margin=total_margin,
-                cumulative_margin=cumulative_margin,
-                budget=available_budget,
-                sector_counts=sector_counts,
-                selected_symbols=selected_symbols,
-                current_position_count=len(selected_trades),
+            metrics.append((margin_per_contract, total_margin, total_premium))
+
+        # Step 7: Choose the premium-maximizing set within the constraints
+        # (using available_budget after accounting for staged trades)
+        selection = optimize_selection(
+            [
+                SelectionItem(
+                    value=total_premium,
+                    weight=total_margin,
+                    symbol=candidate.symbol,
+                    sector=candidate.sector or "Unknown",
+                )
+                for candidate, (_, total_margin, total_premium) in zip(
+                    sorted_candidates, metrics
+                )
+            ],
+            budget=available_budget,
+            max_positions=self.config.max_positions,
+            max_per_sector=self.config.max_sector_concentration,
+            time_budget_ms=self.config.selection_time_budget_ms,
+        )
+        logger.info(f"Portfolio selection — {selection.summary()}")
+        chosen = set(selection.selected)
+
+        selected_trades: list[StagedTrade] = []
+        skipped_trades: list[StagedTrade] = []
+        warnings: list[str] = []
+        cumulative_margin = 0.0
+        sector_counts: dict[str, int] = {}
+        selected_symbols: set[str] = set()
+
+        for i, candidate in enumerate(sorted_candidates):
+            if i in chosen:
+                sector = candidate.sector or "Unknown"
+                sector_counts[sector] = sector_counts.get(sector, 0) + 1
+                selected_symbols.add(candidate.symbol)
+        final_margin = sum(metrics[i][1] for i in chosen)
+
+        # Add warning if many trades already staged
+        if already_staged_count > 0:
+            warnings.append(
+                f"Note: {already_staged_count} trades already staged "
+                f"(${already_staged_margin:,.0f} margin) - "
+                f"budget reduced to ${available_budget:,.0f} for new trades"
             )
 
+        for rank, candidate in enumerate(sorted_candidates, start=1):
+            margin_per_contract, total_margin, total_premium = metrics[rank - 1]
+
+            if rank - 1 in chosen:
+                skip_reason = None
+            else:
+                # Report the limit that keeps this trade out of the final set
+                skip_reason = self._check_constraints(
+                    candidate=candidate,
+                    total_margin=total_margin,
+                    cumulative_margin=final_margin,
+                    budget=available_budget,
+                    sector_counts=sector_counts,
+                    selected_symbols=selected_symbols,
+                    current_position_count=len(chosen),
+                ) or "Not selected (better combination within budget)"
+
             staged_trade = StagedTrade(
                 candidate=candidate,
                 margin_per_contract=margin_per_contract,
                 margin_source=candidate.margin_source,
-                contracts=contracts,
+                contracts=candidate.contracts,
                 total_margin=total_margin,
                 total_premium=total_premium,
                 portfolio_rank=rank,
@@ -396,11 +444,6 @@ class PortfolioBuilder:
                 # Trade accepted
                 selected_trades.append(staged_trade)
                 cumulative_margin += total_margin
-                selected_symbols.add(candidate.symbol)
-
-                # Update sector count
-                sector = candidate.sector or "Unknown"
-                sector_counts[sector] = sector_counts.get(sector, 0) + 1
 
                 # Check for high IV warning
                 if candidate.iv_rank > self.config.high_iv_threshold:
@@ -437,6 +480,7 @@ class PortfolioBuilder:
             sector_distribution=sector_counts,
             warnings=warnings,
             ibkr_connected=self._ibkr_connected,
+            selection=selection,
         )
 
         logger.info(
@@ -0,0 +1,445 @@
+"""Optimal portfolio selection under margin, position and sector limits.
+
+Picking trades for a portfolio is a 0/1 knapsack with side constraints:
+
+- Total margin must fit the available budget
+- At most ``max_positions`` trades
+- At most ``max_per_sector`` trades per sector
+- At most one trade per symbol
+
+Greedy selection (sort by score or efficiency, take what fits) is fast but
+order-dependent and routinely leaves margin unused: one large early pick
+can block two smaller trades that are worth more together.
+
+``optimize_selection()`` solves the problem exactly with depth-first
+branch-and-bound for moderate candidate counts, and falls back to a
+greedy-plus-swap approximation for very large lists. Both paths run under a
+hard time budget, start from the greedy solution (so they are never worse
+than greedy), and report how far the result is from greedy and from the
+proven upper bound.
+
+Example:
+    >>> items = [SelectionItem(value=c.score, weight=c.margin,
+    ...                        symbol=c.symbol, sector=c.sector) for c in ranked]
+    >>> result = optimize_selection(items, budget=50000, max_positions=10,
+    ...                             max_per_sector=3)
+    >>> chosen = [ranked[i] for i in result.selected]
+"""
+
+import heapq
+import time
+from dataclasses import dataclass
+
+DEFAULT_TIME_BUDGET_MS = 50.0
+EXACT_MAX_ITEMS = 60
+
+# Nodes between deadline checks during branch-and-bound
+_DEADLINE_CHECK_INTERVAL = 256
+
+
+@dataclass
+class SelectionItem:
+    """One selectable trade.
+
+    Attributes:
+        value: Objective contribution (score, premium, ...); higher is better
+        weight: Margin the trade consumes
+        symbol: Underlying symbol (one trade per symbol)
+        sector: Sector for the per-sector limit
+    """
+
+    value: float
+    weight: float
+    symbol: str
+    sector: str
+
+
+@dataclass
+class SelectionResult:
+    """Outcome of a portfolio selection run.
+
+    Attributes:
+        selected: Indices of chosen items, in input (priority) order
+        value: Objective value of the selection
+        weight: Total margin of the selection
+        greedy_value: Objective value of greedy selection in input order
+        upper_bound: Proven upper bound on the optimal value
+        method: "exact", "exact_timeout" or "approximate"
+        optimal: True when the selection is proven optimal
+        nodes: Branch-and-bound nodes explored (0 for the approximation)
+        elapsed_ms: Wall time spent selecting
+    """
+
+    selected: list[int]
+    value: float
+    weight: float
+    greedy_value: float
+    upper_bound: float
+    method: str
+    optimal: bool
+    nodes: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def gain_vs_greedy_pct(self) -> float:
+        """Objective improvement over the greedy baseline, in percent."""
+        if self.greedy_value <= 0:
+            return 0.0
+        return (self.value - self.greedy_value) / self.greedy_value * 100
+
+    @property
+    def optimality_gap_pct(self) -> float:
+        """Distance from the upper bound, in percent (0 when proven optimal)."""
+        if self.optimal or self.upper_bound <= 0:
+            return 0.0
+        return max(0.0, (self.upper_bound - self.value) / self.upper_bound * 100)
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        return (
+            f"{self.method}: {len(self.selected)} selected, value {self.value:.4g} "
+            f"(greedy {self.greedy_value:.4g}, {self.gain_vs_greedy_pct:+.1f}%), "
+            f"gap {self.optimality_gap_pct:.1f}%, {self.nodes} nodes, "
+            f"{self.elapsed_ms:.1f}ms"
+        )
+
+
+class _Selection:
+    """Mutable selection state shared by the greedy and swap passes."""
+
+    def __init__(self, items: list[SelectionItem], budget: float,
+                 max_positions: int, max_per_sector: int):
+        self.items = items
+        self.budget = budget
+        self.max_positions = max_positions
+        self.max_per_sector = max_per_sector
+        self.chosen: set[int] = set()
+        self.weight = 0.0
+        self.value = 0.0
+        self.symbols: set[str] = set()
+        self.sectors: dict[str, int] = {}
+
+    def can_add(self, i: int, freed: int | None = None) -> bool:
+        """Whether item i fits, optionally after removing item ``freed``."""
+        item = self.items[i]
+        count = len(self.chosen)
+        weight = self.weight
+        symbols_taken = item.symbol in self.symbols
+        sector_count = self.sectors.get(item.sector, 0)
+        if freed is not None:
+            out = self.items[freed]
+            count -= 1
+            weight -= out.weight
+            if out.symbol == item.symbol:
+                symbols_taken = False
+            if out.sector == item.sector:
+                sector_count -= 1
+        return (
+            count < self.max_positions
+            and not symbols_taken
+            and sector_count < self.max_per_sector
+            and weight + item.weight <= self.budget
+        )
+
+    def add(self, i: int) -> None:
+        item = self.items[i]
+        self.chosen.add(i)
+        self.weight += item.weight
+        self.value += item.value
+        self.symbols.add(item.symbol)
+        self.sectors[item.sector] = self.sectors.get(item.sector, 0) + 1
+
+    def remove(self, i: int) -> None:
+        item = self.items[i]
+        self.chosen.discard(i)
+        self.weight -= item.weight
+        self.value -= item.value
+        self.symbols.discard(item.symbol)
+        self.sectors[item.sector] -= 1
+
+    def fill(self, order) -> None:
+        """Add every item that still fits, in the given order."""
+        for i in order:
+            if i not in self.chosen and self.can_add(i):
+                self.add(i)
+
+
+def greedy_select(
+    items: list[SelectionItem],
+    budget: float,
+    max_positions: int,
+    max_per_sector: int,
+) -> list[int]:
+    """Greedy selection in input order (the baseline the optimizer must beat).
+
+    Args:
+        items: Candidates in priority order
+        budget: Available margin
+        max_positions: Maximum number of trades
+        max_per_sector: Maximum trades per sector
+
+    Returns:
+        Indices of selected items, in input order
+    """
+    sel = _Selection(items, budget, max_positions, max_per_sector)
+    sel.fill(range(len(items)))
+    return sorted(sel.chosen)
+
+
+def optimize_selection(
+    items: list[SelectionItem],
+    budget: float,
+    max_positions: int,
+    max_per_sector: int,
+    time_budget_ms: float = DEFAULT_TIME_BUDGET_MS,
+    exact_max_items: int = EXACT_MAX_ITEMS,
+) -> SelectionResult:
+    """Select the subset of items with the highest total value.
+
+    Up to ``exact_max_items`` candidates are solved with branch-and-bound;
+    larger lists use greedy-plus-swap local search. Either way the search
+    stops at ``time_budget_ms`` and returns the best selection found, which
+    is never worse than greedy selection in input order. Every item that
+    still fits after optimization is added (in input order), so the result
+    is maximal: each unselected item violates at least one limit.
+
+    Args:
+        items: Candidates in priority order (ties favour earlier items)
+        budget: Available margin
+        max_positions: Maximum number of trades
+        max_per_sector: Maximum trades per sector
+        time_budget_ms: Hard limit on search time
+        exact_max_items: Largest candidate count solved exactly
+
+    Returns:
+        SelectionResult with the selection, greedy baseline and bounds
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget_ms / 1000
+
+    n = len(items)
+    greedy = greedy_select(items, budget, max_positions, max_per_sector)
+    greedy_value = sum(items[i].value for i in greedy)
+
+    if n == 0 or max_positions <= 0 or max_per_sector <= 0:
+        return SelectionResult(
+            selected=greedy, value=greedy_value,
+            weight=sum(items[i].weight for i in greedy), greedy_value=greedy_value,
+            upper_bound=greedy_value, method="exact", optimal=True,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+
+    # Only positive-value items that fit on their own can improve the objective
+    useful = [
+        i for i in range(n)
+        if items[i].value > 0 and items[i].weight <= budget
+    ]
+    by_density = sorted(useful, key=lambda i: (-_density(items[i]), i))
+
+    best = _approximate(
+        items, budget, max_positions, max_per_sector, greedy, by_density, deadline
+    )
+    root_bound = _upper_bound(
+        items, by_density, budget, max_positions, set(), {}, max_per_sector
+    )
+
+    nodes = 0
+    if len(useful) <= exact_max_items:
+        search = _BranchAndBound(
+            items, by_density, budget, max_positions, max_per_sector, deadline,
+            best.value, set(best.chosen),
+        )
+        search.run()
+        nodes = search.nodes
+        if search.best_value > best.value:
+            best = _Selection(items, budget, max_positions, max_per_sector)
+            for i in search.best_set:
+                best.add(i)
+        optimal = not search.timed_out
+        method = "exact_timeout" if search.timed_out else "exact"
+    else:
+        optimal = False
+        method = "approximate"
+
+    # Zero-value or tied items that still fit keep the selection maximal
+    best.fill(range(n))
+
+    upper_bound = best.value if optimal else max(root_bound, best.value)
+    return SelectionResult(
+        selected=sorted(best.chosen),
+        value=best.value,
+        weight=best.weight,
+        greedy_value=greedy_value,
+        upper_bound=upper_bound,
+        method=method,
+        optimal=optimal,
+        nodes=nodes,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+def _density(item: SelectionItem) -> float:
+    """Value per unit of margin (zero-margin items rank first)."""
+    if item.weight <= 0:
+        return float("inf")
+    return item.value / item.weight
+
+
+def _approximate(
+    items: list[SelectionItem],
+    budget: float,
+    max_positions: int,
+    max_per_sector: int,
+    greedy: list[int],
+    by_density: list[int],
+    deadline: float,
+) -> _Selection:
+    """Best of several greedy orders, improved by 1-for-1 swaps.
+
+    Each pass is O(n * max_positions), so this stays fast for thousands of
+    candidates and stops at the deadline.
+    """
+    by_value = sorted(by_density, key=lambda i: (-items[i].value, i))
+
+    best: _Selection | None = None
+    for order in (greedy, by_value, by_density):
+        sel = _Selection(items, budget, max_positions, max_per_sector)
+        sel.fill(order)
+        if best is None or sel.value > best.value:
+            best = sel
+
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for j in by_density:
+            if j in best.chosen:
+                continue
+            if best.can_add(j):
+                best.add(j)
+                improved = True
+                continue
+            gain_item = items[j].value
+            swap_out = None
+            for i in best.chosen:
+                if gain_item > items[i].value and best.can_add(j, freed=i):
+                    if swap_out is None or items[i].value < items[swap_out].value:
+                        swap_out = i
+            if swap_out is not None:
+                best.remove(swap_out)
+                best.add(j)
+                improved = True
+        if improved:
+            best.fill(by_density)
+    return best
+
+
+def _upper_bound(
+    items: list[SelectionItem],
+    order: list[int],
+    budget: float,
+    slots: int,
+    symbols: set[str],
+    sectors: dict[str, int],
+    max_per_sector: int,
+    start: int = 0,
+) -> float:
+    """Upper bound on the value still obtainable from order[start:].
+
+    The minimum of two relaxations: the fractional knapsack over margin
+    (ignoring the position limit) and the best ``slots`` values (ignoring
+    margin). Both drop the symbol constraint.
+    """
+    if slots <= 0:
+        return 0.0
+
+    fractional = 0.0
+    remaining = budget
+    values = []
+    for k in range(start, len(order)):
+        item = items[order[k]]
+        if (
+            item.weight > budget
+            or item.symbol in symbols
+            or sectors.get(item.sector, 0) >= max_per_sector
+        ):
+            continue
+        values.append(item.value)
+        if remaining > 0:
+            if item.weight <= remaining:
+                fractional += item.value
+                remaining -= item.weight
+            else:
+                fractional += item.value * remaining / item.weight
+                remaining = 0.0
+
+    top_values = sum(heapq.nlargest(slots, values))
+    return min(fractional, top_values)
+
+
+class _BranchAndBound:
+    """Depth-first branch-and-bound over items in density order."""
+
+    def __init__(self, items, order, budget, max_positions, max_per_sector,
+                 deadline, incumbent_value, incumbent_set):
+        self.items = items
+        self.order = order
+        self.budget = budget
+        self.max_positions = max_positions
+        self.max_per_sector = max_per_sector
+        self.deadline = deadline
+        self.best_value = incumbent_value
+        self.best_set = incumbent_set
+        self.nodes = 0
+        self.timed_out = False
+
+        self._chosen: list[int] = []
+        self._symbols: set[str] = set()
+        self._sectors: dict[str, int] = {}
+
+    def run(self) -> None:
+        self._search(0, self.budget, 0.0)
+
+    def _search(self, pos: int, remaining: float, value: float) -> None:
+        if self.timed_out:
+            return
+        self.nodes += 1
+        if self.nodes % _DEADLINE_CHECK_INTERVAL == 0 and (
+            time.perf_counter() >= self.deadline
+        ):
+            self.timed_out = True
+            return
+
+        if value > self.best_value:
+            self.best_value = value
+            self.best_set = set(self._chosen)
+
+        slots = self.max_positions - len(self._chosen)
+        if pos >= len(self.order) or slots <= 0:
+            return
+
+        bound = _upper_bound(
+            self.items, self.order, remaining, slots, self._symbols,
+            self._sectors, self.max_per_sector, start=pos,
+        )
+        if value + bound <= self.best_value:
+            return
+
+        i = self.order[pos]
+        item = self.items[i]
+
+        # Branch 1: take the item
+        if (
+            item.weight <= remaining
+            and item.symbol not in self._symbols
+            and self._sectors.get(item.sector, 0) < self.max_per_sector
+        ):
+            self._chosen.append(i)
+            self._symbols.add(item.symbol)
+            self._sectors[item.sector] = self._sectors.get(item.sector, 0) + 1
+            self._search(pos + 1, remaining - item.weight, value + item.value)
+            self._sectors[item.sector] -= 1
+            self._symbols.discard(item.symbol)
+            self._chosen.pop()
+
+        # Branch 2: skip it
+        self._search(pos + 1, remaining, value)
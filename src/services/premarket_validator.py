@@ -6,8 +6,16 @@ This module validates staged trades at two critical points:
 
 Pre-market data is unreliable for option premiums, so we need both stages.
 Stage 1 catches major stock price gaps, Stage 2 confirms premium viability.
+
+Both stages run against a deadline. The async variants fetch all underlying
+prices (one request per symbol) and option quotes concurrently; anything
+still outstanding at the deadline is marked TIMED_OUT instead of holding up
+the rest of the batch. Stage 1 also looks up the option chains of every
+symbol that will need a strike adjustment concurrently, so adjusting does
+not wait on one chain request per symbol.
 """
 
+import asyncio
 import os
 import time as time_mod
 from dataclasses import dataclass, field
@@ -28,6 +36,7 @@ class ValidationStatus(Enum):
     ADJUSTED = "ADJUSTED"  # Passed after adjustment
     STALE = "STALE"  # Failed check, skip this trade
     PENDING = "PENDING"  # Not yet checked
+    TIMED_OUT = "TIMED_OUT"  # Not validated before the batch deadline
 
 
 @dataclass
@@ -53,6 +62,11 @@ class ValidationConfig:
     General:
         min_otm_execute: Minimum OTM% to execute at any stage (default 12%)
         min_premium_execute: Minimum premium to execute (default $0.20)
+
+    Deadlines:
+        premarket_deadline_seconds: Budget for a whole Stage 1 batch (default 60s)
+        open_deadline_seconds: Budget for a whole Stage 2 batch incl. retries (default 60s)
+        quote_timeout_seconds: Per-quote wait in the concurrent fetch (default 3s)
     """
 
     # Stage 1 - Stock price deviation thresholds
@@ -74,6 +88,11 @@ class ValidationConfig:
     min_otm_aggressive: float = 0.12  # Minimum OTM for aggressive adjustments
     min_premium_aggressive: float = 0.20  # Minimum premium for aggressive adjustments
 
+    # Batch deadlines — opportunities not validated in time are TIMED_OUT
+    premarket_deadline_seconds: float = 60.0
+    open_deadline_seconds: float = 60.0
+    quote_timeout_seconds: float = 3.0
+
     @classmethod
     def from_env(cls) -> "ValidationConfig":
         """Load configuration from environment variables.
@@ -97,6 +116,15 @@ class ValidationConfig:
             ),
             min_otm_execute=float(os.getenv("MIN_OTM_PCT", "0.10")),
             min_premium_execute=float(os.getenv("MIN_PREMIUM_EXECUTE", "0.20")),
+            premarket_deadline_seconds=float(
+                os.getenv("PREMARKET_VALIDATION_DEADLINE_SECONDS", "60")
+            ),
+            open_deadline_seconds=float(
+                os.getenv("OPEN_VALIDATION_DEADLINE_SECONDS", "60")
+            ),
+            quote_timeout_seconds=float(
+                os.getenv("VALIDATION_QUOTE_TIMEOUT_SECONDS", "3.0")
+            ),
         )
 
 
@@ -188,6 +216,28 @@ class OpenCheckResult:
 
 
 
+def _quote_price(quote) -> float | None:
+    """Underlying price from a Quote: last, else bid/ask midpoint."""
+    if quote is None or not quote.is_valid:
+        return None
+    if quote.last and quote.last > 0:
+        return quote.last
+    if quote.bid > 0 and quote.ask > 0:
+        return (quote.bid + quote.ask) / 2
+    return None
+
+
+def _option_quote_dict(quote) -> dict | None:
+    """Option quote in get_option_quote() format.
+
+    A quote with a last/close price but no bid yet maps to bid=0, which
+    Stage 2 treats as PENDING (options not trading yet).
+    """
+    if quote is None or not quote.is_valid:
+        return None
+    return {"bid": quote.bid, "ask": quote.ask, "last": quote.last}
+
+
 class PremarketValidator:
     """Two-stage validation for staged trades.
 
@@ -201,6 +251,8 @@ class PremarketValidator:
         >>> premarket_results = validator.validate_premarket(staged_opportunities)
         >>> # Stage 2: Market-open validation
         >>> open_results = validator.validate_at_open(ready_opportunities)
+        >>> # From async code, fetch quotes concurrently
+        >>> open_results = await validator.validate_at_open_async(ready_opportunities)
     """
 
     def __init__(
@@ -220,6 +272,16 @@ class PremarketValidator:
         self.config = config or ValidationConfig.from_env()
         self.limit_calculator = limit_calculator or LimitPriceCalculator()
 
+        # Underlying prices shared by every opportunity in one validation
+        # pass (several staged trades often share a symbol). Cleared at the
+        # start of each pass so Stage 2 never sees Stage 1 prices.
+        self._stock_prices: dict[str, float | None] = {}
+        # Strike grids don't change intraday; detected intervals are reused
+        self._strike_intervals: dict[str, float] = {}
+        # Symbols whose chain lookup already failed in this pass, so the
+        # sequential path does not repeat it
+        self._chain_misses: set[str] = set()
+
         logger.debug(
             f"PremarketValidator initialized: "
             f"stock_thresholds=[{self.config.max_deviation_ready:.0%}, "
@@ -232,6 +294,7 @@ class PremarketValidator:
     def validate_premarket(
         self,
         opportunities: list[StagedOpportunity],
+        deadline_seconds: float | None = None,
     ) -> list[PremarketCheckResult]:
         """Stage 1: Pre-market validation (9:15 AM ET).
 
@@ -241,17 +304,107 @@ class PremarketValidator:
         - deviation 5-10%: Aggressive adjustment (lower OTM threshold)
         - deviation > 10%: STALE (too much movement)
 
+        Opportunities not reached before the deadline are TIMED_OUT.
+
         Args:
             opportunities: List of staged opportunities to validate
+            deadline_seconds: Batch budget (default config.premarket_deadline_seconds)
 
         Returns:
             List of PremarketCheckResult with status for each
         """
         logger.info(f"Stage 1: Validating {len(opportunities)} staged opportunities")
+        if deadline_seconds is None:
+            deadline_seconds = self.config.premarket_deadline_seconds
+        deadline = time_mod.monotonic() + deadline_seconds
+
+        self._stock_prices.clear()
+        self._chain_misses.clear()
+        return self._run_premarket(opportunities, deadline, deadline_seconds)
+
+    async def validate_premarket_async(
+        self,
+        opportunities: list[StagedOpportunity],
+        deadline_seconds: float | None = None,
+    ) -> list[PremarketCheckResult]:
+        """Stage 1 with all underlying prices fetched concurrently.
+
+        Same decision tree as validate_premarket(). Prices are requested once
+        per symbol, in parallel; symbols whose price has not arrived by the
+        deadline have their opportunities marked TIMED_OUT. Symbols that
+        returned no usable quote fall back to the sequential lookup while
+        time remains. Strike intervals for the symbols that moved enough to
+        need an adjustment are then looked up in parallel too.
+
+        Args:
+            opportunities: List of staged opportunities to validate
+            deadline_seconds: Batch budget (default config.premarket_deadline_seconds)
+
+        Returns:
+            List of PremarketCheckResult with status for each
+        """
+        logger.info(
+            f"Stage 1: Validating {len(opportunities)} staged opportunities "
+            f"(concurrent)"
+        )
+        if deadline_seconds is None:
+            deadline_seconds = self.config.premarket_deadline_seconds
+        deadline = time_mod.monotonic() + deadline_seconds
+
+        self._stock_prices.clear()
+        self._chain_misses.clear()
+        late_symbols = await self._prefetch_stock_prices(
+            {opp.symbol for opp in opportunities}, deadline
+        )
+        await self._prefetch_strike_intervals(
+            self._symbols_to_adjust(opportunities), deadline
+        )
+        return self._run_premarket(
+            opportunities, deadline, deadline_seconds, late_symbols
+        )
+
+    def _run_premarket(
+        self,
+        opportunities: list[StagedOpportunity],
+        deadline: float,
+        deadline_seconds: float,
+        late_symbols: set[str] | None = None,
+    ) -> list[PremarketCheckResult]:
+        """Evaluate Stage 1 for each opportunity until the deadline.
+
+        Opportunities whose price is already cached are always evaluated
+        (that is local work); the others are fetched one by one until the
+        deadline and TIMED_OUT after it.
+
+        Args:
+            opportunities: Opportunities to validate
+            deadline: time.monotonic() value after which nothing is fetched
+            deadline_seconds: Batch budget (for the TIMED_OUT reason)
+            late_symbols: Symbols whose prefetched price missed the deadline
+
+        Returns:
+            List of PremarketCheckResult in input order
+        """
+        late_symbols = late_symbols or set()
         results: list[PremarketCheckResult] = []
 
         for opp in opportunities:
-            result = self._validate_premarket_single(opp)
+            expired = (
+                opp.symbol not in self._stock_prices
+                and time_mod.monotonic() >= deadline
+            )
+            if opp.symbol in late_symbols or expired:
+                result = PremarketCheckResult(
+                    opportunity=opp,
+                    status=ValidationStatus.TIMED_OUT,
+                    staged_price=opp.staged_stock_price,
+                    premarket_price=opp.staged_stock_price,
+                    deviation_pct=0.0,
+                    new_otm_pct=opp.otm_pct,
+                    adjustment_reason=self._deadline_reason(deadline_seconds),
+                )
+            else:
+                result = self._validate_premarket_single(opp)
             results.append(result)
 
             log_level = "info" if result.passed else "warning"
@@ -264,10 +417,12 @@ class PremarketValidator:
         ready_count = sum(1 for r in results if r.status == ValidationStatus.READY)
         adjusted_count = sum(1 for r in results if r.status == ValidationStatus.ADJUSTED)
         stale_count = sum(1 for r in results if r.status == ValidationStatus.STALE)
+        timed_out = sum(1 for r in results if r.status == ValidationStatus.TIMED_OUT)
 
         logger.info(
             f"Stage 1 complete: {ready_count} READY, "
             f"{adjusted_count} ADJUSTED, {stale_count} STALE"
+            + (f", {timed_out} TIMED_OUT" if timed_out else "")
         )
 
         return results
@@ -392,7 +547,10 @@ class PremarketValidator:
         Returns:
             Strike interval (e.g., 0.50, 1.00, 2.50, 5.00)
         """
-        if self.ibkr_client:
+        if symbol in self._strike_intervals:
+            return self._strike_intervals[symbol]
+
+        if self.ibkr_client and symbol not in self._chain_misses:
             try:
                 # Try to get option chain and detect actual interval
                 from ib_async import Stock
@@ -406,39 +564,67 @@ class PremarketValidator:
                         sec_type=qualified.secType,
                         con_id=qualified.conId,
                     )
-
-                    if chains and len(chains) > 0:
-                        # Get strikes from first exchange
-                        strikes = sorted(chains[0].strikes)
-
-                        if len(strikes) >= 10:
-                            # Look at strikes near current price
-                            nearby_strikes = [
-                                s for s in strikes if abs(s - stock_price) < stock_price * 0.3
-                            ]
-
-                            if len(nearby_strikes) >= 5:
-                                # Calculate intervals between consecutive strikes
-                                intervals = [
-                                    nearby_strikes[i + 1] - nearby_strikes[i]
-                                    for i in range(min(10, len(nearby_strikes) - 1))
-                                ]
-
-                                # Find most common interval
-                                from collections import Counter
-
-                                counter = Counter(intervals)
-                                if counter:
-                                    most_common_interval = counter.most_common(1)[0][0]
-                                    logger.debug(
-                                        f"{symbol}: Detected strike interval ${most_common_interval} "
-                                        f"from options chain"
-                                    )
-                                    return most_common_interval
+                    interval = self._interval_from_chains(symbol, chains, stock_price)
+                    if interval is not None:
+                        return interval
 
             except Exception as e:
                 logger.debug(f"{symbol}: Could not detect strike interval from chain: {e}")
 
+        return self._fallback_strike_interval(stock_price)
+
+    def _interval_from_chains(
+        self, symbol: str, chains: list, stock_price: float
+    ) -> float | None:
+        """Detect and cache the strike interval from option chain definitions.
+
+        Args:
+            symbol: Stock symbol
+            chains: OptionChain definitions for the symbol
+            stock_price: Current stock price
+
+        Returns:
+            Most common interval between strikes near the price, or None if
+            the chain has too few strikes
+        """
+        if not chains:
+            return None
+
+        # Get strikes from first exchange
+        strikes = sorted(chains[0].strikes)
+        if len(strikes) < 10:
+            return None
+
+        # Look at strikes near current price
+        nearby_strikes = [
+            s for s in strikes if abs(s - stock_price) < stock_price * 0.3
+        ]
+        if len(nearby_strikes) < 5:
+            return None
+
+        # Calculate intervals between consecutive strikes
+        intervals = [
+            nearby_strikes[i + 1] - nearby_strikes[i]
+            for i in range(min(10, len(nearby_strikes) - 1))
+        ]
+
+        # Find most common interval
+        from collections import Counter
+
+        counter = Counter(intervals)
+        if not counter:
+            return None
+        most_common_interval = counter.most_common(1)[0][0]
+        logger.debug(
+            f"{symbol}: Detected strike interval ${most_common_interval} "
+            f"from options chain"
+        )
+        self._strike_intervals[symbol] = most_common_interval
+        return most_common_interval
+
+    @staticmethod
+    def _fallback_strike_interval(stock_price: float) -> float:
+        """Standard strike interval for a price when the chain is unknown."""
         # Fallback to standard intervals based on stock price
         # Most liquid stocks use $1.00 intervals regardless of price
         # Only very low-priced or very high-priced stocks differ
@@ -530,6 +716,7 @@ class PremarketValidator:
         opportunities: list[StagedOpportunity],
         max_retries: int = 3,
         retry_delay: float = 10.0,
+        deadline_seconds: float | None = None,
     ) -> list[OpenCheckResult]:
         """Stage 2: Market-open validation (9:30 AM ET).
 
@@ -549,68 +736,197 @@ class PremarketValidator:
         Retry logic: If IBKR returns bid <= 0 (market not open yet), the
         result is PENDING and retried up to max_retries times with
         retry_delay seconds between attempts. After all retries, PENDING
-        results are converted to STALE.
+        results are converted to STALE. Opportunities not validated before
+        the deadline (including PENDING ones with no time left to retry)
+        are TIMED_OUT.
 
         Args:
             opportunities: List of READY opportunities from Stage 1
             max_retries: Max attempts for trades with invalid bids (default 3)
             retry_delay: Seconds between retries (default 10.0)
+            deadline_seconds: Batch budget (default config.open_deadline_seconds)
 
         Returns:
             List of OpenCheckResult with status for each
         """
         logger.info(f"Stage 2: Validating {len(opportunities)} ready opportunities")
+        if deadline_seconds is None:
+            deadline_seconds = self.config.open_deadline_seconds
+        deadline = time_mod.monotonic() + deadline_seconds
 
         remaining = list(opportunities)
         final_results: list[OpenCheckResult] = []
 
         for attempt in range(max_retries):
+            self._stock_prices.clear()
             batch_results: list[OpenCheckResult] = []
 
             for opp in remaining:
-                result = self._validate_at_open_single(opp)
+                if time_mod.monotonic() >= deadline:
+                    result = self._open_timed_out(opp, deadline_seconds)
+                else:
+                    result = self._validate_at_open_single(opp)
                 batch_results.append(result)
+                self._log_open_result(result)
+
+            remaining = self._settle_open_attempt(
+                batch_results, final_results, attempt, max_retries,
+                retry_delay, deadline, deadline_seconds,
+            )
+            if not remaining:
+                break
+            time_mod.sleep(retry_delay)
+
+        self._log_open_summary(final_results)
+        return final_results
+
+    async def validate_at_open_async(
+        self,
+        opportunities: list[StagedOpportunity],
+        max_retries: int = 3,
+        retry_delay: float = 10.0,
+        deadline_seconds: float | None = None,
+    ) -> list[OpenCheckResult]:
+        """Stage 2 with option quotes and underlying prices fetched concurrently.
+
+        Same decision tree and PENDING retry logic as validate_at_open().
+        Each attempt requests every option quote and each underlying price
+        (once per symbol) in parallel; opportunities whose data has not
+        arrived by the deadline are marked TIMED_OUT. Contracts that returned
+        no usable quote fall back to the sequential lookup while time remains.
+
+        Args:
+            opportunities: List of READY opportunities from Stage 1
+            max_retries: Max attempts for trades with invalid bids (default 3)
+            retry_delay: Seconds between retries (default 10.0)
+            deadline_seconds: Batch budget (default config.open_deadline_seconds)
+
+        Returns:
+            List of OpenCheckResult with status for each
+        """
+        logger.info(
+            f"Stage 2: Validating {len(opportunities)} ready opportunities "
+            f"(concurrent)"
+        )
+        if deadline_seconds is None:
+            deadline_seconds = self.config.open_deadline_seconds
+        deadline = time_mod.monotonic() + deadline_seconds
+
+        remaining = list(opportunities)
+        final_results: list[OpenCheckResult] = []
+
+        for attempt in range(max_retries):
+            self._stock_prices.clear()
+            quotes, late = await self._prefetch_open_quotes(remaining, deadline)
+            batch_results: list[OpenCheckResult] = []
 
-                if result.status == ValidationStatus.PENDING:
-                    status_emoji = "⏳"
-                    log_level = "warning"
-                elif result.passed:
-                    status_emoji = "✓"
-                    log_level = "info"
+            for opp in remaining:
+                quote = quotes.get(id(opp))
+                if quote is None and id(opp) not in late:
+                    if time_mod.monotonic() >= deadline:
+                        late.add(id(opp))
+                    else:
+                        # No usable concurrent quote: take the sequential path
+                        quote = self._get_option_quote(opp)
+
+                if id(opp) in late:
+                    result = self._open_timed_out(opp, deadline_seconds)
                 else:
-                    status_emoji = "✗"
-                    log_level = "warning"
+                    result = self._evaluate_at_open(opp, quote)
+                batch_results.append(result)
+                self._log_open_result(result)
+
+            remaining = self._settle_open_attempt(
+                batch_results, final_results, attempt, max_retries,
+                retry_delay, deadline, deadline_seconds,
+            )
+            if not remaining:
+                break
+            await asyncio.sleep(retry_delay)
+
+        self._log_open_summary(final_results)
+        return final_results
+
+    def _settle_open_attempt(
+        self,
+        batch_results: list[OpenCheckResult],
+        final_results: list[OpenCheckResult],
+        attempt: int,
+        max_retries: int,
+        retry_delay: float,
+        deadline: float,
+        deadline_seconds: float,
+    ) -> list[StagedOpportunity]:
+        """Move resolved results to final_results and decide what to retry.
+
+        Args:
+            batch_results: Results of this attempt
+            final_results: Accumulated final results (appended to)
+            attempt: Zero-based attempt number
+            max_retries: Max attempts
+            retry_delay: Seconds before the next attempt
+            deadline: time.monotonic() deadline for the batch
+            deadline_seconds: Batch budget (for the TIMED_OUT reason)
 
-                getattr(logger, log_level)(
-                    f"  {status_emoji} {opp.symbol}: {result.status.value} "
-                    f"(premium Δ {result.premium_deviation_pct:+.1%})"
+        Returns:
+            Opportunities to retry (empty when the batch is finished)
+        """
+        # Separate PENDING from resolved results
+        pending = [r for r in batch_results if r.status == ValidationStatus.PENDING]
+        resolved = [r for r in batch_results if r.status != ValidationStatus.PENDING]
+        final_results.extend(resolved)
+
+        if not pending:
+            return []
+
+        if attempt == max_retries - 1:
+            # Convert remaining PENDING to STALE on final attempt
+            for r in pending:
+                r.status = ValidationStatus.STALE
+                r.adjustment_reason = (
+                    f"No valid bid after {max_retries} attempts "
+                    f"({r.adjustment_reason})"
+                )
+            final_results.extend(pending)
+            return []
+
+        if time_mod.monotonic() + retry_delay >= deadline:
+            # No time left for another attempt
+            for r in pending:
+                r.status = ValidationStatus.TIMED_OUT
+                r.adjustment_reason = (
+                    f"No valid bid before the deadline "
+                    f"({self._deadline_reason(deadline_seconds)})"
                 )
+            final_results.extend(pending)
+            return []
 
-            # Separate PENDING from resolved results
-            pending = [r for r in batch_results if r.status == ValidationStatus.PENDING]
-            resolved = [r for r in batch_results if r.status != ValidationStatus.PENDING]
-            final_results.extend(resolved)
-
-            if not pending or attempt == max_retries - 1:
-                # Convert remaining PENDING to STALE on final attempt
-                for r in pending:
-                    r.status = ValidationStatus.STALE
-                    r.adjustment_reason = (
-                        f"No valid bid after {max_retries} attempts "
-                        f"({r.adjustment_reason})"
-                    )
-                final_results.extend(pending)
-                break
+        logger.info(
+            f"  ⏳ {len(pending)} trades have no valid bids, "
+            f"retrying in {retry_delay:.0f}s "
+            f"(attempt {attempt + 1}/{max_retries})..."
+        )
+        return [r.opportunity for r in pending]
+
+    def _log_open_result(self, result: OpenCheckResult) -> None:
+        """Log one Stage 2 result."""
+        if result.status in (ValidationStatus.PENDING, ValidationStatus.TIMED_OUT):
+            status_emoji = "⏳"
+            log_level = "warning"
+        elif result.passed:
+            status_emoji = "✓"
+            log_level = "info"
+        else:
+            status_emoji = "✗"
+            log_level = "warning"
 
-            logger.info(
-                f"  ⏳ {len(pending)} trades have no valid bids, "
-                f"retrying in {retry_delay:.0f}s "
-                f"(attempt {attempt + 1}/{max_retries})..."
-            )
-            time_mod.sleep(retry_delay)
-            remaining = [r.opportunity for r in pending]
+        getattr(logger, log_level)(
+            f"  {status_emoji} {result.opportunity.symbol}: {result.status.value} "
+            f"(premium Δ {result.premium_deviation_pct:+.1%})"
+        )
 
-        # Summary
+    def _log_open_summary(self, final_results: list[OpenCheckResult]) -> None:
+        """Log the Stage 2 summary line."""
         confirmed = sum(
             1 for r in final_results if r.status == ValidationStatus.READY
         )
@@ -618,13 +934,34 @@ class PremarketValidator:
             1 for r in final_results if r.status == ValidationStatus.ADJUSTED
         )
         stale = sum(1 for r in final_results if r.status == ValidationStatus.STALE)
+        timed_out = sum(
+            1 for r in final_results if r.status == ValidationStatus.TIMED_OUT
+        )
 
         logger.info(
             f"Stage 2 complete: {confirmed} CONFIRMED, "
             f"{adjusted} ADJUSTED, {stale} STALE"
+            + (f", {timed_out} TIMED_OUT" if timed_out else "")
         )
 
-        return final_results
+    def _open_timed_out(
+        self, opp: StagedOpportunity, deadline_seconds: float
+    ) -> OpenCheckResult:
+        """Stage 2 result for an opportunity the deadline cut off."""
+        staged_limit = opp.adjusted_limit_price or opp.staged_limit_price
+        return OpenCheckResult(
+            opportunity=opp,
+            status=ValidationStatus.TIMED_OUT,
+            staged_limit=staged_limit,
+            live_bid=opp.current_bid or 0.0,
+            live_ask=opp.current_ask or 0.0,
+            premium_deviation_pct=0.0,
+            adjustment_reason=self._deadline_reason(deadline_seconds),
+        )
+
+    @staticmethod
+    def _deadline_reason(deadline_seconds: float) -> str:
+        return f"Not validated within the {deadline_seconds:.0f}s deadline"
 
     def _validate_at_open_single(
         self, opp: StagedOpportunity
@@ -637,8 +974,20 @@ class PremarketValidator:
         Returns:
             OpenCheckResult with validation status
         """
-        # Get live quote
-        quote = self._get_option_quote(opp)
+        return self._evaluate_at_open(opp, self._get_option_quote(opp))
+
+    def _evaluate_at_open(
+        self, opp: StagedOpportunity, quote: dict | None
+    ) -> OpenCheckResult:
+        """Apply the Stage 2 decision tree to an already-fetched quote.
+
+        Args:
+            opp: The opportunity to validate
+            quote: Option quote dict with bid/ask, or None if unavailable
+
+        Returns:
+            OpenCheckResult with validation status
+        """
         effective_strike = opp.adjusted_strike or opp.strike
 
         if quote is None:
@@ -810,15 +1159,21 @@ class PremarketValidator:
         Returns:
             Current price or None if unavailable
         """
+        if symbol in self._stock_prices:
+            return self._stock_prices[symbol]
+
         if self.ibkr_client is None:
             return None
 
         try:
-            return self.ibkr_client.get_stock_price(symbol)
+            price = self.ibkr_client.get_stock_price(symbol)
         except Exception as e:
             logger.debug(f"Error getting stock price for {symbol}: {e}")
             return None
 
+        self._stock_prices[symbol] = price
+        return price
+
     def _get_option_quote(self, opp: StagedOpportunity) -> dict | None:
         """Get option quote from IBKR.
 
@@ -832,27 +1187,224 @@ class PremarketValidator:
             return None
 
         try:
-            effective_strike = opp.adjusted_strike or opp.strike
-
-            # Convert expiration to IBKR format (YYYYMMDD)
-            exp_str = opp.expiration
-            if isinstance(exp_str, str):
-                # Convert from ISO format "2026-02-13" to IBKR format "20260213"
-                exp_str = exp_str.replace("-", "")
-            else:
-                # Convert datetime to IBKR format
-                exp_str = exp_str.strftime("%Y%m%d")
-
             return self.ibkr_client.get_option_quote(
                 opp.symbol,
-                effective_strike,
-                exp_str,
+                opp.adjusted_strike or opp.strike,
+                self._ibkr_expiration(opp),
                 "P",  # Put
             )
         except Exception as e:
             logger.debug(f"Error getting option quote for {opp.symbol}: {e}")
             return None
 
+    @staticmethod
+    def _ibkr_expiration(opp: StagedOpportunity) -> str:
+        """Expiration in IBKR format (YYYYMMDD)."""
+        exp_str = opp.expiration
+        if isinstance(exp_str, str):
+            # Convert from ISO format "2026-02-13" to IBKR format "20260213"
+            return exp_str.replace("-", "")
+        # Convert datetime to IBKR format
+        return exp_str.strftime("%Y%m%d")
+
+    async def _prefetch_stock_prices(
+        self, symbols: set[str], deadline: float
+    ) -> set[str]:
+        """Fetch underlying prices for all symbols concurrently into the cache.
+
+        Args:
+            symbols: Symbols to price (one request each)
+            deadline: time.monotonic() deadline
+
+        Returns:
+            Symbols whose price did not arrive before the deadline
+        """
+        if self.ibkr_client is None or not symbols:
+            return set()
+
+        contracts = {s: self.ibkr_client.get_stock_contract(s) for s in symbols}
+        quotes, late = await self._fetch_quotes(contracts, deadline)
+        for symbol, quote in quotes.items():
+            price = _quote_price(quote)
+            if price is not None:
+                # Misses are left uncached so _get_stock_price() retries them
+                self._stock_prices[symbol] = price
+
+        logger.debug(
+            f"Prefetched {len(quotes)}/{len(symbols)} underlying prices"
+            + (f", {len(late)} late" if late else "")
+        )
+        return late
+
+    def _symbols_to_adjust(
+        self, opportunities: list[StagedOpportunity]
+    ) -> dict[str, float]:
+        """Symbols whose cached price puts them in the strike-adjustment bands.
+
+        Args:
+            opportunities: Opportunities being validated
+
+        Returns:
+            Current price keyed by symbol, for symbols without a known interval
+        """
+        symbols: dict[str, float] = {}
+        for opp in opportunities:
+            price = self._stock_prices.get(opp.symbol)
+            if price is None or opp.symbol in self._strike_intervals:
+                continue
+            deviation = abs(price - opp.staged_stock_price) / opp.staged_stock_price
+            if self.config.max_deviation_ready <= deviation < self.config.max_deviation_stale:
+                symbols[opp.symbol] = price
+        return symbols
+
+    async def _prefetch_strike_intervals(
+        self, symbols: dict[str, float], deadline: float
+    ) -> None:
+        """Look up option chains for all symbols concurrently into the cache.
+
+        Symbols whose chain is unusable are remembered for this pass, so
+        _determine_strike_interval() falls back to the standard interval
+        instead of repeating the lookup sequentially.
+
+        Args:
+            symbols: Current price keyed by symbol
+            deadline: time.monotonic() deadline
+        """
+        if self.ibkr_client is None or not symbols:
+            return
+        remaining = deadline - time_mod.monotonic()
+        if remaining <= 0:
+            return
+
+        async def lookup(symbol: str, price: float) -> None:
+            contract = self.ibkr_client.get_stock_contract(symbol)
+            qualified = await self.ibkr_client.qualify_contracts_async(contract)
+            if not qualified:
+                self._chain_misses.add(symbol)
+                return
+            stock = qualified[0]
+            chains = await self.ibkr_client.get_option_chain_definitions_async(
+                stock.symbol, sec_type=stock.secType, con_id=stock.conId
+            )
+            if self._interval_from_chains(symbol, chains, price) is None:
+                self._chain_misses.add(symbol)
+
+        tasks = {
+            symbol: asyncio.ensure_future(lookup(symbol, price))
+            for symbol, price in symbols.items()
+        }
+        done, pending = await asyncio.wait(tasks.values(), timeout=remaining)
+        for task in pending:
+            task.cancel()
+        for symbol, task in tasks.items():
+            if task not in done or task.exception() is not None:
+                if task in done:
+                    logger.debug(
+                        f"{symbol}: Could not detect strike interval from chain: "
+                        f"{task.exception()}"
+                    )
+                self._chain_misses.add(symbol)
+
+        found = sum(1 for symbol in symbols if symbol in self._strike_intervals)
+        logger.debug(f"Prefetched strike intervals for {found}/{len(symbols)} symbols")
+
+    async def _prefetch_open_quotes(
+        self, opportunities: list[StagedOpportunity], deadline: float
+    ) -> tuple[dict[int, dict | None], set[int]]:
+        """Fetch option quotes and underlying prices concurrently.
+
+        Args:
+            opportunities: Opportunities to quote
+            deadline: time.monotonic() deadline
+
+        Returns:
+            (option quote dict or None keyed by id(opp),
+             ids of opportunities whose data missed the deadline)
+        """
+        if self.ibkr_client is None or not opportunities:
+            return {}, set()
+
+        option_contracts = {
+            id(opp): self.ibkr_client.get_option_contract(
+                symbol=opp.symbol,
+                expiration=self._ibkr_expiration(opp),
+                strike=opp.adjusted_strike or opp.strike,
+                right="P",
+            )
+            for opp in opportunities
+        }
+
+        (late_symbols, (option_quotes, late)) = await asyncio.gather(
+            self._prefetch_stock_prices({o.symbol for o in opportunities}, deadline),
+            self._fetch_quotes(option_contracts, deadline),
+        )
+
+        late |= {id(o) for o in opportunities if o.symbol in late_symbols}
+        return (
+            {key: _option_quote_dict(q) for key, q in option_quotes.items()},
+            late,
+        )
+
+    async def _fetch_quotes(
+        self, contracts: dict, deadline: float
+    ) -> tuple[dict, set]:
+        """Qualify and quote contracts in parallel, bounded by the deadline.
+
+        Args:
+            contracts: Unqualified contracts keyed by caller-chosen key
+            deadline: time.monotonic() deadline
+
+        Returns:
+            (Quote or None per key that completed, keys still outstanding
+             at the deadline)
+        """
+        remaining = deadline - time_mod.monotonic()
+        if remaining <= 0:
+            return {}, set(contracts)
+
+        try:
+            qualified = await asyncio.wait_for(
+                self.ibkr_client.qualify_contracts_async(*contracts.values()),
+                timeout=remaining,
+            )
+        except asyncio.TimeoutError:
+            return {}, set(contracts)
+        except Exception as e:
+            logger.debug(f"Contract qualification failed: {e}")
+            qualified = []
+
+        # ib_async qualifies in place and the client drops failures
+        qualified_ids = {id(c) for c in qualified}
+        quotes: dict = {
+            key: None for key, c in contracts.items() if id(c) not in qualified_ids
+        }
+
+        timeout = min(self.config.quote_timeout_seconds, remaining)
+        tasks = {
+            key: asyncio.ensure_future(self.ibkr_client.get_quote(c, timeout=timeout))
+            for key, c in contracts.items()
+            if id(c) in qualified_ids
+        }
+        if not tasks:
+            return quotes, set()
+
+        done, pending = await asyncio.wait(
+            tasks.values(), timeout=max(0.0, deadline - time_mod.monotonic())
+        )
+        for task in pending:
+            task.cancel()
+
+        late = set()
+        for key, task in tasks.items():
+            if task not in done:
+                late.add(key)
+            elif task.exception() is not None:
+                logger.debug(f"Quote failed for {key}: {task.exception()}")
+                quotes[key] = None
+            else:
+                quotes[key] = task.result()
+        return quotes, late
+
     def get_target_state_for_result(
         self,
         result: PremarketCheckResult | OpenCheckResult,
@@ -874,6 +1426,7 @@ class PremarketValidator:
             elif result.status == ValidationStatus.ADJUSTED:
                 return OpportunityState.READY  # Adjusted and ready
             else:
+                # STALE and TIMED_OUT
                 return OpportunityState.STALE
 
         else:
@@ -19,6 +19,7 @@ from enum import Enum
 from loguru import logger
 
 from src.services.adaptive_order_executor import AdaptiveOrderExecutor, LiveQuote
+from src.services.execution_latency import LatencyRecorder, OrderLatency
 from src.services.premarket_validator import StagedOpportunity
 from src.broker.protocols import BrokerClient
 
@@ -27,6 +28,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.execution.risk_governor import RiskGovernor
+    from src.services.execution_prewarm import PrewarmCache
 
 
 class OrderStatus(Enum):
@@ -61,6 +63,7 @@ class PendingOrder:
         filled_qty: Quantity filled
         order_type: Type of order (Adaptive, LIMIT, etc.)
         adjustment_count: Number of price adjustments made
+        latency: Lifecycle timings for latency telemetry (None if untracked)
     """
 
     staged: StagedOpportunity
@@ -78,6 +81,7 @@ class PendingOrder:
     filled_qty: int = 0
     remaining_qty: int = 0
     adjustment_count: int = 0
+    latency: OrderLatency | None = None
 
 
 @dataclass
@@ -126,10 +130,12 @@ class ExecutionReport:
         skipped: List of skipped trades
         failed: List of failed trades
         total_premium: Total premium from fills
+        last_submission_at: When the last order of the batch was submitted
     """
 
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
+    last_submission_at: datetime | None = None
     submission_time: float = 0.0
     monitoring_time: float = 0.0
     submitted: list[ExecutionSummary] = field(default_factory=list)
@@ -177,6 +183,7 @@ class ExecutionReport:
         order_type: str,
     ) -> None:
         """Add a submitted trade."""
+        self.last_submission_at = datetime.now()
         self.submitted.append(
             ExecutionSummary(
                 symbol=staged.symbol,
@@ -300,6 +307,7 @@ class RapidFireExecutor:
         self.adaptive_executor = adaptive_executor
         self.risk_governor = risk_governor
         self.pending_orders: dict[int, PendingOrder] = {}
+        self.latency = LatencyRecorder()
         self.max_wait = int(os.getenv("RAPID_FIRE_MAX_WAIT_SECONDS", "120"))
         self.adjustment_threshold = float(os.getenv("ADJUSTMENT_THRESHOLD", "0.02"))
 
@@ -332,6 +340,10 @@ class RapidFireExecutor:
             pending.last_status = trade.orderStatus.status
             pending.last_update = datetime.now()
             pending.remaining_qty = int(trade.orderStatus.remaining)
+            if pending.latency:
+                pending.latency.on_status(
+                    trade.orderStatus.status, trade.orderStatus.filled
+                )
 
             if trade.orderStatus.status == "Filled":
                 pending.fill_price = trade.orderStatus.avgFillPrice
@@ -346,6 +358,7 @@ class RapidFireExecutor:
     async def execute_all(
         self,
         staged_trades: list[StagedOpportunity],
+        prewarm: "PrewarmCache | None" = None,
     ) -> ExecutionReport:
         """Execute all staged trades using rapid-fire parallel submission.
 
@@ -357,8 +370,12 @@ class RapidFireExecutor:
             T+??:   Condition-based adjustments (when limit > $0.02 outside spread)
             T+120:  Final status, leave unfilled as DAY orders
 
+        With a pre-warm cache, T+0 and T+1 collapse to a cache lookup and a
+        read of the streaming ticker for every trade prepared before the open.
+
         Args:
             staged_trades: List of staged opportunities to execute
+            prewarm: Optional PrewarmCache from ExecutionPrewarmer
 
         Returns:
             ExecutionReport with complete execution details
@@ -370,36 +387,27 @@ class RapidFireExecutor:
         report = ExecutionReport()
         submission_start = time.time()
 
+        # Latency telemetry: the decision to execute is the zero point
+        latencies = [self.latency.start(staged) for staged in staged_trades]
+
         logger.info(
             f"🚀 RAPID FIRE: Starting parallel execution for {len(staged_trades)} trades"
         )
 
         # Step 1: Pre-qualify contracts in batch (parallel)
-        logger.info("Step 1: Pre-qualifying all contracts in batch...")
-        contracts = []
-        for staged in staged_trades:
-            # Get expiration in IBKR format
-            exp_str = staged.expiration
-            if isinstance(exp_str, str):
-                exp_str = exp_str.replace("-", "")
-            else:
-                exp_str = exp_str.strftime("%Y%m%d")
-
-            contract = self.client.get_option_contract(
-                symbol=staged.symbol,
-                expiration=exp_str,
-                strike=staged.strike,
-                right="P",
+        if prewarm is not None:
+            staged_trades, latencies, qualified, prewarmed = (
+                await self._resolve_prewarmed(staged_trades, latencies, prewarm, report)
             )
-            contracts.append(contract)
-
-        # Batch qualify all at once
-        qualified = await self.client.qualify_contracts_async(*contracts)
-
-        if len(qualified) != len(contracts):
-            logger.warning(
-                f"Only {len(qualified)}/{len(contracts)} contracts qualified"
+        else:
+            qualified, _ = await self._qualify_all(staged_trades)
+            staged_trades, latencies, qualified = self._align_qualified(
+                staged_trades, latencies, qualified, report
             )
+            prewarmed = [None] * len(qualified)
+
+        for latency in latencies:
+            latency.mark("contract_ready")
 
         # Step 2: Request live quotes for ALL contracts (parallel)
         # Use a longer timeout at market open — 0.5s is too short for
@@ -410,8 +418,15 @@ class RapidFireExecutor:
             f"(parallel, {quote_timeout}s timeout)..."
         )
 
-        # Use IBKRClient's batch quote method (clean architecture)
-        raw_quotes = await self.client.get_quotes_batch(qualified, timeout=quote_timeout)
+        if prewarm is not None:
+            raw_quotes = await self._prewarmed_quotes(
+                qualified, prewarmed, quote_timeout
+            )
+        else:
+            # Use IBKRClient's batch quote method (clean architecture)
+            raw_quotes = await self.client.get_quotes_batch(
+                qualified, timeout=quote_timeout
+            )
 
         # Log quote validity summary
         valid_count = sum(1 for q in raw_quotes if q.is_valid)
@@ -456,12 +471,6 @@ class RapidFireExecutor:
         logger.info("Step 3: 🔥 RAPID FIRE - Submitting all orders NOW")
 
         # Validate list lengths before zip (detect silent truncation)
-        if len(qualified) != len(staged_trades):
-            logger.critical(
-                f"🛑 CONTRACT QUALIFICATION MISMATCH: "
-                f"{len(qualified)}/{len(staged_trades)} contracts qualified — "
-                f"trades beyond index {len(qualified)} will be silently dropped!"
-            )
         if len(quotes) != len(staged_trades):
             logger.critical(
                 f"🛑 QUOTE COUNT MISMATCH: "
@@ -470,16 +479,19 @@ class RapidFireExecutor:
             )
 
         # Track trades dropped by zip truncation
-        processed_count = min(len(staged_trades), len(qualified), len(quotes))
+        processed_count = min(len(staged_trades), len(quotes))
         if processed_count < len(staged_trades):
             for i in range(processed_count, len(staged_trades)):
                 dropped = staged_trades[i]
                 logger.critical(
                     f"🛑 {dropped.symbol}: DROPPED — not processed due to list length mismatch"
                 )
-                report.add_failed(dropped, None, "Dropped: qualification/quote list mismatch")
+                report.add_failed(dropped, None, "Dropped: quote list mismatch")
 
-        for staged, contract, quote in zip(staged_trades, qualified, quotes):
+        # Quotes may be short (reported as dropped above); the rest are aligned
+        for staged, contract, quote, latency, entry in zip(
+            staged_trades, qualified, quotes, latencies, prewarmed, strict=False
+        ):
             if not quote.is_tradeable:
                 reason = quote.reason or f"Premium ${quote.limit:.2f} < min ${self.min_premium:.2f}"
                 logger.warning(
@@ -488,10 +500,17 @@ class RapidFireExecutor:
                 report.add_skipped(staged, reason)
                 continue
 
-            # Place order using adaptive executor
-            result = await self.adaptive_executor.place_order(staged, contract, quote)
+            # Place order using adaptive executor (pre-built order if pre-warmed)
+            if entry is not None and entry.order is not None:
+                result = await self.adaptive_executor.place_order(
+                    staged, contract, quote, order=entry.order
+                )
+            else:
+                result = await self.adaptive_executor.place_order(staged, contract, quote)
 
             if result.success:
+                latency.mark("submitted")
+                latency.order_id = result.order_id
                 # Track as pending for monitoring
                 self.pending_orders[result.order_id] = PendingOrder(
                     staged=staged,
@@ -503,6 +522,7 @@ class RapidFireExecutor:
                     last_ask=quote.ask,
                     submitted_at=datetime.now(),
                     order_type=result.order_type,
+                    latency=latency,
                 )
                 report.add_submitted(staged, result.order_id, quote.limit, result.order_type)
             else:
@@ -540,8 +560,162 @@ class RapidFireExecutor:
 
         report.completed_at = datetime.now()
 
+        # Persist this batch's latency records now rather than at cleanup()
+        self.latency.flush()
+
         return report
 
+    async def _qualify_all(
+        self,
+        staged_trades: list[StagedOpportunity],
+    ) -> tuple[list, list]:
+        """Build and batch-qualify option contracts for all staged trades.
+
+        Returns:
+            Tuple of (qualified contracts, prewarmed entries — all None)
+        """
+        logger.info("Step 1: Pre-qualifying all contracts in batch...")
+        contracts = []
+        for staged in staged_trades:
+            # Get expiration in IBKR format
+            exp_str = staged.expiration
+            if isinstance(exp_str, str):
+                exp_str = exp_str.replace("-", "")
+            else:
+                exp_str = exp_str.strftime("%Y%m%d")
+
+            contract = self.client.get_option_contract(
+                symbol=staged.symbol,
+                expiration=exp_str,
+                strike=staged.strike,
+                right="P",
+            )
+            contracts.append(contract)
+
+        # Batch qualify all at once
+        qualified = await self.client.qualify_contracts_async(*contracts)
+
+        if len(qualified) != len(contracts):
+            logger.warning(
+                f"Only {len(qualified)}/{len(contracts)} contracts qualified"
+            )
+
+        return qualified, [None] * len(qualified)
+
+    def _align_qualified(
+        self,
+        staged_trades: list[StagedOpportunity],
+        latencies: list[OrderLatency],
+        qualified: list,
+        report: ExecutionReport,
+    ) -> tuple[list, list, list]:
+        """Match qualified contracts back to their staged trades.
+
+        Batch qualification drops contracts that IBKR rejects, which shifts
+        the rest. When any are missing, contracts are matched by contract
+        key and the unmatched trades are reported as failed.
+
+        Returns:
+            Aligned lists (staged_trades, latencies, qualified)
+        """
+        if len(qualified) == len(staged_trades):
+            return staged_trades, latencies, qualified
+
+        from src.services.execution_prewarm import contract_key, staged_key
+
+        by_key = {
+            contract_key(c.symbol, c.strike, c.lastTradeDateOrContractMonth): c
+            for c in qualified
+        }
+        out_staged, out_latencies, out_contracts = [], [], []
+        for staged, latency in zip(staged_trades, latencies, strict=True):
+            contract = by_key.get(staged_key(staged))
+            if contract is None:
+                logger.warning(f"{staged.symbol}: contract not qualified — not submitted")
+                report.add_failed(staged, None, "Contract qualification failed")
+                continue
+            out_staged.append(staged)
+            out_latencies.append(latency)
+            out_contracts.append(contract)
+        return out_staged, out_latencies, out_contracts
+
+    async def _resolve_prewarmed(
+        self,
+        staged_trades: list[StagedOpportunity],
+        latencies: list[OrderLatency],
+        prewarm: "PrewarmCache",
+        report: ExecutionReport,
+    ) -> tuple[list, list, list, list]:
+        """Take contracts from the pre-warm cache, qualifying only cache misses.
+
+        Misses (e.g. strikes changed by adaptive selection after pre-warm) are
+        qualified in one batch and matched back by contract key. Anything that
+        still cannot be qualified is reported as failed rather than dropped.
+
+        Returns:
+            Aligned lists (staged_trades, latencies, qualified, prewarmed)
+        """
+        from src.services.execution_prewarm import contract_key, staged_key
+
+        entries = [prewarm.get(staged) for staged in staged_trades]
+        misses = [s for s, e in zip(staged_trades, entries, strict=True) if e is None]
+        logger.info(
+            f"Step 1: {len(staged_trades) - len(misses)}/{len(staged_trades)} "
+            f"contracts from pre-warm cache"
+            + (f", qualifying {len(misses)} misses..." if misses else "")
+        )
+
+        qualified_misses = {}
+        if misses:
+            miss_qualified, _ = await self._qualify_all(misses)
+            qualified_misses = {
+                contract_key(c.symbol, c.strike, c.lastTradeDateOrContractMonth): c
+                for c in miss_qualified
+            }
+
+        out_staged, out_latencies, out_contracts, out_entries = [], [], [], []
+        for staged, latency, entry in zip(staged_trades, latencies, entries, strict=True):
+            contract = entry.contract if entry else qualified_misses.get(staged_key(staged))
+            if contract is None:
+                logger.warning(f"{staged.symbol}: contract not qualified — not submitted")
+                report.add_failed(staged, None, "Contract qualification failed")
+                continue
+            out_staged.append(staged)
+            out_latencies.append(latency)
+            out_contracts.append(contract)
+            out_entries.append(entry)
+
+        return out_staged, out_latencies, out_contracts, out_entries
+
+    async def _prewarmed_quotes(
+        self,
+        qualified: list,
+        prewarmed: list,
+        timeout: float,
+    ) -> list:
+        """Read quotes from pre-warm tickers, fetching only what is missing.
+
+        Streaming tickers are read without a round-trip; trades without a
+        usable streaming bid/ask fall back to a batch quote request.
+        """
+        raw_quotes = [
+            entry.snapshot_quote() if entry else None for entry in prewarmed
+        ]
+        missing = [
+            i for i, q in enumerate(raw_quotes) if q is None or not q.is_valid
+        ]
+        if missing:
+            fetched = await self.client.get_quotes_batch(
+                [qualified[i] for i in missing], timeout=timeout
+            )
+            for i, quote in zip(missing, fetched):
+                raw_quotes[i] = quote
+        logger.info(
+            f"  {len(raw_quotes) - len(missing)}/{len(raw_quotes)} quotes "
+            f"from streaming subscriptions"
+        )
+        return raw_quotes
+
     async def _monitor_and_adjust(self, report: ExecutionReport):
         """Monitor fills and adjust unfilled orders when condition met.
 
@@ -573,10 +747,22 @@ class RapidFireExecutor:
                         pending.adjustment_count,
                     )
                     filled_ids.append(order_id)
+                    if self.risk_governor:
+                        self.risk_governor.record_fill(
+                            pending.staged.symbol,
+                            pending.staged.strike,
+                            pending.staged.expiration,
+                        )
 
                 elif pending.last_status in ("Cancelled", "Inactive", "ApiCancelled"):
                     report.add_failed(pending.staged, order_id, pending.last_status)
                     filled_ids.append(order_id)
+                    if self.risk_governor:
+                        self.risk_governor.record_order_cancelled(
+                            pending.staged.symbol,
+                            pending.staged.strike,
+                            pending.staged.expiration,
+                        )
 
             # Remove completed orders from pending
             for order_id in filled_ids:
@@ -681,6 +867,7 @@ class RapidFireExecutor:
         Returns:
             True if modification successful, False otherwise
         """
+        modify_start = time.perf_counter()
         try:
             # Cancel existing order
             await self.client.cancel_order(
@@ -711,6 +898,9 @@ class RapidFireExecutor:
                 pending.order_id = result.order_id
                 self.pending_orders[result.order_id] = pending
                 del self.pending_orders[old_id]
+                if pending.latency:
+                    pending.latency.record_modify(modify_start)
+                    pending.latency.order_id = result.order_id
                 return True
             else:
                 logger.error(
@@ -728,7 +918,11 @@ class RapidFireExecutor:
         Call this at the end of the session (after final reconciliation
         and database save) to release resources. After cleanup, the
         executor should not be reused.
+
+        Latency records not yet persisted by execute_all() are flushed
+        here.
         """
+        self.latency.flush()
         self.pending_orders.clear()
         self.client.order_status_event -= self._on_order_status
         logger.debug("RapidFireExecutor cleanup complete")
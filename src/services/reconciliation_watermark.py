@@ -0,0 +1,159 @@
+"""Persisted execution watermark for incremental order reconciliation.
+
+Order reconciliation used to pull the full execution history from TWS on
+every run. The watermark records the newest execution already processed
+(execution time plus the execIds at that timestamp, since several fills can
+share a second), so the next run only asks TWS for executions at or after
+that time and drops the ones it has already seen.
+
+The watermark lives in the ``reconciliation_watermarks`` table, so it is
+shared by every process that reconciles: whichever of the daemon's EOD sync,
+the dashboard's Sync Orders button or the CLI runs first processes a new
+execution, and the others skip it.
+
+Example:
+    >>> store = ReconciliationWatermarkStore(session)
+    >>> reconciler = OrderReconciliation(client, trade_repo, watermarks=store)
+    >>> report = await reconciler.sync_all_orders()           # incremental
+    >>> report = await reconciler.sync_all_orders(full=True)  # full resync
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from src.data.models import ReconciliationWatermark
+from src.utils.timezone import utc_now
+
+ORDER_SCOPE = "orders"
+
+
+def execution_time_utc(fill) -> datetime | None:
+    """Naive-UTC execution time of an IBKR Fill (None if unavailable)."""
+    exec_time = getattr(getattr(fill, "execution", None), "time", None)
+    if not isinstance(exec_time, datetime):
+        return None
+    if exec_time.tzinfo is not None:
+        exec_time = exec_time.astimezone(timezone.utc).replace(tzinfo=None)
+    return exec_time
+
+
+@dataclass
+class Watermark:
+    """Detached copy of the persisted watermark.
+
+    Attributes:
+        last_exec_time: Naive-UTC time of the newest processed execution
+        boundary_exec_ids: execIds processed at exactly last_exec_time
+        last_exec_id: execId of the newest processed execution
+        last_perm_id: permId of the newest processed execution
+        last_sync_at: When any sync last completed
+        last_full_sync_at: When a full history sync last completed
+        last_summary: Counts reported by the last sync
+    """
+
+    last_exec_time: datetime | None = None
+    boundary_exec_ids: set[str] = field(default_factory=set)
+    last_exec_id: str | None = None
+    last_perm_id: int | None = None
+    last_sync_at: datetime | None = None
+    last_full_sync_at: datetime | None = None
+    last_summary: dict = field(default_factory=dict)
+
+    def is_new(self, fill) -> bool:
+        """Whether a fill is newer than the watermark."""
+        if self.last_exec_time is None:
+            return True
+        exec_time = execution_time_utc(fill)
+        if exec_time is None:
+            # No timestamp: fall back to the execId boundary only
+            return fill.execution.execId not in self.boundary_exec_ids
+        if exec_time > self.last_exec_time:
+            return True
+        if exec_time == self.last_exec_time:
+            return fill.execution.execId not in self.boundary_exec_ids
+        return False
+
+    def advance(self, fills: list) -> None:
+        """Move the watermark past the given fills."""
+        for fill in fills:
+            exec_time = execution_time_utc(fill)
+            if exec_time is None:
+                continue
+            ex = fill.execution
+            if self.last_exec_time is None or exec_time > self.last_exec_time:
+                self.last_exec_time = exec_time
+                self.boundary_exec_ids = {ex.execId}
+                self.last_exec_id = ex.execId
+                self.last_perm_id = ex.permId or None
+            elif exec_time == self.last_exec_time:
+                self.boundary_exec_ids.add(ex.execId)
+
+
+class ReconciliationWatermarkStore:
+    """Load and save the reconciliation watermark for one scope."""
+
+    def __init__(self, session: Session, scope: str = ORDER_SCOPE):
+        """Initialize store.
+
+        Args:
+            session: SQLAlchemy session (caller owns the transaction)
+            scope: Watermark scope (one row per scope)
+        """
+        self.session = session
+        self.scope = scope
+
+    def load(self) -> Watermark | None:
+        """Load the watermark, or None if no sync has recorded one yet."""
+        try:
+            row = self._row()
+        except Exception as e:
+            logger.warning(f"Could not load reconciliation watermark: {e}")
+            return None
+        if row is None:
+            return None
+        return Watermark(
+            last_exec_time=row.last_exec_time,
+            boundary_exec_ids=set(row.boundary_exec_ids or []),
+            last_exec_id=row.last_exec_id,
+            last_perm_id=row.last_perm_id,
+            last_sync_at=row.last_sync_at,
+            last_full_sync_at=row.last_full_sync_at,
+            last_summary=dict(row.last_summary or {}),
+        )
+
+    def save(self, watermark: Watermark, full: bool, summary: dict) -> None:
+        """Persist the watermark after a completed sync.
+
+        Args:
+            watermark: Watermark advanced past every processed execution
+            full: Whether the sync was a full history sync
+            summary: Counts to record for the last sync
+        """
+        now = utc_now()
+        try:
+            row = self._row()
+            if row is None:
+                row = ReconciliationWatermark(scope=self.scope)
+                self.session.add(row)
+            row.last_exec_time = watermark.last_exec_time
+            row.boundary_exec_ids = sorted(watermark.boundary_exec_ids)
+            row.last_exec_id = watermark.last_exec_id
+            row.last_perm_id = watermark.last_perm_id
+            row.last_sync_at = now
+            if full:
+                row.last_full_sync_at = now
+            row.last_summary = summary
+            self.session.commit()
+        except Exception as e:
+            logger.warning(f"Could not save reconciliation watermark: {e}")
+            self.session.rollback()
+
+    def _row(self) -> ReconciliationWatermark | None:
+        return (
+            self.session.query(ReconciliationWatermark)
+            .filter(ReconciliationWatermark.scope == self.scope)
+            .first()
+        )
@@ -0,0 +1,287 @@
+"""Retention and archival for the daemon's append-only tables.
+
+daemon_events, decision_audit, guardrail_metrics and claude_api_costs grow
+forever, and every pending-event poll, /api/decisions page and cost
+aggregation gets slower as they do. RetentionService moves rows past their
+retention age out of the hot tables:
+
+- PostgreSQL: into ``<table>_archive`` tables (same columns, created on
+  first use, JSON/Text columns lz4-compressed where supported) with one
+  ``WITH moved AS (DELETE ... RETURNING ...) INSERT ...`` per batch.
+- SQLite: into gzip-compressed JSON-lines files, one per table and month
+  (``<archive_dir>/<table>/<YYYY-MM>.jsonl.gz``), then deleted.
+
+Rows that are still referenced by a hot row (a decision_audit row pointing
+at an event, an embedding pointing at a decision) stay until the referrer
+is archived, so foreign keys are never broken.
+
+Example:
+    >>> service = RetentionService(session)
+    >>> for result in service.run():
+    ...     print(result.table, result.rows_archived, result.rows_per_second)
+"""
+
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import delete, exists, func, inspect, select, text
+from sqlalchemy.orm import Session
+
+from src.data.models import (
+    ClaudeApiCost,
+    DaemonEvent,
+    DecisionAudit,
+    DecisionEmbedding,
+    GuardrailMetric,
+)
+from src.utils.timezone import utc_now
+
+DEFAULT_ARCHIVE_DIR = "data/archive"
+
+
+@dataclass
+class RetentionPolicy:
+    """How long rows of one table stay hot, and which rows may move."""
+
+    model: type
+    age_column: str
+    retention_days: int
+    # Only rows whose status is one of these (None = any row)
+    statuses: Optional[tuple[str, ...]] = None
+    # (model, column) pairs whose rows must not point at an archived row
+    referenced_by: list[tuple[type, str]] = field(default_factory=list)
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__
+
+
+DEFAULT_POLICIES = [
+    RetentionPolicy(
+        ClaudeApiCost,
+        "timestamp",
+        retention_days=int(os.getenv("RETENTION_CLAUDE_API_COSTS_DAYS", "180")),
+    ),
+    RetentionPolicy(
+        GuardrailMetric,
+        "metric_date",
+        retention_days=int(os.getenv("RETENTION_GUARDRAIL_METRICS_DAYS", "365")),
+    ),
+    # decision_audit before daemon_events: archiving a decision frees its event
+    RetentionPolicy(
+        DecisionAudit,
+        "timestamp",
+        retention_days=int(os.getenv("RETENTION_DECISION_AUDIT_DAYS", "365")),
+        referenced_by=[
+            (DecisionEmbedding, "decision_audit_id"),
+            (ClaudeApiCost, "decision_audit_id"),
+        ],
+    ),
+    RetentionPolicy(
+        DaemonEvent,
+        "created_at",
+        retention_days=int(os.getenv("RETENTION_DAEMON_EVENTS_DAYS", "30")),
+        statuses=("completed", "failed"),
+        referenced_by=[(DecisionAudit, "event_id")],
+    ),
+]
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of archiving one table."""
+
+    table: str
+    rows_archived: int = 0
+    seconds: float = 0.0
+    destination: str = ""
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_archived / self.seconds if self.seconds > 0 else 0.0
+
+
+def _jsonable(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class RetentionService:
+    """Archive rows past their retention age and report table sizes."""
+
+    def __init__(
+        self,
+        db_session: Session,
+        policies: Optional[list[RetentionPolicy]] = None,
+        archive_dir: Optional[str] = None,
+        batch_size: int = 1000,
+    ):
+        """Initialize retention service.
+
+        Args:
+            db_session: SQLAlchemy session
+            policies: Tables to archive (defaults to DEFAULT_POLICIES)
+            archive_dir: Directory for SQLite archive files
+                (RETENTION_ARCHIVE_DIR, default data/archive)
+            batch_size: Rows moved per transaction
+        """
+        self.db = db_session
+        self.policies = policies if policies is not None else DEFAULT_POLICIES
+        self.archive_dir = Path(
+            archive_dir or os.getenv("RETENTION_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR)
+        )
+        self.batch_size = batch_size
+        self.is_postgres = self.db.get_bind().dialect.name == "postgresql"
+
+    def run(self, dry_run: bool = False) -> list[ArchiveResult]:
+        """Archive every policy's eligible rows.
+
+        Args:
+            dry_run: Count eligible rows without moving them
+
+        Returns:
+            One ArchiveResult per table, in policy order
+        """
+        return [self.archive(policy, dry_run=dry_run) for policy in self.policies]
+
+    def archive(self, policy: RetentionPolicy, dry_run: bool = False) -> ArchiveResult:
+        """Move one table's eligible rows to its archive, in batches."""
+        result = ArchiveResult(table=policy.table)
+        if dry_run:
+            result.rows_archived = self.db.execute(
+                select(func.count()).select_from(self._eligible_ids(policy).subquery())
+            ).scalar()
+            return result
+
+        move = self._move_to_table if self.is_postgres else self._move_to_file
+        start = time.perf_counter()
+        while True:
+            ids = list(self.db.execute(self._eligible_ids(policy).limit(self.batch_size)).scalars())
+            if not ids:
+                break
+            result.destination = move(policy, ids)
+            self.db.commit()
+            result.rows_archived += len(ids)
+            if len(ids) < self.batch_size:
+                break
+        result.seconds = time.perf_counter() - start
+
+        if result.rows_archived:
+            logger.info(
+                f"Archived {result.rows_archived} {policy.table} rows to "
+                f"{result.destination} ({result.rows_per_second:.0f} rows/s)"
+            )
+        return result
+
+    def table_sizes(self) -> list[dict]:
+        """Row counts (and on PostgreSQL, bytes) of each hot and archive table.
+
+        Returns:
+            [{"table", "rows", "bytes", "archive_rows", "archive_bytes"}]
+        """
+        sizes = []
+        for policy in self.policies:
+            entry = {
+                "table": policy.table,
+                "rows": self.db.query(func.count()).select_from(policy.model).scalar(),
+                "bytes": None,
+                "archive_rows": None,
+                "archive_bytes": None,
+            }
+            if self.is_postgres:
+                entry["bytes"] = self._relation_bytes(policy.table)
+                archive = f"{policy.table}_archive"
+                if inspect(self.db.get_bind()).has_table(archive):
+                    entry["archive_rows"] = self.db.execute(
+                        text(f"SELECT count(*) FROM {archive}")
+                    ).scalar()
+                    entry["archive_bytes"] = self._relation_bytes(archive)
+            else:
+                files = list((self.archive_dir / policy.table).glob("*.jsonl.gz"))
+                entry["archive_bytes"] = sum(f.stat().st_size for f in files)
+            sizes.append(entry)
+        return sizes
+
+    # ------------------------------------------------------------------
+
+    def _eligible_ids(self, policy: RetentionPolicy):
+        model = policy.model
+        age = getattr(model, policy.age_column)
+        cutoff = utc_now() - timedelta(days=policy.retention_days)
+        if age.type.python_type is date:
+            cutoff = cutoff.date()
+        query = select(model.id).where(age < cutoff)
+        if policy.statuses:
+            query = query.where(model.status.in_(policy.statuses))
+        for ref_model, ref_column in policy.referenced_by:
+            query = query.where(~exists().where(getattr(ref_model, ref_column) == model.id))
+        return query.order_by(model.id)
+
+    def _columns(self, policy: RetentionPolicy) -> list[str]:
+        return [c.name for c in policy.model.__table__.columns]
+
+    def _move_to_table(self, policy: RetentionPolicy, ids: list[int]) -> str:
+        """PostgreSQL: move rows into <table>_archive in one statement."""
+        archive = f"{policy.table}_archive"
+        self._ensure_archive_table(policy, archive)
+        columns = ", ".join(self._columns(policy))
+        self.db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {policy.table} WHERE id = ANY(:ids) "
+                f"RETURNING {columns}) "
+                f"INSERT INTO {archive} ({columns}) SELECT {columns} FROM moved"
+            ),
+            {"ids": ids},
+        )
+        return archive
+
+    def _ensure_archive_table(self, policy: RetentionPolicy, archive: str) -> None:
+        if inspect(self.db.get_bind()).has_table(archive):
+            return
+        self.db.execute(text(f"CREATE TABLE {archive} (LIKE {policy.table} INCLUDING DEFAULTS)"))
+        self.db.execute(text(f"ALTER TABLE {archive} ADD PRIMARY KEY (id)"))
+        for column in policy.model.__table__.columns:
+            if column.type.__class__.__name__ in ("JSON", "Text"):
+                try:
+                    with self.db.begin_nested():
+                        self.db.execute(
+                            text(f"ALTER TABLE {archive} ALTER COLUMN {column.name} SET COMPRESSION lz4")
+                        )
+                except Exception as e:
+                    logger.debug(f"lz4 compression unavailable for {archive}.{column.name}: {e}")
+        logger.info(f"Created archive table {archive}")
+
+    def _move_to_file(self, policy: RetentionPolicy, ids: list[int]) -> str:
+        """SQLite: append rows to monthly gzip JSON-lines files, then delete."""
+        model = policy.model
+        table = model.__table__
+        rows = self.db.execute(select(table).where(table.c.id.in_(ids))).mappings().all()
+        directory = self.archive_dir / policy.table
+        directory.mkdir(parents=True, exist_ok=True)
+
+        by_month: dict[str, list[dict]] = {}
+        for row in rows:
+            stamp = row[policy.age_column]
+            month = stamp.strftime("%Y-%m") if stamp else "undated"
+            by_month.setdefault(month, []).append({k: _jsonable(v) for k, v in row.items()})
+        for month, records in by_month.items():
+            # Appending a gzip member keeps earlier batches readable
+            with gzip.open(directory / f"{month}.jsonl.gz", "at", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, default=str) + "\n")
+
+        self.db.execute(delete(table).where(table.c.id.in_(ids)))
+        return str(directory)
+
+    def _relation_bytes(self, table: str) -> Optional[int]:
+        return self.db.execute(
+            text("SELECT pg_total_relation_size(CAST(:t AS regclass))"), {"t": table}
+        ).scalar()
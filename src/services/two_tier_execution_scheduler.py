@@ -13,6 +13,7 @@ Key Features:
 
 Timeline (relative to market open, e.g. 09:30 US / 10:00 ASX):
 open-15m Stage 1: Pre-market validation
+open-3m  Pre-warm: qualify contracts, stream quotes, what-if margin, build orders
 open     Adaptive strike selection (or Stage 2 fallback)
 open     TIER 1: Submit all orders (conservative)
 open+15m..open+60m  TIER 2: Monitor conditions, retry when favorable
@@ -36,6 +37,7 @@ from rich.console import Console
 
 from src.config.exchange_profile import get_active_profile
 from src.data.opportunity_state import OpportunityState
+from src.services.execution_prewarm import ExecutionPrewarmer, PrewarmCache
 from src.services.execution_scheduler import ExecutionReport
 from src.services.fill_manager import FillManager
 from src.services.live_strike_selector import LiveStrikeSelector
@@ -115,6 +117,7 @@ class TwoTierExecutionScheduler:
         fill_manager: FillManager | None = None,
         automation_mode: AutomationMode = AutomationMode.HYBRID,
         tier2_enabled: bool = True,
+        prewarm_enabled: bool | None = None,
     ):
         """Initialize two-tier execution scheduler.
 
@@ -128,6 +131,8 @@ class TwoTierExecutionScheduler:
             fill_manager: Fill manager (None = disabled, uses legacy wait)
             automation_mode: Automation mode (default: HYBRID for testing)
             tier2_enabled: Enable Tier 2 retry logic (default: True)
+            prewarm_enabled: Pre-warm Tier 1 before the open
+                (default: PREWARM_ENABLED env, true)
         """
         self.client = ibkr_client
         self.validator = premarket_validator or PremarketValidator(ibkr_client=ibkr_client)
@@ -150,6 +155,10 @@ class TwoTierExecutionScheduler:
         self.fill_manager = fill_manager
         self.automation_mode = automation_mode
         self.tier2_enabled = tier2_enabled
+        if prewarm_enabled is None:
+            prewarm_enabled = os.getenv("PREWARM_ENABLED", "true").lower() == "true"
+        self.prewarm_enabled = prewarm_enabled
+        self._prewarm: PrewarmCache | None = None
 
         # Exchange-aware timezone and time defaults
         profile = get_active_profile()
@@ -167,6 +176,9 @@ class TwoTierExecutionScheduler:
         # Track which order IDs have been saved to database (prevents duplicates)
         self._saved_order_ids: set[int] = set()
 
+        # Entry snapshots are captured off the execution path
+        self._snapshot_queue = None
+
         # Load Tier 2 configuration from environment
         self.tier2_window_start = self._parse_time(os.getenv("TIER2_WINDOW_START", _tier2_start_default.strftime("%H:%M")))
         self.tier2_window_end = self._parse_time(os.getenv("TIER2_WINDOW_END", _tier2_end_default.strftime("%H:%M")))
@@ -178,6 +190,13 @@ class TwoTierExecutionScheduler:
         self.tier1_time = self._parse_time(os.getenv("TIER1_EXECUTION_TIME", market_open.strftime("%H:%M")))
         self.reconciliation_time = self._parse_time(os.getenv("RECONCILIATION_TIME", _reconcile_default.strftime("%H:%M")))
 
+        # Pre-warm runs this many seconds before Tier 1
+        prewarm_lead = int(os.getenv("PREWARM_LEAD_SECONDS", "180"))
+        self.prewarm_time = (
+            datetime.combine(date_type.today(), self.tier1_time)
+            - timedelta(seconds=prewarm_lead)
+        ).time()
+
         logger.info(
             f"TwoTierExecutionScheduler initialized:\n"
             f"  Mode: {automation_mode.value}\n"
@@ -196,6 +215,7 @@ class TwoTierExecutionScheduler:
 
         Timeline:
         09:15    Stage 1: Pre-market validation
+        09:27    Pre-warm Tier 1 (contracts, quotes, what-if margin, orders)
         09:30    Adaptive strike selection (or Stage 2 fallback)
         09:30    Tier 1: Submit all orders
         09:35-10:30  Tier 2: Condition-based retry
@@ -220,7 +240,7 @@ class TwoTierExecutionScheduler:
         await self._wait_until_time(self.stage1_time, "Stage 1 validation")
         logger.info("📊 Stage 1: Pre-market validation")
 
-        stage1_results = self.validator.validate_premarket(staged_trades)
+        stage1_results = await self.validator.validate_premarket_async(staged_trades)
         ready_trades = [r.opportunity for r in stage1_results if r.passed]
 
         console.print(self._format_stage1_table(stage1_results))
@@ -237,83 +257,92 @@ class TwoTierExecutionScheduler:
 
         logger.info(f"Stage 1 complete: {len(ready_trades)}/{len(staged_trades)} passed")
 
-        # ── Strike validation: adaptive selection OR Stage 2 fallback ──
-        if self.strike_selector:
-            # Adaptive strike selection replaces Stage 2.
-            # The strike selector validates delta, premium, OTM%, spread, and
-            # liquidity — everything Stage 2 checks plus more.
-            # Wait for market open so option bids are valid (not -1.0).
-            await self._wait_until_time(self.tier1_time, "market open for strike selection")
-            logger.info("🎯 Running adaptive strike selection (Stage 2 skipped)")
-
-            strike_results = await self.strike_selector.select_all(ready_trades)
-
-            for r in strike_results:
-                if r.status == "ABANDONED":
-                    logger.warning(
-                        f"  ✗ {r.opportunity.symbol}: ABANDONED — {r.reason}"
-                    )
-                else:
-                    logger.info(
-                        f"  ✓ {r.opportunity.symbol}: {r.status} "
-                        f"strike=${r.selected_strike} delta={r.selected_delta}"
+        # ── Pre-warm: move preparation out of the opening window ──
+        if self.prewarm_enabled and not dry_run:
+            await self._wait_until_time(self.prewarm_time, "execution pre-warm")
+            await self._prewarm_execution(ready_trades)
+
+        # Subscriptions opened by pre-warm are released on every exit path
+        try:
+            # ── Strike validation: adaptive selection OR Stage 2 fallback ──
+            if self.strike_selector:
+                # Adaptive strike selection replaces Stage 2.
+                # The strike selector validates delta, premium, OTM%, spread, and
+                # liquidity — everything Stage 2 checks plus more.
+                # Wait for market open so option bids are valid (not -1.0).
+                await self._wait_until_time(self.tier1_time, "market open for strike selection")
+                logger.info("🎯 Running adaptive strike selection (Stage 2 skipped)")
+
+                strike_results = await self.strike_selector.select_all(ready_trades)
+
+                for r in strike_results:
+                    if r.status == "ABANDONED":
+                        logger.warning(
+                            f"  ✗ {r.opportunity.symbol}: ABANDONED — {r.reason}"
+                        )
+                    else:
+                        logger.info(
+                            f"  ✓ {r.opportunity.symbol}: {r.status} "
+                            f"strike=${r.selected_strike} delta={r.selected_delta}"
+                        )
+
+                confirmed_trades = [
+                    r.opportunity for r in strike_results
+                    if r.status != "ABANDONED"
+                ]
+
+                if not confirmed_trades:
+                    logger.warning("No trades remain after adaptive strike selection")
+                    return ExecutionReport(
+                        execution_date=datetime.now(self._tz).date(),
+                        started_at=datetime.now(self._tz),
+                        completed_at=datetime.now(self._tz),
+                        dry_run=dry_run,
+                        warnings=["All trades abandoned during strike selection"],
                     )
 
-            confirmed_trades = [
-                r.opportunity for r in strike_results
-                if r.status != "ABANDONED"
-            ]
-
-            if not confirmed_trades:
-                logger.warning("No trades remain after adaptive strike selection")
-                return ExecutionReport(
-                    execution_date=datetime.now(self._tz).date(),
-                    started_at=datetime.now(self._tz),
-                    completed_at=datetime.now(self._tz),
-                    dry_run=dry_run,
-                    warnings=["All trades abandoned during strike selection"],
+                logger.info(
+                    f"Strike selection complete: "
+                    f"{len(confirmed_trades)}/{len(ready_trades)} confirmed"
                 )
+            else:
+                # Fallback: Stage 2 premium validation at market open (not 9:28).
+                # Options don't trade pre-market; IBKR returns bid=-1.0 before 9:30.
+                await self._wait_until_time(self.tier1_time, "Stage 2 validation at market open")
+                logger.info("🔄 Stage 2: Refreshing quotes and validating premiums")
+
+                stage2_results = await self.validator.validate_at_open_async(ready_trades)
+                confirmed_trades = [
+                    r.opportunity
+                    for r in stage2_results
+                    if r.status in (ValidationStatus.READY, ValidationStatus.ADJUSTED)
+                ]
+
+                console.print(self._format_stage2_table(stage2_results))
+
+                if not confirmed_trades:
+                    logger.warning("No trades confirmed after Stage 2")
+                    return ExecutionReport(
+                        execution_date=datetime.now(self._tz).date(),
+                        started_at=datetime.now(self._tz),
+                        completed_at=datetime.now(self._tz),
+                        dry_run=dry_run,
+                        warnings=["No trades passed Stage 2"],
+                    )
 
-            logger.info(
-                f"Strike selection complete: "
-                f"{len(confirmed_trades)}/{len(ready_trades)} confirmed"
-            )
-        else:
-            # Fallback: Stage 2 premium validation at market open (not 9:28).
-            # Options don't trade pre-market; IBKR returns bid=-1.0 before 9:30.
-            await self._wait_until_time(self.tier1_time, "Stage 2 validation at market open")
-            logger.info("🔄 Stage 2: Refreshing quotes and validating premiums")
-
-            stage2_results = self.validator.validate_at_open(ready_trades)
-            confirmed_trades = [
-                r.opportunity
-                for r in stage2_results
-                if r.status in (ValidationStatus.READY, ValidationStatus.ADJUSTED)
-            ]
-
-            console.print(self._format_stage2_table(stage2_results))
-
-            if not confirmed_trades:
-                logger.warning("No trades confirmed after Stage 2")
-                return ExecutionReport(
-                    execution_date=datetime.now(self._tz).date(),
-                    started_at=datetime.now(self._tz),
-                    completed_at=datetime.now(self._tz),
-                    dry_run=dry_run,
-                    warnings=["No trades passed Stage 2"],
+                logger.info(
+                    f"Stage 2 complete: {len(confirmed_trades)}/{len(ready_trades)} confirmed"
                 )
 
-            logger.info(
-                f"Stage 2 complete: {len(confirmed_trades)}/{len(ready_trades)} confirmed"
-            )
-
-        # ── Automation mode branching ──
-        if self.automation_mode == AutomationMode.HYBRID:
-            return await self._run_hybrid_mode(confirmed_trades, dry_run)
-        elif self.automation_mode == AutomationMode.SUPERVISED:
-            return await self._run_supervised_mode(confirmed_trades, dry_run)
-        else:  # AUTONOMOUS
-            return await self._run_autonomous_mode(confirmed_trades, dry_run)
+            # ── Automation mode branching ──
+            if self.automation_mode == AutomationMode.HYBRID:
+                return await self._run_hybrid_mode(confirmed_trades, dry_run)
+            elif self.automation_mode == AutomationMode.SUPERVISED:
+                return await self._run_supervised_mode(confirmed_trades, dry_run)
+            else:  # AUTONOMOUS
+                return await self._run_autonomous_mode(confirmed_trades, dry_run)
+        finally:
+            self._release_prewarm()
 
     async def _run_hybrid_mode(
         self,
@@ -464,14 +493,21 @@ class TwoTierExecutionScheduler:
         # This is a WARNING, not a fatal block — the execution pipeline
         # has its own per-contract validation that will catch real issues.
         logger.info("Pre-flight check 1: Market data health...")
-        is_healthy, health_error = self.client.check_market_data_health()
+        if self._prewarm is not None and self._prewarm.market_data_health is not None:
+            is_healthy, health_error = self._prewarm.market_data_health
+        else:
+            is_healthy, health_error = self.client.check_market_data_health()
         if not is_healthy:
             warnings.append(f"Market data warning: {health_error}")
             logger.warning(f"⚠ Market data health check failed (non-fatal): {health_error}")
 
         # Check 2: Total margin within budget (NLV × margin_budget_pct)
         logger.info("Pre-flight check 2: Margin limits...")
-        total_margin = sum(opp.staged_margin for opp in staged if opp.staged_margin)
+        # Prefer what-if margins computed during pre-warm over staged estimates
+        total_margin = 0.0
+        for opp in staged:
+            whatif = self._prewarm.whatif_margin(opp) if self._prewarm else None
+            total_margin += whatif or opp.staged_margin or 0.0
         from src.config.base import get_config
         from src.agentic.scanner_settings import load_scanner_settings
 
@@ -482,7 +518,10 @@ class TwoTierExecutionScheduler:
         # Calculate budget from IBKR NLV or use default
         margin_budget = scanner_settings.budget.margin_budget_default
         try:
-            summary = self.client.get_account_summary()
+            if self._prewarm is not None and self._prewarm.account_summary:
+                summary = self._prewarm.account_summary
+            else:
+                summary = self.client.get_account_summary()
             if summary and "NetLiquidation" in summary:
                 nlv = float(summary["NetLiquidation"])
                 margin_budget = nlv * margin_budget_pct
@@ -581,6 +620,36 @@ class TwoTierExecutionScheduler:
 
         return report
 
+    async def _prewarm_execution(self, staged: list[StagedOpportunity]) -> None:
+        """Prepare Tier 1 before the open (contracts, quotes, margin, orders).
+
+        Failure is never fatal: without a cache Tier 1 takes the normal path.
+
+        Args:
+            staged: Trades that passed Stage 1
+        """
+        logger.info(f"🔥 Pre-warming Tier 1 for {len(staged)} trades")
+        try:
+            prewarmer = ExecutionPrewarmer(self.client, self.executor.adaptive_executor)
+            self._prewarm = await prewarmer.prewarm(staged)
+        except Exception as e:
+            logger.warning(f"Pre-warm failed, Tier 1 will use the live path: {e}")
+            self._prewarm = None
+
+    def _release_prewarm(self) -> None:
+        """Cancel pre-warm quote subscriptions once Tier 1 has been submitted."""
+        if self._prewarm is not None:
+            try:
+                self._prewarm.release(self.client)
+            except Exception as e:
+                logger.debug(f"Error releasing pre-warm subscriptions: {e}")
+
+    def _open_bell(self) -> datetime:
+        """Today's Tier 1 time as an aware datetime in the exchange timezone."""
+        return datetime.combine(
+            datetime.now(self._tz).date(), self.tier1_time, tzinfo=self._tz
+        )
+
     async def _execute_tier1_and_tier2(
         self,
         staged: list[StagedOpportunity],
@@ -610,13 +679,28 @@ class TwoTierExecutionScheduler:
         logger.info(f"🚀 TIER 1: Submitting {len(staged)} orders at market open")
 
         # Use RapidFireExecutor for Tier 1
-        tier1_report = await self.executor.execute_all(staged)
+        if self._prewarm is not None:
+            tier1_report = await self.executor.execute_all(staged, prewarm=self._prewarm)
+        else:
+            tier1_report = await self.executor.execute_all(staged)
+        self._release_prewarm()
 
         logger.info(
             f"Tier 1 complete: {tier1_report.total_filled}/{tier1_report.total_submitted} filled "
             f"in {tier1_report.submission_time:.1f}s"
         )
 
+        # Open bell → last Tier 1 submission (rapid-fire timestamps are naive local)
+        open_to_last_submission = None
+        last_submission_at = getattr(tier1_report, "last_submission_at", None)
+        if isinstance(last_submission_at, datetime):
+            open_to_last_submission = (
+                last_submission_at.astimezone(self._tz) - self._open_bell()
+            ).total_seconds()
+            logger.info(
+                f"⏱️ Open bell → last Tier 1 submission: {open_to_last_submission:.2f}s"
+            )
+
         # Save PENDING records for ALL submitted orders (crash safety)
         await self._save_pending_trades_to_db(tier1_report, staged)
 
@@ -702,6 +786,9 @@ class TwoTierExecutionScheduler:
             logger.info(f"💾 Final save: {len(newly_filled)} trades that filled before reconciliation...")
             await self._save_filled_trades_to_db(newly_filled, staged)
 
+        # Snapshots were captured in the background; wait for stragglers
+        await self._flush_entry_snapshots()
+
         # Release executor resources (unregister callback, clear pending)
         self.executor.cleanup()
 
@@ -728,6 +815,8 @@ class TwoTierExecutionScheduler:
             failed_count=len(tier1_report.failed) + len(tier1_report.skipped),
             total_premium=tier1_report.total_premium,
             warnings=tier1_report.warnings,
+            open_to_last_submission_seconds=open_to_last_submission,
+            prewarmed_count=len(self._prewarm.trades) if self._prewarm else 0,
         )
 
         return final_report
@@ -1129,10 +1218,10 @@ class TwoTierExecutionScheduler:
             # Import here to avoid circular dependencies
             from src.data.database import get_db_session
             from src.data.models import Trade
-            from src.services.entry_snapshot import EntrySnapshotService
+            from src.services.entry_snapshot import SnapshotRequest
             from src.execution.opportunity_lifecycle import OpportunityLifecycleManager
 
-            snapshot_service = EntrySnapshotService(ibkr_client=self.client)
+            snapshot_requests = []
 
             with get_db_session() as session:
                 lifecycle_manager = OpportunityLifecycleManager(session)
@@ -1222,7 +1311,8 @@ class TwoTierExecutionScheduler:
                             f"{contracts} contracts @ ${summary.fill_price or summary.submitted_limit}"
                         )
 
-                        # Capture entry snapshot (98+ fields for learning)
+                        # Queue entry snapshot (98+ fields for learning); it is
+                        # captured in the background once the trade is committed
                         try:
                             # Extract strike selection data from staged opportunity
                             sel_method = getattr(staged_opp, "strike_selection_method", None) if staged_opp else None
@@ -1235,25 +1325,25 @@ class TwoTierExecutionScheduler:
                                 staged_opp, session
                             )
 
-                            snapshot = snapshot_service.capture_entry_snapshot(
-                                trade_id=trade_record.id,
-                                opportunity_id=getattr(staged_opp, "id", None),
-                                symbol=summary.symbol,
-                                strike=summary.strike,
-                                expiration=trade_record.expiration,
-                                option_type="PUT",
-                                contracts=trade_record.contracts,
-                                entry_premium=trade_record.entry_premium,
-                                stock_price=getattr(staged_opp, "staged_stock_price", 0) if staged_opp else 0,
-                                dte=dte,
-                                source="two_tier_scheduler",
-                                strike_selection_method=sel_method,
-                                original_strike=orig_strike,
-                                live_delta_at_selection=live_delta,
-                                scanner_fallback=scanner_fallback,
+                            snapshot_requests.append(
+                                SnapshotRequest(
+                                    trade_id=trade_record.id,
+                                    opportunity_id=getattr(staged_opp, "id", None),
+                                    symbol=summary.symbol,
+                                    strike=summary.strike,
+                                    expiration=trade_record.expiration,
+                                    option_type="PUT",
+                                    contracts=trade_record.contracts,
+                                    entry_premium=trade_record.entry_premium,
+                                    stock_price=getattr(staged_opp, "staged_stock_price", 0) if staged_opp else 0,
+                                    dte=dte,
+                                    source="two_tier_scheduler",
+                                    strike_selection_method=sel_method,
+                                    original_strike=orig_strike,
+                                    live_delta_at_selection=live_delta,
+                                    scanner_fallback=scanner_fallback,
+                                )
                             )
-                            snapshot_service.save_snapshot(snapshot, session)
-                            logger.debug(f"  ✓ Entry snapshot captured for {summary.symbol}")
                         except Exception as e:
                             logger.warning(
                                 f"  ⚠ Entry snapshot failed for {summary.symbol}: {e}"
@@ -1287,12 +1377,37 @@ class TwoTierExecutionScheduler:
                 session.commit()
                 logger.info(f"✓ Database commit successful: {len(filled_trades)} trades saved")
 
+            for request in snapshot_requests:
+                self._entry_snapshots().submit(request)
+
         except Exception as e:
             logger.opt(exception=True).error(
                 "✗ Critical error saving trades to database: " + str(e)
             )
             # Don't raise - execution already happened, just log the failure
 
+    def _entry_snapshots(self):
+        """Background entry snapshot queue (created on first fill)."""
+        if self._snapshot_queue is None:
+            from src.services.entry_snapshot import (
+                EntrySnapshotQueue,
+                EntrySnapshotService,
+            )
+
+            self._snapshot_queue = EntrySnapshotQueue(
+                EntrySnapshotService(ibkr_client=self.client)
+            )
+        return self._snapshot_queue
+
+    async def _flush_entry_snapshots(self) -> None:
+        """Wait for queued entry snapshots to be captured and saved."""
+        if self._snapshot_queue is None:
+            return
+        try:
+            await self._snapshot_queue.join()
+        except Exception as e:
+            logger.warning(f"⚠ Entry snapshot queue failed: {e}")
+
     def _build_scanner_fallback(
         self, staged_opp: StagedOpportunity | None, session
     ) -> dict | None:
@@ -1379,6 +1494,11 @@ class TwoTierExecutionScheduler:
         console.print(f"  Working:   {report.working_count}")
         console.print(f"  Failed:    {report.failed_count}")
         console.print(f"  Premium:   ${report.total_premium:,.2f}")
+        if report.open_to_last_submission_seconds is not None:
+            console.print(
+                f"  Open→last Tier 1 submit: {report.open_to_last_submission_seconds:.2f}s "
+                f"({report.prewarmed_count} pre-warmed)"
+            )
         console.print("=" * 70 + "\n")
 
     def _format_stage1_table(self, results):
@@ -11,13 +11,17 @@ import os
 import re
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from ib_async import IB, Contract, Index, LimitOrder, Option, Order, Stock, Trade, util
 from loguru import logger
 
 from src.config.base import IBKRConfig
+from src.utils.market_data import ticker_market_data
+
+# Symbols quoted as CBOE indices rather than SMART-routed stocks/ETFs
+CBOE_INDICES = frozenset({"VIX", "VIX3M", "VVIX", "SPX"})
 
 
 @dataclass
@@ -791,31 +795,9 @@ class IBKRClient:
 
             # Build data dict from whatever we got
             if ticker:
-                last_val = ticker.last if (
-                    ticker.last is not None
-                    and not (isinstance(ticker.last, float) and math.isnan(ticker.last))
-                ) else None
-                bid_val = ticker.bid if (
-                    ticker.bid is not None
-                    and not (isinstance(ticker.bid, float) and math.isnan(ticker.bid))
-                ) else None
-                ask_val = ticker.ask if (
-                    ticker.ask is not None
-                    and not (isinstance(ticker.ask, float) and math.isnan(ticker.ask))
-                ) else None
-
-                if last_val or (bid_val and ask_val):
-                    return {
-                        "symbol": contract.symbol,
-                        "last": last_val or ((bid_val + ask_val) / 2 if bid_val and ask_val else None),
-                        "bid": bid_val,
-                        "ask": ask_val,
-                        "volume": ticker.volume if not (isinstance(ticker.volume, float) and math.isnan(ticker.volume)) else None,
-                        "open": ticker.open if not (isinstance(ticker.open, float) and math.isnan(ticker.open)) else None,
-                        "high": ticker.high if not (isinstance(ticker.high, float) and math.isnan(ticker.high)) else None,
-                        "low": ticker.low if not (isinstance(ticker.low, float) and math.isnan(ticker.low)) else None,
-                        "close": ticker.close if not (isinstance(ticker.close, float) and math.isnan(ticker.close)) else None,
-                    }
+                data = ticker_market_data(contract, ticker)
+                if data:
+                    return data
 
             logger.warning(
                 f"No valid market data for {contract.symbol} after {timeout}s"
@@ -1620,6 +1602,41 @@ class IBKRClient:
 
         return False
 
+    def cancel_all_orders(self, reason: str = "") -> bool:
+        """Cancel every working order in one request (reqGlobalCancel).
+
+        Cancels all open orders on the account, including orders placed by
+        other API clients and manually in TWS. Used by emergency flatten.
+
+        Args:
+            reason: Human-readable reason for cancellation
+
+        Returns:
+            True if the request was sent, False otherwise
+        """
+        self.ensure_connected()
+
+        audit = OrderAuditEntry(
+            timestamp=datetime.now(),
+            action="CANCEL_ALL",
+            symbol="*",
+            order_type="*",
+            quantity=0,
+            reason=reason,
+        )
+        try:
+            self.ib.reqGlobalCancel()
+            audit.status = "CANCELLED"
+            logger.warning("Global cancel sent: all working orders" + (f" ({reason})" if reason else ""))
+            return True
+        except Exception as e:
+            audit.status = "FAILED"
+            audit.error = str(e)
+            logger.error(f"Global cancel failed: {e}")
+            return False
+        finally:
+            self._order_audit_log.append(audit)
+
     def modify_order_sync(
         self,
         trade: Trade,
@@ -1852,7 +1869,7 @@ class IBKRClient:
         self.ensure_connected()
         return self.ib.fills()
 
-    def get_req_executions(self) -> list:
+    def get_req_executions(self, since: datetime | None = None) -> list:
         """Request executions from IBKR server via reqExecutions().
 
         Unlike get_executions() (which returns cached ib.executions()) and
@@ -1861,6 +1878,10 @@ class IBKRClient:
         include real orderIds, permIds, and actual fill prices — even for
         orders placed in prior API sessions.
 
+        Args:
+            since: Only return executions at or after this time (naive UTC
+                or timezone-aware). Default: everything TWS still holds.
+
         Returns:
             List of Fill objects with .execution.orderId, .execution.permId,
             .execution.avgPrice, and .commissionReport
@@ -1874,7 +1895,12 @@ class IBKRClient:
         from ib_async import ExecutionFilter
 
         self.ensure_connected()
-        fills = self.ib.reqExecutions(ExecutionFilter())
+        exec_filter = ExecutionFilter()
+        if since is not None:
+            if since.tzinfo is not None:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            exec_filter.time = since.strftime("%Y%m%d-%H:%M:%S")  # UTC form
+        fills = self.ib.reqExecutions(exec_filter)
         logger.info(f"reqExecutions returned {len(fills)} fills")
         return fills
 
@@ -1977,6 +2003,36 @@ class IBKRClient:
             logger.error(f"Error getting option chain definitions for {underlying_symbol}: {e}")
             return []
 
+    async def get_option_chain_definitions_async(
+        self,
+        underlying_symbol: str,
+        sec_type: str = "",
+        exchange: str = "",
+        con_id: int = 0,
+    ) -> list:
+        """Async get_option_chain_definitions(), for concurrent lookups.
+
+        Wraps ib.reqSecDefOptParamsAsync().
+
+        Args:
+            underlying_symbol: Underlying symbol (e.g. "AAPL", "SPX")
+            sec_type: Security type filter (e.g. "STK", "IND")
+            exchange: Exchange filter (e.g. "SMART", "CBOE")
+            con_id: Underlying contract ID (0 = any)
+
+        Returns:
+            List of OptionChain namedtuples from ib_async
+        """
+        self.ensure_connected()
+        try:
+            chains = await self.ib.reqSecDefOptParamsAsync(
+                underlying_symbol, exchange, sec_type, con_id,
+            )
+            return chains if chains else []
+        except Exception as e:
+            logger.error(f"Error getting option chain definitions for {underlying_symbol}: {e}")
+            return []
+
     def qualify_contracts_batch(self, *contracts: Contract) -> list:
         """Qualify multiple contracts in a single request.
 
@@ -2038,6 +2094,25 @@ class IBKRClient:
         except Exception:
             pass
 
+    def ticker(self, symbol: str):
+        """Subscribe to streaming quotes for a stock, ETF or CBOE index.
+
+        Returns immediately; the Ticker fills in as data arrives, so several
+        symbols can be subscribed back to back and awaited together. Cancel
+        with cancel_market_data(ticker.contract) when done.
+
+        Args:
+            symbol: Ticker symbol (VIX, VIX3M, VVIX and SPX are indices)
+
+        Returns:
+            Ticker object from ib_async (updates in-place)
+        """
+        if symbol in CBOE_INDICES:
+            contract = Index(symbol, "CBOE", "USD")
+        else:
+            contract = Stock(symbol, "SMART", "USD")
+        return self.subscribe_market_data(contract)
+
     def get_historical_bars(
         self,
         contract: Contract,
@@ -2077,6 +2152,54 @@ class IBKRClient:
             logger.error(f"Error getting historical bars for {contract.symbol}: {e}")
             return []
 
+    async def get_historical_bars_batch(
+        self,
+        contracts: list[Contract],
+        duration: str = "30 D",
+        bar_size: str = "1 day",
+        what_to_show: str = "TRADES",
+        use_rth: bool = True,
+        timeout: float = 10.0,
+    ) -> list[list]:
+        """Get historical bars for several contracts in parallel.
+
+        Each request has its own timeout, so one slow symbol does not hold
+        up the others.
+
+        Args:
+            contracts: Qualified contracts
+            duration: Duration string (e.g. "30 D", "1 Y")
+            bar_size: Bar size (e.g. "1 day")
+            what_to_show: Data type (TRADES, MIDPOINT, ...)
+            use_rth: Regular trading hours only
+            timeout: Maximum wait per request in seconds
+
+        Returns:
+            List of bar lists in the same order as contracts
+            (empty for requests that failed or timed out)
+        """
+        self.ensure_connected()
+
+        async def fetch(contract: Contract) -> list:
+            try:
+                bars = await asyncio.wait_for(
+                    self.ib.reqHistoricalDataAsync(
+                        contract,
+                        endDateTime="",
+                        durationStr=duration,
+                        barSizeSetting=bar_size,
+                        whatToShow=what_to_show,
+                        useRTH=use_rth,
+                    ),
+                    timeout,
+                )
+                return list(bars) if bars else []
+            except Exception as e:
+                logger.debug(f"Historical bars for {contract.symbol} failed: {e}")
+                return []
+
+        return list(await asyncio.gather(*(fetch(c) for c in contracts)))
+
     def get_fundamental_data(
         self,
         contract: Contract,
@@ -2212,6 +2335,20 @@ class IBKRClient:
         """
         pass  # Event was already mutated in-place by __iadd__
 
+    @property
+    def portfolio_event(self):
+        """Direct access to streamed portfolio updates (PortfolioItem per position).
+
+        Example:
+            >>> client.portfolio_event += my_portfolio_callback
+        """
+        return self.ib.updatePortfolioEvent
+
+    @portfolio_event.setter
+    def portfolio_event(self, value):
+        """No-op setter to support ``+=`` / ``-=`` on the property."""
+        pass  # Event was already mutated in-place by __iadd__
+
     @property
     def exec_details_event(self):
         """Direct access to execution events for callbacks.
@@ -0,0 +1,90 @@
+"""Latency measurement helpers shared by execution and daemon telemetry.
+
+Keeps percentile maths in one place so every latency view (order
+lifecycle, event dispatch, LLM queueing) reports p50/p95/p99 the same way.
+
+Usage:
+    from src.utils.latency import elapsed_ms, summarize_latencies
+
+    t0 = time.perf_counter()
+    ...
+    samples.append(elapsed_ms(t0))
+    summary = summarize_latencies(samples)  # {"count", "p50", "p95", "p99", ...}
+"""
+
+import math
+import time
+
+# Upper bucket edges (ms) for dashboard histograms. The last bucket is open-ended.
+DEFAULT_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+def elapsed_ms(start: float) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter()`` reading."""
+    return (time.perf_counter() - start) * 1000.0
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of a list of samples.
+
+    Args:
+        values: Samples (need not be sorted)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Percentile value, or None when there are no samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def histogram(
+    values: list[float], buckets: tuple[float, ...] = DEFAULT_BUCKETS_MS
+) -> list[dict]:
+    """Bucket samples into a cumulative-free histogram.
+
+    Returns:
+        List of {"le": upper_edge_or_None, "count": n}; ``le=None`` is the
+        overflow bucket.
+    """
+    counts = [0] * (len(buckets) + 1)
+    for v in values:
+        for i, edge in enumerate(buckets):
+            if v <= edge:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    edges: list[float | None] = [*buckets, None]
+    return [{"le": edge, "count": n} for edge, n in zip(edges, counts, strict=True)]
+
+
+def summarize_latencies(
+    values: list[float], include_histogram: bool = False
+) -> dict:
+    """Summarise latency samples as count/p50/p95/p99/max (milliseconds).
+
+    Args:
+        values: Latency samples in milliseconds
+        include_histogram: Also return bucketed counts for charting
+
+    Returns:
+        Summary dict; percentile fields are None when there are no samples
+    """
+    summary = {
+        "count": len(values),
+        "p50": _round(percentile(values, 50)),
+        "p95": _round(percentile(values, 95)),
+        "p99": _round(percentile(values, 99)),
+        "max": _round(max(values)) if values else None,
+    }
+    if include_histogram:
+        summary["histogram"] = histogram(values)
+    return summary
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
@@ -6,6 +6,7 @@ NaN guard logic so callers don't need to repeat it.
 """
 
 import math
+from datetime import datetime
 
 
 def _is_valid_price(value) -> bool:
@@ -75,3 +76,54 @@ def safe_field(ticker, field: str) -> float | None:
     if value is not None and isinstance(value, (int, float)) and not math.isnan(value):
         return value
     return None
+
+
+def ticker_market_data(contract, ticker) -> dict | None:
+    """Build the IBKRClient.get_market_data() dict from a streaming ticker.
+
+    Args:
+        contract: Contract the ticker belongs to
+        ticker: ib_async Ticker object
+
+    Returns:
+        Dict with symbol, last (or mid), bid, ask, volume and OHLC, or None
+        if the ticker has neither a last price nor a bid/ask pair
+    """
+    last = safe_field(ticker, "last")
+    bid = safe_field(ticker, "bid")
+    ask = safe_field(ticker, "ask")
+    if not (last or (bid and ask)):
+        return None
+    return {
+        "symbol": contract.symbol,
+        "last": last or ((bid + ask) / 2 if bid and ask else None),
+        "bid": bid,
+        "ask": ask,
+        "volume": safe_field(ticker, "volume"),
+        "open": safe_field(ticker, "open"),
+        "high": safe_field(ticker, "high"),
+        "low": safe_field(ticker, "low"),
+        "close": safe_field(ticker, "close"),
+    }
+
+
+def last_tick(ticker) -> tuple[float | None, datetime | None]:
+    """Latest price (last, else bid/ask mid) and tick time of a streaming ticker.
+
+    Args:
+        ticker: ib_async Ticker object (or None)
+
+    Returns:
+        (price, tick time), or (None, None) if the ticker has not ticked
+        with a usable price yet
+    """
+    tick_time = getattr(ticker, "time", None)
+    if not isinstance(tick_time, datetime):
+        return None, None
+    last = safe_field(ticker, "last")
+    if last and last > 0:
+        return last, tick_time
+    bid, ask = safe_bid_ask(ticker)
+    if bid and ask:
+        return (bid + ask) / 2, tick_time
+    return None, None
@@ -59,7 +59,10 @@ def phase5_config(tmp_path):
     """Create a Phase5Config with test-friendly settings."""
     return Phase5Config(
         autonomy=AutonomyConfig(initial_level=4, max_level=4),  # L4 to avoid escalation
-        claude=ClaudeConfig(daily_cost_cap_usd=100.0),
+        claude=ClaudeConfig(
+            daily_cost_cap_usd=100.0,
+            embedding_index_dir=str(tmp_path / "decision_index"),
+        ),
         daemon=DaemonConfig(
             pid_file=str(tmp_path / "test_taad.pid"),
             heartbeat_interval_seconds=10,
@@ -8,11 +8,12 @@ Covers:
 - get_pending_approvals() returns pending items
 - approve() marks approval
 - reject() marks rejection and records override
+- CLOSE_ALL_POSITIONS goes through one emergency flatten
 """
 
 import asyncio
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -416,3 +417,84 @@ class TestExecutionErrorHandling:
         )
 
         assert result.action == "REQUEST_HUMAN_REVIEW"
+
+
+class TestClosePreflight:
+    """Pre-flight for a CLOSE_POSITION that is still being reasoned."""
+
+    def test_preflight_awaits_exit_manager(self, executor):
+        executor.exit_manager = MagicMock()
+        executor.exit_manager.prepare_exit = AsyncMock(return_value=True)
+
+        ready = asyncio.get_event_loop().run_until_complete(
+            executor.preflight_close("AAPL_200.0_20260215_P")
+        )
+
+        assert ready == "AAPL_200.0_20260215_P"
+        executor.exit_manager.prepare_exit.assert_awaited_once_with("AAPL_200.0_20260215_P")
+
+    def test_preflight_not_ready_returns_none(self, executor):
+        executor.exit_manager = MagicMock()
+        executor.exit_manager.prepare_exit = AsyncMock(return_value=False)
+
+        ready = asyncio.get_event_loop().run_until_complete(
+            executor.preflight_close("AAPL_200.0_20260215_P")
+        )
+
+        assert ready is None
+
+    def test_discard_preflights_passes_keys(self, executor):
+        executor.exit_manager = MagicMock()
+
+        executor.discard_preflights(["AAPL_200.0_20260215_P"])
+
+        executor.exit_manager.discard_prepared_exits.assert_called_once_with(
+            ["AAPL_200.0_20260215_P"]
+        )
+
+
+class TestCloseAll:
+    """CLOSE_ALL_POSITIONS flattens the book in one sweep."""
+
+    def test_close_all_uses_emergency_flatten(self, executor):
+        from src.execution.emergency_flatten import (
+            FlattenLeg,
+            FlattenReport,
+            FlattenTarget,
+        )
+
+        def target(key):
+            return FlattenTarget(key, "AAPL", 200.0, "20260215", "P", 1)
+
+        report = FlattenReport(legs=[
+            FlattenLeg(target=target("A"), status="filled", fill_price=0.40),
+            FlattenLeg(target=target("B"), status="failed", error="no quote"),
+        ])
+        executor.exit_manager = MagicMock()
+        executor.exit_manager.emergency_flatten.return_value = report
+
+        result = asyncio.get_event_loop().run_until_complete(
+            executor._handle_close_all(
+                _make_decision("CLOSE_ALL_POSITIONS", metadata={"reason": "vix spike"})
+            )
+        )
+
+        executor.exit_manager.emergency_flatten.assert_called_once_with(reason="vix spike")
+        executor.exit_manager.execute_exit.assert_not_called()
+        assert not result.success
+        assert result.data["closed_count"] == 1
+        assert result.data["failed_count"] == 1
+        assert result.data["details"][1]["error"] == "no quote"
+
+    def test_close_all_with_nothing_open(self, executor):
+        from src.execution.emergency_flatten import FlattenReport
+
+        executor.exit_manager = MagicMock()
+        executor.exit_manager.emergency_flatten.return_value = FlattenReport()
+
+        result = asyncio.get_event_loop().run_until_complete(
+            executor._handle_close_all(_make_decision("CLOSE_ALL_POSITIONS"))
+        )
+
+        assert result.success
+        assert result.data["closed_count"] == 0
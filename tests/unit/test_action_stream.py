@@ -0,0 +1,108 @@
+"""Unit tests for incremental action parsing of streamed responses.
+
+Tests:
+- Single exit check surfaces the action with the request's trade_id
+- Batched responses pair each action with its own trade_id, in either key order
+- Braces and quoted words inside strings never produce an action
+- Time to first action is measured from request start
+- reset() discards a failed attempt's scan and restarts the clock
+"""
+
+import json
+
+import pytest
+
+from src.agentic.action_stream import IncrementalActionParser
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _feed_in_chunks(parser, text, size=5):
+    found = []
+    for i in range(0, len(text), size):
+        found.extend(parser.feed(text[i:i + size]))
+    return found
+
+
+class TestIncrementalActionParser:
+    def test_single_action_surfaces_before_reasoning(self):
+        parser = IncrementalActionParser(default_trade_id="T1")
+        head = '```json\n{"action": "CLOSE_POSITION", "confidence": 0.8, "reasoning": "AAPL 150P'
+
+        found = _feed_in_chunks(parser, head)
+
+        assert [(a.action, a.trade_id) for a in found] == [("CLOSE_POSITION", "T1")]
+
+    def test_batch_metadata_first(self):
+        text = json.dumps({
+            "assessment": "a",
+            "actions": [
+                {"metadata": {"trade_id": "T1"}, "action": "MONITOR_ONLY", "reasoning": "x"},
+                {"metadata": {"trade_id": "T2"}, "action": "CLOSE_POSITION", "reasoning": "y"},
+            ],
+        })
+        parser = IncrementalActionParser()
+
+        found = _feed_in_chunks(parser, text)
+
+        assert [(a.action, a.trade_id) for a in found] == [
+            ("MONITOR_ONLY", "T1"), ("CLOSE_POSITION", "T2"),
+        ]
+
+    def test_batch_metadata_last_pairs_within_object(self):
+        text = json.dumps({"actions": [
+            {"action": "CLOSE_POSITION", "reasoning": "x", "metadata": {"trade_id": "T1"}},
+            {"action": "MONITOR_ONLY", "reasoning": "y", "metadata": {"trade_id": "T2"}},
+        ]})
+        parser = IncrementalActionParser()
+
+        found = _feed_in_chunks(parser, text, size=1)
+
+        assert [(a.action, a.trade_id) for a in found] == [
+            ("CLOSE_POSITION", "T1"), ("MONITOR_ONLY", "T2"),
+        ]
+
+    def test_strings_cannot_fake_actions(self):
+        text = json.dumps({
+            "assessment": 'quoted {"action": "CLOSE_ALL_POSITIONS"} inside',
+            "action": "MONITOR_ONLY",
+            "key_factors": ["action", "{"],
+        })
+        parser = IncrementalActionParser()
+
+        found = _feed_in_chunks(parser, text, size=3)
+
+        assert [(a.action, a.trade_id) for a in found] == [("MONITOR_ONLY", None)]
+
+    def test_first_action_ms(self):
+        clock = FakeClock()
+        parser = IncrementalActionParser(default_trade_id="T1", clock=clock)
+        parser.feed('{"confidence": 0.9, "act')
+        assert parser.first_action_ms is None
+
+        clock.now += 0.35
+        parser.feed('ion": "MONITOR_ONLY", "reasoning": "...')
+        clock.now += 2.0
+        parser.feed('done"}')
+
+        assert parser.first_action_ms == pytest.approx(350.0)
+        assert len(parser.actions) == 1
+
+    def test_reset_starts_over(self):
+        clock = FakeClock()
+        parser = IncrementalActionParser(default_trade_id="T1", clock=clock)
+        parser.feed('{"action": "CLOSE_POSITION", "reas')
+
+        clock.now += 5.0  # failed attempt, back-off, new slot
+        parser.reset()
+        clock.now += 0.2
+        parser.feed('{"action": "MONITOR_ONLY"}')
+
+        assert [a.action for a in parser.actions] == ["MONITOR_ONLY"]
+        assert parser.first_action_ms == pytest.approx(200.0)
@@ -2,7 +2,8 @@
 
 Tests cover:
 - compute_composite_score_4w: all 4 weights, 3-weight fallback, custom weights
-- build_auto_select_portfolio: budget, sector, max positions, duplicates, sorting
+- build_auto_select_portfolio: budget, sector, max positions, duplicates, sorting,
+  optimal (non-greedy) selection
 - PortfolioCandidate.from_best_strike: construction from BestStrikeResult + AI data
 """
 
@@ -331,6 +332,25 @@ class TestBuildAutoSelectPortfolio:
         assert all(s.selected is True for s in selected)
         assert all(s.selected is False for s in skipped)
 
+    def test_two_smaller_beat_one_large(self):
+        """A high-margin top pick is dropped when two others are worth more."""
+        big = _make_portfolio_candidate(
+            symbol="AAPL", composite_score=0.90, margin=5000.0, sector="S1",
+        )
+        c2 = _make_portfolio_candidate(
+            symbol="JPM", composite_score=0.80, margin=2500.0, sector="S2",
+        )
+        c3 = _make_portfolio_candidate(
+            symbol="XOM", composite_score=0.70, margin=2500.0, sector="S3",
+        )
+        selected, skipped, _ = build_auto_select_portfolio(
+            [big, c2, c3], available_budget=5000.0,
+        )
+        assert [s.symbol for s in selected] == ["JPM", "XOM"]
+        assert [s.portfolio_rank for s in selected] == [1, 2]
+        assert skipped == [big]
+        assert big.skip_reason == "budget_exceeded"
+
 
 # ---------------------------------------------------------------------------
 # PortfolioCandidate.from_best_strike tests
@@ -18,6 +18,7 @@ import pytest
 from sqlalchemy.orm import Session
 
 from src.agentic.config import ExitRulesConfig, Phase5Config
+from src.agentic.context_sections import ContextSectionCache
 from src.data.database import close_database, get_session, init_database
 from src.data.models import (
     DaemonEvent,
@@ -227,9 +228,31 @@ class TestCloseAllPositions:
         )
         return executor, mock_exit_manager
 
+    @staticmethod
+    def _report(*statuses):
+        """FlattenReport with one leg per status."""
+        from src.execution.emergency_flatten import (
+            FlattenLeg,
+            FlattenReport,
+            FlattenTarget,
+        )
+
+        return FlattenReport(legs=[
+            FlattenLeg(
+                target=FlattenTarget(
+                    f"SYM{i}_100.0_20260320_P", f"SYM{i}", 100.0, "20260320", "P", 1
+                ),
+                status=status,
+                fill_price=0.10 if status == "filled" else None,
+                error="No fills" if status == "failed" else None,
+            )
+            for i, status in enumerate(statuses)
+        ])
+
     def test_no_open_trades_returns_success(self, db_session, executor_with_exit):
-        """_handle_close_all with no open trades returns success with closed_count=0."""
-        executor, _ = executor_with_exit
+        """_handle_close_all with nothing to flatten returns success with closed_count=0."""
+        executor, mock_exit_manager = executor_with_exit
+        mock_exit_manager.emergency_flatten.return_value = self._report()
         decision = _make_decision(
             action="CLOSE_ALL_POSITIONS",
             metadata={"reason": "test emergency"},
@@ -241,26 +264,11 @@ class TestCloseAllPositions:
         assert result.data["closed_count"] == 0
 
     def test_closes_all_open_trades(self, db_session, executor_with_exit):
-        """_handle_close_all closes all open trades with market orders."""
+        """_handle_close_all flattens every position in one emergency flatten."""
         executor, mock_exit_manager = executor_with_exit
-
-        # Insert 2 open trades
-        for sym in ["AAPL", "NVDA"]:
-            db_session.add(Trade(
-                trade_id=f"{sym}_100.0_20260320_P_123",
-                symbol=sym,
-                strike=100.0,
-                expiration=date(2026, 3, 20),
-                option_type="PUT",
-                entry_date=datetime(2026, 3, 1),
-                entry_premium=1.50,
-                contracts=1,
-                dte=16,
-            ))
-        db_session.commit()
-
-        mock_result = MagicMock(success=True, exit_price=0.10, error_message=None)
-        mock_exit_manager.execute_exit.return_value = mock_result
+        mock_exit_manager.emergency_flatten.return_value = self._report(
+            "filled", "filled"
+        )
 
         decision = _make_decision(
             action="CLOSE_ALL_POSITIONS",
@@ -273,27 +281,13 @@ class TestCloseAllPositions:
         assert result.success is True
         assert result.data["closed_count"] == 2
         assert result.data["failed_count"] == 0
-        assert mock_exit_manager.execute_exit.call_count == 2
+        mock_exit_manager.emergency_flatten.assert_called_once()
+        mock_exit_manager.execute_exit.assert_not_called()
 
-    def test_uses_market_exit_type_critical_urgency(self, db_session, executor_with_exit):
-        """_handle_close_all uses exit_type='market' and urgency='critical'."""
+    def test_passes_reason_to_emergency_flatten(self, db_session, executor_with_exit):
+        """_handle_close_all records the decision's reason on the flatten."""
         executor, mock_exit_manager = executor_with_exit
-
-        db_session.add(Trade(
-            trade_id="SPY_500.0_20260320_P_456",
-            symbol="SPY",
-            strike=500.0,
-            expiration=date(2026, 3, 20),
-            option_type="PUT",
-            entry_date=datetime(2026, 3, 1),
-            entry_premium=2.00,
-            contracts=1,
-            dte=16,
-        ))
-        db_session.commit()
-
-        mock_result = MagicMock(success=True, exit_price=0.05, error_message=None)
-        mock_exit_manager.execute_exit.return_value = mock_result
+        mock_exit_manager.emergency_flatten.return_value = self._report("filled")
 
         decision = _make_decision(
             action="CLOSE_ALL_POSITIONS",
@@ -303,33 +297,16 @@ class TestCloseAllPositions:
             executor._handle_close_all(decision)
         )
 
-        call_args = mock_exit_manager.execute_exit.call_args
-        exit_decision = call_args[0][1]
-        assert exit_decision.exit_type == "market"
-        assert exit_decision.urgency == "critical"
+        mock_exit_manager.emergency_flatten.assert_called_once_with(
+            reason="circuit breaker"
+        )
 
     def test_aggregates_successes_and_failures(self, db_session, executor_with_exit):
-        """_handle_close_all aggregates per-trade success/failure results."""
+        """_handle_close_all aggregates per-leg results; working legs count as placed."""
         executor, mock_exit_manager = executor_with_exit
-
-        for i, sym in enumerate(["AAPL", "NVDA", "TSLA"]):
-            db_session.add(Trade(
-                trade_id=f"{sym}_100.0_20260320_P_{i}",
-                symbol=sym,
-                strike=100.0,
-                expiration=date(2026, 3, 20),
-                option_type="PUT",
-                entry_date=datetime(2026, 3, 1),
-                entry_premium=1.50,
-                contracts=1,
-                dte=16,
-            ))
-        db_session.commit()
-
-        # First two succeed, third fails
-        success = MagicMock(success=True, exit_price=0.10, error_message=None)
-        failure = MagicMock(success=False, exit_price=None, error_message="No fills")
-        mock_exit_manager.execute_exit.side_effect = [success, success, failure]
+        mock_exit_manager.emergency_flatten.return_value = self._report(
+            "filled", "working", "failed"
+        )
 
         decision = _make_decision(
             action="CLOSE_ALL_POSITIONS",
@@ -344,6 +321,7 @@ class TestCloseAllPositions:
         assert result.data["failed_count"] == 1
         assert result.data["total"] == 3
         assert len(result.data["details"]) == 3
+        assert result.data["details"][2]["error"] == "No fills"
 
     def test_no_exit_manager_returns_error(self, db_session):
         """_handle_close_all without exit_manager returns error."""
@@ -657,6 +635,148 @@ class TestEventDetector:
         assert payload["breach_type"] == "critical_stop_loss"
 
 
+def _tick(symbol, price, seconds_ago=0.5):
+    """Mock streamed ticker whose last trade arrived seconds_ago."""
+    from datetime import timezone
+
+    ticker = MagicMock()
+    ticker.contract.symbol = symbol
+    ticker.last = price
+    ticker.time = datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)
+    return ticker
+
+
+class TestTickDrivenDetection:
+    """Tests for per-tick VIX spike and strike breach detection."""
+
+    @pytest.fixture
+    def mock_event_bus(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def detector(self, mock_event_bus):
+        from src.agentic.event_detector import EventDetector
+
+        detector = EventDetector(event_bus=mock_event_bus, ibkr_client=MagicMock())
+        detector._has_recent_breach_event = MagicMock(return_value=False)
+        return detector
+
+    def test_rolling_baseline_decays_by_half_life(self):
+        from src.agentic.event_detector import RollingBaseline
+
+        baseline = RollingBaseline(half_life_seconds=60)
+        baseline.update(10.0, 0.0)
+
+        assert baseline.update(20.0, 60.0) == pytest.approx(15.0)
+
+    def test_vix_tick_spike_vs_rolling_baseline(self, detector, mock_event_bus):
+        """Spike against the rolling baseline emits once, with latency."""
+        detector._session_open_vix = 15.0
+        detector._vix_baseline.update(18.0, _tick("VIX", 18.0).time.timestamp())
+
+        detector._on_vix_tick(_tick("VIX", 21.0))
+        detector._on_vix_tick(_tick("VIX", 22.0))
+
+        mock_event_bus.emit.assert_called_once()
+        payload = mock_event_bus.emit.call_args[1]["payload"]
+        assert payload["breach_type"] == "vix_spike"
+        assert payload["baseline"] == "session_open"
+        assert payload["vix_rolling_baseline"] == pytest.approx(18.0, abs=0.01)
+        assert payload["detection_latency_ms"] >= 500
+        assert detector.detection_latency_summary()["count"] == 1
+
+    def test_vix_tick_ignored_when_market_closed(self, detector, mock_event_bus):
+        detector.calendar = MagicMock()
+        detector.calendar.is_market_open.return_value = False
+        detector._session_open_vix = 15.0
+
+        detector._on_vix_tick(_tick("VIX", 30.0))
+
+        mock_event_bus.emit.assert_not_called()
+
+    def test_strike_breach_emits_once_per_cooldown(self, detector, mock_event_bus):
+        detector._watched = {
+            "AAPL": [("AAPL_150.0_20260301_P", 150.0, "PUT")],
+        }
+
+        detector._on_underlying_tick(_tick("AAPL", 151.0))
+        mock_event_bus.emit.assert_not_called()
+
+        detector._on_underlying_tick(_tick("AAPL", 149.5))
+        detector._on_underlying_tick(_tick("AAPL", 149.0))
+
+        mock_event_bus.emit.assert_called_once()
+        payload = mock_event_bus.emit.call_args[1]["payload"]
+        assert payload["breach_type"] == "strike_breach"
+        assert payload["position_id"] == "AAPL_150.0_20260301_P"
+        assert "detection_latency_ms" in payload
+
+    def test_underlying_tick_ignored_when_market_closed(self, detector, mock_event_bus):
+        detector.calendar = MagicMock()
+        detector.calendar.is_market_open.return_value = False
+        detector._watched = {
+            "AAPL": [("AAPL_150.0_20260301_P", 150.0, "PUT")],
+        }
+
+        detector._on_underlying_tick(_tick("AAPL", 140.0))
+
+        mock_event_bus.emit.assert_not_called()
+        assert "AAPL" not in detector._underlying_baselines
+
+    def test_refresh_streams_follows_open_positions(self, detector):
+        vix = MagicMock()
+        service = MagicMock()
+        service.ticker.return_value = vix
+        detector.ibkr_client.ticker.side_effect = lambda s: _tick(s, 100.0)
+        detector._load_watched_positions = MagicMock(
+            return_value={"AAPL": [], "MSFT": []}
+        )
+
+        with patch(
+            "src.services.market_conditions.get_market_conditions_service",
+            return_value=service,
+        ):
+            detector._refresh_streams()
+            vix.updateEvent.connect.assert_called_once_with(detector._on_vix_tick)
+            assert set(detector._underlying_tickers) == {"AAPL", "MSFT"}
+
+            msft = detector._underlying_tickers["MSFT"]
+            detector._load_watched_positions.return_value = {"AAPL": []}
+            detector._refresh_streams()
+
+        assert set(detector._underlying_tickers) == {"AAPL"}
+        msft.updateEvent.disconnect.assert_called_once()
+        detector.ibkr_client.cancel_market_data.assert_called_once_with(msft.contract)
+        vix.updateEvent.connect.assert_called_once()
+
+    def test_load_detection_latency_summary(self, db_session):
+        from src.agentic.event_detector import load_detection_latency_summary
+
+        for breach_type, latency in (
+            ("vix_spike", 120.0),
+            ("strike_breach", 40.0),
+            ("strike_breach", 60.0),
+            ("critical_stop_loss", None),
+        ):
+            payload = {"breach_type": breach_type}
+            if latency is not None:
+                payload["detection_latency_ms"] = latency
+            db_session.add(
+                DaemonEvent(
+                    event_type="RISK_LIMIT_BREACH",
+                    payload=payload,
+                    created_at=datetime.utcnow(),
+                )
+            )
+        db_session.commit()
+
+        summary = load_detection_latency_summary(db_session, days=7)
+
+        assert summary["overall"]["count"] == 3
+        assert summary["by_breach_type"]["strike_breach"]["count"] == 2
+        assert "critical_stop_loss" not in summary["by_breach_type"]
+
+
 # ---------------------------------------------------------------------------
 # Workstream 3: Trade Outcome Feedback Loop
 # ---------------------------------------------------------------------------
@@ -1521,6 +1641,39 @@ class TestPerPositionExitChecks:
         symbols = {c[1]["payload"]["symbol"] for c in exit_check_calls}
         assert symbols == {"AAPL", "TSLA"}
 
+    def test_material_positions_coalesced_into_batches(self, daemon, db_session):
+        """Positions escalated in one cycle share batched POSITION_EXIT_CHECKs."""
+        from src.agentic.event_bus import EventType
+
+        symbols = ["AAPL", "TSLA", "NVDA", "AMD", "META"]
+        for sym in symbols:
+            db_session.add(Trade(
+                trade_id=f"{sym}_100_P",
+                symbol=sym,
+                strike=100.0,
+                expiration=date(2026, 3, 6),
+                option_type="P",
+                entry_date=datetime(2026, 2, 23),
+                entry_premium=1.00,
+                contracts=1,
+                dte=11,
+            ))
+        db_session.commit()
+        daemon.position_monitor.get_position_price.return_value = 0.40
+        daemon.exit_check_batch_size = 2
+
+        emitted = daemon._emit_material_position_checks(db_session, set())
+
+        payloads = [
+            c[1]["payload"] for c in daemon.event_bus.emit.call_args_list
+            if c[0][0] == EventType.POSITION_EXIT_CHECK
+        ]
+        assert emitted == 5
+        assert [len(p.get("positions", [p])) for p in payloads] == [2, 2, 1]
+        assert payloads[2]["trade_id"] == "META_100_P"  # Batch of one stays plain
+        batched = {pos["symbol"] for p in payloads[:2] for pos in p["positions"]}
+        assert batched == {"AAPL", "TSLA", "NVDA", "AMD"}
+
     def test_get_position_pnl_pct_calculation(self, daemon, db_session):
         """_get_position_pnl_pct correctly computes P&L percentage."""
         trade = Trade(
@@ -1545,6 +1698,41 @@ class TestPerPositionExitChecks:
         pnl = daemon._get_position_pnl_pct(trade, db_session)
         assert pnl == -100.0
 
+    def test_position_prices_fetched_concurrently(self, daemon, db_session):
+        """Positions without a cached price get one concurrent live quote each."""
+        from src.tools.ibkr_client import Quote
+
+        for trade_id, premium in (("LIVE_A", 2.00), ("LIVE_B", 1.00)):
+            db_session.add(Trade(
+                trade_id=trade_id,
+                symbol="TEST",
+                strike=100.0,
+                expiration=date(2026, 3, 6),
+                option_type="P",
+                entry_date=datetime(2026, 2, 23),
+                entry_premium=premium,
+                contracts=1,
+                dte=11,
+            ))
+        db_session.commit()
+        daemon.position_monitor.get_position_price.return_value = None
+        daemon.ibkr_client.is_connected.return_value = True
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(
+            side_effect=lambda c: [c]
+        )
+        daemon.ibkr_client.get_quote = AsyncMock(
+            return_value=Quote(bid=0.40, ask=0.60, last=0.50, is_valid=True, reason="")
+        )
+
+        prices = asyncio.get_event_loop().run_until_complete(
+            daemon._fetch_position_prices(db_session)
+        )
+
+        assert prices == {"LIVE_A": 0.50, "LIVE_B": 0.50}
+        daemon.ibkr_client.qualify_contract.assert_not_called()
+        trade = db_session.query(Trade).filter_by(trade_id="LIVE_A").one()
+        assert daemon._get_position_pnl_pct(trade, db_session, prices) == 75.0
+
     def test_get_position_pnl_pct_no_price_returns_none(self, daemon, db_session):
         """_get_position_pnl_pct returns None when no price available."""
         trade = Trade(
@@ -1823,6 +2011,23 @@ class TestPendingApprovalDeduplication:
         result = daemon._get_suppressed_close_trade_ids(db_session)
         assert "TSLA_200_20260301_P" in result
 
+    def test_get_pending_close_trade_ids_from_batched_event(self, daemon, db_session):
+        """Every position in a pending batched POSITION_EXIT_CHECK is suppressed."""
+        db_session.add(DaemonEvent(
+            event_type="POSITION_EXIT_CHECK",
+            priority=3,
+            status="pending",
+            payload={"positions": [
+                {"trade_id": "TSLA_200_20260301_P", "symbol": "TSLA"},
+                {"trade_id": "AMD_90_20260301_P", "symbol": "AMD"},
+            ]},
+            created_at=datetime.utcnow(),
+        ))
+        db_session.commit()
+
+        result = daemon._get_suppressed_close_trade_ids(db_session)
+        assert {"TSLA_200_20260301_P", "AMD_90_20260301_P"} <= result
+
     def test_get_pending_close_excludes_executed(self, daemon, db_session):
         """Already-executed CLOSE_POSITION decisions are NOT in pending set."""
         audit = DecisionAudit(
@@ -2811,6 +3016,7 @@ class TestEodReflectionFreshnessExemption:
             staged_candidates=[],
         )
         d.memory.market_context = {}
+        d.memory.context_cache = ContextSectionCache()
         d._db = db_session
 
         # Real guardrails with data freshness enabled
@@ -3232,7 +3438,7 @@ class TestEnrichPositionPnlFallback:
 
         mock_contract = MagicMock()
         daemon.ibkr_client.get_option_contract.return_value = mock_contract
-        daemon.ibkr_client.qualify_contract.return_value = mock_contract
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(return_value=[mock_contract])
         daemon.ibkr_client.get_quote = AsyncMock(
             return_value=Quote(bid=0.50, ask=0.60, last=0.55, is_valid=True, reason="")
         )
@@ -3264,7 +3470,7 @@ class TestEnrichPositionPnlFallback:
 
         mock_contract = MagicMock()
         daemon.ibkr_client.get_option_contract.return_value = mock_contract
-        daemon.ibkr_client.qualify_contract.return_value = mock_contract
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(return_value=[mock_contract])
         daemon.ibkr_client.get_quote = AsyncMock(
             return_value=Quote(bid=0.55, ask=0.55, last=0.55, is_valid=True, reason="frozen_close")
         )
@@ -3295,7 +3501,7 @@ class TestEnrichPositionPnlFallback:
 
         mock_contract = MagicMock()
         daemon.ibkr_client.get_option_contract.return_value = mock_contract
-        daemon.ibkr_client.qualify_contract.return_value = mock_contract
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(return_value=[mock_contract])
         # Live quote fails
         daemon.ibkr_client.get_quote = AsyncMock(
             return_value=Quote(bid=0, ask=0, is_valid=False, reason="Timeout after 1.0s")
@@ -3337,7 +3543,7 @@ class TestEnrichPositionPnlFallback:
 
         mock_contract = MagicMock()
         daemon.ibkr_client.get_option_contract.return_value = mock_contract
-        daemon.ibkr_client.qualify_contract.return_value = mock_contract
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(return_value=[mock_contract])
         daemon.ibkr_client.get_quote = AsyncMock(
             return_value=Quote(bid=0.50, ask=0.60, last=0.55, is_valid=True, reason="")
         )
@@ -3368,7 +3574,7 @@ class TestEnrichPositionPnlFallback:
 
         mock_contract = MagicMock()
         daemon.ibkr_client.get_option_contract.return_value = mock_contract
-        daemon.ibkr_client.qualify_contract.return_value = mock_contract
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(return_value=[mock_contract])
         daemon.ibkr_client.get_quote = AsyncMock(
             return_value=Quote(bid=0, ask=0, is_valid=False, reason="Timeout after 1.0s")
         )
@@ -3404,7 +3610,7 @@ class TestEnrichPositionPnlFallback:
 
         mock_contract = MagicMock()
         daemon.ibkr_client.get_option_contract.return_value = mock_contract
-        daemon.ibkr_client.qualify_contract.return_value = mock_contract
+        daemon.ibkr_client.qualify_contracts_async = AsyncMock(return_value=[mock_contract])
         daemon.ibkr_client.get_quote = AsyncMock(
             return_value=Quote(bid=0, ask=0, is_valid=False, reason="Timeout after 1.0s")
         )
@@ -3591,3 +3797,101 @@ class TestPnlSourceInPrompt:
 
         prompt = ctx.to_prompt_string()
         assert "P&L=?" in prompt
+
+
+class TestClosePreflight:
+    """An early streamed CLOSE_POSITION starts its pre-flight on the loop."""
+
+    def test_close_schedules_preflight_from_reasoning_thread(self):
+        from src.agentic.action_stream import EarlyAction
+        from src.agentic.daemon import TAADDaemon
+
+        daemon = TAADDaemon.__new__(TAADDaemon)
+        daemon.executor = MagicMock()
+        daemon.executor.preflight_close = AsyncMock(return_value=True)
+
+        async def run():
+            tasks = []
+            on_early_action = daemon._close_preflight_starter(tasks)
+
+            def reasoning_thread():
+                on_early_action(EarlyAction("MONITOR_ONLY", "T1", 10.0))
+                on_early_action(EarlyAction("CLOSE_POSITION", "T2", 20.0))
+
+            await asyncio.to_thread(reasoning_thread)
+            await asyncio.gather(*tasks)
+            return tasks
+
+        tasks = asyncio.get_event_loop().run_until_complete(run())
+
+        assert len(tasks) == 1
+        daemon.executor.preflight_close.assert_awaited_once_with("T2")
+
+
+class TestWorkerSessions:
+    """Concurrent event workers each get their own database session."""
+
+    def test_standalone_worker_uses_own_session(self, db_session):
+        from src.agentic.daemon import TAADDaemon
+
+        event = DaemonEvent(
+            event_type="POSITION_EXIT_CHECK", priority=3, status="processing",
+            payload={"trade_id": "T1"}, created_at=datetime.utcnow(),
+        )
+        db_session.add(event)
+        db_session.commit()
+        daemon = TAADDaemon.__new__(TAADDaemon)
+        daemon._db_session = None
+        daemon._process_event = AsyncMock()
+
+        asyncio.get_event_loop().run_until_complete(
+            daemon._process_claimed_event(event, db_session)
+        )
+
+        worker_event, worker_db = daemon._process_event.await_args.args
+        assert worker_db is not db_session
+        assert worker_event.id == event.id
+        assert worker_event is not event  # Loaded into the worker session
+
+    def test_worker_status_change_is_committed(self, db_session):
+        """The status set on the worker's copy of the event reaches the DB."""
+        from src.agentic.daemon import TAADDaemon
+        from src.agentic.event_bus import EventBus
+        from src.agentic.guardrails.config import GuardrailConfig
+
+        event = DaemonEvent(
+            event_type="POSITION_EXIT_CHECK", priority=3, status="processing",
+            payload={"trade_id": "T1"}, created_at=datetime.utcnow(),
+        )
+        db_session.add(event)
+        db_session.commit()
+        daemon = TAADDaemon.__new__(TAADDaemon)
+        daemon._db_session = None
+        daemon.config = MagicMock()
+        daemon.config.guardrails = GuardrailConfig()
+        daemon.event_bus = EventBus(db_session)
+        daemon.health = MagicMock()
+        daemon.health.shutdown_requested = False
+        daemon.calendar = MagicMock()
+        daemon.calendar.is_market_open.return_value = False  # Skipped, completed
+
+        asyncio.get_event_loop().run_until_complete(
+            daemon._process_claimed_event(event, db_session)
+        )
+
+        db_session.expire_all()
+        assert db_session.get(DaemonEvent, event.id).status == "completed"
+
+    def test_injected_session_is_shared(self, db_session):
+        from src.agentic.daemon import TAADDaemon
+
+        event = MagicMock()
+        daemon = TAADDaemon.__new__(TAADDaemon)
+        daemon._db_session = db_session
+        daemon._process_event = AsyncMock()
+
+        asyncio.get_event_loop().run_until_complete(
+            daemon._process_claimed_event(event, db_session)
+        )
+
+        daemon._process_event.assert_awaited_once_with(event, db_session, claimed=True)
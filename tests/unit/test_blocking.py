@@ -0,0 +1,146 @@
+"""Unit tests for the daemon's blocking-work executor and loop lag monitor.
+
+Tests:
+- run() executes blocking callables off the loop thread
+- install() routes asyncio.to_thread through the bounded pool
+- run_db() gives each task its own session (commit/rollback/close)
+- Without a session factory, run_db() uses the shared session
+- LoopLagMonitor counts and logs a stall with a stack sample
+- CostTracker uses per-call sessions when given a factory
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from loguru import logger
+
+from src.agentic.blocking import BlockingExecutor, LoopLagMonitor
+from src.agentic.reasoning_engine import CostTracker
+
+
+class TestBlockingExecutor:
+    @pytest.mark.asyncio
+    async def test_run_executes_off_loop_thread(self):
+        executor = BlockingExecutor(max_workers=2)
+        try:
+            loop_thread = threading.get_ident()
+            worker_thread = await executor.run(threading.get_ident)
+            assert worker_thread != loop_thread
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_install_bounds_to_thread(self):
+        executor = BlockingExecutor(max_workers=1)
+        try:
+            executor.install()
+            name = await asyncio.to_thread(lambda: threading.current_thread().name)
+            assert name.startswith("taad-blocking")
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_db_commits_and_closes_task_session(self):
+        session = MagicMock()
+        executor = BlockingExecutor(session_factory=lambda: session)
+        try:
+            result = await executor.run_db(lambda s, x: (s, x * 2), 21)
+        finally:
+            executor.shutdown()
+
+        assert result == (session, 42)
+        session.commit.assert_called_once()
+        session.rollback.assert_not_called()
+        session.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_run_db_rolls_back_on_error(self):
+        session = MagicMock()
+        executor = BlockingExecutor(session_factory=lambda: session)
+
+        def fail(s):
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError):
+                await executor.run_db(fail)
+        finally:
+            executor.shutdown()
+
+        session.commit.assert_not_called()
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_run_db_without_factory_uses_shared_session(self):
+        shared = MagicMock()
+        executor = BlockingExecutor(shared_session=shared)
+        try:
+            thread_id, used = await executor.run_db(lambda s: (threading.get_ident(), s))
+        finally:
+            executor.shutdown()
+
+        assert used is shared
+        assert thread_id == threading.get_ident()
+        shared.commit.assert_not_called()
+        shared.close.assert_not_called()
+
+
+class TestLoopLagMonitor:
+    @pytest.mark.asyncio
+    async def test_blocked_loop_logs_stack_sample(self):
+        messages = []
+        sink = logger.add(lambda m: messages.append(str(m)), level="WARNING")
+        monitor = LoopLagMonitor(threshold_ms=100, interval=0.02)
+        try:
+            monitor.start()
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)  # Block the loop
+            await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+            logger.remove(sink)
+
+        assert monitor.stalls == 1
+        assert any("Event loop blocked" in m and "time.sleep(0.3)" in m for m in messages)
+        assert monitor.lag_summary()["max"] >= 200
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_reports_no_stalls(self):
+        monitor = LoopLagMonitor(threshold_ms=200, interval=0.02)
+        try:
+            monitor.start()
+            await asyncio.sleep(0.2)
+        finally:
+            monitor.stop()
+
+        assert monitor.stalls == 0
+        assert monitor.lag_summary()["count"] > 0
+
+
+class TestCostTrackerSessions:
+    def test_record_uses_own_session_with_factory(self):
+        shared = MagicMock()
+        task_session = MagicMock()
+        # Counter row value after the increment
+        task_session.query.return_value.filter.return_value.scalar.return_value = 1.75
+        tracker = CostTracker(shared, session_factory=lambda: task_session)
+
+        tracker.record("claude-sonnet-4-5-20250929", "reasoning", 1000, 200, 0.25)
+
+        shared.add.assert_not_called()
+        task_session.add.assert_called_once()
+        task_session.commit.assert_called_once()
+        task_session.close.assert_called_once()
+        assert task_session.add.call_args[0][0].daily_total_usd == 1.75
+
+    def test_without_factory_uses_shared_session(self):
+        shared = MagicMock()
+        shared.query.return_value.filter.return_value.scalar.return_value = 2.0
+        tracker = CostTracker(shared)
+
+        assert tracker.get_daily_total() == 2.0
+        shared.close.assert_not_called()
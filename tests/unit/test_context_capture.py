@@ -367,3 +367,64 @@ class TestGenerateDecisionId:
 
         # Assert
         assert id1 != id2
+
+
+class TestConcurrentCapture:
+    """Test deadline-bound concurrent capture and the per-minute cache."""
+
+    def test_full_context_subscribes_all_symbols_before_waiting(
+        self, context_service, sample_opportunity
+    ):
+        """Underlying and market quotes are streamed together."""
+        pending = Mock()
+        pending.marketPrice = Mock(return_value=float("nan"))
+        pending.close = 100.0
+        pending.open = pending.high = pending.low = None
+        pending.volume, pending.avgVolume = 1000, 1000
+        context_service.ibkr.ticker = Mock(return_value=pending)
+        subscribed_before_wait = []
+        context_service.ibkr.wait = Mock(
+            side_effect=lambda s: (
+                subscribed_before_wait.append(context_service.ibkr.ticker.call_count),
+                setattr(pending, "marketPrice", Mock(return_value=101.0)),
+            )
+        )
+
+        result = context_service.capture_full_context(sample_opportunity, {}, {})
+
+        assert subscribed_before_wait == [4]
+        assert result.underlying.current_price == 101.0
+        assert result.market.spy_price == 101.0
+        assert result.market.missing_fields == []
+        assert context_service.ibkr.cancel_market_data.call_count == 4
+
+    def test_deadline_returns_partial_context_with_missing_fields(
+        self, mock_ibkr_client, mock_ticker
+    ):
+        """A quote that never arrives is marked missing, not waited on."""
+        slow = Mock()
+        slow.marketPrice = Mock(return_value=float("nan"))
+        slow.close = float("nan")
+        mock_ibkr_client.ticker = Mock(
+            side_effect=lambda s: slow if s == "VIX" else mock_ticker
+        )
+        service = ContextCaptureService(mock_ibkr_client, timeout=0.05, poll_interval=0.01)
+
+        result = service.capture_market_context()
+
+        assert result.spy_price == 450.25
+        assert result.vix == 0.0
+        assert result.missing_fields == ["vix", "vix_change_pct"]
+
+    def test_complete_market_context_cached_for_the_minute(
+        self, context_service, mock_ticker, sample_opportunity
+    ):
+        """A second capture in the same minute only streams the underlying."""
+        context_service.ibkr.ticker = Mock(return_value=mock_ticker)
+
+        first = context_service.capture_market_context()
+        context_service.capture_full_context(sample_opportunity, {}, {})
+
+        calls = [c[0][0] for c in context_service.ibkr.ticker.call_args_list]
+        assert calls == ["SPY", "QQQ", "VIX", "AAPL"]
+        assert context_service.capture_market_context().spy_price == first.spy_price
@@ -0,0 +1,211 @@
+"""Unit tests for incremental reasoning-context assembly.
+
+Tests:
+- Sections are cached by version and returned as copies
+- Event/action invalidation, TTL expiry, failed builds not cached
+- Invalidation during a build leaves the entry stale
+- Per-section build timings
+- WorkingMemory only assembles the sections an event type needs
+- EventDetector invalidates the market section on material VIX moves
+"""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agentic.context_sections import (
+    ALL_SECTIONS,
+    SECTION_MARKET,
+    SECTION_PATTERNS,
+    SECTION_PNL,
+    SECTION_POSITIONS,
+    SECTION_RECENT_TRADES,
+    SECTION_STAGED,
+    ContextSectionCache,
+    sections_for_event,
+)
+from src.agentic.working_memory import WorkingMemory
+from src.data.database import close_database, get_session, init_database
+from src.data.models import Pattern, Trade
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_session():
+    init_database(database_url="sqlite:///:memory:")
+    session = get_session()
+    yield session
+    session.close()
+    close_database()
+
+
+def _open_trade(trade_id, symbol="AAPL"):
+    return Trade(
+        trade_id=trade_id,
+        symbol=symbol,
+        strike=180.0,
+        expiration=date(2026, 3, 21),
+        option_type="PUT",
+        entry_date=datetime(2026, 2, 15),
+        entry_premium=1.50,
+        contracts=1,
+        dte=34,
+        exit_date=None,
+    )
+
+
+class TestContextSectionCache:
+    def test_build_caches_and_returns_copies(self):
+        cache = ContextSectionCache()
+        builder = MagicMock(return_value={"open_positions": [{"symbol": "AAPL"}]})
+
+        first = cache.build(SECTION_POSITIONS, builder)
+        first["open_positions"][0]["pnl"] = 0.5  # Enrichment mutates in place
+        second = cache.build(SECTION_POSITIONS, builder)
+
+        builder.assert_called_once()
+        assert second == {"open_positions": [{"symbol": "AAPL"}]}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_event_invalidates_only_its_sections(self):
+        cache = ContextSectionCache()
+        positions = MagicMock(return_value={"open_positions": []})
+        patterns = MagicMock(return_value={"active_patterns": []})
+        cache.build(SECTION_POSITIONS, positions)
+        cache.build(SECTION_PATTERNS, patterns)
+
+        cache.invalidate_for_event("POSITION_CLOSED")
+        cache.build(SECTION_POSITIONS, positions)
+        cache.build(SECTION_PATTERNS, patterns)
+
+        assert positions.call_count == 2
+        assert patterns.call_count == 1
+
+    def test_action_invalidation(self):
+        cache = ContextSectionCache()
+        staged = MagicMock(return_value=[])
+        cache.build(SECTION_STAGED, staged)
+
+        cache.invalidate_for_action("MONITOR_ONLY")
+        cache.build(SECTION_STAGED, staged)
+        cache.invalidate_for_action("STAGE_CANDIDATES")
+        cache.build(SECTION_STAGED, staged)
+
+        assert staged.call_count == 2
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ContextSectionCache(ttl_seconds={SECTION_PNL: 15}, clock=clock)
+        builder = MagicMock(return_value={"T1": {"pnl": 0.1}})
+        cache.build(SECTION_PNL, builder)
+
+        clock.now += 14
+        cache.build(SECTION_PNL, builder)
+        clock.now += 2
+        cache.build(SECTION_PNL, builder)
+
+        assert builder.call_count == 2
+
+    def test_failed_build_not_cached(self):
+        cache = ContextSectionCache()
+        builder = MagicMock(return_value=None)
+
+        assert cache.build(SECTION_RECENT_TRADES, builder) is None
+        cache.build(SECTION_RECENT_TRADES, builder)
+
+        assert builder.call_count == 2
+
+    def test_invalidation_during_build_leaves_entry_stale(self):
+        cache = ContextSectionCache()
+
+        def builder():
+            cache.invalidate(SECTION_POSITIONS)  # e.g. a fill lands mid-build
+            return {"open_positions": []}
+
+        cache.build(SECTION_POSITIONS, builder)
+        assert not cache.is_fresh(SECTION_POSITIONS)
+
+    @pytest.mark.asyncio
+    async def test_build_async_and_timings(self):
+        cache = ContextSectionCache()
+
+        async def builder():
+            return {"vix": 18.0}
+
+        assert await cache.build_async(SECTION_MARKET, builder) == {"vix": 18.0}
+        assert await cache.build_async(SECTION_MARKET, builder) == {"vix": 18.0}
+
+        summary = cache.build_time_summary()
+        assert list(summary) == [SECTION_MARKET]
+        assert summary[SECTION_MARKET]["count"] == 1
+
+    def test_sections_for_event(self):
+        exit_sections = sections_for_event("POSITION_EXIT_CHECK")
+        assert exit_sections == {SECTION_POSITIONS, SECTION_MARKET, SECTION_PNL}
+        assert sections_for_event("SCHEDULED_CHECK") == ALL_SECTIONS
+        assert sections_for_event(None) == ALL_SECTIONS
+
+
+class TestIncrementalAssembly:
+    def test_exit_check_skips_unneeded_sections(self, db_session):
+        db_session.add(_open_trade("T1"))
+        db_session.add(
+            Pattern(
+                pattern_type="delta_bucket",
+                pattern_name="low_delta",
+                sample_size=40,
+                win_rate=0.8,
+                avg_roi=0.03,
+                confidence=0.9,
+                p_value=0.01,
+                status="active",
+                date_detected=datetime(2026, 1, 15),
+            )
+        )
+        db_session.commit()
+        wm = WorkingMemory(db_session)
+
+        ctx = wm.assemble_context("POSITION_EXIT_CHECK")
+
+        assert [p["trade_id"] for p in ctx.open_positions] == ["T1"]
+        assert ctx.active_patterns == []
+        assert wm.context_cache.build_time_summary().keys() == {SECTION_POSITIONS}
+
+    def test_sections_reused_until_invalidated(self, db_session):
+        db_session.add(_open_trade("T1"))
+        db_session.commit()
+        wm = WorkingMemory(db_session)
+        wm.assemble_context("SCHEDULED_CHECK")
+
+        # A trade written without an event is not seen until invalidation
+        db_session.add(_open_trade("T2", symbol="MSFT"))
+        db_session.commit()
+        cached = wm.assemble_context("SCHEDULED_CHECK")
+        refreshed = wm.assemble_context("ORDER_FILLED")
+
+        assert len(cached.open_positions) == 1
+        assert len(refreshed.open_positions) == 2
+        assert wm.context_cache.hits >= 3  # positions + patterns + recent trades
+
+
+class TestVixTickInvalidation:
+    def test_material_vix_move_invalidates_market(self):
+        from src.agentic.event_detector import EventDetector
+
+        cache = ContextSectionCache()
+        detector = EventDetector(event_bus=MagicMock(), context_cache=cache)
+
+        detector._invalidate_market_context(18.00)
+        version = cache.versions[SECTION_MARKET]
+        detector._invalidate_market_context(18.04)
+        assert cache.versions[SECTION_MARKET] == version
+        detector._invalidate_market_context(18.15)
+        assert cache.versions[SECTION_MARKET] == version + 1
@@ -0,0 +1,261 @@
+"""Unit tests for deadline-bound emergency flatten.
+
+Tests:
+- One cancel sweep, then every closing order submitted before any wait
+- Time-to-flat reported once all legs fill
+- Unfilled legs re-priced in place on schedule and left working at deadline
+- Rejected orders resubmitted more aggressively
+- ExitManager target building and DB bookkeeping
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.config.baseline_strategy import BaselineStrategy
+from src.execution.emergency_flatten import (
+    EmergencyFlattener,
+    FlattenConfig,
+    FlattenTarget,
+)
+from src.execution.exit_manager import ExitManager
+from src.execution.position_monitor import PositionMonitor, PositionStatus
+from src.tools.ibkr_client import IBKRClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def _trade(order_id, status="Submitted"):
+    trade = Mock()
+    trade.order.orderId = order_id
+    trade.orderStatus.status = status
+    trade.orderStatus.avgFillPrice = 0.0
+    trade.orderStatus.remaining = 0
+    return trade
+
+
+def _target(symbol, quantity=2, reference=0.40):
+    return FlattenTarget(
+        position_id=f"{symbol}_200.0_20260215_P",
+        symbol=symbol,
+        strike=200.0,
+        expiration="20260215",
+        right="P",
+        quantity=quantity,
+        reference_price=reference,
+    )
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("src.execution.emergency_flatten.time.monotonic", clock.monotonic):
+        yield clock
+
+
+@pytest.fixture
+def client(clock):
+    client = MagicMock(spec=IBKRClient)
+    client.cancel_all_orders.return_value = True
+    client.get_option_contract.side_effect = lambda **kw: Mock(symbol=kw["symbol"])
+    client.qualify_contracts_batch.side_effect = lambda *cs: [
+        Mock(conId=i + 1, symbol=c.symbol) for i, c in enumerate(cs)
+    ]
+    client.subscribe_market_data.return_value = Mock(ask=0.45)
+    client.wait.side_effect = clock.advance
+    return client
+
+
+@pytest.fixture
+def config():
+    return FlattenConfig(
+        deadline_seconds=10.0,
+        poll_interval_seconds=0.5,
+        escalation_interval_seconds=2.0,
+        escalation_step_pct=0.10,
+        max_escalations=2,
+    )
+
+
+class TestEmergencyFlattener:
+    def test_sweep_then_concurrent_submit_and_time_to_flat(self, client, config, clock):
+        trades = [_trade(1), _trade(2)]
+        client.place_order_sync.side_effect = trades
+        placed_before_wait = []
+        client.wait.side_effect = lambda s: (
+            placed_before_wait.append(client.place_order_sync.call_count),
+            clock.advance(s),
+            [setattr(t.orderStatus, "status", "Filled") for t in trades],
+            [setattr(t.orderStatus, "avgFillPrice", 0.45) for t in trades],
+        )
+
+        report = EmergencyFlattener(client, config).flatten(
+            [_target("AAPL"), _target("MSFT")]
+        )
+
+        client.cancel_all_orders.assert_called_once()
+        client.qualify_contracts_batch.assert_called_once()
+        assert placed_before_wait[0] == 2
+        order = client.place_order_sync.call_args_list[0][0][1]
+        assert order.action == "BUY" and order.lmtPrice == 0.45
+        assert report.all_flat
+        assert report.time_to_flat_seconds == pytest.approx(0.5)
+        assert all(leg.fill_price == 0.45 for leg in report.legs)
+        assert client.cancel_market_data.call_count == 2
+
+    def test_unfilled_leg_escalates_then_left_working(self, client, config):
+        client.place_order_sync.return_value = _trade(7)
+        client.modify_order_sync.side_effect = lambda trade, price, reason: trade
+
+        report = EmergencyFlattener(client, config).flatten([_target("AAPL")])
+
+        leg = report.legs[0]
+        prices = [c[0][1] for c in client.modify_order_sync.call_args_list]
+        assert prices == [0.5, 0.55]  # ask + $0.05 steps, capped at 2
+        assert leg.status == "working"
+        assert leg.acked_at is not None
+        assert report.time_to_flat_seconds is None
+        assert not report.all_flat
+
+    def test_rejected_order_resubmitted(self, client, config):
+        rejected, filled = _trade(1, "Inactive"), _trade(2, "Filled")
+        filled.orderStatus.avgFillPrice = 0.50
+        client.place_order_sync.side_effect = [rejected, filled]
+
+        report = EmergencyFlattener(client, config).flatten([_target("AAPL")])
+
+        assert client.place_order_sync.call_count == 2
+        assert client.place_order_sync.call_args[0][1].lmtPrice == 0.5
+        assert report.legs[0].status == "filled"
+        assert report.legs[0].order_id == 2
+
+    def test_no_price_uses_market_order(self, client, config):
+        client.subscribe_market_data.return_value = Mock(ask=float("nan"))
+        client.place_order_sync.return_value = _trade(1, "Filled")
+
+        EmergencyFlattener(client, config).flatten([_target("AAPL", reference=None)])
+
+        assert client.place_order_sync.call_args[0][1].orderType == "MKT"
+
+    def test_global_cancel_failure_falls_back_per_order(self, client, config):
+        client.cancel_all_orders.return_value = False
+        client.get_open_trades.return_value = [_trade(11), _trade(12)]
+
+        report = EmergencyFlattener(client, config).flatten([])
+
+        assert client.cancel_order_sync.call_count == 2
+        assert report.legs == []
+
+    def test_unqualified_contract_fails_leg(self, client, config):
+        client.qualify_contracts_batch.side_effect = lambda *cs: [Mock(conId=0)]
+
+        report = EmergencyFlattener(client, config).flatten([_target("AAPL")])
+
+        assert report.legs[0].status == "failed"
+        client.place_order_sync.assert_not_called()
+
+
+def _position(symbol, contracts=5):
+    return PositionStatus(
+        position_id=f"{symbol}_200.0_20260215_P",
+        symbol=symbol,
+        strike=200.0,
+        option_type="PUT",
+        expiration_date="20260215",
+        contracts=contracts,
+        entry_premium=0.50,
+        current_premium=0.40,
+        current_pnl=50.0,
+        current_pnl_pct=0.20,
+        days_held=2,
+        dte=10,
+    )
+
+
+def _ib_position(symbol, quantity):
+    pos = Mock()
+    pos.contract.secType = "OPT"
+    pos.contract.symbol = symbol
+    pos.contract.strike = 200.0
+    pos.contract.lastTradeDateOrContractMonth = "20260215"
+    pos.contract.right = "P"
+    pos.position = quantity
+    return pos
+
+
+class TestExitManagerFlatten:
+    @pytest.fixture
+    def manager(self, client):
+        monitor = MagicMock(spec=PositionMonitor)
+        with patch.object(ExitManager, "_reconcile_pending_exits_on_startup"):
+            manager = ExitManager(client, monitor, BaselineStrategy())
+        manager._record_fill_in_db = Mock()
+        manager._mark_exit_pending_in_db = Mock()
+        manager._clear_pending_exit_in_db = Mock()
+        return manager
+
+    def test_targets_reconciled_against_broker(self, manager, client):
+        client.get_positions.return_value = [
+            _ib_position("AAPL", -3),  # DB says 5: capped at 3
+            _ib_position("MSFT", 2),  # broker long: skipped
+            _ib_position("NVDA", -1),  # broker-only short: added
+        ]
+
+        targets = manager._flatten_targets(
+            [_position("AAPL"), _position("MSFT"), _position("TSLA")]
+        )
+
+        assert {t.symbol: t.quantity for t in targets} == {
+            "AAPL": 3,
+            "TSLA": 5,
+            "NVDA": 1,
+        }
+        assert all(t.right == "P" for t in targets)
+
+    def test_fills_recorded_and_working_tracked(self, manager, client, config):
+        manager.position_monitor.get_all_positions.return_value = [
+            _position("AAPL"),
+            _position("MSFT"),
+        ]
+        manager._exit_orders_placed["OLD_1.0_20260215_P"] = (3, "profit_target")
+        filled, working = _trade(1, "Filled"), _trade(2)
+        filled.orderStatus.avgFillPrice = 0.42
+        client.place_order_sync.side_effect = [filled, working]
+        client.modify_order_sync.side_effect = lambda trade, price, reason: trade
+
+        report = manager.emergency_flatten(config=config)
+        results = manager.flatten_results(report)
+
+        manager._record_fill_in_db.assert_called_once_with(
+            "AAPL_200.0_20260215_P", 0.42, "emergency_exit"
+        )
+        manager._mark_exit_pending_in_db.assert_called_once_with(
+            "MSFT_200.0_20260215_P", 2
+        )
+        manager._clear_pending_exit_in_db.assert_called_once_with(
+            "OLD_1.0_20260215_P"
+        )
+        assert manager._exit_orders_placed == {
+            "MSFT_200.0_20260215_P": (2, "emergency_exit")
+        }
+        assert [r.success for r in results] == [True, True]
+        assert results[0].exit_price == 0.42
+
+    def test_dry_run_places_nothing(self, manager, client):
+        manager.dry_run = True
+        manager.position_monitor.get_all_positions.return_value = [_position("AAPL")]
+
+        report = manager.emergency_flatten()
+
+        client.cancel_all_orders.assert_not_called()
+        client.place_order_sync.assert_not_called()
+        assert report.legs[0].status == "dry_run"
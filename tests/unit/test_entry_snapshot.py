@@ -10,6 +10,8 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from sqlalchemy.orm import Session
 
+from ib_async import Stock
+
 from src.data.models import TradeEntrySnapshot
 from src.services.entry_snapshot import EntrySnapshotService
 
@@ -969,3 +971,150 @@ class TestScannerFallback:
         assert snapshot.delta == -0.22
         assert snapshot.iv == 0.30
         assert snapshot.gamma == 0.010
+
+
+def _batch_client():
+    """Mock client whose streams return data immediately."""
+    client = _make_ibkr_client()
+    client.is_market_open.return_value = {"is_open": True}
+    client.get_stock_contract.side_effect = lambda symbol: Stock(symbol, "SMART", "USD")
+    client.get_option_contract.side_effect = lambda symbol, *a, **kw: Mock(
+        symbol=symbol
+    )
+    client.qualify_contracts_batch.side_effect = lambda *cs: [
+        Mock(
+            conId=i + 1,
+            symbol=c.symbol,
+            secType=getattr(c, "secType", "OPT"),
+            currency=getattr(c, "currency", "USD"),
+        )
+        for i, c in enumerate(cs)
+    ]
+
+    def subscribe(contract):
+        ticker = Mock(
+            bid=2.45, ask=2.55, last=100.0, close=99.0, open=98.0,
+            high=101.0, low=97.0, volume=500, openInterest=1000,
+        )
+        ticker.modelGreeks = Mock(
+            delta=-0.30, gamma=0.015, theta=-0.08, vega=0.12, impliedVol=0.35
+        )
+        return ticker
+
+    client.subscribe_market_data.side_effect = subscribe
+    return client
+
+
+class TestBatchCapture:
+    """Test capture_entry_snapshots batch streaming and caching."""
+
+    def test_burst_streams_everything_at_once(self, sample_trade_params):
+        from src.services.entry_snapshot import SnapshotRequest
+
+        client = _batch_client()
+        service = EntrySnapshotService(client)
+        requests = [
+            SnapshotRequest(**{**sample_trade_params, "trade_id": i, "symbol": sym})
+            for i, sym in enumerate(["AAPL", "MSFT", "AAPL"])
+        ]
+
+        snapshots = service.capture_entry_snapshots(requests)
+
+        assert [s.trade_id for s in snapshots] == [0, 1, 2]
+        assert all(s.delta == -0.30 and s.bid == 2.45 for s in snapshots)
+        # One qualification request for all options, no polling needed
+        assert len(client.qualify_contracts_batch.call_args_list[0][0]) == 3
+        client.wait.assert_not_called()
+        # 3 options + 2 underlyings + SPY, VIX, QQQ, IWM
+        assert client.subscribe_market_data.call_count == 9
+        assert client.cancel_market_data.call_count == 9
+        # Shared quotes came from the streams, not blocking requests
+        client.get_market_data.assert_not_called()
+        assert snapshots[0].vix == 100.0
+
+    def test_second_burst_in_same_minute_reuses_shared_quotes(
+        self, sample_trade_params
+    ):
+        client = _batch_client()
+        EntrySnapshotService(client).capture_entry_snapshot(**sample_trade_params)
+        client.subscribe_market_data.reset_mock()
+
+        # New service on the same connection shares the cache
+        EntrySnapshotService(client).capture_entry_snapshot(**sample_trade_params)
+
+        assert client.subscribe_market_data.call_count == 1  # the option only
+
+    def test_slow_streams_stop_at_component_deadlines(self, sample_trade_params):
+        client = _batch_client()
+        client.subscribe_market_data.side_effect = lambda c: Mock(
+            bid=float("nan"), ask=float("nan"), last=float("nan"), modelGreeks=None
+        )
+        service = EntrySnapshotService(client)
+        service.greeks_timeout = 1.0
+        service.quote_timeout = 0.5
+
+        snapshot = service.capture_entry_snapshot(**sample_trade_params)
+
+        assert client.wait.call_count == 4  # 1.0s / 0.25s
+        assert snapshot.delta is None
+        # Option, underlying, SPY, VIX, QQQ, IWM
+        assert client.cancel_market_data.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_async_capture_prefetches_bars_concurrently(
+        self, sample_trade_params
+    ):
+        from unittest.mock import AsyncMock
+
+        from src.services.entry_snapshot import SnapshotRequest
+
+        client = _batch_client()
+        client.qualify_contracts_async = AsyncMock(
+            side_effect=lambda *cs: [Mock(conId=1, symbol=c.symbol, secType="STK",
+                                          currency="USD") for c in cs]
+        )
+        client.get_historical_bars_batch = AsyncMock(return_value=[[Mock()], [Mock()]])
+        service = EntrySnapshotService(client)
+        requests = [
+            SnapshotRequest(**{**sample_trade_params, "symbol": sym})
+            for sym in ["AAPL", "MSFT"]
+        ]
+
+        snapshots = await service.capture_entry_snapshots_async(requests)
+
+        assert len(snapshots) == 2
+        client.get_historical_bars_batch.assert_awaited_once()
+        # Indicators read the prefetched bars from the cache
+        client.get_historical_bars.assert_not_called()
+
+
+class TestEntrySnapshotQueue:
+    """Test background snapshot capture."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_batches_burst(
+        self, sample_trade_params
+    ):
+        from unittest.mock import AsyncMock
+
+        from src.services.entry_snapshot import EntrySnapshotQueue, SnapshotRequest
+
+        service = Mock()
+        service.capture_entry_snapshots_async = AsyncMock(
+            side_effect=lambda batch: [Mock(symbol=r.symbol) for r in batch]
+        )
+        queue = EntrySnapshotQueue(service)
+
+        with patch("src.data.database.get_db_session") as get_session:
+            for i in range(10):
+                queue.submit(SnapshotRequest(**{**sample_trade_params, "trade_id": i}))
+            assert queue.pending == 10
+            service.capture_entry_snapshots_async.assert_not_called()
+
+            await queue.join()
+
+        service.capture_entry_snapshots_async.assert_awaited_once()
+        assert len(service.capture_entry_snapshots_async.call_args[0][0]) == 10
+        assert service.save_snapshot.call_count == 10
+        assert queue.captured == 10
+        get_session.assert_called_once()
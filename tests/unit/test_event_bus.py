@@ -5,12 +5,14 @@ backed by the daemon_events database table. Covers event emission, status
 transitions, priority ordering, and event counting.
 """
 
+import asyncio
 import time
 from datetime import datetime, timedelta
 
 import pytest
 from sqlalchemy.orm import Session
 
+import src.agentic.event_bus as event_bus_module
 from src.agentic.event_bus import EVENT_PRIORITIES, EventBus, EventType
 from src.data.database import close_database, get_session, init_database
 from src.data.models import Base, DaemonEvent
@@ -595,6 +597,137 @@ class TestStop:
         assert event_bus._stop_event.is_set()
 
 
+class TestClaimPendingEvents:
+    """Tests for batched atomic claiming."""
+
+    def test_claims_batch_in_priority_order(self, event_bus):
+        low = event_bus.emit(EventType.HEARTBEAT)
+        high = event_bus.emit(EventType.EMERGENCY_STOP)
+        scheduled = event_bus.emit(EventType.SCHEDULED_CHECK)
+
+        claimed = event_bus.claim_pending_events(limit=2)
+
+        assert [e.id for e in claimed] == [high.id, scheduled.id]
+        assert all(e.status == "processing" for e in claimed)
+        assert all(e.processed_at is not None for e in claimed)
+        assert [e.id for e in event_bus.get_pending_events()] == [low.id]
+
+    def test_events_never_claimed_twice(self, event_bus):
+        for _ in range(3):
+            event_bus.emit(EventType.HEARTBEAT)
+
+        first = event_bus.claim_pending_events(limit=2)
+        second = event_bus.claim_pending_events(limit=2)
+
+        assert len(first) == 2 and len(second) == 1
+        assert not {e.id for e in first} & {e.id for e in second}
+        assert event_bus.claim_pending_events(limit=2) == []
+
+    def test_release_returns_event_to_pending(self, event_bus):
+        event_bus.emit(EventType.HEARTBEAT)
+        (event,) = event_bus.claim_pending_events(limit=1)
+
+        event_bus.release(event)
+
+        assert event.status == "pending"
+        assert event_bus.claim_pending_events(limit=1)[0].id == event.id
+
+
+# ---------------------------------------------------------------------------
+# Tests: stream() wake-ups
+# ---------------------------------------------------------------------------
+
+
+class TestStreamWakeup:
+    """Tests for stream() waking on emit rather than on the poll."""
+
+    @pytest.mark.asyncio
+    async def test_emit_wakes_stream_before_poll(self, event_bus):
+        """An in-process emit is dispatched well inside the poll interval."""
+        stream = event_bus.stream(poll_interval=30.0)
+        waiter = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)  # stream is now idle, waiting
+        assert not waiter.done()
+
+        start = time.perf_counter()
+        emitted = event_bus.emit(EventType.SCHEDULED_CHECK)
+        event = await asyncio.wait_for(waiter, timeout=1.0)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert event.id == emitted.id
+        assert elapsed_ms < 50
+        assert event_bus.dispatch_latency_summary()["count"] == 1
+        event_bus.stop()
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stop_wakes_idle_stream(self, event_bus):
+        stream = event_bus.stream(poll_interval=30.0)
+        waiter = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+
+        event_bus.stop()
+
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(waiter, timeout=1.0)
+        assert not event_bus_module._local_listeners
+
+    @pytest.mark.asyncio
+    async def test_full_batch_fetches_again_without_waiting(self, event_bus):
+        stream = event_bus.stream(poll_interval=30.0, max_events=2)
+        waiter = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        for _ in range(3):
+            event_bus.emit(EventType.HEARTBEAT)
+
+        seen = []
+        event = await asyncio.wait_for(waiter, timeout=1.0)
+        while True:
+            seen.append(event.id)
+            event_bus.mark_completed(event)
+            if len(seen) == 3:
+                break
+            event = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+
+        assert len(set(seen)) == 3
+        event_bus.stop()
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_refetch_yields_to_loop(self, event_bus):
+        """Unmarked events re-fetched after a full batch do not starve the loop."""
+        event_bus.emit(EventType.HEARTBEAT)
+        stream = event_bus.stream(poll_interval=30.0, max_events=1)
+        await stream.__anext__()  # startup replay
+        await stream.__anext__()  # steady state: same event, still pending
+        ran = []
+        asyncio.get_running_loop().call_soon(ran.append, True)
+
+        await stream.__anext__()
+
+        assert ran == [True]
+        event_bus.stop()
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_claiming_stream_releases_unyielded_events(self, event_bus):
+        for _ in range(3):
+            event_bus.emit(EventType.HEARTBEAT)
+        stream = event_bus.stream(poll_interval=30.0, claim=True)
+
+        first = await stream.__anext__()
+        assert first.status == "processing"
+        event_bus.stop()
+        await stream.aclose()
+
+        assert event_bus.get_event_counts() == {"processing": 1, "pending": 2}
+
+    def test_emit_skips_notify_on_sqlite(self, event_bus, db_session):
+        """NOTIFY is only issued on PostgreSQL."""
+        assert not event_bus._is_postgres()
+        assert event_bus._listen_postgres(None, None) is None
+
+
 # ---------------------------------------------------------------------------
 # Tests: Full lifecycle transitions
 # ---------------------------------------------------------------------------
@@ -0,0 +1,109 @@
+"""Unit tests for concurrent daemon event processing.
+
+Tests:
+- Independent events run concurrently up to max_workers
+- Events for the same trade run one at a time, in order
+- Per-event-type concurrency limits
+- Handler errors do not stop the pool; drain() waits / cancels
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from src.agentic.event_workers import DAEMON_LANE, EventWorkerPool, ordering_key
+
+
+def _event(event_id, event_type="POSITION_EXIT_CHECK", **payload):
+    return Mock(id=event_id, event_type=event_type, payload=payload)
+
+
+class Recorder:
+    """Handler that records start/finish order and peak concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self.started = []
+        self.finished = []
+
+    async def __call__(self, event):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.started.append(event.id)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        self.finished.append(event.id)
+
+
+class TestOrderingKey:
+    def test_trade_position_and_daemon_lanes(self):
+        assert ordering_key(_event(1, trade_id="T1")) == "trade:T1"
+        assert ordering_key(_event(2, position_id="AAPL_150.0_20260301_P")) == (
+            "position:AAPL_150.0_20260301_P"
+        )
+        assert ordering_key(_event(3, "MARKET_OPEN")) == DAEMON_LANE
+
+
+class TestEventWorkerPool:
+    @pytest.mark.asyncio
+    async def test_independent_events_run_concurrently(self):
+        handler = Recorder()
+        pool = EventWorkerPool(handler, max_workers=3)
+
+        for i in range(6):
+            await pool.submit(_event(i, trade_id=f"T{i}"))
+        await pool.drain()
+
+        assert handler.peak == 3
+        assert sorted(handler.finished) == list(range(6))
+
+    @pytest.mark.asyncio
+    async def test_same_trade_runs_in_order_one_at_a_time(self):
+        handler = Recorder()
+        pool = EventWorkerPool(handler, max_workers=4)
+
+        for i in range(3):
+            await pool.submit(_event(i, trade_id="T1"))
+        await pool.submit(_event(9, trade_id="T2"))
+        await pool.drain()
+
+        same_trade = [e for e in handler.finished if e != 9]
+        assert same_trade == [0, 1, 2]
+        assert handler.peak == 2  # T1 serialised, T2 alongside
+        assert pool._lanes == {}
+
+    @pytest.mark.asyncio
+    async def test_type_limit_caps_concurrency(self):
+        handler = Recorder()
+        pool = EventWorkerPool(
+            handler, max_workers=4, type_limits={"POSITION_EXIT_CHECK": 1}
+        )
+
+        for i in range(3):
+            await pool.submit(_event(i, trade_id=f"T{i}"))
+        await pool.submit(_event(7, "ORDER_FILLED", trade_id="T7"))
+        await pool.drain()
+
+        assert handler.peak == 2  # one exit check + the fill
+
+    @pytest.mark.asyncio
+    async def test_handler_error_logged_and_slot_released(self):
+        async def handler(event):
+            raise RuntimeError("boom")
+
+        pool = EventWorkerPool(handler, max_workers=1)
+        await pool.submit(_event(1))
+        await pool.submit(_event(2))  # would block if the slot leaked
+
+        assert await pool.drain(timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_cancels_stragglers(self):
+        pool = EventWorkerPool(Recorder(delay=10), max_workers=2)
+        await pool.submit(_event(1))
+
+        assert not await pool.drain(timeout=0.05)
+        assert pool.in_flight == 0
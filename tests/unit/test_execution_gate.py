@@ -7,7 +7,7 @@ import time
 
 import pytest
 from dataclasses import dataclass, field
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 
 from src.agentic.guardrails.config import GuardrailConfig
 from src.agentic.guardrails.execution_gate import ExecutionGate
@@ -344,3 +344,22 @@ def test_validate_fetches_live_data_once(gate, config):
 
     # _fetch_live_data should be called exactly once
     gate._fetch_live_data.assert_called_once_with(mock_client)
+
+
+def test_fetch_live_data_reads_fresh_shared_snapshot(gate):
+    """A fresh streamed snapshot answers the gate without any IBKR request."""
+    mock_client = MagicMock()
+    snapshot = MagicMock(vix=22.0, spy_price=505.0)
+    service = MagicMock()
+    service.snapshot.return_value = snapshot
+
+    with patch(
+        "src.services.market_conditions.get_market_conditions_service",
+        return_value=service,
+    ):
+        assert gate._fetch_live_data(mock_client) == (22.0, 505.0)
+
+    service.snapshot.assert_called_once_with(
+        max_age_seconds=ExecutionGate.LIVE_DATA_MAX_AGE_SECONDS
+    )
+    mock_client.ib.qualifyContracts.assert_not_called()
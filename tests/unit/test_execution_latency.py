@@ -0,0 +1,205 @@
+"""Unit tests for order lifecycle latency telemetry.
+
+Tests:
+- Stage marking and TWS status mapping on OrderLatency
+- Percentile/histogram aggregation per segment
+- Persistence of submitted orders to order_latency
+- RapidFireExecutor callback wiring
+"""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.services.execution_latency import (
+    LatencyRecorder,
+    OrderLatency,
+    load_latency_summary,
+    summarize_order_latency,
+)
+from src.services.premarket_validator import StagedOpportunity
+from src.services.rapid_fire_executor import PendingOrder, RapidFireExecutor
+from src.utils.latency import histogram, percentile, summarize_latencies
+
+
+@pytest.fixture
+def staged():
+    return StagedOpportunity(
+        id=7,
+        symbol="AAPL",
+        strike=150.0,
+        expiration="2026-02-14",
+        staged_stock_price=155.0,
+        staged_limit_price=0.45,
+        staged_contracts=5,
+        staged_margin=3750.0,
+        otm_pct=0.15,
+    )
+
+
+class TestLatencyHelpers:
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) is None
+
+    def test_histogram_overflow_bucket(self):
+        buckets = histogram([5, 20, 999999], buckets=(10, 100))
+        assert buckets == [
+            {"le": 10, "count": 1},
+            {"le": 100, "count": 1},
+            {"le": None, "count": 1},
+        ]
+
+    def test_summary_empty(self):
+        summary = summarize_latencies([])
+        assert summary["count"] == 0
+        assert summary["p50"] is None
+
+
+class TestOrderLatency:
+    def test_mark_records_first_occurrence_only(self):
+        lat = OrderLatency(symbol="AAPL", strike=150.0)
+        lat.mark("submitted")
+        first = lat.stage_ms["submitted"]
+        time.sleep(0.002)
+        lat.mark("submitted")
+        assert lat.stage_ms["submitted"] == first
+
+    def test_on_status_maps_tws_statuses(self):
+        lat = OrderLatency(symbol="AAPL", strike=150.0)
+        lat.on_status("PreSubmitted", 0)
+        assert "acked" in lat.stage_ms
+        assert "first_partial" not in lat.stage_ms
+
+        lat.on_status("Submitted", 2)
+        assert "first_partial" in lat.stage_ms
+        assert "filled" not in lat.stage_ms
+
+        lat.on_status("Filled", 5)
+        assert "filled" in lat.stage_ms
+        assert lat.final_status == "Filled"
+
+    def test_record_modify(self):
+        lat = OrderLatency(symbol="AAPL", strike=150.0)
+        lat.record_modify(time.perf_counter())
+        assert len(lat.modify_ms) == 1
+        assert lat.modify_ms[0] >= 0
+
+
+class TestSummarize:
+    def test_segments_computed_from_offsets(self):
+        rows = [
+            SimpleNamespace(
+                contract_ready_ms=100.0,
+                submitted_ms=300.0,
+                acked_ms=350.0,
+                first_partial_ms=None,
+                filled_ms=1300.0,
+                modify_ms=[80.0],
+            ),
+            SimpleNamespace(
+                contract_ready_ms=120.0,
+                submitted_ms=320.0,
+                acked_ms=None,
+                first_partial_ms=None,
+                filled_ms=None,
+                modify_ms=None,
+            ),
+        ]
+        summary = summarize_order_latency(rows)
+
+        assert summary["orders"] == 2
+        assert summary["segments"]["decision_to_contract"]["count"] == 2
+        assert summary["segments"]["submit_to_ack"]["count"] == 1
+        assert summary["segments"]["submit_to_ack"]["p50"] == 50.0
+        assert summary["segments"]["submit_to_fill"]["p99"] == 1000.0
+        assert summary["segments"]["submit_to_first_partial"]["count"] == 0
+        assert summary["modify"]["count"] == 1
+
+
+class TestPersistence:
+    def test_flush_persists_submitted_orders_only(self, temp_database, staged):
+        recorder = LatencyRecorder()
+        submitted = recorder.start(staged)
+        submitted.mark("contract_ready")
+        submitted.mark("submitted")
+        submitted.on_status("Filled", 5)
+        recorder.start(staged)  # skipped: never submitted
+
+        assert recorder.flush() == 1
+        assert recorder.records == []
+
+        from src.data.database import get_db_session
+
+        with get_db_session() as session:
+            summary = load_latency_summary(session, days=1)
+
+        assert summary["orders"] == 1
+        assert summary["batches"] == 1
+        assert summary["segments"]["submit_to_fill"]["count"] == 1
+
+    def test_each_flush_is_its_own_batch(self, temp_database, staged):
+        recorder = LatencyRecorder()
+        for _ in range(2):
+            recorder.start(staged).mark("submitted")
+            assert recorder.flush() == 1
+
+        from src.data.database import get_db_session
+
+        with get_db_session() as session:
+            summary = load_latency_summary(session, days=1)
+
+        assert summary["orders"] == 2
+        assert summary["batches"] == 2
+
+    def test_flush_swallows_db_errors(self, staged, monkeypatch):
+        import src.data.database as database
+
+        def _boom():
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(database, "get_db_session", _boom)
+        recorder = LatencyRecorder()
+        lat = recorder.start(staged)
+        lat.mark("submitted")
+        assert recorder.flush() == 0
+
+
+class TestExecutorWiring:
+    def test_order_status_callback_updates_latency(self, staged):
+        client = Mock()
+        event = Mock()
+        event.__iadd__ = Mock(return_value=event)
+        client.order_status_event = event
+        executor = RapidFireExecutor(ibkr_client=client, adaptive_executor=Mock())
+
+        latency = executor.latency.start(staged)
+        latency.mark("submitted")
+        executor.pending_orders[1] = PendingOrder(
+            staged=staged,
+            contract=Mock(),
+            order_id=1,
+            initial_limit=0.45,
+            current_limit=0.45,
+            last_bid=0.44,
+            last_ask=0.48,
+            submitted_at=datetime.now(),
+            order_type="Adaptive",
+            latency=latency,
+        )
+
+        trade = Mock()
+        trade.order.orderId = 1
+        trade.orderStatus.status = "Submitted"
+        trade.orderStatus.filled = 0
+        trade.orderStatus.remaining = 5
+        executor._on_order_status(trade)
+
+        assert "acked" in latency.stage_ms
+        assert "filled" not in latency.stage_ms
@@ -0,0 +1,276 @@
+"""Unit tests for the pre-warmed market-open execution path.
+
+Tests:
+- Cache lookup by current strike (hit/miss) and release idempotency
+- Streaming ticker snapshots
+- ExecutionPrewarmer qualification, subscription, what-if margin and order build
+- RapidFireExecutor consuming the cache (misses fall back to the live path)
+- AdaptiveOrderExecutor placing a pre-built order
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services.adaptive_order_executor import (
+    AdaptiveOrderExecutor,
+    LiveQuote,
+    OrderResult,
+)
+from src.services.adaptive_order_executor import OrderStatus as AdaptiveOrderStatus
+from src.services.execution_prewarm import (
+    ExecutionPrewarmer,
+    PrewarmCache,
+    PrewarmedTrade,
+    contract_key,
+    staged_key,
+)
+from src.services.market_calendar import MarketSession
+from src.services.premarket_validator import StagedOpportunity
+from src.services.rapid_fire_executor import RapidFireExecutor
+from src.tools.ibkr_client import Quote
+
+
+def _staged(id, symbol, strike):
+    return StagedOpportunity(
+        id=id,
+        symbol=symbol,
+        strike=strike,
+        expiration="2026-02-14",
+        staged_stock_price=strike * 1.15,
+        staged_limit_price=0.45,
+        staged_contracts=5,
+        staged_margin=3000.0,
+        otm_pct=0.15,
+    )
+
+
+def _contract(symbol, strike):
+    return SimpleNamespace(
+        symbol=symbol, strike=strike, lastTradeDateOrContractMonth="20260214"
+    )
+
+
+def _ticker(bid, ask):
+    return SimpleNamespace(bid=bid, ask=ask, last=(bid + ask) / 2, volume=100)
+
+
+@pytest.fixture
+def mock_client():
+    client = Mock()
+    client.get_option_contract = Mock(side_effect=lambda **kw: kw)
+    client.qualify_contracts_async = AsyncMock()
+    client.get_quotes_batch = AsyncMock()
+    order_status_event = Mock()
+    order_status_event.__iadd__ = Mock(return_value=order_status_event)
+    client.order_status_event = order_status_event
+    return client
+
+
+def _submitted(order_id):
+    return OrderResult(
+        success=True,
+        order_id=order_id,
+        status=AdaptiveOrderStatus.SUBMITTED,
+        order_type="Adaptive",
+        live_bid=0.44,
+        live_ask=0.48,
+        calculated_limit=0.45,
+    )
+
+
+class TestPrewarmCache:
+    def test_contract_key_normalizes_expiration(self):
+        from datetime import date
+
+        assert contract_key("AAPL", 150, "2026-02-14") == ("AAPL", 150.0, "20260214")
+        assert contract_key("AAPL", 150.0, date(2026, 2, 14)) == ("AAPL", 150.0, "20260214")
+
+    def test_lookup_by_current_strike(self):
+        staged = _staged(1, "AAPL", 150.0)
+        cache = PrewarmCache()
+        cache.trades[staged_key(staged)] = PrewarmedTrade(
+            staged=staged, contract=_contract("AAPL", 150.0), whatif_margin=2800.0
+        )
+
+        assert cache.get(staged) is not None
+        assert cache.whatif_margin(staged) == 2800.0
+
+        # Adaptive strike selection moved the strike after pre-warm
+        staged.strike = 145.0
+        assert cache.get(staged) is None
+        assert cache.whatif_margin(staged) is None
+
+    def test_release_is_idempotent(self):
+        staged = _staged(1, "AAPL", 150.0)
+        cache = PrewarmCache()
+        cache.trades[staged_key(staged)] = PrewarmedTrade(
+            staged=staged, contract=_contract("AAPL", 150.0), ticker=_ticker(0.4, 0.5)
+        )
+        client = Mock()
+
+        cache.release(client)
+        cache.release(client)
+
+        assert client.cancel_market_data.call_count == 1
+        assert cache.get(staged) is None
+
+    def test_snapshot_quote(self):
+        entry = PrewarmedTrade(
+            staged=_staged(1, "AAPL", 150.0),
+            contract=_contract("AAPL", 150.0),
+            ticker=_ticker(0.44, 0.48),
+        )
+        quote = entry.snapshot_quote()
+        assert quote.is_valid
+        assert quote.bid == 0.44
+        assert quote.ask == 0.48
+
+        entry.ticker = SimpleNamespace(bid=float("nan"), ask=0.48, last=None, volume=None)
+        assert not entry.snapshot_quote().is_valid
+
+        entry.ticker = None
+        assert not entry.snapshot_quote().is_valid
+
+
+class TestExecutionPrewarmer:
+    @pytest.mark.asyncio
+    async def test_prewarm_prepares_qualified_trades(self, mock_client):
+        trades = [_staged(1, "AAPL", 150.0), _staged(2, "MSFT", 300.0)]
+        # Only AAPL qualifies
+        mock_client.qualify_contracts_async.return_value = [_contract("AAPL", 150.0)]
+        mock_client.subscribe_market_data = Mock(return_value=_ticker(0.44, 0.48))
+        mock_client.get_actual_margin = Mock(return_value=2900.0)
+        mock_client.get_account_summary = Mock(return_value={"AvailableFunds": 50000})
+        mock_client.check_market_data_health = Mock(return_value=(True, None))
+
+        adaptive = Mock()
+        adaptive.use_adaptive = True
+        adaptive.create_adaptive_order = Mock(return_value=SimpleNamespace(lmtPrice=0.45))
+
+        cache = await ExecutionPrewarmer(mock_client, adaptive).prewarm(trades)
+
+        assert len(cache.trades) == 1
+        assert cache.failed == {"MSFT": "Contract not qualified"}
+        entry = cache.get(trades[0])
+        assert entry.whatif_margin == 2900.0
+        assert entry.order is not None
+        adaptive.create_adaptive_order.assert_called_once_with(
+            contracts=5, floor_price=0.45
+        )
+        assert cache.account_summary == {"AvailableFunds": 50000}
+        assert cache.market_data_health == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_prewarm_tolerates_broker_errors(self, mock_client):
+        trades = [_staged(1, "AAPL", 150.0)]
+        mock_client.qualify_contracts_async.return_value = [_contract("AAPL", 150.0)]
+        mock_client.subscribe_market_data = Mock(side_effect=RuntimeError("no perms"))
+        mock_client.get_actual_margin = Mock(side_effect=RuntimeError("timeout"))
+        mock_client.get_account_summary = Mock(side_effect=RuntimeError("down"))
+        mock_client.check_market_data_health = Mock(return_value=(True, None))
+
+        adaptive = Mock()
+        adaptive.use_adaptive = False
+        adaptive.create_limit_order = Mock(return_value=SimpleNamespace(lmtPrice=0.45))
+
+        cache = await ExecutionPrewarmer(mock_client, adaptive).prewarm(trades)
+
+        entry = cache.get(trades[0])
+        assert entry.ticker is None
+        assert entry.whatif_margin is None
+        assert cache.account_summary is None
+        adaptive.create_limit_order.assert_called_once()
+
+
+class TestRapidFireWithPrewarm:
+    @pytest.mark.asyncio
+    async def test_hits_skip_qualification_and_quotes(self, mock_client):
+        adaptive = Mock(spec=AdaptiveOrderExecutor)
+        adaptive.place_order = AsyncMock(side_effect=[_submitted(1), _submitted(2)])
+        adaptive.limit_calc = Mock()
+        adaptive.limit_calc.calculate_sell_limit = Mock(return_value=0.45)
+        executor = RapidFireExecutor(ibkr_client=mock_client, adaptive_executor=adaptive)
+
+        trades = [_staged(1, "AAPL", 150.0), _staged(2, "MSFT", 300.0)]
+        cache = PrewarmCache()
+        orders = []
+        for staged in trades:
+            order = SimpleNamespace(lmtPrice=0.45)
+            orders.append(order)
+            cache.trades[staged_key(staged)] = PrewarmedTrade(
+                staged=staged,
+                contract=_contract(staged.symbol, staged.strike),
+                ticker=_ticker(0.44, 0.48),
+                order=order,
+            )
+
+        with patch.object(executor, "_monitor_and_adjust", new_callable=AsyncMock):
+            report = await executor.execute_all(trades, prewarm=cache)
+
+        assert report.total_submitted == 2
+        assert report.last_submission_at is not None
+        mock_client.qualify_contracts_async.assert_not_called()
+        mock_client.get_quotes_batch.assert_not_called()
+        passed_orders = [c.kwargs["order"] for c in adaptive.place_order.call_args_list]
+        assert passed_orders == orders
+
+    @pytest.mark.asyncio
+    async def test_misses_take_live_path(self, mock_client):
+        adaptive = Mock(spec=AdaptiveOrderExecutor)
+        adaptive.place_order = AsyncMock(side_effect=[_submitted(1), _submitted(2)])
+        adaptive.limit_calc = Mock()
+        adaptive.limit_calc.calculate_sell_limit = Mock(return_value=0.45)
+        executor = RapidFireExecutor(ibkr_client=mock_client, adaptive_executor=adaptive)
+
+        hit = _staged(1, "AAPL", 150.0)
+        miss = _staged(2, "MSFT", 300.0)
+        unqualified = _staged(3, "NVDA", 100.0)
+        cache = PrewarmCache()
+        cache.trades[staged_key(hit)] = PrewarmedTrade(
+            staged=hit, contract=_contract("AAPL", 150.0), ticker=_ticker(0.44, 0.48)
+        )
+        mock_client.qualify_contracts_async.return_value = [_contract("MSFT", 300.0)]
+        mock_client.get_quotes_batch.return_value = [
+            Quote(bid=0.44, ask=0.48, last=0.46, volume=100, is_valid=True)
+        ]
+
+        with patch.object(executor, "_monitor_and_adjust", new_callable=AsyncMock):
+            report = await executor.execute_all([hit, miss, unqualified], prewarm=cache)
+
+        # Only the two misses are qualified, only the live-path contract is quoted
+        assert len(mock_client.qualify_contracts_async.call_args[0]) == 2
+        quoted = mock_client.get_quotes_batch.call_args[0][0]
+        assert [c.symbol for c in quoted] == ["MSFT"]
+        assert report.total_submitted == 2
+        assert [f.symbol for f in report.failed] == ["NVDA"]
+
+
+class TestAdaptivePlaceOrderPrebuilt:
+    @pytest.mark.asyncio
+    async def test_prebuilt_order_gets_live_limit(self):
+        client = Mock()
+        trade = Mock()
+        trade.order.orderId = 42
+        trade.orderStatus.status = "Submitted"
+        client.place_order = AsyncMock(return_value=trade)
+        executor = AdaptiveOrderExecutor(ibkr_client=client, limit_calc=Mock())
+        executor.create_adaptive_order = Mock()
+
+        staged = _staged(1, "AAPL", 150.0)
+        order = SimpleNamespace(lmtPrice=0.45, algoStrategy="Adaptive")
+        quote = LiveQuote(bid=0.46, ask=0.50, limit=0.47, is_tradeable=True)
+
+        calendar = Mock()
+        calendar.get_current_session.return_value = MarketSession.REGULAR
+        with patch(
+            "src.services.adaptive_order_executor.MarketCalendar", return_value=calendar
+        ), patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await executor.place_order(staged, Mock(), quote, order=order)
+
+        assert result.success
+        assert result.order_type == "Adaptive"
+        assert order.lmtPrice == 0.47
+        executor.create_adaptive_order.assert_not_called()
+        assert client.place_order.call_args[0][1] is order
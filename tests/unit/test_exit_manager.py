@@ -3,7 +3,8 @@
 Tests automated exit decision-making and execution.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -1163,3 +1164,101 @@ class TestExitResultDataclass:
         assert result.order_id is None
         assert result.exit_price is None
         assert result.error_message == "Order rejected"
+
+
+class TestPrepareExit:
+    """Pre-flight for an exit decided while reasoning is still streaming."""
+
+    KEY = "AAPL_200.0_20260215_P"
+
+    @pytest.fixture(autouse=True)
+    def held_position(self, mock_ibkr_client):
+        contract = Mock(
+            symbol="AAPL", strike=200.0, lastTradeDateOrContractMonth="20260215", right="P"
+        )
+        mock_ibkr_client.get_positions.return_value = [Mock(contract=contract, position=-5)]
+        mock_ibkr_client.qualify_contracts_async.return_value = [Mock()]
+
+    def _prepare(self, exit_manager, key=KEY):
+        return asyncio.get_event_loop().run_until_complete(exit_manager.prepare_exit(key))
+
+    def test_prepare_caches_qualified_contract(
+        self, exit_manager, mock_position_monitor, mock_ibkr_client
+    ):
+        assert self._prepare(exit_manager)
+
+        mock_ibkr_client.qualify_contracts_async.assert_awaited_once()
+        mock_ibkr_client.qualify_contract.assert_not_called()
+        mock_position_monitor.update_position.assert_not_called()
+        assert self.KEY in exit_manager._prepared_contracts
+        mock_ibkr_client.place_order_sync.assert_not_called()
+
+    @patch("src.data.database.get_db_session")
+    def test_execute_reuses_prepared_contract(
+        self, mock_get_db_session, exit_manager, mock_position_monitor,
+        mock_ibkr_client, profitable_position,
+    ):
+        mock_session = MagicMock()
+        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_get_db_session.return_value.__enter__ = Mock(return_value=mock_session)
+        mock_get_db_session.return_value.__exit__ = Mock(return_value=False)
+        mock_position_monitor.update_position.return_value = profitable_position
+        mock_trade = Mock()
+        mock_trade.order.orderId = 123
+        mock_trade.orderStatus.status = "Filled"
+        mock_trade.orderStatus.avgFillPrice = 0.26
+        mock_ibkr_client.place_order_sync.return_value = mock_trade
+
+        self._prepare(exit_manager)
+        result = exit_manager.execute_exit(
+            self.KEY, ExitDecision(should_exit=True, reason="claude_decision", limit_price=0.26)
+        )
+
+        assert result.success
+        mock_ibkr_client.qualify_contract.assert_not_called()
+        assert exit_manager._prepared_contracts == {}
+
+    def test_prepare_skips_position_with_exit_order(self, exit_manager, mock_ibkr_client):
+        exit_manager._exit_orders_placed[self.KEY] = (99, "profit_target")
+
+        assert not self._prepare(exit_manager)
+        mock_ibkr_client.qualify_contracts_async.assert_not_called()
+
+    def test_prepare_skips_position_not_held(self, exit_manager, mock_ibkr_client):
+        assert not self._prepare(exit_manager, "MSFT_350.0_20260215_P")
+        mock_ibkr_client.qualify_contracts_async.assert_not_called()
+
+    def test_discard_drops_only_given_contracts(self, exit_manager):
+        self._prepare(exit_manager)
+        other = "MSFT_350.0_20260215_P"
+        exit_manager._prepared_contracts[other] = MagicMock()
+
+        exit_manager.discard_prepared_exits([self.KEY])
+
+        assert list(exit_manager._prepared_contracts) == [other]
+
+
+class TestRiskStateReporting:
+    """Filled exits are reported to the risk governor."""
+
+    @patch("src.data.database.get_db_session")
+    def test_recorded_fill_reports_close(
+        self, mock_get_db_session, mock_ibkr_client, mock_position_monitor, config
+    ):
+        mock_get_db_session.return_value.__enter__ = Mock(return_value=MagicMock())
+        mock_get_db_session.return_value.__exit__ = Mock(return_value=False)
+        governor = MagicMock()
+        manager = ExitManager(
+            mock_ibkr_client, mock_position_monitor, config, risk_governor=governor
+        )
+        trade = Mock(
+            symbol="AAPL", strike=200.0, expiration=date(2026, 2, 15),
+            entry_premium=0.50, contracts=5,
+        )
+
+        with patch.object(manager, "_find_trade_by_position_id", return_value=trade):
+            manager._record_fill_in_db("POS1", 0.20, "profit_target")
+
+        governor.record_position_closed.assert_called_once_with(
+            "AAPL", 200.0, date(2026, 2, 15), trade.profit_loss
+        )
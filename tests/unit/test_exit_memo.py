@@ -0,0 +1,278 @@
+"""Unit tests for the POSITION_EXIT_CHECK decision memo.
+
+Tests:
+- Fingerprint ignores sub-bucket P&L noise, changes on material inputs
+- Lookup hits only a fresh entry with the same fingerprint
+- Only MONITOR_ONLY decisions are memoized; fills/alerts/actions invalidate
+- Cost view summary aggregates hits and dollars saved from decision_audit
+- Daemon skips enrichment and reasoning on a hit, re-asks after a fill
+- Batched checks reuse hits per position and send only the misses
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agentic.context_sections import ContextSectionCache
+from src.agentic.exit_memo import (
+    ExitDecisionMemo,
+    exit_check_fingerprint,
+    load_exit_memo_summary,
+)
+from src.agentic.reasoning_engine import DecisionOutput
+from src.data.database import close_database, get_session, init_database
+from src.data.models import DaemonEvent, DecisionAudit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_session():
+    init_database(database_url="sqlite:///:memory:")
+    session = get_session()
+    yield session
+    session.close()
+    close_database()
+
+
+def _payload(**overrides):
+    payload = {"trade_id": "T1", "symbol": "AAPL", "pnl_pct": 61.3, "dte": 9}
+    payload.update(overrides)
+    return payload
+
+
+def _monitor(cost=0.012):
+    return DecisionOutput(
+        action="MONITOR_ONLY",
+        confidence=0.8,
+        reasoning="Theta still working, no reversal risk",
+        metadata={"trade_id": "T1", "call_cost_usd": cost},
+    )
+
+
+class TestFingerprint:
+    def test_stable_within_bucket(self):
+        a = exit_check_fingerprint(_payload(pnl_pct=61.3), vix=17.0, autonomy_level=2)
+        b = exit_check_fingerprint(_payload(pnl_pct=64.9), vix=18.5, autonomy_level=2)
+        assert a == b
+
+    @pytest.mark.parametrize(
+        "payload, vix, level",
+        [
+            (_payload(pnl_pct=71.0), 17.0, 2),
+            (_payload(dte=8), 17.0, 2),
+            (_payload(earnings_in_dte=True), 17.0, 2),
+            (_payload(), 22.0, 2),
+            (_payload(), 17.0, 3),
+        ],
+    )
+    def test_material_change(self, payload, vix, level):
+        base = exit_check_fingerprint(_payload(), vix=17.0, autonomy_level=2)
+        assert exit_check_fingerprint(payload, vix=vix, autonomy_level=level) != base
+
+    def test_incomplete_payload(self):
+        assert exit_check_fingerprint({"pnl_pct": 60.0}) is None
+        assert exit_check_fingerprint({"trade_id": "T1"}) is None
+
+
+class TestExitDecisionMemo:
+    def test_hit_requires_same_fingerprint_and_ttl(self):
+        clock = FakeClock()
+        memo = ExitDecisionMemo(ttl_seconds=600, clock=clock)
+        memo.store("T1", "fp1", _monitor(), cost_usd=0.012, audit_id=7)
+
+        assert memo.lookup("T1", "fp2") is None
+        entry = memo.lookup("T1", "fp1")
+        assert entry.audit_id == 7
+        clock.now += 600
+        assert memo.lookup("T1", "fp1") is None
+
+        assert (memo.hits, memo.misses) == (1, 2)
+        assert memo.saved_usd == pytest.approx(0.012)
+
+    def test_close_decision_not_memoized(self):
+        memo = ExitDecisionMemo()
+        memo.store("T1", "fp1", _monitor(), cost_usd=0.01)
+        close = DecisionOutput(action="CLOSE_POSITION", confidence=0.9, reasoning="x")
+        memo.store("T1", "fp1", close, cost_usd=0.01)
+
+        assert memo.lookup("T1", "fp1") is None
+
+    def test_zero_ttl_disables(self):
+        memo = ExitDecisionMemo(ttl_seconds=0)
+        memo.store("T1", "fp1", _monitor(), cost_usd=0.01)
+        assert memo.lookup("T1", "fp1") is None
+
+    @pytest.mark.parametrize("event_type", ["ORDER_FILLED", "RISK_LIMIT_BREACH"])
+    def test_fill_and_alert_invalidate(self, event_type):
+        memo = ExitDecisionMemo()
+        memo.store("T1", "fp1", _monitor(), cost_usd=0.01)
+        memo.invalidate_for_event("SCHEDULED_CHECK")
+        assert memo.lookup("T1", "fp1") is not None
+
+        memo.invalidate_for_event(event_type)
+        assert memo.lookup("T1", "fp1") is None
+
+    def test_close_action_invalidates(self):
+        memo = ExitDecisionMemo()
+        memo.store("T1", "fp1", _monitor(), cost_usd=0.01)
+        memo.invalidate_for_action("MONITOR_ONLY")
+        assert memo.lookup("T1", "fp1") is not None
+        memo.invalidate_for_action("CLOSE_POSITION")
+        assert memo.lookup("T1", "fp1") is None
+
+
+class TestSummary:
+    def test_hit_rate_and_saved(self, db_session):
+        for meta in (
+            {"decision_source": "claude", "call_cost_usd": 0.02},
+            {"decision_source": "exit_memo", "saved_cost_usd": 0.02},
+            {"decision_source": "exit_memo", "saved_cost_usd": 0.015},
+        ):
+            db_session.add(
+                DecisionAudit(
+                    timestamp=datetime.utcnow(),
+                    autonomy_level=2,
+                    event_type="POSITION_EXIT_CHECK",
+                    action="MONITOR_ONLY",
+                    confidence=0.8,
+                    reasoning="r",
+                    autonomy_approved=True,
+                    decision_metadata=meta,
+                )
+            )
+        db_session.commit()
+
+        summary = load_exit_memo_summary(db_session, days=1)
+
+        assert summary["exit_checks"] == 3
+        assert summary["memo_hits"] == 2
+        assert summary["hit_rate"] == pytest.approx(0.6667)
+        assert summary["saved_usd"] == pytest.approx(0.035)
+
+
+class TestDaemonShortCircuit:
+    @pytest.fixture
+    def daemon(self, db_session):
+        from src.agentic.action_executor import ExecutionResult
+        from src.agentic.daemon import TAADDaemon
+        from src.agentic.guardrails.config import GuardrailConfig
+        from src.agentic.guardrails.registry import GuardrailRegistry
+
+        d = TAADDaemon.__new__(TAADDaemon)
+        d.config = MagicMock()
+        d.config.claude.reasoning_model = "test-model"
+        d.event_bus = MagicMock()
+        d.health = MagicMock()
+        d.health.shutdown_requested = False
+        d.calendar = MagicMock()
+        d.calendar.is_market_open.return_value = True
+        d.memory = MagicMock()
+        d.memory.assemble_context.return_value = MagicMock(
+            market_context={}, open_positions=[], staged_candidates=[]
+        )
+        d.memory.market_context = {"vix": 17.0}
+        d.memory.context_cache = ContextSectionCache()
+        d.guardrails = GuardrailRegistry(GuardrailConfig())
+        d.reasoning = MagicMock()
+        d.reasoning.reason.return_value = [_monitor()]
+        d.reasoning._reasoning_agent = MagicMock(
+            total_input_tokens=0, total_output_tokens=0, session_cost=0.0
+        )
+        d.governor = MagicMock()
+        d.governor.level = 2
+        d.executor = MagicMock()
+        d.executor.execute = AsyncMock(
+            return_value=ExecutionResult(success=True, action="MONITOR_ONLY", message="ok")
+        )
+        d.entropy_monitor = MagicMock()
+        d.cro_agent = None
+        d.ibkr_client = None
+        d._enrich_context = AsyncMock()
+        d.exit_memo = ExitDecisionMemo(ttl_seconds=900)
+        return d
+
+    def _run(self, daemon, db_session, event_type="POSITION_EXIT_CHECK", payload=None):
+        event = DaemonEvent(
+            event_type=event_type,
+            priority=3,
+            status="pending",
+            payload=payload if payload is not None else _payload(),
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(event)
+        db_session.commit()
+        asyncio.get_event_loop().run_until_complete(
+            daemon._process_event(event, db_session, claimed=True)
+        )
+
+    def test_unchanged_check_skips_enrichment_and_reasoning(self, daemon, db_session):
+        self._run(daemon, db_session)
+        self._run(daemon, db_session, payload=_payload(pnl_pct=62.0))
+
+        assert daemon.reasoning.reason.call_count == 1
+        assert daemon._enrich_context.await_count == 1
+        hit = (
+            db_session.query(DecisionAudit)
+            .order_by(DecisionAudit.id.desc())
+            .first()
+        )
+        assert hit.decision_metadata["decision_source"] == "exit_memo"
+        assert hit.decision_metadata["saved_cost_usd"] == pytest.approx(0.012)
+        assert load_exit_memo_summary(db_session)["memo_hits"] == 1
+
+    def test_fill_forces_new_call(self, daemon, db_session):
+        self._run(daemon, db_session)
+        self._run(daemon, db_session, event_type="ORDER_FILLED", payload={})
+        self._run(daemon, db_session)
+
+        exit_calls = [
+            c for c in daemon.reasoning.reason.call_args_list
+            if c.kwargs["event_type"] == "POSITION_EXIT_CHECK"
+        ]
+        assert len(exit_calls) == 2
+
+    def test_batched_check_sends_only_misses(self, daemon, db_session):
+        self._run(daemon, db_session)  # Memoizes T1
+        close = DecisionOutput(
+            action="CLOSE_POSITION", confidence=0.9, reasoning="x",
+            metadata={"trade_id": "T2", "call_cost_usd": 0.01},
+        )
+        close_t3 = DecisionOutput(
+            action="CLOSE_POSITION", confidence=0.9, reasoning="y",
+            metadata={"trade_id": "T3", "call_cost_usd": 0.01},
+        )
+        daemon.reasoning.reason.return_value = [close, close_t3]
+        daemon._is_duplicate_decision = MagicMock(return_value=None)
+        batch = {"positions": [
+            _payload(),
+            _payload(trade_id="T2", symbol="TSLA"),
+            _payload(trade_id="T3", symbol="NVDA"),
+        ]}
+
+        self._run(daemon, db_session, payload=batch)
+
+        sent = daemon.reasoning.reason.call_args.kwargs["event_payload"]
+        assert [p["trade_id"] for p in sent["positions"]] == ["T2", "T3"]
+        # Per-trade dedup: closing T2 does not suppress T3
+        trade_ids = [
+            c.kwargs["trade_id"] for c in daemon._is_duplicate_decision.call_args_list
+        ]
+        assert trade_ids == ["T2", "T3"]
+        assert load_exit_memo_summary(db_session)["memo_hits"] == 1
+
+    def test_close_dedup_is_per_trade(self, daemon):
+        daemon.memory.recent_decisions = [
+            {"action": "CLOSE_POSITION", "trade_id": "T2", "timestamp": daemon._market_timestamp()}
+        ]
+        assert daemon._is_duplicate_decision("CLOSE_POSITION", trade_id="T3") is None
+        assert daemon._is_duplicate_decision("CLOSE_POSITION", trade_id="T2") is not None
+        assert daemon._is_duplicate_decision("CLOSE_POSITION") is not None
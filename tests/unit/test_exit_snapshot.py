@@ -394,3 +394,87 @@ def test_save_snapshot_handles_errors(exit_service, mock_db_session):
 
     # Verify rollback was called
     mock_db_session.rollback.assert_called_once()
+
+
+# ============================================================
+# Exit Context Tests
+# ============================================================
+
+
+def _quote(last):
+    ticker = Mock(spec=["last", "bid", "ask", "modelGreeks"])
+    ticker.last = last
+    ticker.bid = ticker.ask = float("nan")
+    ticker.modelGreeks = None
+    return ticker
+
+
+def _exit_context_client(vix_last=18.5):
+    """Client whose option, stock and VIX streams fill on the first wait."""
+    client = Mock()
+    option = Mock(symbol="AAPL", secType="OPT")
+    client.qualify_contracts_batch.return_value = [option]
+    option_ticker = _quote(float("nan"))
+    stock_ticker, vix_ticker = _quote(float("nan")), _quote(float("nan"))
+    streams = {"OPT": option_ticker, "STK": stock_ticker, "IND": vix_ticker}
+    client.subscribe_market_data.side_effect = lambda c: streams[c.secType]
+    subscribed_before_wait = []
+
+    def wait(seconds):
+        subscribed_before_wait.append(client.subscribe_market_data.call_count)
+        option_ticker.modelGreeks = Mock(impliedVol=0.31)
+        stock_ticker.last = 158.0
+        vix_ticker.last = vix_last
+
+    client.wait.side_effect = wait
+    client.subscribed_before_wait = subscribed_before_wait
+    return client
+
+
+def test_capture_exit_context_streams_concurrently(sample_trade, mock_db_session):
+    """Option, stock and VIX are subscribed together and awaited once."""
+    client = _exit_context_client()
+    service = ExitSnapshotService(client, mock_db_session, context_timeout=5)
+    snapshot = TradeExitSnapshot(trade_id=1)
+
+    service._capture_exit_context(snapshot, sample_trade)
+
+    assert client.subscribed_before_wait[0] == 3
+    assert client.wait.call_count == 1
+    assert snapshot.exit_iv == 0.31
+    assert snapshot.stock_price_at_exit == 158.0
+    assert snapshot.vix_at_exit == 18.5
+    assert snapshot.missing_context_fields is None
+    assert client.cancel_market_data.call_count == 3
+
+
+def test_capture_exit_context_marks_missing_at_deadline(sample_trade, mock_db_session):
+    """A quote that never arrives is marked missing instead of blocking."""
+    client = _exit_context_client(vix_last=float("nan"))
+    service = ExitSnapshotService(client, mock_db_session, context_timeout=0.5)
+    service.poll_interval = 0.01
+    snapshot = TradeExitSnapshot(trade_id=1)
+
+    service._capture_exit_context(snapshot, sample_trade)
+
+    assert snapshot.stock_price_at_exit == 158.0
+    assert snapshot.vix_at_exit is None
+    assert snapshot.missing_context_fields == ["vix_at_exit"]
+    assert client.cancel_market_data.call_count == 3
+
+
+def test_capture_exit_context_reuses_cached_quotes(sample_trade, mock_db_session):
+    """Stock and VIX quotes from an earlier capture this minute are reused."""
+    client = _exit_context_client()
+    service = ExitSnapshotService(client, mock_db_session, context_timeout=5)
+    service._capture_exit_context(TradeExitSnapshot(trade_id=1), sample_trade)
+    client.subscribe_market_data.reset_mock()
+
+    snapshot = TradeExitSnapshot(trade_id=2)
+    ExitSnapshotService(client, mock_db_session)._capture_exit_context(
+        snapshot, sample_trade
+    )
+
+    assert client.subscribe_market_data.call_count == 1  # option only
+    assert snapshot.vix_at_exit == 18.5
+    assert snapshot.stock_price_at_exit == 158.0
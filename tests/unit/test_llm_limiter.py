@@ -0,0 +1,115 @@
+"""Unit tests for the Claude call limiter.
+
+Tests:
+- TokenBucket refills continuously and caps oversize requests
+- LlmLimiter bounds in-flight requests and records queue waits
+- settle() charges the token budget for the real prompt size
+- BaseAgent calls run concurrently, and share one client per API key
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents import base_agent
+from src.agents.base_agent import BaseAgent
+from src.agents.llm_limiter import LlmLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    def test_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(per_minute=60, clock=clock)
+        bucket.take(60)
+
+        assert bucket.wait_seconds(1) == pytest.approx(1.0)
+        clock.now += 0.5
+        assert bucket.wait_seconds(1) == pytest.approx(0.5)
+        clock.now += 120
+        assert bucket.wait_seconds(60) == 0.0  # Capped at capacity
+
+    def test_oversize_request_waits_for_full_bucket(self):
+        bucket = TokenBucket(per_minute=100, clock=FakeClock())
+        assert bucket.wait_seconds(500) == 0.0
+
+
+class TestLlmLimiter:
+    def test_bounds_in_flight(self):
+        limiter = LlmLimiter(max_concurrency=2, requests_per_minute=10_000)
+        peak = []
+        lock = threading.Lock()
+
+        def call():
+            with limiter.slot():
+                with lock:
+                    peak.append(limiter.in_flight)
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) == 2
+        stats = limiter.stats()
+        assert stats["in_flight"] == 0
+        assert stats["queue_wait_ms"]["count"] == 6
+        assert stats["queue_wait_ms"]["max"] >= 40
+
+    def test_settle_charges_actual_tokens(self):
+        limiter = LlmLimiter(tokens_per_minute=1000)
+        with limiter.slot(estimated_tokens=100):
+            pass
+        limiter.settle(estimated_tokens=100, actual_tokens=900)
+
+        assert limiter.tokens.wait_seconds(200) > 0
+
+
+class TestBaseAgentConcurrency:
+    def _agent(self):
+        agent = BaseAgent(model="claude-sonnet-4-5-20250929", api_key="test-key")
+        agent.client = MagicMock()
+
+        def create(**kwargs):
+            time.sleep(0.2)
+            response = MagicMock()
+            response.usage.input_tokens = 100
+            response.usage.output_tokens = 10
+            response.content = [MagicMock(text="{}")]
+            return response
+
+        agent.client.messages.create.side_effect = create
+        return agent
+
+    def test_calls_overlap(self, monkeypatch):
+        limiter = LlmLimiter(max_concurrency=4)
+        monkeypatch.setattr(base_agent, "get_limiter", lambda: limiter)
+        agents = [self._agent(), self._agent()]
+
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=a.send_message, args=("sys", "msg")) for a in agents
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert time.perf_counter() - start < 0.35
+        assert all(a.total_requests == 1 for a in agents)
+
+    def test_client_shared_per_key(self):
+        a = BaseAgent(api_key="shared-key")
+        b = BaseAgent(model="claude-haiku-4-5-20251001", api_key="shared-key")
+        assert a.client is b.client
@@ -9,14 +9,19 @@ Tests market condition monitoring for Tier 2 execution timing:
 """
 
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
 from ib_async import Contract
 
-from src.services.market_conditions import MarketConditionMonitor, MarketConditions
+from src.services.market_conditions import (
+    MarketConditionMonitor,
+    MarketConditions,
+    MarketConditionsService,
+    get_market_conditions_service,
+)
 from src.tools.ibkr_client import Quote
 
 
@@ -455,3 +460,96 @@ class TestConfigurableThresholds:
             assert monitor.vvix_warn_threshold == 100.0
             assert monitor.vvix_extreme_threshold == 130.0
             assert monitor.term_structure_block_threshold == 1.05
+
+
+def _stream_ticker(last, age_seconds=1.0):
+    ticker = Mock(spec=["last", "bid", "ask", "time", "contract"])
+    ticker.last = last
+    ticker.bid = ticker.ask = float("nan")
+    ticker.time = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    return ticker
+
+
+@pytest.fixture
+def streaming_client():
+    """Client whose VIX/VVIX/VIX3M/SPY subscriptions return live tickers."""
+    client = Mock()
+    client.qualify_contracts_batch = Mock(
+        side_effect=lambda *cs: [MagicMock(conId=i + 1, symbol=c.symbol) for i, c in enumerate(cs)]
+    )
+    client.tickers = {
+        "VIX": _stream_ticker(19.0),
+        "VVIX": _stream_ticker(95.0),
+        "VIX3M": _stream_ticker(21.0),
+        "SPY": _stream_ticker(500.0, age_seconds=5.0),
+    }
+    client.subscribe_market_data = Mock(side_effect=lambda c: client.tickers[c.symbol])
+    return client
+
+
+class TestMarketConditionsService:
+    """Tests for the shared streaming market-conditions snapshot."""
+
+    def test_snapshot_assessed_from_streams(self, streaming_client):
+        """Fresh ticks produce a stream snapshot timestamped by the oldest tick."""
+        service = MarketConditionsService(streaming_client)
+
+        conditions = service.snapshot(max_age_seconds=30)
+
+        assert conditions.source == "stream"
+        assert (conditions.vix, conditions.vvix, conditions.vix3m) == (19.0, 95.0, 21.0)
+        assert conditions.spy_price == 500.0
+        assert conditions.term_structure == "contango"
+        assert 5.0 <= conditions.age_seconds() < 10.0
+        assert streaming_client.subscribe_market_data.call_count == 4
+
+        service.snapshot(max_age_seconds=30)
+        streaming_client.qualify_contracts_batch.assert_called_once()
+
+    def test_stale_snapshot_rejected(self, streaming_client):
+        """Data older than the caller's max age is not returned."""
+        streaming_client.tickers["SPY"] = _stream_ticker(500.0, age_seconds=20.0)
+        service = MarketConditionsService(streaming_client)
+
+        assert service.snapshot(max_age_seconds=10) is None
+        assert service.snapshot(max_age_seconds=30) is not None
+
+    def test_missing_vvix_uses_default(self, streaming_client):
+        """VVIX without ticks falls back to the default, VIX drives the snapshot."""
+        streaming_client.tickers["VVIX"] = _stream_ticker(float("nan"))
+
+        conditions = MarketConditionsService(streaming_client).snapshot(max_age_seconds=30)
+
+        assert conditions.vvix == 90.0
+
+    def test_no_vix_stream_returns_none(self, streaming_client):
+        """Without a VIX subscription there is no snapshot."""
+        streaming_client.qualify_contracts_batch = Mock(return_value=[])
+        service = MarketConditionsService(streaming_client)
+
+        assert service.snapshot(max_age_seconds=30) is None
+        assert service.snapshot(max_age_seconds=30) is None
+        # Not retried until resubscribe_seconds has passed
+        streaming_client.qualify_contracts_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_current_falls_back_to_poll_when_stale(self, streaming_client):
+        """current() performs a one-off check when the stream is stale."""
+        streaming_client.tickers["VIX"] = _stream_ticker(19.0, age_seconds=300.0)
+        polled = Mock(spec=MarketConditions)
+        service = MarketConditionsService(streaming_client)
+        service.monitor.check_conditions = AsyncMock(return_value=polled)
+
+        result = await service.current(max_age_seconds=60)
+
+        assert result is polled
+        assert service.fallback_reads == 1
+
+    def test_service_shared_per_client(self, streaming_client):
+        """Every reader on the same client gets the same service."""
+        assert get_market_conditions_service(streaming_client) is (
+            get_market_conditions_service(streaming_client)
+        )
+        assert get_market_conditions_service(streaming_client) is not (
+            get_market_conditions_service(Mock())
+        )
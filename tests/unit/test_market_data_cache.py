@@ -0,0 +1,73 @@
+"""Unit tests for the per-minute market data cache."""
+
+from unittest.mock import MagicMock, Mock
+
+from ib_async import Index, Stock
+
+from src.services.market_data_cache import (
+    CachedMarketData,
+    MarketDataCache,
+    get_market_data_cache,
+)
+
+
+class FakeClock:
+    def __init__(self, now=600.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestMarketDataCache:
+    def test_entries_expire_when_minute_rolls(self):
+        clock = FakeClock(600.0)
+        cache = MarketDataCache(clock=clock)
+        fetch = Mock(return_value={"last": 15.0})
+
+        assert cache.get_or_fetch("vix", fetch) == {"last": 15.0}
+        clock.now = 659.0
+        assert cache.get_or_fetch("vix", fetch) == {"last": 15.0}
+        assert fetch.call_count == 1
+
+        clock.now = 660.0
+        cache.get_or_fetch("vix", fetch)
+        assert fetch.call_count == 2
+
+    def test_empty_results_not_cached_but_explicit_none_is(self):
+        cache = MarketDataCache(clock=FakeClock())
+        fetch = Mock(return_value=None)
+
+        cache.get_or_fetch("spy", fetch)
+        cache.get_or_fetch("spy", fetch)
+        assert fetch.call_count == 2
+
+        cache.put("qqq", None)
+        assert cache.get_or_fetch("qqq", fetch) is None
+        assert fetch.call_count == 2
+
+    def test_shared_per_client(self):
+        client_a, client_b = MagicMock(), MagicMock()
+        assert get_market_data_cache(client_a) is get_market_data_cache(client_a)
+        assert get_market_data_cache(client_a) is not get_market_data_cache(client_b)
+
+
+class TestCachedMarketData:
+    def test_quotes_and_bars_cached_other_calls_pass_through(self):
+        client = MagicMock()
+        client.get_market_data.return_value = {"last": 450.0}
+        client.get_historical_bars.return_value = [Mock()]
+        market = CachedMarketData(client, MarketDataCache(clock=FakeClock()))
+
+        for _ in range(3):
+            market.get_market_data(Stock("SPY", "SMART", "USD"))
+            market.get_historical_bars(Stock("SPY", "SMART", "USD"), duration="10 D")
+        market.get_market_data(Index("VIX", "CBOE", "USD"))
+        market.get_historical_bars(
+            Stock("SPY", "SMART", "USD"), duration="10 D", end_date_time="20260101"
+        )
+        market.get_account_id()
+
+        assert client.get_market_data.call_count == 2  # SPY once, VIX once
+        assert client.get_historical_bars.call_count == 2  # dated request not cached
+        client.get_account_id.assert_called_once()
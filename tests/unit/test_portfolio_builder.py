@@ -441,6 +441,28 @@ class TestPortfolioBuilder:
         aapl_trades = [t for t in plan.trades if t.symbol == "AAPL"]
         assert len(aapl_trades) == 1
 
+    def test_build_portfolio_maximizes_premium(self, builder):
+        """Budget left unused by the most efficient trade goes to a better pair."""
+        candidates = [
+            create_test_candidate(
+                "BIG", bid=1.00, contracts=1, margin_estimate=30000.0, sector="S1",
+            ),
+            create_test_candidate(
+                "MID1", bid=0.55, contracts=1, margin_estimate=20000.0, sector="S2",
+            ),
+            create_test_candidate(
+                "MID2", bid=0.55, contracts=1, margin_estimate=20000.0, sector="S3",
+            ),
+        ]
+
+        plan = builder.build_portfolio(candidates, margin_budget=40000.0)
+
+        assert sorted(t.symbol for t in plan.trades) == ["MID1", "MID2"]
+        assert plan.skipped_trades[0].symbol == "BIG"
+        assert "Would exceed budget" in plan.skipped_trades[0].skip_reason
+        assert plan.selection.optimal
+        assert plan.selection.value > plan.selection.greedy_value
+
     def test_build_portfolio_ranks_by_efficiency(self, builder):
         """Test that trades are ranked by margin efficiency."""
         candidates = [
@@ -0,0 +1,135 @@
+"""Unit tests for optimal portfolio selection.
+
+Tests:
+- Optimizer beats greedy where greedy leaves margin unused
+- Exact search matches brute force on random instances
+- Approximation for large lists respects all limits and never loses to greedy
+- Time budget and maximality of the result
+"""
+
+import itertools
+import random
+
+import pytest
+
+from src.services.portfolio_optimizer import (
+    SelectionItem,
+    greedy_select,
+    optimize_selection,
+)
+
+
+def _feasible(items, chosen, budget, max_positions, max_per_sector):
+    if len(chosen) > max_positions:
+        return False
+    if sum(items[i].weight for i in chosen) > budget:
+        return False
+    symbols = [items[i].symbol for i in chosen]
+    if len(symbols) != len(set(symbols)):
+        return False
+    sectors = {}
+    for i in chosen:
+        sectors[items[i].sector] = sectors.get(items[i].sector, 0) + 1
+    return all(count <= max_per_sector for count in sectors.values())
+
+
+def _brute_force(items, budget, max_positions, max_per_sector):
+    best = 0.0
+    for r in range(0, min(len(items), max_positions) + 1):
+        for combo in itertools.combinations(range(len(items)), r):
+            if _feasible(items, combo, budget, max_positions, max_per_sector):
+                best = max(best, sum(items[i].value for i in combo))
+    return best
+
+
+def _random_items(rng, n, symbols=8, sectors=3):
+    return [
+        SelectionItem(
+            value=round(rng.uniform(0.1, 1.0), 3),
+            weight=round(rng.uniform(500, 6000), 0),
+            symbol=f"S{rng.randrange(symbols)}",
+            sector=f"X{rng.randrange(sectors)}",
+        )
+        for _ in range(n)
+    ]
+
+
+class TestOptimizeSelection:
+    def test_beats_greedy_when_large_pick_blocks_two_smaller(self):
+        items = [
+            SelectionItem(value=0.9, weight=5000, symbol="AAPL", sector="Tech"),
+            SelectionItem(value=0.8, weight=2500, symbol="JPM", sector="Fin"),
+            SelectionItem(value=0.7, weight=2500, symbol="XOM", sector="Energy"),
+        ]
+        result = optimize_selection(items, budget=5000, max_positions=10, max_per_sector=3)
+
+        assert greedy_select(items, 5000, 10, 3) == [0]
+        assert result.selected == [1, 2]
+        assert result.value == pytest.approx(1.5)
+        assert result.greedy_value == pytest.approx(0.9)
+        assert result.gain_vs_greedy_pct == pytest.approx(66.67, abs=0.01)
+        assert result.optimal
+        assert result.optimality_gap_pct == 0.0
+
+    @pytest.mark.parametrize("seed", range(15))
+    def test_exact_matches_brute_force(self, seed):
+        rng = random.Random(seed)
+        items = _random_items(rng, 11)
+        budget, max_positions, max_per_sector = 12000, 4, 2
+
+        result = optimize_selection(
+            items, budget, max_positions, max_per_sector, time_budget_ms=1000
+        )
+
+        assert result.optimal
+        assert _feasible(items, result.selected, budget, max_positions, max_per_sector)
+        assert result.value == pytest.approx(
+            _brute_force(items, budget, max_positions, max_per_sector)
+        )
+        assert result.value >= result.greedy_value - 1e-9
+
+    def test_approximation_for_large_lists(self):
+        rng = random.Random(42)
+        items = _random_items(rng, 3000, symbols=800, sectors=11)
+
+        result = optimize_selection(
+            items, budget=40000, max_positions=10, max_per_sector=3,
+            exact_max_items=100,
+        )
+
+        assert result.method == "approximate"
+        assert not result.optimal
+        assert _feasible(items, result.selected, 40000, 10, 3)
+        assert result.value >= result.greedy_value
+        assert result.upper_bound >= result.value
+
+    def test_time_budget_is_respected(self):
+        rng = random.Random(7)
+        items = _random_items(rng, 60, symbols=60, sectors=6)
+
+        result = optimize_selection(
+            items, budget=30000, max_positions=10, max_per_sector=3,
+            time_budget_ms=5,
+        )
+
+        # Generous slack for slow CI machines; the search itself stops at 5ms
+        assert result.elapsed_ms < 250
+        assert _feasible(items, result.selected, 30000, 10, 3)
+        assert result.value >= result.greedy_value
+        if result.method == "exact_timeout":
+            assert result.upper_bound >= result.value
+
+    def test_result_is_maximal(self):
+        """Zero-value items that still fit are included, not silently dropped."""
+        items = [
+            SelectionItem(value=1.0, weight=1000, symbol="AAPL", sector="Tech"),
+            SelectionItem(value=0.0, weight=1000, symbol="JPM", sector="Fin"),
+            SelectionItem(value=0.5, weight=9000, symbol="XOM", sector="Energy"),
+        ]
+        result = optimize_selection(items, budget=3000, max_positions=5, max_per_sector=2)
+        assert result.selected == [0, 1]
+
+    def test_empty_and_degenerate_limits(self):
+        assert optimize_selection([], 1000, 5, 2).selected == []
+        items = [SelectionItem(value=1.0, weight=10, symbol="A", sector="X")]
+        assert optimize_selection(items, 1000, 0, 2).selected == []
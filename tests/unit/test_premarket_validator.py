@@ -3,9 +3,13 @@
 Tests the two-stage validation logic for staged trades:
 - Stage 1: Pre-market stock price validation (9:15 AM)
 - Stage 2: Market-open premium validation (9:30 AM)
+- Concurrent variants, shared price cache and batch deadline
+- Concurrent strike-interval lookup for symbols that need adjusting
 """
 
-from unittest.mock import MagicMock
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -18,6 +22,7 @@ from src.services.premarket_validator import (
     ValidationConfig,
     ValidationStatus,
 )
+from src.tools.ibkr_client import Quote
 
 
 def create_staged_opportunity(
@@ -768,3 +773,208 @@ class TestStage2InvalidBidHandling:
         msft_result = next(r for r in results if r.opportunity.symbol == "MSFT")
         assert aapl_result.passed is True
         assert msft_result.passed is True
+
+
+def _quote(bid=0.0, ask=0.0, last=0.0):
+    return Quote(bid=bid, ask=ask, last=last, is_valid=bool(last or (bid and ask)))
+
+
+def _async_ibkr(stock_prices, option_quotes=None, slow=()):
+    """Mock client for the concurrent path.
+
+    Contracts are SimpleNamespaces; quotes for symbols in ``slow`` never
+    arrive (they outlive any test deadline).
+    """
+    option_quotes = option_quotes or {}
+    mock = MagicMock()
+    mock.get_stock_contract.side_effect = lambda s: SimpleNamespace(
+        symbol=s, secType="STK", conId=0
+    )
+    mock.get_option_contract.side_effect = lambda **kw: SimpleNamespace(
+        secType="OPT", **kw
+    )
+    mock.qualify_contracts_async = AsyncMock(side_effect=lambda *cs: list(cs))
+
+    async def get_quote(contract, timeout=None):
+        if contract.symbol in slow:
+            await asyncio.sleep(60)
+        if contract.secType == "STK":
+            return _quote(last=stock_prices[contract.symbol])
+        return option_quotes[contract.symbol]
+
+    mock.get_quote = AsyncMock(side_effect=get_quote)
+    return mock
+
+
+class TestSharedPriceCache:
+    """Underlying prices are fetched once per symbol per pass."""
+
+    def test_stage1_fetches_each_symbol_once(self):
+        mock_ibkr = MagicMock()
+        mock_ibkr.get_stock_price.return_value = 179.0
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+        opps = [
+            create_staged_opportunity(symbol="AAPL", strike=150.0),
+            create_staged_opportunity(symbol="AAPL", strike=145.0),
+        ]
+
+        results = validator.validate_premarket(opps)
+
+        assert [r.status for r in results] == [ValidationStatus.READY] * 2
+        mock_ibkr.get_stock_price.assert_called_once_with("AAPL")
+
+    def test_cache_cleared_between_stages(self):
+        mock_ibkr = MagicMock()
+        mock_ibkr.get_stock_price.return_value = 180.0
+        mock_ibkr.get_option_quote.return_value = {"bid": 0.49, "ask": 0.55}
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+        opp = create_staged_opportunity()
+
+        validator.validate_premarket([opp])
+        validator.validate_at_open([opp])
+
+        assert mock_ibkr.get_stock_price.call_count == 2
+
+
+class TestValidationDeadline:
+    """Opportunities not validated before the deadline are TIMED_OUT."""
+
+    def test_stage1_expired_deadline_marks_timed_out(self):
+        mock_ibkr = MagicMock()
+        mock_ibkr.get_stock_price.return_value = 179.0
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+
+        results = validator.validate_premarket(
+            [create_staged_opportunity()], deadline_seconds=0
+        )
+
+        assert results[0].status == ValidationStatus.TIMED_OUT
+        assert not results[0].passed
+        assert "deadline" in results[0].adjustment_reason
+        mock_ibkr.get_stock_price.assert_not_called()
+        assert (
+            validator.get_target_state_for_result(results[0])
+            == OpportunityState.STALE
+        )
+
+    def test_stage2_pending_without_time_to_retry_times_out(self):
+        mock_ibkr = MagicMock()
+        mock_ibkr.get_stock_price.return_value = 180.0
+        mock_ibkr.get_option_quote.return_value = {"bid": -1.0, "ask": -1.0}
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+
+        results = validator.validate_at_open(
+            [create_staged_opportunity()],
+            max_retries=3,
+            retry_delay=30.0,
+            deadline_seconds=5.0,
+        )
+
+        assert results[0].status == ValidationStatus.TIMED_OUT
+        assert "No valid bid" in results[0].adjustment_reason
+        assert mock_ibkr.get_option_quote.call_count == 1
+
+
+class TestConcurrentValidation:
+    """validate_premarket_async / validate_at_open_async."""
+
+    @pytest.mark.asyncio
+    async def test_stage1_concurrent_matches_sequential(self):
+        mock_ibkr = _async_ibkr({"AAPL": 179.0, "MSFT": 330.0})
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+        opps = [
+            create_staged_opportunity(symbol="AAPL"),
+            create_staged_opportunity(symbol="AAPL", strike=145.0),
+            create_staged_opportunity(
+                symbol="MSFT", staged_stock_price=400.0, strike=300.0
+            ),
+        ]
+
+        results = await validator.validate_premarket_async(opps)
+
+        assert [r.status for r in results] == [
+            ValidationStatus.READY,
+            ValidationStatus.READY,
+            ValidationStatus.STALE,  # -17.5% move
+        ]
+        # One quote per symbol, no sequential price lookups
+        assert mock_ibkr.get_quote.call_count == 2
+        mock_ibkr.get_stock_price.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stage1_slow_symbol_times_out_without_blocking(self):
+        mock_ibkr = _async_ibkr({"AAPL": 179.0, "MSFT": 350.0}, slow={"MSFT"})
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+        opps = [
+            create_staged_opportunity(symbol="AAPL"),
+            create_staged_opportunity(symbol="MSFT", staged_stock_price=350.0),
+        ]
+
+        results = await asyncio.wait_for(
+            validator.validate_premarket_async(opps, deadline_seconds=0.2),
+            timeout=5,
+        )
+
+        assert results[0].status == ValidationStatus.READY
+        assert results[1].status == ValidationStatus.TIMED_OUT
+
+    @pytest.mark.asyncio
+    async def test_stage2_concurrent(self):
+        mock_ibkr = _async_ibkr(
+            {"AAPL": 180.0, "MSFT": 180.0},
+            {"AAPL": _quote(bid=0.49, ask=0.55), "MSFT": _quote(bid=0.10, ask=0.12)},
+        )
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+        opps = [
+            create_staged_opportunity(symbol="AAPL"),
+            create_staged_opportunity(symbol="MSFT"),
+        ]
+
+        results = await validator.validate_at_open_async(opps)
+
+        assert results[0].status == ValidationStatus.READY
+        assert results[1].status == ValidationStatus.STALE  # premium collapsed
+        mock_ibkr.get_option_quote.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stage2_no_bid_yet_retries(self):
+        quotes = iter([_quote(last=0.50), _quote(bid=0.48, ask=0.55)])
+        mock_ibkr = _async_ibkr({"AAPL": 180.0})
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+
+        async def get_quote(contract, timeout=None):
+            if contract.secType == "STK":
+                return _quote(last=180.0)
+            return next(quotes)
+
+        mock_ibkr.get_quote.side_effect = get_quote
+
+        results = await validator.validate_at_open_async(
+            [create_staged_opportunity()], retry_delay=0.0
+        )
+
+        assert results[0].passed
+
+    @pytest.mark.asyncio
+    async def test_stage1_adjustment_chains_fetched_concurrently(self):
+        mock_ibkr = _async_ibkr({"AAPL": 172.8, "MSFT": 384.0})  # both -4%
+        chain = SimpleNamespace(strikes={100.0 + 2.5 * i for i in range(80)})
+        mock_ibkr.get_option_chain_definitions_async = AsyncMock(
+            side_effect=lambda symbol, **kw: [chain] if symbol == "AAPL" else []
+        )
+        validator = PremarketValidator(ibkr_client=mock_ibkr)
+        opps = [
+            create_staged_opportunity(symbol="AAPL"),
+            create_staged_opportunity(
+                symbol="MSFT", staged_stock_price=400.0, strike=330.0
+            ),
+        ]
+
+        results = await validator.validate_premarket_async(opps)
+
+        assert results[0].status == ValidationStatus.ADJUSTED
+        assert results[0].adjusted_strike % 2.5 == 0
+        assert mock_ibkr.get_option_chain_definitions_async.await_count == 2
+        # No sequential chain lookups, even for the symbol without a chain
+        mock_ibkr.qualify_contract.assert_not_called()
+        mock_ibkr.get_option_chain_definitions.assert_not_called()
@@ -213,6 +213,76 @@ class TestParallelSubmission:
             assert len(call_args) == 3  # All 3 contracts in one call
 
 
+class TestQualificationAlignment:
+    """Trades, contracts and latency records stay paired when IBKR drops one."""
+
+    @staticmethod
+    def _contract(staged):
+        return Mock(
+            symbol=staged.symbol,
+            strike=staged.strike,
+            lastTradeDateOrContractMonth=staged.expiration.replace("-", ""),
+        )
+
+    @pytest.mark.asyncio
+    async def test_unqualified_trade_fails_without_shifting_others(
+        self,
+        rapid_fire_executor,
+        staged_trades,
+        mock_ibkr_client,
+        mock_adaptive_executor,
+    ):
+        aapl, msft, googl = staged_trades
+        contracts = [self._contract(aapl), self._contract(googl)]
+        mock_ibkr_client.qualify_contracts_async.return_value = contracts
+
+        from src.tools.ibkr_client import Quote
+        mock_ibkr_client.get_quotes_batch = AsyncMock(
+            return_value=[
+                Quote(bid=0.44, ask=0.48, last=0.46, volume=1000, is_valid=True, reason="")
+                for _ in contracts
+            ]
+        )
+        mock_adaptive_executor.place_order.side_effect = [
+            OrderResult(
+                success=True,
+                order_id=order_id,
+                status=AdaptiveOrderStatus.SUBMITTED,
+                order_type="Adaptive",
+                live_bid=0.44,
+                live_ask=0.48,
+                calculated_limit=0.45,
+            )
+            for order_id in (12345, 12346)
+        ]
+
+        with patch.object(rapid_fire_executor, "_monitor_and_adjust", new_callable=AsyncMock):
+            report = await rapid_fire_executor.execute_all(staged_trades)
+
+        placed = [call.args[:2] for call in mock_adaptive_executor.place_order.call_args_list]
+        assert placed == [(aapl, contracts[0]), (googl, contracts[1])]
+        assert [f.symbol for f in report.failed] == ["MSFT"]
+        latencies = {p.staged.symbol: p.latency for p in rapid_fire_executor.pending_orders.values()}
+        assert latencies["GOOGL"].order_id == 12346
+        assert "contract_ready" in latencies["GOOGL"].stage_ms
+
+    @pytest.mark.asyncio
+    async def test_latency_flushed_per_batch(
+        self,
+        rapid_fire_executor,
+        staged_trades,
+        mock_ibkr_client,
+    ):
+        mock_ibkr_client.qualify_contracts_async.return_value = []
+        mock_ibkr_client.get_quotes_batch = AsyncMock(return_value=[])
+
+        with patch.object(rapid_fire_executor, "_monitor_and_adjust", new_callable=AsyncMock), \
+                patch.object(rapid_fire_executor.latency, "flush") as flush:
+            await rapid_fire_executor.execute_all(staged_trades)
+
+        flush.assert_called_once()
+
+
 class TestEventDrivenMonitoring:
     """Tests for event-driven fill monitoring."""
 
@@ -1,6 +1,7 @@
 """Unit tests for the Claude-powered reasoning engine.
 
-Tests CostTracker daily totals, cap enforcement, and record persistence.
+Tests CostTracker daily totals, cap enforcement, record persistence, and
+the running-total counter row shared across processes.
 Tests ClaudeReasoningEngine.reason() with mocked BaseAgent, including
 cost-cap fallback, Claude failure fallback, and response parsing.
 Tests _parse_response() for valid JSON, markdown code blocks, invalid JSON,
@@ -22,7 +23,7 @@ from src.agentic.reasoning_engine import (
 )
 from src.agentic.working_memory import ReasoningContext
 from src.data.database import close_database, get_session, init_database
-from src.data.models import Base, ClaudeApiCost, DecisionAudit
+from src.data.models import Base, ClaudeApiCost, ClaudeDailyCost, DecisionAudit
 
 
 # ---------------------------------------------------------------------------
@@ -289,6 +290,71 @@ class TestCostTrackerRecord:
         assert row.decision_audit_id is None
 
 
+class TestCostTrackerRunningTotal:
+    """The cap check uses an in-memory total backed by claude_daily_costs."""
+
+    def test_can_call_does_not_query_after_seed(self, cost_tracker, db_session):
+        """Only the first check of the day reads the database."""
+        cost_tracker.can_call()
+        with patch.object(db_session, "query", side_effect=AssertionError("queried")):
+            assert cost_tracker.can_call() is True
+            assert cost_tracker.get_daily_total() == 0.0
+
+    def test_record_increments_counter_row(self, cost_tracker, db_session):
+        """Recorded costs accumulate in the day's counter row and in memory."""
+        for cost in (4.0, 7.0):
+            cost_tracker.record("claude-opus-4-6", "reasoning", 500, 100, cost)
+
+        counter = db_session.query(ClaudeDailyCost).one()
+        assert counter.day == datetime.utcnow().date()
+        assert counter.total_usd == pytest.approx(11.0)
+        assert cost_tracker.get_daily_total() == pytest.approx(11.0)
+        assert cost_tracker.can_call() is False
+
+    def test_counter_seeded_from_existing_rows(self, cost_tracker, db_session):
+        """The first record of the day includes costs logged without the counter."""
+        db_session.add(
+            ClaudeApiCost(
+                timestamp=datetime.utcnow(),
+                model="claude-opus-4-6",
+                purpose="reasoning",
+                input_tokens=500,
+                output_tokens=100,
+                cost_usd=2.0,
+            )
+        )
+        db_session.commit()
+
+        cost_tracker.record("claude-opus-4-6", "reasoning", 500, 100, 0.5)
+
+        assert db_session.query(ClaudeDailyCost).one().total_usd == pytest.approx(2.5)
+
+    def test_other_process_spend_picked_up_on_record(self, db_session):
+        """Two trackers (daemon and dashboard) share one counter row."""
+        daemon = CostTracker(db_session, daily_cap_usd=10.0)
+        dashboard = CostTracker(db_session, daily_cap_usd=10.0)
+        assert daemon.can_call() is True
+
+        dashboard.record("claude-opus-4-6", "reasoning", 500, 100, 6.0)
+        daemon.record("claude-opus-4-6", "reasoning", 500, 100, 5.0)
+
+        assert daemon.get_daily_total() == pytest.approx(11.0)
+        assert daemon.can_call() is False
+
+    def test_other_process_spend_seen_after_refresh(self, db_session):
+        """A tracker that never records still sees other processes' spend."""
+        daemon = CostTracker(db_session, daily_cap_usd=10.0, refresh_seconds=30.0)
+        dashboard = CostTracker(db_session, daily_cap_usd=10.0)
+        assert daemon.can_call() is True
+
+        dashboard.record("claude-opus-4-6", "reasoning", 500, 100, 12.0)
+        assert daemon.can_call() is True  # cached total still fresh
+
+        daemon._loaded_at -= 31.0
+        assert daemon.can_call() is False
+        assert daemon.get_daily_total() == pytest.approx(12.0)
+
+
 # ===========================================================================
 # ClaudeReasoningEngine.reason() Tests
 # ===========================================================================
@@ -1248,3 +1314,348 @@ class TestDecisionAuditPlanFields:
         assert len(audits) == 2
         assert all(a.plan_id == plan_id for a in audits)
         assert all(a.plan_assessment == assessment for a in audits)
+
+
+# ===========================================================================
+# Prompt caching
+# ===========================================================================
+
+
+class TestPromptCaching:
+    """Stable prompt blocks are cached; cache tokens are costed and reported."""
+
+    @pytest.fixture
+    def patterned_context(self):
+        return ReasoningContext(
+            autonomy_level=1,
+            market_context={"vix": 18.5},
+            active_patterns=[{"name": "low_delta", "win_rate": 0.8, "confidence": 0.9}],
+        )
+
+    def test_patterns_sent_as_cached_prefix(
+        self, db_session, patterned_context, valid_claude_response
+    ):
+        mock_reasoning = MagicMock()
+        mock_reasoning.send_message.return_value = valid_claude_response
+        mock_reasoning.estimate_cost.return_value = 0.018
+
+        engine = _make_engine(db_session, reasoning_agent=mock_reasoning)
+        engine.reason(patterned_context, event_type="SCHEDULED_CHECK")
+
+        kwargs = mock_reasoning.send_message.call_args.kwargs
+        assert "low_delta" in kwargs["cache_prefix"][0]
+        assert "Active Patterns" not in kwargs["user_message"]
+
+    def test_caching_disabled(self, db_session, patterned_context, valid_claude_response):
+        mock_reasoning = MagicMock()
+        mock_reasoning.send_message.return_value = valid_claude_response
+        mock_reasoning.estimate_cost.return_value = 0.018
+
+        engine = _make_engine(db_session, reasoning_agent=mock_reasoning)
+        engine.config.prompt_caching = False
+        engine.reason(patterned_context, event_type="SCHEDULED_CHECK")
+
+        kwargs = mock_reasoning.send_message.call_args.kwargs
+        assert kwargs["cache_prefix"] is None
+        assert "low_delta" in kwargs["user_message"]
+
+    def test_cache_tokens_recorded(self, db_session, sample_context, valid_claude_response):
+        mock_reasoning = MagicMock()
+        mock_reasoning.send_message.return_value = {
+            **valid_claude_response,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 3000,
+            "latency_ms": 850.0,
+        }
+        mock_reasoning.estimate_cost.return_value = 0.012
+
+        engine = _make_engine(db_session, reasoning_agent=mock_reasoning)
+        engine.reason(sample_context, event_type="SCHEDULED_CHECK")
+
+        mock_reasoning.estimate_cost.assert_called_once_with(1000, 200, 0, 3000)
+        row = db_session.query(ClaudeApiCost).one()
+        assert (row.cache_creation_tokens, row.cache_read_tokens) == (0, 3000)
+        assert row.latency_ms == pytest.approx(850.0)
+
+    def test_build_request_marks_stable_blocks(self):
+        from src.agents.base_agent import BaseAgent
+
+        system, messages = BaseAgent._build_request("SYSTEM", "EVENT", ["", "PATTERNS"])
+
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+        content = messages[0]["content"]
+        assert [b["text"] for b in content] == ["PATTERNS", "EVENT"]
+        assert "cache_control" in content[0]
+        assert "cache_control" not in content[1]
+        assert BaseAgent._build_request("SYSTEM", "EVENT", None) == (
+            "SYSTEM", [{"role": "user", "content": "EVENT"}]
+        )
+
+    def test_cache_pricing(self):
+        from src.agents.base_agent import BaseAgent, cache_savings_usd
+
+        agent = BaseAgent(model="claude-sonnet-4-5-20250929", api_key="test-key")
+
+        # 1M cache reads at 10% of $3 input
+        assert agent.estimate_cost(0, 0, 0, 1_000_000) == pytest.approx(0.30)
+        assert agent.estimate_cost(0, 0, 1_000_000, 0) == pytest.approx(3.75)
+        assert cache_savings_usd(
+            "claude-sonnet-4-5-20250929", 0, 1_000_000
+        ) == pytest.approx(2.70)
+
+    def test_summary(self, db_session):
+        from src.agentic.reasoning_engine import load_prompt_cache_summary
+
+        tracker = CostTracker(db_session, daily_cap_usd=10.0)
+        model = "claude-sonnet-4-5-20250929"
+        tracker.record(model, "reasoning", 4000, 200, 0.05,
+                       cache_creation_tokens=3000, latency_ms=2000.0)
+        tracker.record(model, "reasoning", 1000, 200, 0.01,
+                       cache_read_tokens=3000, latency_ms=1500.0)
+
+        summary = load_prompt_cache_summary(db_session, days=1)
+
+        assert summary["calls"] == 2
+        assert summary["cached_calls"] == 1
+        assert summary["cache_hit_ratio"] == pytest.approx(3000 / 11000, abs=1e-4)
+        # 3000 reads save 90% of $3/M; 3000 writes cost 25% extra
+        assert summary["saved_usd"] == pytest.approx(0.0081 - 0.00225, abs=1e-4)
+        assert summary["latency_reduction_pct"] == pytest.approx(25.0)
+
+
+class TestBatchedExitCheck:
+    """Several exit checks share one Claude call and get one decision each."""
+
+    @staticmethod
+    def _position(sym, pnl=60.0):
+        return {
+            "trade_id": f"{sym}_100_P",
+            "symbol": sym,
+            "strike": 100.0,
+            "pnl_pct": pnl,
+            "option_type": "PUT",
+            "dte": 4,
+            "escalation_reason": f"{sym} profit in grey zone",
+            "snapshot": {"delta": -0.12, "entry_delta": -0.2, "iv": 31.0},
+            "sector_context": "No other positions in sector",
+            "portfolio_delta": -45.0,
+            "is_opex_week": False,
+            "margin_utilisation_pct": 32.5,
+            "earnings_in_dte": False,
+        }
+
+    @staticmethod
+    def _response(actions, input_tokens=2500):
+        return {
+            "content": json.dumps({"assessment": "Quiet tape", "actions": actions}),
+            "input_tokens": input_tokens,
+            "output_tokens": 600,
+        }
+
+    def _engine(self, db_session, response):
+        agent = MagicMock()
+        agent.send_message.return_value = response
+        agent.estimate_cost.return_value = 0.05
+        return _make_engine(db_session, reasoning_agent=agent), agent
+
+    def test_one_call_one_decision_per_position(self, db_session, sample_context):
+        positions = [self._position(s) for s in ("AAPL", "TSLA", "NVDA")]
+        engine, agent = self._engine(db_session, self._response([
+            {"action": "CLOSE_POSITION", "confidence": 0.8, "reasoning": "r",
+             "metadata": {"trade_id": "TSLA_100_P"}},
+            {"action": "EXECUTE_TRADES", "confidence": 0.9, "reasoning": "r",
+             "metadata": {"trade_id": "AAPL_100_P"}},
+            {"action": "CLOSE_POSITION", "confidence": 0.9, "reasoning": "r",
+             "metadata": {"trade_id": "MSFT_100_P"}},
+        ]))
+
+        decisions = engine.reason(
+            sample_context, "POSITION_EXIT_CHECK", {"positions": positions}
+        )
+
+        assert agent.send_message.call_count == 1
+        message = agent.send_message.call_args.kwargs["user_message"]
+        assert all(p["trade_id"] in message for p in positions)
+        assert [d.metadata["trade_id"] for d in decisions] == [
+            "AAPL_100_P", "TSLA_100_P", "NVDA_100_P",
+        ]
+        # Exit checks may only close or monitor; unknown trades are dropped
+        assert [d.action for d in decisions] == [
+            "MONITOR_ONLY", "CLOSE_POSITION", "MONITOR_ONLY",
+        ]
+        assert decisions[2].metadata["decision_source"] == "fallback_batch_missing"
+        assert "call_cost_usd" not in decisions[2].metadata
+        assert decisions[0].metadata["call_cost_usd"] == pytest.approx(0.05 / 3, abs=1e-6)
+        assert decisions[0].metadata["_plan_assessment"] == "Quiet tape"
+        assert db_session.query(ClaudeApiCost).count() == 1
+
+    def test_batch_is_much_smaller_than_separate_checks(self, db_session, sample_context):
+        """Five-position stress moment: one prompt instead of five."""
+        positions = [self._position(s) for s in ("AAPL", "TSLA", "NVDA", "AMD", "META")]
+        engine, agent = self._engine(db_session, self._response([]))
+
+        engine.reason(sample_context, "POSITION_EXIT_CHECK", {"positions": positions})
+        kwargs = agent.send_message.call_args.kwargs
+        batched_chars = len(kwargs["system_prompt"]) + len(kwargs["user_message"])
+        assert kwargs["max_tokens"] >= 5 * 400
+
+        separate_chars = sum(
+            len(kwargs["system_prompt"])
+            + len(engine._build_position_exit_message(sample_context, p))
+            for p in positions
+        )
+        assert batched_chars * 3 < separate_chars
+
+
+class TestStreaming:
+    """Responses stream; actions surface early and time to first action is recorded."""
+
+    @staticmethod
+    def _streaming_agent(content, chunk=8):
+        def send_message(**kwargs):
+            on_text = kwargs.get("on_text")
+            if on_text is not None:
+                for i in range(0, len(content), chunk):
+                    on_text(content[i:i + chunk])
+            return {"content": content, "input_tokens": 900, "output_tokens": 300,
+                    "latency_ms": 4000.0}
+
+        agent = MagicMock()
+        agent.send_message.side_effect = send_message
+        agent.estimate_cost.return_value = 0.02
+        return agent
+
+    def test_early_close_reported_with_trade(self, db_session, sample_context):
+        content = json.dumps({
+            "action": "CLOSE_POSITION",
+            "confidence": 0.85,
+            "reasoning": "AAPL 150P exp=2026-03-20 (DTE=2): " + "x" * 400,
+        })
+        engine = _make_engine(db_session, reasoning_agent=self._streaming_agent(content))
+        early = []
+
+        decisions = engine.reason(
+            sample_context, "POSITION_EXIT_CHECK",
+            {"trade_id": "AAPL_150_P", "symbol": "AAPL"},
+            on_early_action=early.append,
+        )
+
+        assert [(e.action, e.trade_id) for e in early] == [("CLOSE_POSITION", "AAPL_150_P")]
+        assert decisions[0].action == "CLOSE_POSITION"
+        row = db_session.query(ClaudeApiCost).one()
+        assert row.first_action_ms is not None
+
+    def test_disallowed_early_action_not_reported(self, db_session, sample_context):
+        content = json.dumps({"action": "EXECUTE_TRADES", "confidence": 0.9, "reasoning": "r"})
+        engine = _make_engine(db_session, reasoning_agent=self._streaming_agent(content))
+        early = []
+
+        decisions = engine.reason(
+            sample_context, "POSITION_EXIT_CHECK", {"trade_id": "T1"},
+            on_early_action=early.append,
+        )
+
+        assert early == []
+        assert decisions[0].action == "MONITOR_ONLY"
+
+    def test_streaming_disabled(self, db_session, sample_context, valid_claude_response):
+        agent = MagicMock()
+        agent.send_message.return_value = valid_claude_response
+        agent.estimate_cost.return_value = 0.01
+        engine = _make_engine(db_session, reasoning_agent=agent)
+        engine.config.streaming = False
+
+        engine.reason(sample_context, event_type="SCHEDULED_CHECK")
+
+        assert agent.send_message.call_args.kwargs["on_text"] is None
+        assert db_session.query(ClaudeApiCost).one().first_action_ms is None
+
+    def test_base_agent_streams_chunks(self):
+        from src.agents.base_agent import BaseAgent
+
+        agent = BaseAgent(model="claude-sonnet-4-5-20250929", api_key="test-key")
+        agent.client = MagicMock()
+        stream = agent.client.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = iter(['{"action": ', '"MONITOR_ONLY"}'])
+        final = stream.get_final_message.return_value
+        final.usage.input_tokens = 100
+        final.usage.output_tokens = 10
+        final.content = [MagicMock(text='{"action": "MONITOR_ONLY"}')]
+        chunks = []
+
+        response = agent.send_message("sys", "msg", on_text=chunks.append)
+
+        assert chunks == ['{"action": ', '"MONITOR_ONLY"}']
+        assert response["content"] == '{"action": "MONITOR_ONLY"}'
+        agent.client.messages.create.assert_not_called()
+
+    def test_base_agent_signals_each_attempt(self):
+        import httpx
+        from anthropic import APITimeoutError
+
+        from src.agents.base_agent import BaseAgent
+
+        agent = BaseAgent(model="claude-sonnet-4-5-20250929", api_key="test-key")
+        agent.client = MagicMock()
+        stream = MagicMock()
+        stream.text_stream = iter(['{"action": "MONITOR_ONLY"}'])
+        final = stream.get_final_message.return_value
+        final.usage.input_tokens = 100
+        final.usage.output_tokens = 10
+        final.content = [MagicMock(text='{"action": "MONITOR_ONLY"}')]
+        timeout = APITimeoutError(request=httpx.Request("POST", "https://api.test"))
+        agent.client.messages.stream.return_value.__enter__.side_effect = [
+            timeout, stream,
+        ]
+        attempts = []
+
+        agent.send_message(
+            "sys", "msg", on_text=lambda _: None,
+            on_attempt=lambda: attempts.append(1),
+        )
+
+        assert len(attempts) == 2
+
+    def test_parser_reset_per_attempt(self, db_session, sample_context):
+        content = json.dumps({"action": "MONITOR_ONLY", "confidence": 0.9,
+                              "reasoning": "ok"})
+
+        def send_message(**kwargs):
+            # First attempt streams half a CLOSE, then BaseAgent retries
+            kwargs["on_attempt"]()
+            kwargs["on_text"]('{"action": "CLOSE_POSITION", "reas')
+            kwargs["on_attempt"]()
+            kwargs["on_text"](content)
+            return {"content": content, "input_tokens": 900, "output_tokens": 300,
+                    "latency_ms": 4000.0}
+
+        agent = MagicMock()
+        agent.send_message.side_effect = send_message
+        agent.estimate_cost.return_value = 0.02
+        engine = _make_engine(db_session, reasoning_agent=agent)
+        early = []
+
+        engine.reason(sample_context, "SCHEDULED_CHECK", on_early_action=early.append)
+
+        # Only the retried attempt's action is reported and timed
+        assert [e.action for e in early] == ["MONITOR_ONLY"]
+        first_action_ms = db_session.query(ClaudeApiCost).one().first_action_ms
+        assert first_action_ms == pytest.approx(early[0].elapsed_ms)
+
+    def test_summary(self, db_session):
+        from src.agentic.reasoning_engine import load_streaming_summary
+
+        tracker = CostTracker(db_session, daily_cap_usd=10.0)
+        model = "claude-sonnet-4-5-20250929"
+        tracker.record(model, "reasoning", 1000, 300, 0.02, latency_ms=4000.0,
+                       first_action_ms=600.0)
+        tracker.record(model, "reasoning", 1000, 300, 0.02, latency_ms=4000.0,
+                       first_action_ms=1000.0)
+        tracker.record(model, "reflection", 1000, 300, 0.02, latency_ms=9000.0)
+
+        summary = load_streaming_summary(db_session, days=1)
+
+        assert summary["streamed_calls"] == 2
+        assert summary["first_action_p50_ms"] == pytest.approx(600.0)
+        assert summary["completion_p50_ms"] == pytest.approx(4000.0)
+        assert summary["head_start_pct"] == pytest.approx(85.0)
@@ -0,0 +1,297 @@
+"""Unit tests for incremental order reconciliation.
+
+Tests:
+- Watermark is_new/advance at and past the boundary timestamp
+- ReconciliationWatermarkStore round-trip
+- ExecutionIndex lookups and execId deduplication
+- Incremental sync: seen executions dropped, prior-session fetch skipped,
+  unchanged orders skipped, full resync on demand
+- Watermark held before the first order that failed to reconcile
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.services.order_reconciliation import ExecutionIndex, OrderReconciliation
+from src.services.reconciliation_watermark import (
+    ReconciliationWatermarkStore,
+    Watermark,
+)
+
+T0 = datetime(2026, 2, 10, 15, 30, 0)
+
+
+def _fill(exec_id, order_id, time=T0, perm_id=0, symbol="AAPL", price=0.50):
+    fill = Mock()
+    fill.execution.execId = exec_id
+    fill.execution.orderId = order_id
+    fill.execution.permId = perm_id
+    fill.execution.time = time
+    fill.execution.shares = 1
+    fill.execution.avgPrice = price
+    fill.contract.symbol = symbol
+    fill.contract.strike = 150.0
+    fill.contract.lastTradeDateOrContractMonth = "20260220"
+    fill.contract.right = "P"
+    fill.commissionReport.commission = 1.0
+    return fill
+
+
+def _ib_trade(order_id, status, perm_id=0, symbol="AAPL"):
+    trade = Mock()
+    trade.order.orderId = order_id
+    trade.order.permId = perm_id
+    trade.order.lmtPrice = 0
+    trade.contract.symbol = symbol
+    trade.contract.strike = 150.0
+    trade.contract.lastTradeDateOrContractMonth = "20260220"
+    trade.contract.right = "P"
+    trade.orderStatus.status = status
+    trade.orderStatus.avgFillPrice = 0.50 if status == "Filled" else 0.0
+    trade.orderStatus.filled = 1 if status == "Filled" else 0
+    trade.fills = []
+    return trade
+
+
+def _db_trade(id, order_id, tws_status):
+    trade = Mock()
+    trade.id = id
+    trade.order_id = order_id
+    trade.symbol = "AAPL"
+    trade.tws_status = tws_status
+    trade.fill_price = 0.50
+    trade.commission = 1.0
+    trade.contracts = 1
+    trade.strike = 150.0
+    trade.expiration = datetime(2026, 2, 20).date()
+    trade.option_type = "P"
+    trade.entry_premium = 0.50
+    trade.exit_date = None
+    return trade
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.get_trades = Mock(return_value=[])
+    client.get_open_trades = Mock(return_value=[])
+    client.get_completed_orders = Mock(return_value=[])
+    client.get_executions = Mock(return_value=[])
+    client.get_fills = Mock(return_value=[])
+    client.get_req_executions = Mock(return_value=[])
+    client.get_positions = Mock(return_value=[])
+    return client
+
+
+@pytest.fixture
+def repo():
+    repo = Mock()
+    repo.get_trades_by_date = Mock(return_value=[])
+    repo.get_open_positions = Mock(return_value=[])
+    return repo
+
+
+def _store(watermark):
+    store = Mock(spec=ReconciliationWatermarkStore)
+    store.load = Mock(return_value=watermark)
+    return store
+
+
+class TestWatermark:
+    def test_empty_watermark_accepts_everything(self):
+        assert Watermark().is_new(_fill("e1", 1))
+
+    def test_boundary_and_older_executions_are_seen(self):
+        wm = Watermark()
+        wm.advance([_fill("e1", 1, T0), _fill("e2", 2, T0 - timedelta(minutes=5))])
+
+        assert wm.last_exec_time == T0
+        assert wm.boundary_exec_ids == {"e1"}
+        assert not wm.is_new(_fill("e1", 1, T0))
+        assert not wm.is_new(_fill("e2", 2, T0 - timedelta(minutes=5)))
+        # Same second, different execution
+        assert wm.is_new(_fill("e3", 3, T0))
+        assert wm.is_new(_fill("e4", 4, T0 + timedelta(seconds=1)))
+
+    def test_advance_normalizes_aware_times(self):
+        wm = Watermark()
+        wm.advance([_fill("e1", 1, T0.replace(tzinfo=timezone.utc))])
+        assert wm.last_exec_time == T0
+        assert not wm.is_new(_fill("e1", 1, T0))
+
+    def test_store_round_trip(self, temp_database):
+        from src.data.database import get_session
+
+        session = get_session()
+        store = ReconciliationWatermarkStore(session)
+        assert store.load() is None
+
+        wm = Watermark()
+        wm.advance([_fill("e1", 1, T0, perm_id=77), _fill("e2", 2, T0)])
+        store.save(wm, full=True, summary={"reconciled": 2})
+
+        loaded = ReconciliationWatermarkStore(session).load()
+        assert loaded.last_exec_time == T0
+        assert loaded.boundary_exec_ids == {"e1", "e2"}
+        assert loaded.last_perm_id == 77
+        assert loaded.last_full_sync_at is not None
+        assert loaded.last_summary == {"reconciled": 2}
+
+        store.save(loaded, full=False, summary={})
+        again = store.load()
+        assert again.last_full_sync_at == loaded.last_full_sync_at
+        assert again.last_sync_at >= loaded.last_sync_at
+        session.close()
+
+
+class TestExecutionIndex:
+    def test_lookup_and_dedup(self):
+        index = ExecutionIndex()
+        assert index.add(_fill("e1", 10, perm_id=500))
+        assert not index.add(_fill("e1", 10, perm_id=500))
+        assert index.add(_fill("e2", 0, perm_id=501))
+
+        assert len(index.fills_for(10, None)) == 1
+        assert len(index.fills_for(0, 501)) == 1
+        assert index.touches(_ib_trade(99, "Filled", perm_id=501))
+        assert index.touches(_ib_trade(99, "Filled"))  # same contract
+        assert not index.touches(_ib_trade(99, "Filled", symbol="MSFT"))
+
+
+class TestIncrementalSync:
+    @pytest.mark.asyncio
+    async def test_without_store_reads_full_history(self, client, repo):
+        report = await OrderReconciliation(client, repo).sync_all_orders()
+
+        assert report.mode == "full"
+        client.get_req_executions.assert_called_once_with()
+        client.get_completed_orders.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_incremental_drops_seen_and_skips_prior_sessions(self, client, repo):
+        wm = Watermark()
+        wm.advance([_fill("old", 1, T0)])
+        client.get_req_executions.return_value = [
+            _fill("old", 1, T0),
+            _fill("new", 2, T0 + timedelta(minutes=1)),
+        ]
+        client.get_trades.return_value = [_ib_trade(2, "Filled")]
+        store = _store(wm)
+
+        report = await OrderReconciliation(
+            client, repo, watermarks=store
+        ).sync_all_orders()
+
+        assert report.mode == "incremental"
+        assert report.new_executions == 1
+        client.get_req_executions.assert_called_once_with(since=T0)
+        # The new execution's order is in the session: no completed-orders request
+        client.get_completed_orders.assert_not_called()
+        saved, kwargs = store.save.call_args[0][0], store.save.call_args[1]
+        assert saved.boundary_exec_ids == {"new"}
+        assert kwargs["full"] is False
+        assert kwargs["summary"]["new_executions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_fetches_completed_for_unknown_perm_id(
+        self, client, repo
+    ):
+        wm = Watermark()
+        wm.advance([_fill("old", 1, T0)])
+        client.get_req_executions.return_value = [
+            _fill("new", 0, T0 + timedelta(minutes=1), perm_id=900)
+        ]
+
+        await OrderReconciliation(client, repo, watermarks=_store(wm)).sync_all_orders()
+
+        client.get_completed_orders.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_incremental_skips_unchanged_orders(self, client, repo):
+        wm = Watermark()
+        wm.advance([_fill("old", 1, T0)])
+        client.get_trades.return_value = [
+            _ib_trade(1, "Filled", symbol="MSFT"),
+            _ib_trade(2, "Filled", symbol="NVDA"),
+        ]
+        in_sync = _db_trade(1, 1, "Filled")
+        stale = _db_trade(2, 2, "Submitted")
+        repo.get_trades_by_date.return_value = [in_sync, stale]
+
+        report = await OrderReconciliation(
+            client, repo, watermarks=_store(wm)
+        ).sync_all_orders()
+
+        assert report.unchanged == 1
+        assert [t.order_id for t in report.reconciled] == [2]
+
+    @pytest.mark.asyncio
+    async def test_full_resync_ignores_watermark(self, client, repo):
+        wm = Watermark()
+        wm.advance([_fill("old", 1, T0)])
+        client.get_req_executions.return_value = [_fill("old", 1, T0)]
+        store = _store(wm)
+
+        report = await OrderReconciliation(
+            client, repo, watermarks=store
+        ).sync_all_orders(full=True)
+
+        assert report.mode == "full"
+        assert report.new_executions == 1
+        client.get_req_executions.assert_called_once_with()
+        client.get_completed_orders.assert_called_once()
+        assert store.save.call_args[1]["full"] is True
+
+    @pytest.mark.asyncio
+    async def test_watermark_stops_before_failed_reconcile(self, client, repo):
+        wm = Watermark()
+        wm.advance([_fill("old", 9, T0)])
+        client.get_req_executions.return_value = [
+            _fill("ok", 1, T0 + timedelta(minutes=1)),
+            _fill("bad", 2, T0 + timedelta(minutes=2)),
+            _fill("later", 3, T0 + timedelta(minutes=3)),
+        ]
+        client.get_trades.return_value = [
+            _ib_trade(1, "Filled", symbol="MSFT"),
+            _ib_trade(2, "Filled", symbol="NVDA"),
+        ]
+        ok, bad = _db_trade(1, 1, "Submitted"), _db_trade(2, 2, "Submitted")
+        repo.get_trades_by_date.return_value = [ok, bad]
+
+        def update(trade):
+            if trade is bad:
+                raise RuntimeError("database is locked")
+
+        repo.update = Mock(side_effect=update)
+        store = _store(wm)
+
+        report = await OrderReconciliation(
+            client, repo, watermarks=store
+        ).sync_all_orders()
+
+        # The failure is still reported, but unresolved
+        assert report.total_discrepancies == 2
+        assert report.total_resolved == 1
+        saved = store.save.call_args[0][0]
+        assert saved.last_exec_time == T0 + timedelta(minutes=1)
+        assert saved.boundary_exec_ids == {"ok"}
+
+    @pytest.mark.asyncio
+    async def test_watermark_held_when_first_fill_fails(self, client, repo):
+        wm = Watermark()
+        wm.advance([_fill("old", 9, T0)])
+        client.get_req_executions.return_value = [
+            _fill("bad", 2, T0 + timedelta(minutes=1)),
+        ]
+        client.get_trades.return_value = [_ib_trade(2, "Filled")]
+        repo.get_trades_by_date.return_value = [_db_trade(2, 2, "Submitted")]
+        repo.update = Mock(side_effect=RuntimeError("database is locked"))
+        store = _store(wm)
+
+        await OrderReconciliation(client, repo, watermarks=store).sync_all_orders()
+
+        saved = store.save.call_args[0][0]
+        assert saved.last_exec_time == T0
+        assert saved.boundary_exec_ids == {"old"}
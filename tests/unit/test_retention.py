@@ -0,0 +1,150 @@
+"""Unit tests for daemon table retention and archival.
+
+Tests:
+- Old completed events and decisions are moved to gzip archive files
+- Pending/recent rows and rows still referenced stay hot
+- Dry run counts without moving; table sizes report archive bytes
+- Partial index on pending events exists
+"""
+
+import gzip
+import json
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import inspect
+
+from src.data.database import close_database, get_session, init_database
+from src.data.models import (
+    ClaudeApiCost,
+    DaemonEvent,
+    DecisionAudit,
+    DecisionEmbedding,
+    GuardrailMetric,
+)
+from src.services.retention import RetentionService
+from src.utils.timezone import utc_now
+
+
+@pytest.fixture
+def db_session():
+    init_database(database_url="sqlite:///:memory:")
+    session = get_session()
+    yield session
+    session.close()
+    close_database()
+
+
+def _event(status="completed", age_days=60):
+    return DaemonEvent(
+        event_type="SCHEDULED_CHECK",
+        priority=4,
+        status=status,
+        payload={"n": age_days},
+        created_at=utc_now() - timedelta(days=age_days),
+    )
+
+
+def _decision(event=None, age_days=400):
+    return DecisionAudit(
+        event_id=event.id if event else None,
+        timestamp=utc_now() - timedelta(days=age_days),
+        autonomy_level=1,
+        event_type="SCHEDULED_CHECK",
+        action="MONITOR_ONLY",
+        autonomy_approved=True,
+    )
+
+
+def _read_archive(directory):
+    records = []
+    for path in sorted(directory.glob("*.jsonl.gz")):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+class TestRetentionService:
+    def test_archives_old_completed_events_to_files(self, db_session, tmp_path):
+        old, failed = _event(), _event(status="failed")
+        recent, pending = _event(age_days=1), _event(status="pending")
+        db_session.add_all([old, failed, recent, pending])
+        db_session.commit()
+
+        results = RetentionService(db_session, archive_dir=str(tmp_path), batch_size=1).run()
+
+        by_table = {r.table: r for r in results}
+        assert by_table["daemon_events"].rows_archived == 2
+        remaining = {e.id for e in db_session.query(DaemonEvent).all()}
+        assert remaining == {recent.id, pending.id}
+        archived = _read_archive(tmp_path / "daemon_events")
+        assert sorted(r["id"] for r in archived) == sorted([old.id, failed.id])
+        assert archived[0]["payload"] == {"n": 60}
+
+    def test_referenced_rows_stay_until_referrer_archived(self, db_session, tmp_path):
+        kept_event, freed_event = _event(), _event()
+        db_session.add_all([kept_event, freed_event])
+        db_session.flush()
+        recent_decision = _decision(kept_event, age_days=5)
+        old_decision = _decision(freed_event)
+        embedded = _decision()
+        db_session.add_all([recent_decision, old_decision, embedded])
+        db_session.flush()
+        db_session.add(DecisionEmbedding(decision_audit_id=embedded.id, text_content="x"))
+        db_session.commit()
+
+        RetentionService(db_session, archive_dir=str(tmp_path)).run()
+
+        assert {d.id for d in db_session.query(DecisionAudit).all()} == {
+            recent_decision.id,
+            embedded.id,
+        }
+        assert [e.id for e in db_session.query(DaemonEvent).all()] == [kept_event.id]
+
+    def test_costs_and_metrics_archived_by_age(self, db_session, tmp_path):
+        db_session.add_all([
+            ClaudeApiCost(
+                timestamp=utc_now() - timedelta(days=200),
+                model="m", purpose="reasoning",
+                input_tokens=1, output_tokens=1, cost_usd=0.01,
+            ),
+            ClaudeApiCost(
+                timestamp=utc_now(), model="m", purpose="reasoning",
+                input_tokens=1, output_tokens=1, cost_usd=0.02,
+            ),
+            GuardrailMetric(metric_date=date.today() - timedelta(days=400), metric_type="daily_audit"),
+        ])
+        db_session.commit()
+
+        RetentionService(db_session, archive_dir=str(tmp_path)).run()
+
+        assert [c.cost_usd for c in db_session.query(ClaudeApiCost).all()] == [0.02]
+        assert db_session.query(GuardrailMetric).count() == 0
+
+    def test_dry_run_counts_without_moving(self, db_session, tmp_path):
+        db_session.add_all([_event(), _event()])
+        db_session.commit()
+        service = RetentionService(db_session, archive_dir=str(tmp_path))
+
+        results = {r.table: r for r in service.run(dry_run=True)}
+
+        assert results["daemon_events"].rows_archived == 2
+        assert db_session.query(DaemonEvent).count() == 2
+        assert not (tmp_path / "daemon_events").exists()
+
+    def test_table_sizes_report_archive_bytes(self, db_session, tmp_path):
+        db_session.add_all([_event(), _event(age_days=1)])
+        db_session.commit()
+        service = RetentionService(db_session, archive_dir=str(tmp_path))
+        service.run()
+
+        sizes = {s["table"]: s for s in service.table_sizes()}
+
+        assert sizes["daemon_events"]["rows"] == 1
+        assert sizes["daemon_events"]["archive_bytes"] > 0
+        assert sizes["decision_audit"]["archive_bytes"] == 0
+
+
+def test_pending_events_partial_index(db_session):
+    indexes = inspect(db_session.get_bind()).get_indexes("daemon_events")
+    assert "ix_daemon_events_pending" in {i["name"] for i in indexes}
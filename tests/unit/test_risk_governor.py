@@ -8,7 +8,7 @@ import os
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -1790,3 +1790,354 @@ class TestSpreadCheck:
         )
         result = risk_governor._check_spread(opp)
         assert result.approved
+
+
+class TestInMemoryRiskState:
+    """Test that limit checks are answered from the in-memory RiskState."""
+
+    @staticmethod
+    def _position(symbol, strike, pnl, expiration="20260219"):
+        return PositionStatus(
+            position_id=f"{symbol}_{strike}",
+            symbol=symbol,
+            strike=strike,
+            option_type="P",
+            expiration_date=expiration,
+            contracts=1,
+            entry_premium=0.50,
+            current_premium=0.50,
+            current_pnl=pnl,
+            current_pnl_pct=0.0,
+            days_held=1,
+            dte=8,
+        )
+
+    def test_repeated_checks_reuse_state(
+        self, risk_governor, mock_ibkr_client, mock_position_monitor, sample_opportunity
+    ):
+        """Checking many trades in a row reconciles once, not once per trade."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        with patch.object(
+            risk_governor, "_get_realized_daily_pnl", return_value=0.0
+        ) as realized:
+            for _ in range(10):
+                assert risk_governor.pre_trade_check(sample_opportunity).approved
+
+        assert mock_position_monitor.get_all_positions.call_count == 1
+        assert mock_ibkr_client.request_open_orders.call_count == 1
+        assert realized.call_count == 1
+
+    def test_stale_state_is_reconciled(
+        self, risk_governor, mock_ibkr_client, mock_position_monitor
+    ):
+        """State older than RISK_STATE_RECONCILE_SECONDS is rebuilt."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        risk_governor._check_max_positions()
+        risk_governor._risk_state.reconciled_at -= risk_governor.RISK_STATE_RECONCILE_SECONDS
+        risk_governor._check_max_positions()
+
+        assert mock_position_monitor.get_all_positions.call_count == 2
+
+    def test_record_trade_blocks_duplicate_before_fill(
+        self, risk_governor, mock_ibkr_client, sample_opportunity
+    ):
+        """A placed order is treated as pending without re-querying open orders."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        assert risk_governor._check_duplicate_contract(sample_opportunity).approved
+
+        risk_governor.record_trade(sample_opportunity)
+        result = risk_governor._check_duplicate_contract(sample_opportunity)
+
+        assert not result.approved
+        assert "Duplicate order" in result.reason
+        assert mock_ibkr_client.request_open_orders.call_count == 1
+
+    def test_record_fill_counts_toward_limits(
+        self, risk_governor, mock_ibkr_client, sample_opportunity
+    ):
+        """Fills update position count and duplicate detection incrementally."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        risk_governor._check_max_positions()
+
+        risk_governor.record_fill(
+            sample_opportunity.symbol,
+            sample_opportunity.strike,
+            sample_opportunity.expiration,
+        )
+
+        assert risk_governor._check_max_positions().current_value == 1
+        result = risk_governor._check_duplicate_contract(sample_opportunity)
+        assert not result.approved
+        assert "Duplicate position" in result.reason
+
+    def test_record_position_closed_moves_pnl_to_realized(
+        self, risk_governor, mock_ibkr_client, mock_position_monitor
+    ):
+        """A close swaps the position's unrealized P&L for its realized P&L."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        mock_position_monitor.get_all_positions.return_value = [
+            self._position("AAPL", 200.0, -300.0),
+            self._position("MSFT", 400.0, 100.0),
+        ]
+        with patch.object(risk_governor, "_get_realized_daily_pnl", return_value=0.0):
+            state = risk_governor.reconcile_risk_state()
+
+        risk_governor.record_position_closed("AAPL", 200.0, "20260219", -450.0)
+
+        assert state.position_count == 1
+        assert state.unrealized_pnl == pytest.approx(100.0)
+        assert state.realized_pnl == pytest.approx(-450.0)
+
+    def test_cancelled_order_allows_reentry(
+        self, risk_governor, mock_ibkr_client, sample_opportunity
+    ):
+        """An order that ends unfilled stops blocking the contract."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        risk_governor._check_duplicate_contract(sample_opportunity)
+        risk_governor.record_trade(sample_opportunity)
+
+        risk_governor.record_order_cancelled(
+            sample_opportunity.symbol,
+            sample_opportunity.strike,
+            sample_opportunity.expiration,
+        )
+
+        assert risk_governor._check_duplicate_contract(sample_opportunity).approved
+
+    @staticmethod
+    def _portfolio_item(symbol, strike, pnl, position=-1, expiration="20260219"):
+        contract = Mock(
+            secType="OPT", symbol=symbol, strike=strike,
+            lastTradeDateOrContractMonth=expiration,
+        )
+        return Mock(contract=contract, unrealizedPNL=pnl, position=position)
+
+    def test_daily_loss_sees_streamed_unrealized_pnl(
+        self, risk_governor, mock_ibkr_client, mock_position_monitor
+    ):
+        """A portfolio update since the last reconcile trips the halt from memory."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        mock_position_monitor.get_all_positions.return_value = [
+            self._position("AAPL", 200.0, 0.0),
+            self._position("MSFT", 400.0, 100.0),
+        ]
+        with patch.object(risk_governor, "_get_realized_daily_pnl", return_value=0.0):
+            risk_governor.reconcile_risk_state()
+        risk_governor.update_account_summary({"NetLiquidation": 100000})
+
+        risk_governor._on_portfolio_update(self._portfolio_item("AAPL", 200.0, -5100.0))
+        result = risk_governor._check_daily_loss_limit()
+
+        assert not result.approved
+        assert risk_governor._risk_state.unrealized_pnl == pytest.approx(-5000.0)
+        assert mock_position_monitor.get_all_positions.call_count == 1
+
+    def test_portfolio_update_for_closed_position_drops_its_pnl(
+        self, risk_governor, mock_ibkr_client, mock_position_monitor
+    ):
+        mock_ibkr_client.request_open_orders.return_value = []
+        mock_position_monitor.get_all_positions.return_value = [
+            self._position("AAPL", 200.0, -300.0),
+        ]
+        with patch.object(risk_governor, "_get_realized_daily_pnl", return_value=0.0):
+            state = risk_governor.reconcile_risk_state()
+
+        risk_governor._on_portfolio_update(
+            self._portfolio_item("AAPL", 200.0, 0.0, position=0)
+        )
+        risk_governor._on_portfolio_update(self._portfolio_item("MSFT", 400.0, float("nan")))
+
+        assert state.unrealized_pnl == pytest.approx(0.0)
+        assert state.position_pnl == {}
+
+    def test_duplicate_check_fails_open_on_state_error(
+        self, risk_governor, mock_position_monitor, sample_opportunity
+    ):
+        """A position fetch failure is logged, not raised out of pre_trade_check."""
+        mock_position_monitor.get_all_positions.side_effect = RuntimeError("IBKR down")
+
+        result = risk_governor._check_duplicate_contract(sample_opportunity)
+
+        assert result.approved
+
+    def test_new_trading_day_rebuilds_state(
+        self, risk_governor, mock_ibkr_client, mock_position_monitor
+    ):
+        """Realized P&L does not carry over into the next trading day."""
+        mock_ibkr_client.request_open_orders.return_value = []
+        risk_governor._check_max_positions()
+        risk_governor._risk_state.trading_date -= timedelta(days=1)
+
+        risk_governor._check_max_positions()
+
+        assert mock_position_monitor.get_all_positions.call_count == 2
+        assert risk_governor._risk_state.trading_date == us_trading_date()
+
+    def test_settings_not_reparsed_when_file_unchanged(self, risk_governor):
+        """The TTL reload skips the YAML parse if the file mtime is unchanged."""
+        risk_governor._settings_loaded_at -= risk_governor.SETTINGS_RELOAD_INTERVAL_SECONDS
+        with patch(
+            "src.agentic.scanner_settings.load_scanner_settings"
+        ) as load:
+            risk_governor._reload_settings_if_stale()
+
+        load.assert_not_called()
+
+
+class TestBatchPreTradeCheck:
+    """Test joint evaluation of a staged list with pre_trade_check_batch()."""
+
+    @staticmethod
+    def _opp(symbol, strike=100.0, margin=1000.0, days=10):
+        return TradeOpportunity(
+            symbol=symbol,
+            strike=strike,
+            expiration=datetime.now() + timedelta(days=days),
+            option_type="PUT",
+            premium=0.50,
+            contracts=1,
+            otm_pct=0.15,
+            dte=days,
+            stock_price=strike * 1.15,
+            trend="uptrend",
+            margin_required=margin,
+        )
+
+    @pytest.fixture(autouse=True)
+    def _no_open_orders(self, mock_ibkr_client):
+        mock_ibkr_client.request_open_orders.return_value = []
+
+    def test_empty_batch(self, risk_governor):
+        batch = risk_governor.pre_trade_check_batch([])
+        assert batch.verdicts == []
+        assert batch.admitted == []
+
+    def test_max_positions_applies_across_batch(self, risk_governor):
+        """Two candidates that each fit alone cannot both take the last slot."""
+        risk_governor.MAX_POSITIONS = 1
+        first, second = self._opp("AAPL"), self._opp("JPM")
+
+        assert risk_governor.pre_trade_check(second).approved
+        batch = risk_governor.pre_trade_check_batch([first, second])
+
+        assert batch.admitted == [first]
+        assert batch.verdicts[1].limit_name == "max_positions"
+
+    def test_trades_per_day_applies_across_batch(self, risk_governor):
+        risk_governor._trades_today = risk_governor.MAX_POSITIONS_PER_DAY - 1
+        batch = risk_governor.pre_trade_check_batch([self._opp("AAPL"), self._opp("JPM")])
+
+        assert len(batch.admitted) == 1
+        assert batch.verdicts[1].limit_name == "max_trades_per_day"
+
+    def test_margin_is_cumulative(self, risk_governor):
+        """Margin committed by earlier candidates reduces what later ones can use."""
+        risk_governor.MAX_MARGIN_UTILIZATION = 0.50
+        risk_governor.MAX_MARGIN_PER_TRADE_PCT = 1.0
+        # (200k - 150k + 40k) / 200k = 45% each on its own
+        first = self._opp("AAPL", margin=40000.0)
+        second = self._opp("JPM", margin=40000.0)
+
+        assert risk_governor.pre_trade_check(second).approved
+        batch = risk_governor.pre_trade_check_batch([first, second])
+
+        assert batch.admitted == [first]
+        assert batch.verdicts[1].limit_name == "margin_utilization"
+
+    def test_excess_liquidity_is_cumulative(self, risk_governor):
+        """Margin committed by earlier candidates also reduces ExcessLiquidity."""
+        risk_governor.MIN_EXCESS_LIQUIDITY_PCT = 0.48
+        # (50k - 3k) / 100k = 47% once the first candidate is committed
+        first = self._opp("AAPL", margin=3000.0)
+        second = self._opp("JPM", margin=3000.0)
+
+        assert risk_governor.pre_trade_check(second).approved
+        batch = risk_governor.pre_trade_check_batch([first, second], use_whatif=False)
+
+        assert batch.admitted == [first]
+        assert batch.verdicts[1].limit_name == "excess_liquidity"
+
+    def test_sector_concentration_sees_batch_and_is_maximal(
+        self, risk_governor, mock_position_monitor
+    ):
+        """A candidate rejected early is admitted once later ones dilute the sector."""
+        risk_governor.MAX_SECTOR_CONCENTRATION = 0.50
+        mock_position_monitor.get_all_positions.return_value = [
+            TestInMemoryRiskState._position(symbol, 100.0, 0.0)
+            for symbol in ("JPM", "XOM", "AAPL")
+        ]
+        nvda, msft, ko = self._opp("NVDA"), self._opp("MSFT"), self._opp("KO")
+
+        batch = risk_governor.pre_trade_check_batch([nvda, msft, ko])
+
+        # NVDA: 2/4 tech ok; MSFT: 3/5 rejected; KO: ok; MSFT retried: 3/6 ok
+        assert batch.admitted == [nvda, msft, ko]
+
+    def test_sector_rejection_when_nothing_dilutes(
+        self, risk_governor, mock_position_monitor
+    ):
+        risk_governor.MAX_SECTOR_CONCENTRATION = 0.50
+        mock_position_monitor.get_all_positions.return_value = [
+            TestInMemoryRiskState._position(symbol, 100.0, 0.0)
+            for symbol in ("JPM", "XOM", "AAPL")
+        ]
+        nvda, msft = self._opp("NVDA"), self._opp("MSFT")
+
+        batch = risk_governor.pre_trade_check_batch([nvda, msft])
+
+        assert batch.admitted == [nvda]
+        assert batch.rejected[0][1].limit_name == "sector_concentration"
+
+    def test_unkeyed_candidate_counts_toward_sector(
+        self, risk_governor, mock_position_monitor
+    ):
+        """A candidate without a contract key still adds to its sector."""
+        risk_governor.MAX_SECTOR_CONCENTRATION = 0.50
+        mock_position_monitor.get_all_positions.return_value = [
+            TestInMemoryRiskState._position(symbol, 100.0, 0.0)
+            for symbol in ("JPM", "XOM", "AAPL")
+        ]
+        nvda = self._opp("NVDA")
+        nvda.expiration = "not-a-date"
+        msft = self._opp("MSFT")
+
+        batch = risk_governor.pre_trade_check_batch([nvda, msft], use_whatif=False)
+
+        # NVDA: 2/4 tech ok; MSFT: 3/5 rejected
+        assert batch.admitted == [nvda]
+        assert batch.rejected[0][1].limit_name == "sector_concentration"
+
+    def test_duplicate_within_batch_rejected(self, risk_governor):
+        opp = self._opp("AAPL")
+        twin = self._opp("AAPL")
+        batch = risk_governor.pre_trade_check_batch([opp, twin])
+
+        assert batch.admitted == [opp]
+        assert "Duplicate in batch" in batch.verdicts[1].reason
+
+    def test_halt_rejects_all(self, risk_governor):
+        risk_governor.emergency_halt("test")
+        batch = risk_governor.pre_trade_check_batch([self._opp("AAPL"), self._opp("JPM")])
+
+        assert batch.admitted == []
+        assert all(v.limit_name == "trading_halt" for v in batch.verdicts)
+
+    def test_whatif_once_per_candidate(self, risk_governor, mock_ibkr_client):
+        """Retries reuse the WhatIf result; use_whatif=False skips IBKR entirely."""
+        risk_governor.MAX_POSITIONS = 1
+        opps = [self._opp("AAPL"), self._opp("JPM")]
+
+        risk_governor.pre_trade_check_batch(opps)
+        assert mock_ibkr_client.get_margin_requirement.call_count == 1
+
+        mock_ibkr_client.get_margin_requirement.reset_mock()
+        risk_governor.pre_trade_check_batch(opps, use_whatif=False)
+        mock_ibkr_client.get_margin_requirement.assert_not_called()
+
+    def test_batch_does_not_mutate_governor_state(self, risk_governor):
+        opps = [self._opp("AAPL"), self._opp("JPM")]
+        batch = risk_governor.pre_trade_check_batch(opps)
+
+        assert len(batch.admitted) == 2
+        assert risk_governor._trades_today == 0
+        assert risk_governor._risk_state.position_count == 0
@@ -41,6 +41,13 @@ def mock_validator():
     validator = Mock()
     validator.validate_premarket = Mock(return_value=[])
     validator.validate_at_open = Mock(return_value=[])
+    # The scheduler awaits the concurrent variants; route them to the sync mocks
+    validator.validate_premarket_async = AsyncMock(
+        side_effect=lambda *a, **kw: validator.validate_premarket(*a, **kw)
+    )
+    validator.validate_at_open_async = AsyncMock(
+        side_effect=lambda *a, **kw: validator.validate_at_open(*a, **kw)
+    )
     return validator
 
 
@@ -761,7 +768,7 @@ class TestSaveFilledUpdatesExisting:
         mock_lifecycle = Mock()
 
         with patch("src.data.database.get_db_session", return_value=mock_session):
-            with patch("src.data.models.Trade") as MockTrade:
+            with patch("src.data.models.Trade"):
                 with patch(
                     "src.services.entry_snapshot.EntrySnapshotService"
                 ) as MockSnapshot:
@@ -846,7 +853,7 @@ class TestSaveFilledUpdatesExisting:
             with patch(
                 "src.data.models.Trade",
                 return_value=mock_trade_instance,
-            ) as MockTrade:
+            ):
                 with patch(
                     "src.services.entry_snapshot.EntrySnapshotService"
                 ) as MockSnapshot:
@@ -891,7 +898,7 @@ class TestCleanupCalledAtSessionEnd:
                 with patch.object(scheduler, '_save_filled_trades_to_db', new_callable=AsyncMock):
                     with patch.object(scheduler, '_get_newly_filled_trades', return_value=[]):
                         with patch("asyncio.sleep", new_callable=AsyncMock):
-                            report = await scheduler._execute_tier1_and_tier2(
+                            await scheduler._execute_tier1_and_tier2(
                                 [], dry_run=False
                             )
 
@@ -1103,3 +1110,74 @@ class TestAdaptiveStrikeSelectionPipeline:
             (t, r) for t, r in wait_calls if t == scheduler.tier1_time
         )
         assert "strike selection" in tier1_wait[1]
+
+
+class TestExecutionPrewarm:
+    """Tests for the pre-open pre-warm phase."""
+
+    def test_prewarm_time_before_open(self, mock_ibkr_client, mock_rapid_fire):
+        """Pre-warm runs PREWARM_LEAD_SECONDS before Tier 1."""
+        with patch.dict("os.environ", {"PREWARM_LEAD_SECONDS": "120"}):
+            scheduler = TwoTierExecutionScheduler(
+                ibkr_client=mock_ibkr_client, rapid_fire_executor=mock_rapid_fire
+            )
+
+        assert scheduler.prewarm_enabled is True
+        assert scheduler.prewarm_time == time(9, 28)
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failure_falls_back_to_live_path(
+        self, mock_ibkr_client, mock_rapid_fire, staged_trades
+    ):
+        """A failing pre-warm leaves no cache and never raises."""
+        scheduler = TwoTierExecutionScheduler(
+            ibkr_client=mock_ibkr_client, rapid_fire_executor=mock_rapid_fire
+        )
+
+        with patch(
+            "src.services.two_tier_execution_scheduler.ExecutionPrewarmer.prewarm",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("TWS busy"),
+        ):
+            await scheduler._prewarm_execution(staged_trades)
+
+        assert scheduler._prewarm is None
+
+    @pytest.mark.asyncio
+    async def test_tier1_uses_and_releases_prewarm(
+        self, mock_ibkr_client, mock_rapid_fire, staged_trades
+    ):
+        """Tier 1 passes the cache to the executor and releases it afterwards."""
+        from src.services.execution_prewarm import PrewarmCache
+
+        scheduler = TwoTierExecutionScheduler(
+            ibkr_client=mock_ibkr_client,
+            rapid_fire_executor=mock_rapid_fire,
+            tier2_enabled=False,
+        )
+        cache = Mock(spec=PrewarmCache)
+        cache.trades = {"k": Mock()}
+        scheduler._prewarm = cache
+
+        tier1 = Mock()
+        tier1.total_submitted = 1
+        tier1.total_filled = 1
+        tier1.submission_time = 0.4
+        tier1.submitted = []
+        tier1.filled = []
+        tier1.failed = []
+        tier1.skipped = []
+        tier1.total_premium = 0.0
+        tier1.warnings = []
+        tier1.last_submission_at = None
+        mock_rapid_fire.execute_all.return_value = tier1
+
+        with patch.object(scheduler, "_wait_until_time", new_callable=AsyncMock), \
+                patch.object(scheduler, "_save_pending_trades_to_db", new_callable=AsyncMock), \
+                patch.object(scheduler, "_save_filled_trades_to_db", new_callable=AsyncMock), \
+                patch("asyncio.sleep", new_callable=AsyncMock):
+            report = await scheduler._execute_tier1_and_tier2(staged_trades, dry_run=False)
+
+        mock_rapid_fire.execute_all.assert_awaited_once_with(staged_trades, prewarm=cache)
+        cache.release.assert_called_once_with(mock_ibkr_client)
+        assert report.prewarmed_count == 1
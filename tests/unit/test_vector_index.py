@@ -0,0 +1,126 @@
+"""Unit tests for the local decision vector index.
+
+Tests:
+- hash_embedding is deterministic and ranks overlapping texts closer
+- Exact search returns nearest ids with cosine distances
+- IVF search after training still finds planted neighbours, incremental
+  inserts land in lists
+- Memory-mapped index survives reopen (vectors, ids, centroids) and grows
+- An index only reopens under the embedder that wrote it
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.agentic.vector_index import LocalVectorIndex, hash_embedding
+
+
+def _clustered(n, dim=32, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim))
+    return (centers[rng.integers(0, clusters, n)] + 0.2 * rng.standard_normal((n, dim))).astype(
+        np.float32
+    )
+
+
+class TestHashEmbedding:
+    def test_deterministic_unit_vector(self):
+        a = hash_embedding("CLOSE_POSITION AAPL 180P", dim=64)
+        b = hash_embedding("CLOSE_POSITION AAPL 180P", dim=64)
+        assert np.array_equal(a, b)
+        assert np.linalg.norm(a) == pytest.approx(1.0)
+
+    def test_overlap_is_closer(self):
+        query = hash_embedding("AAPL 180P profit target reached")
+        near = hash_embedding("AAPL 180P profit target hit, close")
+        far = hash_embedding("VIX spike market wide review")
+        assert query @ near > query @ far
+
+    def test_empty_text(self):
+        assert not hash_embedding("", dim=16).any()
+
+
+class TestExactSearch:
+    def test_nearest_first_with_cosine_distance(self):
+        index = LocalVectorIndex(dim=3)
+        index.add(10, [1.0, 0.0, 0.0])
+        index.add(11, [0.0, 1.0, 0.0])
+        index.add(12, [1.0, 1.0, 0.0])
+
+        hits = index.search([1.0, 0.1, 0.0], k=2)
+
+        assert [item_id for item_id, _ in hits] == [10, 12]
+        assert hits[0][1] == pytest.approx(1 - 1 / np.sqrt(1.01), abs=1e-6)
+        assert index.max_id == 12
+
+    def test_empty_and_wrong_dimension(self):
+        index = LocalVectorIndex(dim=3)
+        assert index.search([1.0, 0.0, 0.0]) == []
+        with pytest.raises(ValueError):
+            index.add(1, [1.0, 0.0])
+
+
+class TestIvf:
+    def test_trained_search_finds_planted_neighbour(self):
+        data = _clustered(3000)
+        index = LocalVectorIndex(dim=32, train_threshold=1000, nprobe=4)
+        index.add_many(list(range(1, 3001)), data)
+        assert index.trained
+
+        for row in (0, 1234, 2999):
+            assert index.search(data[row], k=1)[0][0] == row + 1
+
+    def test_incremental_insert_after_training(self):
+        data = _clustered(1200)
+        index = LocalVectorIndex(dim=32, train_threshold=1000)
+        index.add_many(list(range(1, 1001)), data[:1000])
+        trained_lists = index._centroids
+
+        index.add(5000, data[1100])
+
+        assert index._centroids is trained_lists  # No retrain below 2x
+        assert index.search(data[1100], k=1)[0][0] == 5000
+
+
+class TestPersistence:
+    def test_reopen_and_grow(self, tmp_path):
+        data = _clustered(2500)
+        index = LocalVectorIndex(dim=32, path=tmp_path, train_threshold=1000)
+        index.add_many(list(range(1, 2501)), data)  # Grows past initial capacity
+        assert index.trained
+
+        reopened = LocalVectorIndex(dim=32, path=tmp_path, train_threshold=1000)
+
+        assert reopened.count == 2500
+        assert reopened.max_id == 2500
+        assert np.array_equal(reopened._centroids, index._centroids)
+        assert reopened.search(data[42], k=1)[0][0] == 43
+
+    def test_dimension_mismatch_rejected(self, tmp_path):
+        LocalVectorIndex(dim=32, path=tmp_path).add(1, np.ones(32))
+        with pytest.raises(ValueError):
+            LocalVectorIndex(dim=64, path=tmp_path)
+
+    def test_embedder_mismatch_rejected(self, tmp_path):
+        LocalVectorIndex(dim=32, path=tmp_path).add(1, np.ones(32))
+
+        assert json.loads((tmp_path / "meta.json").read_text())["embedder"] == "hash"
+        with pytest.raises(ValueError):
+            LocalVectorIndex(
+                dim=32, path=tmp_path, embed_fn=lambda t: np.ones(32), embedder="provider"
+            )
+
+    def test_index_without_recorded_embedder_opens_as_hash(self, tmp_path):
+        LocalVectorIndex(dim=32, path=tmp_path).add(1, np.ones(32))
+        meta_file = tmp_path / "meta.json"
+        meta = json.loads(meta_file.read_text())
+        del meta["embedder"]
+        meta_file.write_text(json.dumps(meta))
+
+        assert LocalVectorIndex(dim=32, path=tmp_path).count == 1
+
+    def test_custom_embed_fn_needs_a_name(self):
+        with pytest.raises(ValueError):
+            LocalVectorIndex(dim=3, embed_fn=lambda t: np.ones(3))
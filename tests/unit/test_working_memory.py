@@ -1,21 +1,24 @@
 """Unit tests for WorkingMemory and ReasoningContext.
 
-Tests crash-safe working memory persistence, FIFO decision queue,
+Tests crash-safe working memory persistence (delta journal, snapshot
+compaction and replay), FIFO decision queue,
 autonomy level clamping, anomaly tracking, context assembly from
-open positions and patterns, and prompt string generation.
+open positions and patterns, prompt string generation, and similarity
+search through a local vector index.
 """
 
 from datetime import datetime, date, timedelta
 
 import pytest
 
+from src.agentic.vector_index import LocalVectorIndex
 from src.agentic.working_memory import (
     MAX_RECENT_DECISIONS,
     ReasoningContext,
     WorkingMemory,
 )
 from src.data.database import close_database, get_session, init_database
-from src.data.models import Base, Pattern, Trade, WorkingMemoryRow
+from src.data.models import Base, Pattern, Trade, WorkingMemoryDelta, WorkingMemoryRow
 
 
 @pytest.fixture
@@ -182,14 +185,17 @@ class TestAddDecision:
         assert wm.recent_decisions[0]["action"] == "sell_put"
 
     def test_add_decision_persists_to_db(self, db_session):
-        """add_decision() auto-saves to the database."""
+        """add_decision() journals one delta that survives a reload."""
         wm = WorkingMemory(db_session)
         wm.add_decision({"action": "hold"})
 
-        row = db_session.query(WorkingMemoryRow).get(1)
-        assert row is not None
-        assert len(row.recent_decisions) == 1
-        assert row.recent_decisions[0]["action"] == "hold"
+        delta = db_session.query(WorkingMemoryDelta).one()
+        assert delta.kind == "decision"
+        assert delta.payload == {"action": "hold"}
+
+        reloaded = WorkingMemory(db_session)
+        assert len(reloaded.recent_decisions) == 1
+        assert reloaded.recent_decisions[0]["action"] == "hold"
 
     def test_add_decision_fifo_max_50(self, db_session):
         """add_decision() caps at MAX_RECENT_DECISIONS (50), dropping oldest."""
@@ -210,9 +216,9 @@ class TestAddDecision:
         for i in range(MAX_RECENT_DECISIONS + 5):
             wm.add_decision({"idx": i})
 
-        row = db_session.query(WorkingMemoryRow).get(1)
-        assert len(row.recent_decisions) == MAX_RECENT_DECISIONS
-        assert row.recent_decisions[0]["idx"] == 5
+        reloaded = WorkingMemory(db_session)
+        assert len(reloaded.recent_decisions) == MAX_RECENT_DECISIONS
+        assert reloaded.recent_decisions[0]["idx"] == 5
 
     def test_add_decision_preserves_existing(self, db_session):
         """Adding a decision does not remove non-overflowed entries."""
@@ -246,8 +252,7 @@ class TestUpdateMarketContext:
         wm = WorkingMemory(db_session)
         wm.update_market_context({"vix": 30.0})
 
-        row = db_session.query(WorkingMemoryRow).get(1)
-        assert row.market_context == {"vix": 30.0}
+        assert WorkingMemory(db_session).market_context == {"vix": 30.0}
 
     def test_update_market_context_replaces_entirely(self, db_session):
         """update_market_context() replaces the entire dict, not merges."""
@@ -280,8 +285,7 @@ class TestUpdateStrategyState:
         wm = WorkingMemory(db_session)
         wm.update_strategy_state({"mode": "aggressive"})
 
-        row = db_session.query(WorkingMemoryRow).get(1)
-        assert row.strategy_state == {"mode": "aggressive"}
+        assert WorkingMemory(db_session).strategy_state == {"mode": "aggressive"}
 
 
 # =========================================================================
@@ -323,8 +327,7 @@ class TestSetAutonomyLevel:
         wm = WorkingMemory(db_session)
         wm.set_autonomy_level(3)
 
-        row = db_session.query(WorkingMemoryRow).get(1)
-        assert row.autonomy_level == 3
+        assert WorkingMemory(db_session).autonomy_level == 3
 
 
 # =========================================================================
@@ -372,9 +375,9 @@ class TestAddAnomaly:
         wm = WorkingMemory(db_session)
         wm.add_anomaly({"description": "unusual volume"})
 
-        row = db_session.query(WorkingMemoryRow).get(1)
-        assert len(row.anomalies) == 1
-        assert row.anomalies[0]["description"] == "unusual volume"
+        reloaded = WorkingMemory(db_session)
+        assert len(reloaded.anomalies) == 1
+        assert reloaded.anomalies[0]["description"] == "unusual volume"
 
     def test_add_anomaly_does_not_mutate_original(self, db_session):
         """add_anomaly() adds timestamp to its own copy, verifiable on stored data."""
@@ -430,8 +433,68 @@ class TestAddReflection:
         wm = WorkingMemory(db_session)
         wm.add_reflection({"summary": "reflection test"})
 
+        assert len(WorkingMemory(db_session).reflection_reports) == 1
+
+
+# =========================================================================
+# Delta journal: compaction and replay
+# =========================================================================
+
+
+class TestDeltaJournal:
+    """Tests for the append-only journal behind working memory."""
+
+    def test_writes_are_constant_size(self, db_session):
+        """Each decision appends one delta; the snapshot is not rewritten."""
+        wm = WorkingMemory(db_session)
+        for i in range(10):
+            wm.add_decision({"idx": i})
+
+        assert db_session.query(WorkingMemoryDelta).count() == 10
+        assert db_session.query(WorkingMemoryRow).get(1) is None
+        payloads = [d.payload for d in db_session.query(WorkingMemoryDelta)]
+        assert payloads[-1] == {"idx": 9}
+
+    def test_save_compacts_journal_into_snapshot(self, db_session):
+        """save() folds the journal into the snapshot and truncates it."""
+        wm = WorkingMemory(db_session)
+        wm.add_decision({"action": "hold"})
+        wm.set_autonomy_level(3)
+        wm.save()
+
+        assert db_session.query(WorkingMemoryDelta).count() == 0
         row = db_session.query(WorkingMemoryRow).get(1)
-        assert len(row.reflection_reports) == 1
+        assert row.recent_decisions == [{"action": "hold"}]
+        assert row.autonomy_level == 3
+
+    def test_automatic_compaction(self, db_session, monkeypatch):
+        """The journal is compacted every COMPACT_EVERY_DELTAS deltas."""
+        import src.agentic.working_memory as wm_module
+
+        monkeypatch.setattr(wm_module, "COMPACT_EVERY_DELTAS", 5)
+        wm = WorkingMemory(db_session)
+        for i in range(7):
+            wm.add_decision({"idx": i})
+
+        assert db_session.query(WorkingMemoryDelta).count() == 2
+        assert len(db_session.query(WorkingMemoryRow).get(1).recent_decisions) == 5
+
+    def test_replay_over_snapshot_reports_recovery(self, db_session):
+        """Startup replays deltas newer than the snapshot, in order."""
+        wm = WorkingMemory(db_session)
+        wm.update_market_context({"vix": 18.0})
+        wm.save()
+        wm.update_market_context({"vix": 21.0})
+        wm.set_scheduled_fingerprint("abc123")
+        wm.add_anomaly({"description": "gap"})
+
+        reloaded = WorkingMemory(db_session)
+
+        assert reloaded.market_context == {"vix": 21.0}
+        assert reloaded.last_scheduled_fingerprint == "abc123"
+        assert reloaded.anomalies[0]["description"] == "gap"
+        assert reloaded.replayed_deltas == 3
+        assert reloaded.recovery_ms >= 0
 
 
 # =========================================================================
@@ -1049,6 +1112,91 @@ class TestRetrieveSimilarContext:
         assert results == []
 
 
+class TestLocalVectorIndexSearch:
+    """retrieve_similar_context with a LocalVectorIndex on SQLite."""
+
+    def _store(self, wm, db_session, action, text):
+        from src.data.models import DecisionAudit
+
+        audit = DecisionAudit(
+            autonomy_level=1,
+            event_type="POSITION_EXIT_CHECK",
+            action=action,
+            confidence=0.8,
+            reasoning=text,
+            autonomy_approved=True,
+        )
+        db_session.add(audit)
+        db_session.flush()
+        wm.store_embedding(decision_audit_id=audit.id, text_content=text)
+
+    def test_returns_nearest_decisions(self, db_session):
+        """Stored decisions are searchable by text on SQLite."""
+        wm = WorkingMemory(db_session, vector_index=LocalVectorIndex(dim=128))
+        self._store(wm, db_session, "CLOSE_POSITION", "AAPL 180P profit target reached, close")
+        self._store(wm, db_session, "MONITOR_ONLY", "MSFT 400P theta decay on track, hold")
+        self._store(wm, db_session, "MONITOR_ONLY", "VIX spike, market wide risk review")
+
+        results = wm.retrieve_similar_context(query_text="AAPL 180P profit target", k=2)
+
+        assert len(results) == 2
+        assert results[0]["action"] == "CLOSE_POSITION"
+        assert "AAPL 180P" in results[0]["text"]
+        assert results[0]["distance"] < results[1]["distance"]
+
+    def test_sync_backfills_stored_text(self, db_session):
+        """sync_vector_index() indexes rows stored without the index."""
+        self._store(WorkingMemory(db_session), db_session, "MONITOR_ONLY", "NVDA 120P hold")
+        wm = WorkingMemory(db_session, vector_index=LocalVectorIndex(dim=128))
+
+        assert wm.sync_vector_index() == 1
+        assert wm.sync_vector_index() == 0
+        assert wm.retrieve_similar_context(query_text="NVDA 120P")[0]["action"] == "MONITOR_ONLY"
+
+    def test_store_without_text_or_embedding_skips_index(self, db_session):
+        """A row with nothing to embed is stored but not indexed."""
+        from src.data.models import DecisionEmbedding
+
+        wm = WorkingMemory(db_session, vector_index=LocalVectorIndex(dim=128))
+        self._store(wm, db_session, "MONITOR_ONLY", "")
+
+        assert wm.vector_index.count == 0
+        assert db_session.query(DecisionEmbedding).count() == 1
+
+    def test_embedding_from_other_source_is_reembedded(self, db_session):
+        """A same-length vector from another embedder never enters the index."""
+        from src.data.models import DecisionAudit
+
+        wm = WorkingMemory(db_session, vector_index=LocalVectorIndex(dim=128))
+        audit = DecisionAudit(
+            autonomy_level=1,
+            event_type="POSITION_EXIT_CHECK",
+            action="CLOSE_POSITION",
+            confidence=0.8,
+            reasoning="AAPL 180P profit target reached",
+            autonomy_approved=True,
+        )
+        db_session.add(audit)
+        db_session.flush()
+        foreign = [1.0] + [0.0] * 127
+
+        wm.store_embedding(
+            audit.id, "AAPL 180P profit target reached", embedding=foreign,
+            embedding_source="provider",
+        )
+
+        stored = wm.vector_index._vectors[0]
+        assert stored[0] != pytest.approx(1.0)
+        own = list(wm.vector_index.embed("AAPL 180P profit target reached"))
+        assert wm._index_vector(own, None, "hash") == own
+        assert wm._index_vector(foreign, None, "provider") is None
+
+    def test_unusable_query_falls_back(self, db_session):
+        """A query vector of another dimension without text uses the pgvector path."""
+        wm = WorkingMemory(db_session, vector_index=LocalVectorIndex(dim=128))
+        assert wm.retrieve_similar_context(query_embedding=[0.1] * 1536) == []
+
+
 # =========================================================================
 # ReasoningContext.to_prompt_string() — enriched candidate display
 # =========================================================================